@@ -0,0 +1,75 @@
+"""create_effective_project_access_table
+
+Revision ID: 3f9a1c7e2b40
+Revises: a1b2c3d4e5f7
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import ENUM, UUID
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9a1c7e2b40"
+down_revision: str | None = "a1b2c3d4e5f7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create effective_project_access table and backfill from memberships."""
+    # Reference the existing enum type
+    memberrole_enum = ENUM(
+        "viewer", "editor", "admin", name="memberrole", create_type=False
+    )
+
+    op.create_table(
+        "effective_project_access",
+        sa.Column("user_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("project_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("role", memberrole_enum, nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("user_id", "project_id"),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["project_id"],
+            ["projects.id"],
+            ondelete="CASCADE",
+        ),
+    )
+
+    # Reverse lookup: who has access to a project
+    op.create_index(
+        "effective_project_access_project_idx",
+        "effective_project_access",
+        ["project_id", "user_id"],
+    )
+
+    # Backfill from existing direct memberships
+    op.execute(
+        "INSERT INTO effective_project_access (user_id, project_id, role) "
+        "SELECT user_id, project_id, MAX(role) "
+        "FROM project_members "
+        "GROUP BY user_id, project_id"
+    )
+
+
+def downgrade() -> None:
+    """Drop effective_project_access table."""
+    op.drop_index(
+        "effective_project_access_project_idx",
+        table_name="effective_project_access",
+    )
+    op.drop_table("effective_project_access")
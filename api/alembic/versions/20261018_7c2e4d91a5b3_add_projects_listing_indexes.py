@@ -0,0 +1,41 @@
+"""add_projects_listing_indexes
+
+Revision ID: 7c2e4d91a5b3
+Revises: 3f9a1c7e2b40
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2e4d91a5b3"
+down_revision: str | None = "3f9a1c7e2b40"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add indexes backing the keyset-paginated accessible project listing."""
+    op.create_index(
+        "projects_owner_created_idx",
+        "projects",
+        ["owner_id", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "projects_public_created_idx",
+        "projects",
+        ["created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("visibility = 'public'"),
+    )
+
+
+def downgrade() -> None:
+    """Drop projects listing indexes."""
+    op.drop_index("projects_public_created_idx", table_name="projects")
+    op.drop_index("projects_owner_created_idx", table_name="projects")
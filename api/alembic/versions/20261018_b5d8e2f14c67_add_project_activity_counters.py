@@ -0,0 +1,63 @@
+"""add_project_activity_counters
+
+Revision ID: b5d8e2f14c67
+Revises: 7c2e4d91a5b3
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d8e2f14c67"
+down_revision: str | None = "7c2e4d91a5b3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add denormalized document_count and last_activity_at to projects."""
+    op.add_column(
+        "projects",
+        sa.Column("document_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "projects",
+        sa.Column("last_activity_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    # Backfill from existing documents and revision batches
+    op.execute(
+        """
+        UPDATE projects p
+        SET document_count = d.cnt
+        FROM (
+            SELECT project_id, COUNT(*) AS cnt
+            FROM documents
+            WHERE NOT is_folder
+            GROUP BY project_id
+        ) d
+        WHERE d.project_id = p.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE projects p
+        SET last_activity_at = b.last_at
+        FROM (
+            SELECT project_id, MAX(created_at) AS last_at
+            FROM revision_batches
+            GROUP BY project_id
+        ) b
+        WHERE b.project_id = p.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop projects activity counters."""
+    op.drop_column("projects", "last_activity_at")
+    op.drop_column("projects", "document_count")
@@ -0,0 +1,31 @@
+"""add_projects_deleting_at
+
+Revision ID: c81f3a6d2e90
+Revises: b5d8e2f14c67
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c81f3a6d2e90"
+down_revision: str | None = "b5d8e2f14c67"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add deleting_at to projects for background deletion."""
+    op.add_column(
+        "projects",
+        sa.Column("deleting_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop projects.deleting_at."""
+    op.drop_column("projects", "deleting_at")
@@ -0,0 +1,61 @@
+"""add_user_search_indexes
+
+Revision ID: d4a7e9c3b851
+Revises: c81f3a6d2e90
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4a7e9c3b851"
+down_revision: str | None = "c81f3a6d2e90"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add trigram search and keyset pagination indexes for users and members."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "users_name_trgm_idx",
+        "users",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "users_email_trgm_idx",
+        "users",
+        ["email"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"email": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "users_created_idx",
+        "users",
+        ["created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "project_members_project_created_idx",
+        "project_members",
+        ["project_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop user search and member pagination indexes.
+
+    The pg_trgm extension is left installed as other objects may use it.
+    """
+    op.drop_index("project_members_project_created_idx", table_name="project_members")
+    op.drop_index("users_created_idx", table_name="users")
+    op.drop_index("users_email_trgm_idx", table_name="users")
+    op.drop_index("users_name_trgm_idx", table_name="users")
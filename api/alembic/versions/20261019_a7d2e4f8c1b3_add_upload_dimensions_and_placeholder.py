@@ -0,0 +1,37 @@
+"""add_upload_dimensions_and_placeholder
+
+Revision ID: a7d2e4f8c1b3
+Revises: f3a9c1d7e2b5
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d2e4f8c1b3"
+down_revision: str | None = "f3a9c1d7e2b5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add intrinsic image size and inline placeholder to uploads and blobs.
+
+    Existing rows are left NULL; they are not re-decoded here.
+    """
+    for table in ("uploads", "upload_blobs"):
+        op.add_column(table, sa.Column("width", sa.Integer(), nullable=True))
+        op.add_column(table, sa.Column("height", sa.Integer(), nullable=True))
+        op.add_column(table, sa.Column("placeholder", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop image size and placeholder columns."""
+    for table in ("upload_blobs", "uploads"):
+        op.drop_column(table, "placeholder")
+        op.drop_column(table, "height")
+        op.drop_column(table, "width")
@@ -0,0 +1,81 @@
+"""add_project_storage_usage
+
+Revision ID: c6e1a8d3f472
+Revises: a7d2e4f8c1b3
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c6e1a8d3f472"
+down_revision: str | None = "a7d2e4f8c1b3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add denormalized storage totals and an optional quota to projects."""
+    for column in ("upload_bytes", "document_bytes", "revision_bytes"):
+        op.add_column(
+            "projects",
+            sa.Column(column, sa.BigInteger(), server_default="0", nullable=False),
+        )
+    op.add_column(
+        "projects",
+        sa.Column("storage_quota_bytes", sa.BigInteger(), nullable=True),
+    )
+
+    # Backfill from existing uploads, documents and revisions
+    op.execute(
+        """
+        UPDATE projects p
+        SET upload_bytes = u.total
+        FROM (
+            SELECT project_id, SUM(size_bytes) AS total
+            FROM uploads
+            WHERE project_id IS NOT NULL
+            GROUP BY project_id
+        ) u
+        WHERE u.project_id = p.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE projects p
+        SET document_bytes = d.total
+        FROM (
+            SELECT project_id, SUM(OCTET_LENGTH(content)) AS total
+            FROM documents
+            WHERE content IS NOT NULL
+            GROUP BY project_id
+        ) d
+        WHERE d.project_id = p.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE projects p
+        SET revision_bytes = r.total
+        FROM (
+            SELECT b.project_id, SUM(OCTET_LENGTH(r.content)) AS total
+            FROM document_revisions r
+            JOIN revision_batches b ON b.id = r.batch_id
+            WHERE r.content IS NOT NULL
+            GROUP BY b.project_id
+        ) r
+        WHERE r.project_id = p.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop projects storage totals and quota."""
+    op.drop_column("projects", "storage_quota_bytes")
+    op.drop_column("projects", "revision_bytes")
+    op.drop_column("projects", "document_bytes")
+    op.drop_column("projects", "upload_bytes")
@@ -0,0 +1,32 @@
+"""add_uploads_storage_path_index
+
+Revision ID: e5b8f0d4a962
+Revises: d4a7e9c3b851
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b8f0d4a962"
+down_revision: str | None = "d4a7e9c3b851"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add unique index for serving uploads by storage path."""
+    op.create_index(
+        "uploads_storage_path_idx",
+        "uploads",
+        ["storage_path"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop the uploads storage path index."""
+    op.drop_index("uploads_storage_path_idx", table_name="uploads")
@@ -0,0 +1,83 @@
+"""add_upload_blobs
+
+Revision ID: f3a9c1d7e2b5
+Revises: e5b8f0d4a962
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a9c1d7e2b5"
+down_revision: str | None = "e5b8f0d4a962"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add content-addressed blobs shared by identical uploads.
+
+    Existing uploads keep their own files and have no content hash.
+    """
+    op.create_table(
+        "upload_blobs",
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("source_hash", sa.String(length=64), nullable=False),
+        sa.Column("storage_path", sa.String(length=500), nullable=False),
+        sa.Column("mime_type", sa.String(length=100), nullable=False),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("content_hash"),
+    )
+    op.create_index(
+        "upload_blobs_source_hash_idx", "upload_blobs", ["source_hash"], unique=False
+    )
+    op.create_index(
+        "upload_blobs_storage_path_idx",
+        "upload_blobs",
+        ["storage_path"],
+        unique=True,
+    )
+
+    op.add_column(
+        "uploads", sa.Column("content_hash", sa.String(length=64), nullable=True)
+    )
+    op.create_foreign_key(
+        "uploads_content_hash_fkey",
+        "uploads",
+        "upload_blobs",
+        ["content_hash"],
+        ["content_hash"],
+    )
+
+    # Uploads of the same content now share a storage path
+    op.drop_index("uploads_storage_path_idx", table_name="uploads")
+    op.create_index(
+        "uploads_storage_path_idx", "uploads", ["storage_path"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Drop upload blobs.
+
+    Fails if deduplicated uploads share a storage path.
+    """
+    op.drop_index("uploads_storage_path_idx", table_name="uploads")
+    op.create_index(
+        "uploads_storage_path_idx", "uploads", ["storage_path"], unique=True
+    )
+    op.drop_constraint("uploads_content_hash_fkey", "uploads", type_="foreignkey")
+    op.drop_column("uploads", "content_hash")
+    op.drop_index("upload_blobs_storage_path_idx", table_name="upload_blobs")
+    op.drop_index("upload_blobs_source_hash_idx", table_name="upload_blobs")
+    op.drop_table("upload_blobs")
@@ -89,3 +89,25 @@ async def get_current_active_user(
             detail="Inactive user",
         )
     return current_user
+
+
+async def get_current_admin_user(
+    current_user: Annotated[User, Depends(get_current_active_user)],
+) -> User:
+    """Get the current user, requiring system administrator rights.
+
+    Args:
+        current_user: The authenticated active user.
+
+    Returns:
+        The admin user.
+
+    Raises:
+        HTTPException: If user is not an admin.
+    """
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required",
+        )
+    return current_user
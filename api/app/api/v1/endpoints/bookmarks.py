@@ -10,11 +10,11 @@ from app.core.database import get_db
 from app.models.user import User
 from app.repositories.project import ProjectRepository
 from app.repositories.project_bookmark import ProjectBookmarkRepository
-from app.repositories.project_member import ProjectMemberRepository
 from app.schemas.project_bookmark import (
     BookmarkedProjectRead,
     BookmarkStatusRead,
     ProjectBookmarkRead,
+    ProjectBookmarkStatusRead,
 )
 from app.services.exceptions import PermissionDeniedError, ProjectNotFoundError
 from app.services.project_bookmark import ProjectBookmarkService
@@ -34,7 +34,6 @@ def get_bookmark_service(db: AsyncSession = Depends(get_db)) -> ProjectBookmarkS
     return ProjectBookmarkService(
         bookmark_repo=ProjectBookmarkRepository(db),
         project_repo=ProjectRepository(db),
-        member_repo=ProjectMemberRepository(db),
     )
 
 
@@ -62,6 +61,35 @@ async def list_bookmarks(
     return [BookmarkedProjectRead.model_validate(b) for b in bookmarks]
 
 
+@router.get("/bookmarks/status", response_model=list[ProjectBookmarkStatusRead])
+async def get_bookmark_statuses(
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    bookmark_service: Annotated[ProjectBookmarkService, Depends(get_bookmark_service)],
+    slug: Annotated[list[str], Query(min_length=1, max_length=100)],
+) -> list[ProjectBookmarkStatusRead]:
+    """Check whether each of many projects is bookmarked by the current user.
+
+    Answers for every slug in one query, so list views do not need one
+    ``GET /projects/{slug}/bookmark`` call per project. Pass ``slug``
+    repeatedly (up to 100 times). Unknown slugs are left out.
+
+    Args:
+        current_user: The authenticated user.
+        bookmark_service: Bookmark service.
+        slug: Project slugs to check.
+
+    Returns:
+        Bookmark status per project, in request order.
+    """
+    statuses = await bookmark_service.get_bookmark_statuses(
+        list(dict.fromkeys(slug)), current_user.id
+    )
+    return [
+        ProjectBookmarkStatusRead(slug=s, is_bookmarked=is_bookmarked)
+        for s, is_bookmarked in statuses.items()
+    ]
+
+
 @router.post(
     "/projects/{slug}/bookmark",
     response_model=ProjectBookmarkRead,
@@ -1,11 +1,14 @@
 """Health check endpoint."""
 
+from dataclasses import asdict
+
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.image_pool import image_pool
 
 router = APIRouter()
 
@@ -17,6 +20,20 @@ class HealthResponse(BaseModel):
     database: str
 
 
+class ImageProcessingMetricsResponse(BaseModel):
+    """Image processing pool metrics for the API worker serving the request."""
+
+    workers: int
+    running: int
+    queued: int
+    completed: int
+    failed: int
+    rejected: int
+    timed_out: int
+    job_seconds_total: float
+    job_seconds_max: float
+
+
 @router.get("/health", response_model=HealthResponse)
 async def health_check(db: AsyncSession = Depends(get_db)) -> HealthResponse:
     """
@@ -35,3 +52,15 @@ async def health_check(db: AsyncSession = Depends(get_db)) -> HealthResponse:
         status="ok",
         database=db_status,
     )
+
+
+@router.get("/health/image-processing", response_model=ImageProcessingMetricsResponse)
+async def image_processing_metrics() -> ImageProcessingMetricsResponse:
+    """
+    Image processing metrics.
+
+    Returns the queue depth, job counters and job durations of this API
+    worker's image processing pool. Counters are per worker process and
+    reset on restart.
+    """
+    return ImageProcessingMetricsResponse(**asdict(image_pool.stats()))
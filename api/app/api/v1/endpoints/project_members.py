@@ -3,17 +3,20 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_active_user
 from app.core.database import get_db
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
 from app.models.user import User
 from app.repositories.project import ProjectRepository
 from app.repositories.project_member import ProjectMemberRepository
 from app.repositories.user import UserRepository
 from app.schemas.project_member import (
+    ProjectMemberBulkCreate,
     ProjectMemberCreate,
+    ProjectMemberInviteResult,
     ProjectMemberRead,
     ProjectMemberUpdate,
     ProjectMemberWithUserRead,
@@ -51,28 +54,45 @@ def get_member_service(db: AsyncSession = Depends(get_db)) -> ProjectMemberServi
 @router.get("", response_model=list[ProjectMemberWithUserRead])
 async def list_members(
     slug: str,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_active_user)],
     member_service: Annotated[ProjectMemberService, Depends(get_member_service)],
     skip: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 100,
+    q: Annotated[str | None, Query(min_length=1, max_length=255)] = None,
+    cursor: Annotated[str | None, Query()] = None,
 ) -> list[ProjectMemberWithUserRead]:
     """List all members of a project.
 
-    All project members (viewer+) can view the member list.
+    All project members (viewer+) can view the member list. ``q`` filters
+    by member name or email (prefix or substring, case-insensitive). When
+    a full page is returned, the ``X-Next-Cursor`` header holds a cursor
+    for the next page.
 
     Args:
         slug: The project slug.
+        response: Response used to set the next-page cursor header.
         current_user: The authenticated user.
         member_service: Project member service.
         skip: Number of records to skip (pagination).
         limit: Maximum number of records to return.
+        q: Optional name or email search text.
+        cursor: Opaque cursor from a previous ``X-Next-Cursor`` header.
 
     Returns:
         List of project members with user details.
     """
     try:
-        return await member_service.list_members(
-            slug, current_user.id, skip=skip, limit=limit
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    try:
+        members = await member_service.list_members(
+            slug, current_user.id, skip=skip, limit=limit, query=q, cursor=position
         )
     except ProjectNotFoundError as e:
         raise HTTPException(
@@ -85,6 +105,11 @@ async def list_members(
             detail=str(e),
         ) from e
 
+    if len(members) == limit:
+        last = members[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+    return members
+
 
 @router.post("", response_model=ProjectMemberRead, status_code=status.HTTP_201_CREATED)
 async def add_member(
@@ -138,6 +163,47 @@ async def add_member(
         ) from e
 
 
+@router.post("/bulk", response_model=list[ProjectMemberInviteResult])
+async def add_members_bulk(
+    slug: str,
+    request: ProjectMemberBulkCreate,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    member_service: Annotated[ProjectMemberService, Depends(get_member_service)],
+) -> list[ProjectMemberInviteResult]:
+    """Add many members to a project at once.
+
+    Users may be given by ID or email. Unknown users, the owner and
+    duplicates are reported per entry instead of failing the request.
+    Existing members are skipped, or have their role updated with
+    ``on_conflict=update_role``.
+
+    Only project admins and owners can add members.
+
+    Args:
+        slug: The project slug.
+        request: Invites and conflict handling.
+        current_user: The authenticated user.
+        member_service: Project member service.
+
+    Returns:
+        Outcome per invite, in request order.
+    """
+    try:
+        return await member_service.add_members_bulk(
+            slug, request.members, request.on_conflict, current_user.id
+        )
+    except ProjectNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+    except PermissionDeniedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e),
+        ) from e
+
+
 @router.patch("/{member_id}", response_model=ProjectMemberRead)
 async def update_member_role(
     slug: str,
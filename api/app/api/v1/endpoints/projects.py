@@ -2,16 +2,30 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_active_user
 from app.core.database import get_db
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.core.storage import get_storage_provider
 from app.models.user import User
 from app.repositories.project import ProjectRepository
-from app.repositories.project_member import ProjectMemberRepository
+from app.repositories.project_deletion import ProjectDeletionRepository
 from app.schemas.project import (
     ProjectCreate,
+    ProjectDeletionRead,
+    ProjectDeletionStatus,
+    ProjectListInclude,
+    ProjectListItemRead,
     ProjectPermissionsRead,
     ProjectRead,
     ProjectUpdate,
@@ -22,10 +36,10 @@ from app.services import (
     ProjectService,
     SlugAlreadyExistsError,
 )
-from app.services.authorization import (
-    Permission,
-    check_project_permission,
-    get_user_permissions,
+from app.services.authorization import Permission, ProjectAccess
+from app.services.project_deletion import (
+    ProjectDeletionService,
+    run_project_deletion,
 )
 
 router = APIRouter(prefix="/projects", tags=["projects"])
@@ -43,25 +57,45 @@ def get_project_service(db: AsyncSession = Depends(get_db)) -> ProjectService:
     return ProjectService(ProjectRepository(db))
 
 
-def get_member_repo(db: AsyncSession = Depends(get_db)) -> ProjectMemberRepository:
-    """Dependency to get ProjectMemberRepository instance.
+def get_project_deletion_service(
+    db: AsyncSession = Depends(get_db),
+) -> ProjectDeletionService:
+    """Dependency to get ProjectDeletionService instance.
 
     Args:
         db: Database session.
 
     Returns:
-        ProjectMemberRepository instance.
+        ProjectDeletionService instance.
+    """
+    return ProjectDeletionService(ProjectDeletionRepository(db), get_storage_provider())
+
+
+def _permissions_read(access: ProjectAccess) -> ProjectPermissionsRead:
+    """Build the permissions response for a loaded project access.
+
+    Args:
+        access: Project with the current user's effective role.
+
+    Returns:
+        User's permissions and role on the project.
     """
-    return ProjectMemberRepository(db)
+    return ProjectPermissionsRead(
+        permissions=[p.value for p in access.permissions],
+        role=access.role,
+    )
 
 
-@router.get("", response_model=list[ProjectRead])
+@router.get("", response_model=list[ProjectListItemRead])
 async def list_projects(
+    response: Response,
     current_user: Annotated[User, Depends(get_current_active_user)],
     project_service: Annotated[ProjectService, Depends(get_project_service)],
     skip: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 100,
-) -> list[ProjectRead]:
+    cursor: Annotated[str | None, Query()] = None,
+    include: Annotated[list[ProjectListInclude] | None, Query()] = None,
+) -> list[ProjectListItemRead]:
     """List all projects accessible by the current user.
 
     Includes:
@@ -69,19 +103,69 @@ async def list_projects(
     - Projects where user is a member
     - Public projects
 
+    Pass ``include=permissions`` and/or ``include=bookmark`` to also return
+    the current user's permissions and bookmark state on every project,
+    resolved in the same query as the list. Document count and last
+    activity are always returned from denormalized project columns.
+
+    When a full page is returned, the ``X-Next-Cursor`` response header
+    holds a cursor for the next page. Passing it back as ``cursor`` pages
+    by keyset, which stays fast on deep pages unlike ``skip``.
+
     Args:
+        response: Response used to set the next-page cursor header.
         current_user: The authenticated user.
         project_service: Project service.
         skip: Number of records to skip (pagination).
         limit: Maximum number of records to return.
+        cursor: Opaque cursor from a previous ``X-Next-Cursor`` header.
+        include: Optional extra data to include per project.
 
     Returns:
         List of accessible projects.
+
+    Raises:
+        HTTPException: If the cursor is malformed.
     """
-    projects = await project_service.get_accessible_projects(
-        current_user.id, skip=skip, limit=limit
-    )
-    return [ProjectRead.model_validate(p) for p in projects]
+    try:
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    if include:
+        entries = await project_service.get_accessible_projects_enriched(
+            current_user.id, skip=skip, limit=limit, cursor=position
+        )
+        items = [
+            ProjectListItemRead.model_validate(access.project).model_copy(
+                update={
+                    "permissions": (
+                        _permissions_read(access)
+                        if ProjectListInclude.PERMISSIONS in include
+                        else None
+                    ),
+                    "is_bookmarked": (
+                        is_bookmarked
+                        if ProjectListInclude.BOOKMARK in include
+                        else None
+                    ),
+                }
+            )
+            for access, is_bookmarked in entries
+        ]
+    else:
+        projects = await project_service.get_accessible_projects(
+            current_user.id, skip=skip, limit=limit, cursor=position
+        )
+        items = [ProjectListItemRead.model_validate(p) for p in projects]
+
+    if len(items) == limit:
+        last = items[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+    return items
 
 
 @router.post("", response_model=ProjectRead, status_code=status.HTTP_201_CREATED)
@@ -118,7 +202,6 @@ async def get_project(
     slug: str,
     current_user: Annotated[User, Depends(get_current_active_user)],
     project_service: Annotated[ProjectService, Depends(get_project_service)],
-    member_repo: Annotated[ProjectMemberRepository, Depends(get_member_repo)],
 ) -> ProjectRead:
     """Get a project by slug.
 
@@ -126,7 +209,6 @@ async def get_project(
         slug: The project slug.
         current_user: The authenticated user.
         project_service: Project service.
-        member_repo: Project member repository.
 
     Returns:
         The project.
@@ -135,19 +217,16 @@ async def get_project(
         HTTPException: If project is not found or user does not have access.
     """
     try:
-        project = await project_service.get_project_by_slug(slug)
+        access = await project_service.get_project_access(slug, current_user.id)
 
-        # Check view permission using authorization helper
-        has_permission = await check_project_permission(
-            project, current_user.id, Permission.VIEW, member_repo
-        )
-        if not has_permission:
+        # Check view permission using the preloaded role
+        if not access.has_permission(Permission.VIEW):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You do not have permission to view this project",
             )
 
-        return ProjectRead.model_validate(project)
+        return ProjectRead.model_validate(access.project)
     except ProjectNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -191,24 +270,78 @@ async def update_project(
         ) from e
 
 
-@router.delete("/{slug}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{slug}",
+    response_model=ProjectDeletionRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def delete_project(
     slug: str,
+    background_tasks: BackgroundTasks,
     current_user: Annotated[User, Depends(get_current_active_user)],
     project_service: Annotated[ProjectService, Depends(get_project_service)],
-) -> None:
+) -> ProjectDeletionRead:
     """Delete a project.
 
+    The project is hidden immediately and its data is removed by a
+    background job. Progress is available from ``GET /{slug}/deletion``.
+
     Args:
         slug: The project slug.
+        background_tasks: Background task queue for the deletion job.
         current_user: The authenticated user.
         project_service: Project service.
 
+    Returns:
+        Initial deletion status.
+
     Raises:
         HTTPException: If project is not found or user is not the owner.
     """
     try:
-        await project_service.delete_project(slug, current_user.id)
+        project = await project_service.delete_project(slug, current_user.id)
+    except ProjectNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+    except PermissionDeniedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e),
+        ) from e
+
+    background_tasks.add_task(run_project_deletion, project.id)
+    return ProjectDeletionRead(
+        project_id=project.id, status=ProjectDeletionStatus.PENDING
+    )
+
+
+@router.get("/{slug}/deletion", response_model=ProjectDeletionRead)
+async def get_project_deletion(
+    slug: str,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    deletion_service: Annotated[
+        ProjectDeletionService, Depends(get_project_deletion_service)
+    ],
+) -> ProjectDeletionRead:
+    """Get progress of a pending project deletion.
+
+    Returns 404 once the deletion has completed.
+
+    Args:
+        slug: The project slug.
+        current_user: The authenticated user.
+        deletion_service: Project deletion service.
+
+    Returns:
+        Deletion progress.
+
+    Raises:
+        HTTPException: If no deletion is pending or user is not the owner.
+    """
+    try:
+        return await deletion_service.get_status(slug, current_user.id)
     except ProjectNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -226,7 +359,6 @@ async def get_project_permissions(
     slug: str,
     current_user: Annotated[User, Depends(get_current_active_user)],
     project_service: Annotated[ProjectService, Depends(get_project_service)],
-    member_repo: Annotated[ProjectMemberRepository, Depends(get_member_repo)],
 ) -> ProjectPermissionsRead:
     """Get the current user's permissions on a project.
 
@@ -239,7 +371,6 @@ async def get_project_permissions(
         slug: The project slug.
         current_user: The authenticated user.
         project_service: Project service.
-        member_repo: Project member repository.
 
     Returns:
         User's permissions and role on the project.
@@ -248,22 +379,8 @@ async def get_project_permissions(
         HTTPException: If project is not found.
     """
     try:
-        project = await project_service.get_project_by_slug(slug)
-
-        # Get user permissions using authorization helper
-        permissions = await get_user_permissions(project, current_user.id, member_repo)
-
-        # Determine user's role
-        if project.owner_id == current_user.id:
-            role = "owner"
-        else:
-            member_role = await member_repo.get_user_role(project.id, current_user.id)
-            role = member_role.value if member_role else None
-
-        return ProjectPermissionsRead(
-            permissions=[p.value for p in permissions],
-            role=role,
-        )
+        access = await project_service.get_project_access(slug, current_user.id)
+        return _permissions_read(access)
     except ProjectNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,33 +1,82 @@
 """Upload endpoints."""
 
-from typing import Annotated
+from typing import Annotated, Literal
+from urllib.parse import quote
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, Path, UploadFile, status
-from fastapi.responses import Response
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import (
+    FileResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_active_user
+from app.api.deps import get_current_active_user, get_current_admin_user
+from app.config import settings
 from app.core.database import get_db
+from app.core.http_cache import format_http_date, is_not_modified
+from app.core.image_pool import image_pool
 from app.core.storage import get_storage_provider
+from app.core.upload_cache import upload_file_cache
 from app.models.user import User
 from app.repositories.project import ProjectRepository
-from app.repositories.project_member import ProjectMemberRepository
+from app.repositories.storage_usage import StorageUsageRepository
 from app.repositories.upload import UploadRepository
-from app.schemas.upload import UploadCreateResponse, UploadRead
-from app.services.authorization import Permission, check_project_permission
+from app.repositories.upload_gc import UploadGCRepository
+from app.schemas.upload import (
+    DirectUploadCreate,
+    DirectUploadRead,
+    DirectUploadTicket,
+    ProjectStorageUsageRead,
+    UploadCreateResponse,
+    UploadGCRead,
+    UploadGCStatus,
+    UploadRead,
+    UploadStorageStatsRead,
+)
+from app.services.authorization import Permission, get_project_access_by_id
 from app.services.exceptions import (
+    DirectUploadNotFoundError,
+    DirectUploadStateError,
     FileTooLargeError,
+    ImageProcessingUnavailableError,
+    ImageTooLargeError,
     InvalidFileTypeError,
+    InvalidVariantError,
     PermissionDeniedError,
+    ProjectNotFoundError,
     StorageError,
+    StorageQuotaExceededError,
     UploadNotFoundError,
 )
 from app.services.image_processor import ImageProcessor
-from app.services.upload import UploadService
+from app.services.storage_usage import StorageUsageService
+from app.services.upload import (
+    RESUMABLE_CONTENT_TYPE,
+    UploadService,
+    run_direct_upload_finalization,
+)
+from app.services.upload_gc import UploadGCService, run_upload_gc
 
 router = APIRouter(tags=["uploads"])
 
+# Sent with resumable upload responses; the protocol follows tus 1.0.0
+RESUMABLE_HEADERS = {"Tus-Resumable": "1.0.0"}
+
 
 def get_upload_service(db: AsyncSession = Depends(get_db)) -> UploadService:
     """Dependency to get UploadService instance.
@@ -42,17 +91,72 @@ def get_upload_service(db: AsyncSession = Depends(get_db)) -> UploadService:
         upload_repo=UploadRepository(db),
         storage=get_storage_provider(),
         image_processor=ImageProcessor(),
+        image_pool=image_pool,
+        file_cache=upload_file_cache,
+    )
+
+
+def get_upload_gc_service(db: AsyncSession = Depends(get_db)) -> UploadGCService:
+    """Dependency to get UploadGCService instance.
+
+    Args:
+        db: Database session.
+
+    Returns:
+        UploadGCService instance.
+    """
+    return UploadGCService(
+        UploadGCRepository(db), get_storage_provider(), upload_file_cache
     )
 
 
+def get_storage_usage_service(
+    db: AsyncSession = Depends(get_db),
+) -> StorageUsageService:
+    """Dependency to get StorageUsageService instance.
+
+    Args:
+        db: Database session.
+
+    Returns:
+        StorageUsageService instance.
+    """
+    return StorageUsageService(StorageUsageRepository(db))
+
+
 def get_project_repo(db: AsyncSession = Depends(get_db)) -> ProjectRepository:
     """Dependency to get ProjectRepository instance."""
     return ProjectRepository(db)
 
 
-def get_member_repo(db: AsyncSession = Depends(get_db)) -> ProjectMemberRepository:
-    """Dependency to get ProjectMemberRepository instance."""
-    return ProjectMemberRepository(db)
+async def _check_upload_permission(
+    project_repo: ProjectRepository, project_id: UUID, user: User
+) -> None:
+    """Check the project exists and the user may upload to it.
+
+    Args:
+        project_repo: Project repository.
+        project_id: UUID of the project.
+        user: The authenticated user.
+
+    Raises:
+        HTTPException: If project is not found or user lacks EDIT permission.
+    """
+    # Check project exists (loads the caller's member role in the same query)
+    try:
+        access = await get_project_access_by_id(project_repo, project_id, user.id)
+    except ProjectNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        ) from e
+
+    # Check permission (need EDIT permission to upload)
+    if not access.has_permission(Permission.EDIT):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to upload to this project",
+        )
 
 
 @router.post(
@@ -66,7 +170,6 @@ async def upload_image(
     current_user: Annotated[User, Depends(get_current_active_user)],
     upload_service: Annotated[UploadService, Depends(get_upload_service)],
     project_repo: Annotated[ProjectRepository, Depends(get_project_repo)],
-    member_repo: Annotated[ProjectMemberRepository, Depends(get_member_repo)],
 ) -> UploadCreateResponse:
     """Upload an image to a project.
 
@@ -80,7 +183,6 @@ async def upload_image(
         current_user: The authenticated user.
         upload_service: Upload service.
         project_repo: Project repository.
-        member_repo: Project member repository.
 
     Returns:
         Upload metadata including URL.
@@ -88,23 +190,7 @@ async def upload_image(
     Raises:
         HTTPException: Various HTTP errors for validation failures.
     """
-    # Check project exists
-    project = await project_repo.get_by_id(project_id)
-    if project is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
-
-    # Check permission (need EDIT permission to upload)
-    has_permission = await check_project_permission(
-        project, current_user.id, Permission.EDIT, member_repo
-    )
-    if not has_permission:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to upload to this project",
-        )
+    await _check_upload_permission(project_repo, project_id, current_user)
 
     try:
         upload = await upload_service.upload_image(
@@ -118,14 +204,290 @@ async def upload_image(
             filename=upload.filename,
             mime_type=upload.mime_type,
             size_bytes=upload.size_bytes,
+            width=upload.width,
+            height=upload.height,
+            placeholder=upload.placeholder,
             url=upload_service.get_url(upload),
             created_at=upload.created_at,
         )
+    except (FileTooLargeError, ImageTooLargeError, StorageQuotaExceededError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        ) from e
+    except InvalidFileTypeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=str(e),
+        ) from e
+    except ImageProcessingUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        ) from e
+    except StorageError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Storage error: {e}",
+        ) from e
+
+
+@router.post(
+    "/projects/{project_id}/uploads/direct",
+    response_model=DirectUploadTicket,
+    status_code=status.HTTP_201_CREATED,
+)
+async def start_direct_upload(
+    project_id: Annotated[UUID, Path(description="Project UUID")],
+    body: DirectUploadCreate,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    upload_service: Annotated[UploadService, Depends(get_upload_service)],
+    project_repo: Annotated[ProjectRepository, Depends(get_project_repo)],
+) -> DirectUploadTicket:
+    """Start an upload whose file is sent straight to storage.
+
+    1. Call this endpoint with the file's name, type and exact size.
+    2. Send the file as the body of a PUT to ``upload_url`` with the
+       returned headers, before ``expires_at``.
+    3. Call ``POST /uploads/direct/{id}/complete``. The file is validated
+       and processed in the background; poll ``GET /uploads/direct/{id}``
+       for the created upload.
+
+    With object storage the file goes to the bucket directly and never
+    passes through the API.
+
+    Args:
+        project_id: UUID of the project.
+        body: Declared file name, type and size.
+        current_user: The authenticated user.
+        upload_service: Upload service.
+        project_repo: Project repository.
+
+    Returns:
+        Where and how to send the file.
+
+    Raises:
+        HTTPException: If access is denied or the file is not accepted.
+    """
+    await _check_upload_permission(project_repo, project_id, current_user)
+
+    try:
+        return await upload_service.start_direct_upload(
+            user_id=current_user.id,
+            project_id=project_id,
+            filename=body.filename,
+            mime_type=body.mime_type,
+            size_bytes=body.size_bytes,
+        )
+    except (FileTooLargeError, StorageQuotaExceededError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        ) from e
+    except InvalidFileTypeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=str(e),
+        ) from e
+    except StorageError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Storage error: {e}",
+        ) from e
+
+
+@router.put(
+    "/uploads/direct/{token}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def receive_direct_upload(
+    token: Annotated[str, Path(description="Direct upload token")],
+    request: Request,
+    upload_service: Annotated[UploadService, Depends(get_upload_service)],
+) -> None:
+    """Receive the file of a direct upload when storage takes no uploads.
+
+    The ``upload_url`` of a direct upload points here with local storage.
+    The body is the raw file, written to storage as it arrives. The token
+    authorizes the request, so no Authorization header is needed.
+
+    Args:
+        token: Direct upload token.
+        request: The request, whose body is streamed.
+        upload_service: Upload service.
+
+    Raises:
+        HTTPException: If the token is invalid or the body is not accepted.
+    """
+    try:
+        await upload_service.receive_direct_upload(token, request.stream())
+    except DirectUploadNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+    except DirectUploadStateError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        ) from e
     except FileTooLargeError as e:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail=str(e),
         ) from e
+    except StorageError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Storage error: {e}",
+        ) from e
+
+
+@router.post(
+    "/uploads/direct/{token}/complete",
+    response_model=DirectUploadRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def complete_direct_upload(
+    token: Annotated[str, Path(description="Direct upload token")],
+    background_tasks: BackgroundTasks,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    upload_service: Annotated[UploadService, Depends(get_upload_service)],
+) -> DirectUploadRead:
+    """Finish a direct upload once its file has been sent.
+
+    The file is validated and processed by a background job. Progress is
+    available from ``GET /uploads/direct/{token}``.
+
+    Args:
+        token: Direct upload token.
+        background_tasks: Background task queue for the processing job.
+        current_user: The authenticated user.
+        upload_service: Upload service.
+
+    Returns:
+        State of the upload.
+
+    Raises:
+        HTTPException: If the upload is not found, belongs to another user
+            or its file has not arrived.
+    """
+    try:
+        result = await upload_service.complete_direct_upload(token, current_user.id)
+    except DirectUploadNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+    except PermissionDeniedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e),
+        ) from e
+    except DirectUploadStateError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        ) from e
+    except StorageError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Storage error: {e}",
+        ) from e
+
+    background_tasks.add_task(run_direct_upload_finalization, token)
+    return result
+
+
+@router.get("/uploads/direct/{token}", response_model=DirectUploadRead)
+async def get_direct_upload(
+    token: Annotated[str, Path(description="Direct upload token")],
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    upload_service: Annotated[UploadService, Depends(get_upload_service)],
+) -> DirectUploadRead:
+    """Get the state of a direct upload.
+
+    Args:
+        token: Direct upload token.
+        current_user: The authenticated user.
+        upload_service: Upload service.
+
+    Returns:
+        State of the upload, with the created upload once completed.
+
+    Raises:
+        HTTPException: If the upload is not found or belongs to another user.
+    """
+    try:
+        return await upload_service.get_direct_upload_status(token, current_user.id)
+    except DirectUploadNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+    except PermissionDeniedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e),
+        ) from e
+
+
+@router.post(
+    "/projects/{project_id}/uploads/resumable",
+    response_model=DirectUploadTicket,
+    status_code=status.HTTP_201_CREATED,
+)
+async def start_resumable_upload(
+    project_id: Annotated[UUID, Path(description="Project UUID")],
+    body: DirectUploadCreate,
+    response: Response,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    upload_service: Annotated[UploadService, Depends(get_upload_service)],
+    project_repo: Annotated[ProjectRepository, Depends(get_project_repo)],
+) -> DirectUploadTicket:
+    """Start an upload that is sent in chunks and survives dropped connections.
+
+    Modelled on the tus protocol:
+
+    1. Call this endpoint with the file's name, type and exact size.
+    2. Send the file in chunks as PATCH requests to ``upload_url``, each
+       with an ``Upload-Offset`` header giving where the chunk starts and
+       ``Content-Type: application/offset+octet-stream``. After an error,
+       ``HEAD upload_url`` returns the ``Upload-Offset`` to continue from.
+    3. Call ``POST /uploads/direct/{id}/complete`` and poll
+       ``GET /uploads/direct/{id}`` as for a direct upload.
+
+    Args:
+        project_id: UUID of the project.
+        body: Declared file name, type and size.
+        response: Response used to set the Location header.
+        current_user: The authenticated user.
+        upload_service: Upload service.
+        project_repo: Project repository.
+
+    Returns:
+        Where and how to send the chunks.
+
+    Raises:
+        HTTPException: If access is denied or the file is not accepted.
+    """
+    await _check_upload_permission(project_repo, project_id, current_user)
+
+    try:
+        ticket = await upload_service.start_direct_upload(
+            user_id=current_user.id,
+            project_id=project_id,
+            filename=body.filename,
+            mime_type=body.mime_type,
+            size_bytes=body.size_bytes,
+            resumable=True,
+        )
+    except (FileTooLargeError, StorageQuotaExceededError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        ) from e
     except InvalidFileTypeError as e:
         raise HTTPException(
             status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
@@ -137,6 +499,240 @@ async def upload_image(
             detail=f"Storage error: {e}",
         ) from e
 
+    response.headers["Location"] = ticket.upload_url
+    return ticket
+
+
+@router.head("/uploads/resumable/{token}")
+async def get_resumable_upload_offset(
+    token: Annotated[str, Path(description="Direct upload token")],
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    upload_service: Annotated[UploadService, Depends(get_upload_service)],
+) -> Response:
+    """Get how much of a resumable upload has been received.
+
+    Args:
+        token: Direct upload token.
+        current_user: The authenticated user.
+        upload_service: Upload service.
+
+    Returns:
+        Empty response with ``Upload-Offset`` and ``Upload-Length`` headers.
+
+    Raises:
+        HTTPException: If the upload is not found or belongs to another user.
+    """
+    try:
+        offset, length = await upload_service.get_resumable_offset(
+            token, current_user.id
+        )
+    except DirectUploadNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+    except PermissionDeniedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e),
+        ) from e
+
+    return Response(
+        headers={
+            **RESUMABLE_HEADERS,
+            "Upload-Offset": str(offset),
+            "Upload-Length": str(length),
+            "Cache-Control": "no-store",
+        }
+    )
+
+
+@router.patch(
+    "/uploads/resumable/{token}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def append_resumable_upload_chunk(
+    token: Annotated[str, Path(description="Direct upload token")],
+    upload_offset: Annotated[int, Header(alias="Upload-Offset", ge=0)],
+    request: Request,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    upload_service: Annotated[UploadService, Depends(get_upload_service)],
+) -> Response:
+    """Receive the next chunk of a resumable upload.
+
+    The body is written to storage as it arrives. ``Upload-Offset`` must
+    equal the bytes received so far; a chunk cut off part way is
+    discarded and must be sent again from the offset returned by HEAD.
+
+    Args:
+        token: Direct upload token.
+        upload_offset: Offset the chunk starts at.
+        request: The request, whose body is streamed.
+        current_user: The authenticated user.
+        upload_service: Upload service.
+
+    Returns:
+        Empty response with the new ``Upload-Offset`` header.
+
+    Raises:
+        HTTPException: If the upload is not found or belongs to another
+            user, the offset is wrong, or the chunk is not accepted.
+    """
+    if request.headers.get("content-type") != RESUMABLE_CONTENT_TYPE:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Chunks must be sent as {RESUMABLE_CONTENT_TYPE}",
+        )
+
+    try:
+        offset = await upload_service.append_resumable_chunk(
+            token, current_user.id, upload_offset, request.stream()
+        )
+    except DirectUploadNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+    except PermissionDeniedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e),
+        ) from e
+    except DirectUploadStateError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        ) from e
+    except FileTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        ) from e
+    except StorageError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Storage error: {e}",
+        ) from e
+
+    return Response(
+        status_code=status.HTTP_204_NO_CONTENT,
+        headers={**RESUMABLE_HEADERS, "Upload-Offset": str(offset)},
+    )
+
+
+@router.get("/uploads/stats", response_model=UploadStorageStatsRead)
+async def get_upload_storage_stats(
+    _admin: Annotated[User, Depends(get_current_admin_user)],
+    upload_service: Annotated[UploadService, Depends(get_upload_service)],
+) -> UploadStorageStatsRead:
+    """Report storage saved by deduplicating identical uploads.
+
+    Only system administrators can view storage statistics.
+
+    Args:
+        _admin: The authenticated admin user.
+        upload_service: Upload service.
+
+    Returns:
+        Uploaded and stored byte totals.
+    """
+    return await upload_service.get_storage_stats()
+
+
+@router.get("/uploads/stats/projects", response_model=list[ProjectStorageUsageRead])
+async def get_project_storage_usage(
+    _admin: Annotated[User, Depends(get_current_admin_user)],
+    usage_service: Annotated[StorageUsageService, Depends(get_storage_usage_service)],
+    limit: Annotated[
+        int, Query(ge=1, le=200, description="Maximum number of projects")
+    ] = 50,
+) -> list[ProjectStorageUsageRead]:
+    """List the projects using the most storage.
+
+    Totals are maintained as content is written and recounted
+    periodically. Only system administrators can view storage usage.
+
+    Args:
+        _admin: The authenticated admin user.
+        usage_service: Storage usage service.
+        limit: Maximum number of projects.
+
+    Returns:
+        Storage usage per project, largest first.
+    """
+    return await usage_service.get_largest_projects(limit)
+
+
+@router.post(
+    "/uploads/gc",
+    response_model=UploadGCRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def collect_orphaned_uploads(
+    background_tasks: BackgroundTasks,
+    _admin: Annotated[User, Depends(get_current_admin_user)],
+    gc_service: Annotated[UploadGCService, Depends(get_upload_gc_service)],
+    dry_run: Annotated[
+        bool, Query(description="Only report the uploads that would be deleted")
+    ] = True,
+) -> UploadGCRead:
+    """Start collecting uploads no document or revision links to.
+
+    Uploads older than the grace period whose file no document or
+    revision references are deleted by a background job. Progress and the
+    report are available from ``GET /uploads/gc``. Only system
+    administrators can collect uploads.
+
+    Args:
+        background_tasks: Background task queue for the collection job.
+        _admin: The authenticated admin user.
+        gc_service: Orphaned upload collector.
+        dry_run: Only report what would be deleted.
+
+    Returns:
+        Initial job status.
+
+    Raises:
+        HTTPException: If a collection is already running.
+    """
+    current = await gc_service.get_status()
+    if current is not None and current.status == UploadGCStatus.RUNNING:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="An upload collection is already running",
+        )
+
+    background_tasks.add_task(run_upload_gc, dry_run)
+    return UploadGCRead(status=UploadGCStatus.PENDING, dry_run=dry_run)
+
+
+@router.get("/uploads/gc", response_model=UploadGCRead)
+async def get_orphaned_upload_collection(
+    _admin: Annotated[User, Depends(get_current_admin_user)],
+    gc_service: Annotated[UploadGCService, Depends(get_upload_gc_service)],
+) -> UploadGCRead:
+    """Get progress or the report of the latest upload collection.
+
+    Only system administrators can view upload collections.
+
+    Args:
+        _admin: The authenticated admin user.
+        gc_service: Orphaned upload collector.
+
+    Returns:
+        Job progress and counts.
+
+    Raises:
+        HTTPException: If no collection has run recently.
+    """
+    result = await gc_service.get_status()
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No upload collection has run recently",
+        )
+    return result
+
 
 @router.get("/uploads/{upload_id}", response_model=UploadRead)
 async def get_upload(
@@ -144,7 +740,6 @@ async def get_upload(
     current_user: Annotated[User, Depends(get_current_active_user)],
     upload_service: Annotated[UploadService, Depends(get_upload_service)],
     project_repo: Annotated[ProjectRepository, Depends(get_project_repo)],
-    member_repo: Annotated[ProjectMemberRepository, Depends(get_member_repo)],
 ) -> UploadRead:
     """Get upload metadata by ID.
 
@@ -153,7 +748,6 @@ async def get_upload(
         current_user: The authenticated user.
         upload_service: Upload service.
         project_repo: Project repository.
-        member_repo: Project member repository.
 
     Returns:
         Upload metadata.
@@ -166,16 +760,14 @@ async def get_upload(
 
         # Check project permission if project-specific upload
         if upload.project_id:
-            project = await project_repo.get_by_id(upload.project_id)
-            if project:
-                has_permission = await check_project_permission(
-                    project, current_user.id, Permission.VIEW, member_repo
+            access = await get_project_access_by_id(
+                project_repo, upload.project_id, current_user.id
+            )
+            if not access.has_permission(Permission.VIEW):
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="You don't have permission to view this upload",
                 )
-                if not has_permission:
-                    raise HTTPException(
-                        status_code=status.HTTP_403_FORBIDDEN,
-                        detail="You don't have permission to view this upload",
-                    )
 
         return UploadRead(
             id=upload.id,
@@ -184,10 +776,13 @@ async def get_upload(
             filename=upload.filename,
             mime_type=upload.mime_type,
             size_bytes=upload.size_bytes,
+            width=upload.width,
+            height=upload.height,
+            placeholder=upload.placeholder,
             created_at=upload.created_at,
             url=upload_service.get_url(upload),
         )
-    except UploadNotFoundError as e:
+    except (UploadNotFoundError, ProjectNotFoundError) as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
@@ -229,33 +824,114 @@ async def delete_upload(
 @router.get("/uploads/file/{storage_path:path}")
 async def serve_file(
     storage_path: Annotated[str, Path(description="Storage path of the file")],
+    request: Request,
     upload_service: Annotated[UploadService, Depends(get_upload_service)],
+    w: Annotated[
+        int | None, Query(description="Width of a resized variant", gt=0)
+    ] = None,
+    video: Annotated[
+        Literal["mp4", "webm"] | None,
+        Query(description="Serve a GIF as video of this type"),
+    ] = None,
 ) -> Response:
     """Serve uploaded file content.
 
-    Note: In production, this should be handled by a CDN or reverse proxy
-    for better performance.
+    Local files are streamed from disk (sendfile where the server supports
+    it) with byte-range support. Conditional requests are answered with
+    304 Not Modified. With ``UPLOAD_SERVE_MODE=x-accel`` the transfer is
+    handed to nginx via ``X-Accel-Redirect``. Files in object storage are
+    served by a redirect to a presigned URL, or streamed through when
+    presigned downloads are disabled.
+
+    With ``w``, a variant resized to that width is served instead, as AVIF
+    or WebP when the Accept header allows it and JPEG/PNG otherwise.
+
+    GIFs are served as animated WebP when the Accept header allows it, or
+    as MP4/WebM with ``video`` where ffmpeg is available. The original GIF
+    is served when no smaller transcode can be made.
 
     Args:
         storage_path: Storage path of the file.
+        request: Incoming request.
         upload_service: Upload service.
+        w: Optional variant width, one of ``UPLOAD_VARIANT_WIDTHS``.
+        video: Optional video type for GIFs.
 
     Returns:
         File content as HTTP response.
 
     Raises:
-        HTTPException: If file not found.
+        HTTPException: If file not found, the width is not offered, or the
+            variant cannot be generated right now.
     """
     try:
-        content, mime_type = await upload_service.get_file_content_by_path(storage_path)
-
-        return Response(
-            content=content,
-            media_type=mime_type,
-            headers={
-                "Cache-Control": "public, max-age=31536000",  # 1 year cache
-            },
+        accept = request.headers.get("accept", "")
+        if w is None:
+            info = await upload_service.get_animation(storage_path, accept, video)
+        else:
+            info = await upload_service.get_variant(storage_path, w, accept)
+        headers = {
+            "Cache-Control": "public, max-age=31536000",  # 1 year cache
+            "ETag": info.etag,
+            "Last-Modified": format_http_date(info.last_modified),
+        }
+        if (
+            w is not None
+            or info.storage_path != storage_path
+            or info.mime_type == "image/gif"
+        ):
+            headers["Vary"] = "Accept"
+
+        if is_not_modified(request.headers, info.etag, info.last_modified):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        if settings.upload_serve_mode == "x-accel" and settings.storage_type == "local":
+            headers["X-Accel-Redirect"] = settings.upload_x_accel_prefix + quote(
+                info.storage_path
+            )
+            return Response(media_type=info.mime_type, headers=headers)
+
+        local_file = await upload_service.get_local_file(info.storage_path)
+        if local_file is not None:
+            path, stat_result = local_file
+            return FileResponse(
+                path,
+                stat_result=stat_result,
+                media_type=info.mime_type,
+                headers=headers,
+            )
+
+        download_url = upload_service.get_download_url(info.storage_path)
+        if download_url is not None:
+            # The signed URL expires, so caches may only keep the redirect
+            # for part of its lifetime
+            return RedirectResponse(
+                download_url,
+                status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+                headers={
+                    "Cache-Control": "private, max-age="
+                    f"{settings.s3_presign_expires_seconds // 2}",
+                    **({"Vary": headers["Vary"]} if "Vary" in headers else {}),
+                },
+            )
+
+        headers["Content-Length"] = str(info.size_bytes)
+        return StreamingResponse(
+            upload_service.stream_file(info.storage_path),
+            media_type=info.mime_type,
+            headers=headers,
         )
+    except InvalidVariantError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    except ImageProcessingUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        ) from e
     except UploadNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -2,14 +2,19 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
+from app.api.deps import (
+    get_current_active_user,
+    get_current_admin_user,
+    get_current_user,
+)
 from app.core.database import get_db
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
 from app.models.user import User
 from app.repositories.user import UserRepository
-from app.schemas.user import UserProfileUpdate, UserRead
+from app.schemas.user import UserProfileUpdate, UserRead, UserSummaryRead
 from app.services.user import UserService
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -20,6 +25,72 @@ def get_user_service(db: Annotated[AsyncSession, Depends(get_db)]) -> UserServic
     return UserService(UserRepository(db))
 
 
+@router.get("", response_model=list[UserRead])
+async def list_users(
+    response: Response,
+    _admin: Annotated[User, Depends(get_current_admin_user)],
+    service: Annotated[UserService, Depends(get_user_service)],
+    q: Annotated[str | None, Query(min_length=1, max_length=255)] = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 50,
+    cursor: Annotated[str | None, Query()] = None,
+) -> list[User]:
+    """List all users for the admin user directory.
+
+    Only system administrators can list users. ``q`` filters by name or
+    email (prefix or substring, case-insensitive). When a full page is
+    returned, the ``X-Next-Cursor`` header holds the cursor for the next
+    page.
+
+    Args:
+        response: Response used to set the next-page cursor header.
+        _admin: The authenticated admin user.
+        service: User service.
+        q: Optional name or email search text.
+        limit: Maximum number of records to return.
+        cursor: Opaque cursor from a previous ``X-Next-Cursor`` header.
+
+    Returns:
+        List of users, oldest first.
+
+    Raises:
+        HTTPException: If the cursor is malformed.
+    """
+    try:
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    users = await service.search_users(q, limit=limit, cursor=position)
+    if len(users) == limit:
+        last = users[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+    return users
+
+
+@router.get("/search", response_model=list[UserSummaryRead])
+async def search_users(
+    _current_user: Annotated[User, Depends(get_current_active_user)],
+    service: Annotated[UserService, Depends(get_user_service)],
+    q: Annotated[str, Query(min_length=2, max_length=255)],
+    limit: Annotated[int, Query(ge=1, le=20)] = 10,
+) -> list[User]:
+    """Search users by name or email, e.g. for the member invite dialog.
+
+    Args:
+        _current_user: The authenticated user.
+        service: User service.
+        q: Name or email search text (prefix or substring).
+        limit: Maximum number of records to return.
+
+    Returns:
+        Matching users with public profile fields only.
+    """
+    return await service.search_users(q, limit=limit)
+
+
 @router.patch("/me", response_model=UserRead)
 async def update_my_profile(
     data: UserProfileUpdate,
@@ -25,6 +25,18 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str = "redis://localhost:6379"
 
+    # Cache
+    project_cache_ttl_seconds: float = 30.0  # 0 disables the slug cache
+    upload_cache_ttl_seconds: float = 3600.0  # 0 disables the file metadata cache
+
+    # Background jobs
+    project_deletion_chunk_size: int = 500
+    upload_gc_grace_seconds: int = 7 * 24 * 3600  # unreferenced uploads kept
+    upload_gc_batch_size: int = 500
+    upload_gc_interval_seconds: float = 0  # 0 disables scheduled collection
+    storage_reconcile_interval_seconds: float = 86400  # 0 disables reconciliation
+    storage_reconcile_batch_size: int = 100  # projects locked per transaction
+
     # JWT
     jwt_secret_key: str = "your-secret-key-change-in-production"
     jwt_algorithm: str = "HS256"
@@ -41,10 +53,43 @@ class Settings(BaseSettings):
     ]
     upload_storage_path: str = "./storage/uploads"
     upload_max_dimension: int = 2048
+    upload_max_image_pixels: int = 50_000_000  # decoded width x height
+    upload_max_animation_pixels: int = 500_000_000  # width x height x frames
     upload_jpeg_quality: int = 85
     upload_webp_quality: int = 85
     upload_png_compression: int = 9
-    storage_type: str = "local"  # "local" | "s3" (future)
+    upload_avif_quality: int = 50
+    upload_variant_widths: list[int] = [320, 640, 1280]
+    upload_gif_transcode: bool = True  # serve GIFs as animated WebP / video
+    upload_ffmpeg_path: str = "ffmpeg"  # video encoding is skipped if missing
+    upload_direct_expires_seconds: int = 900  # validity of direct upload URLs
+    upload_direct_sweep_interval_seconds: float = 3600  # 0 disables the sweep
+    upload_resumable_expires_seconds: int = 86400  # time to send a resumable upload
+    upload_resumable_max_chunk_size: int = 8 * 1024 * 1024  # 8MB per PATCH
+    project_storage_quota_bytes: int = 0  # default per-project quota, 0 = none
+    image_processing_workers: int = 2  # processes per API worker
+    image_processing_max_queued: int = 16  # waiting jobs before rejecting
+    image_processing_timeout_seconds: float = 30.0
+    storage_io_threads: int = 8  # local file I/O threads per API worker
+    storage_delete_concurrency: int = 16  # deletes in flight when bulk deleting
+    storage_type: str = "local"  # "local" | "s3"
+    upload_serve_mode: str = "stream"  # "stream" | "x-accel"
+    upload_x_accel_prefix: str = "/internal/uploads/"
+
+    # S3-compatible object storage (storage_type = "s3")
+    s3_endpoint_url: str = ""  # e.g. http://minio:9000; empty for AWS S3
+    s3_public_endpoint_url: str = ""  # endpoint as clients reach it, if different
+    s3_region: str = "us-east-1"
+    s3_bucket: str = ""
+    s3_access_key_id: str = ""
+    s3_secret_access_key: str = ""
+    s3_path_style: bool = True  # bucket in the path (MinIO) or the host name
+    s3_max_connections: int = 64  # pooled connections per API worker
+    s3_multipart_threshold: int = 16 * 1024 * 1024  # 16MB
+    s3_multipart_part_size: int = 8 * 1024 * 1024  # 8MB, at least 5MB
+    s3_multipart_concurrency: int = 4  # parts uploaded at once per object
+    s3_presign_downloads: bool = True  # redirect downloads to object storage
+    s3_presign_expires_seconds: int = 3600
 
 
 settings = Settings()
@@ -0,0 +1,55 @@
+"""HTTP conditional request helpers."""
+
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from starlette.datastructures import Headers
+
+
+def format_http_date(value: datetime) -> str:
+    """Format a timestamp as an HTTP date (RFC 9110).
+
+    Args:
+        value: Timezone-aware timestamp.
+
+    Returns:
+        Date string such as ``Wed, 21 Oct 2026 07:28:00 GMT``.
+    """
+    return format_datetime(value, usegmt=True)
+
+
+def is_not_modified(headers: Headers, etag: str, last_modified: datetime) -> bool:
+    """Check whether a GET can be answered with 304 Not Modified.
+
+    If-None-Match takes precedence over If-Modified-Since, as required by
+    RFC 9110. ETags are compared weakly.
+
+    Args:
+        headers: Request headers.
+        etag: Quoted ETag of the current representation.
+        last_modified: Last modification time of the representation.
+
+    Returns:
+        True if the client's cached copy is still current.
+    """
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        candidates = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        return etag.removeprefix("W/") in candidates
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        # HTTP dates have one-second resolution
+        return last_modified.replace(microsecond=0) <= since
+
+    return False
@@ -0,0 +1,238 @@
+"""Process pool for CPU-bound image processing."""
+
+import asyncio
+import logging
+import multiprocessing
+import signal
+import time
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from app.config import settings
+from app.services.exceptions import ImageProcessingUnavailableError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Extra time the caller waits beyond the in-worker deadline, so the worker
+# normally reports the timeout itself and stays reusable
+_TIMEOUT_GRACE_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class ImageProcessingStats:
+    """Snapshot of image processing pool metrics for one API worker."""
+
+    workers: int
+    running: int
+    queued: int
+    completed: int
+    failed: int
+    rejected: int
+    timed_out: int
+    job_seconds_total: float
+    job_seconds_max: float
+
+
+def _run_with_deadline(timeout_seconds: float, fn: Callable[..., T], *args: Any) -> T:
+    """Run a job inside a worker process, aborting it after a deadline.
+
+    Args:
+        timeout_seconds: Seconds the job may run.
+        fn: Picklable callable to run.
+        *args: Arguments for fn.
+
+    Returns:
+        The result of fn.
+
+    Raises:
+        TimeoutError: If the job runs past the deadline.
+    """
+
+    def _expire(signum: int, frame: Any) -> None:
+        raise TimeoutError(f"Image processing exceeded {timeout_seconds}s")
+
+    previous = signal.signal(signal.SIGALRM, _expire)
+    signal.setitimer(signal.ITIMER_REAL, timeout_seconds)
+    try:
+        return fn(*args)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+class ImageProcessingPool:
+    """Bounded process pool that keeps image work off the event loop.
+
+    Jobs wait for one of ``max_workers`` slots; once ``max_queued`` jobs
+    are already waiting, new ones are rejected instead of piling up. A
+    job that runs past ``timeout_seconds`` is aborted in its worker.
+
+    Usage::
+
+        async with image_pool.slot():
+            content = await file.read()
+            result = await image_pool.run(processor.process_bytes, content, mime)
+
+    Reading the input inside the slot keeps at most ``max_workers`` inputs
+    in memory at a time.
+    """
+
+    def __init__(
+        self, max_workers: int, max_queued: int, timeout_seconds: float
+    ) -> None:
+        """Initialize the pool. Worker processes start on first use.
+
+        Args:
+            max_workers: Number of worker processes.
+            max_queued: Jobs allowed to wait for a worker before rejecting.
+            timeout_seconds: Time limit per job.
+        """
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.timeout_seconds = timeout_seconds
+        self._executor: ProcessPoolExecutor | None = None
+        self._slots = asyncio.Semaphore(max_workers)
+        self._running = 0
+        self._queued = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._job_seconds_total = 0.0
+        self._job_seconds_max = 0.0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait for a free worker slot.
+
+        Yields:
+            None, while the slot is held.
+
+        Raises:
+            ImageProcessingUnavailableError: If the queue is full.
+        """
+        if self._queued >= self.max_queued:
+            self._rejected += 1
+            raise ImageProcessingUnavailableError(
+                "Image processing is busy, please retry shortly"
+            )
+
+        self._queued += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._queued -= 1
+
+        self._running += 1
+        try:
+            yield
+        finally:
+            self._running -= 1
+            self._slots.release()
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a job in a worker process. Call it while holding slot().
+
+        Args:
+            fn: Picklable callable to run.
+            *args: Picklable arguments for fn.
+
+        Returns:
+            The result of fn.
+
+        Raises:
+            ImageProcessingUnavailableError: If the job times out or the
+                worker process dies.
+        """
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(
+                loop.run_in_executor(
+                    self._get_executor(),
+                    _run_with_deadline,
+                    self.timeout_seconds,
+                    fn,
+                    *args,
+                ),
+                self.timeout_seconds + _TIMEOUT_GRACE_SECONDS,
+            )
+        except TimeoutError as e:
+            self._timed_out += 1
+            raise ImageProcessingUnavailableError(
+                f"Image processing took longer than {self.timeout_seconds}s"
+            ) from e
+        except BrokenProcessPool as e:
+            self._failed += 1
+            logger.error("Image processing worker died, restarting pool")
+            self._reset_executor()
+            raise ImageProcessingUnavailableError(
+                "Image processing worker failed"
+            ) from e
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._record_duration(time.perf_counter() - started)
+
+        self._completed += 1
+        return result
+
+    def stats(self) -> ImageProcessingStats:
+        """Get a snapshot of the pool metrics.
+
+        Returns:
+            Current queue depth, job counters and job durations.
+        """
+        return ImageProcessingStats(
+            workers=self.max_workers,
+            running=self._running,
+            queued=self._queued,
+            completed=self._completed,
+            failed=self._failed,
+            rejected=self._rejected,
+            timed_out=self._timed_out,
+            job_seconds_total=self._job_seconds_total,
+            job_seconds_max=self._job_seconds_max,
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, cancelling jobs not yet started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get the process pool, starting it on first use."""
+        if self._executor is None:
+            # spawn: forking a process that runs an event loop and holds
+            # open connections is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _reset_executor(self) -> None:
+        """Drop a broken process pool so the next job starts a new one."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _record_duration(self, seconds: float) -> None:
+        """Add a finished job's duration to the metrics."""
+        self._job_seconds_total += seconds
+        self._job_seconds_max = max(self._job_seconds_max, seconds)
+
+
+image_pool = ImageProcessingPool(
+    max_workers=settings.image_processing_workers,
+    max_queued=settings.image_processing_max_queued,
+    timeout_seconds=settings.image_processing_timeout_seconds,
+)
@@ -0,0 +1,43 @@
+"""Keyset pagination cursor helpers."""
+
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor.
+
+    Args:
+        created_at: Creation timestamp of the last row on the page.
+        row_id: UUID of the last row on the page.
+
+    Returns:
+        URL-safe cursor string.
+    """
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode an opaque cursor back into a (created_at, id) position.
+
+    Args:
+        cursor: Cursor produced by encode_cursor.
+
+    Returns:
+        Tuple of (created_at, id).
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode()
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
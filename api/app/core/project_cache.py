@@ -0,0 +1,135 @@
+"""Process-local cache for project lookups by slug."""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Redis pub/sub channel carrying slugs of changed or deleted projects
+INVALIDATION_CHANNEL = "project_cache:invalidate"
+
+
+class ProjectCache:
+    """TTL cache of project column snapshots keyed by slug.
+
+    Entries are plain dicts of column values rather than ORM instances, so
+    they can be shared between sessions. Invalidation is immediate within
+    a process and propagated to other workers through Redis pub/sub; the
+    TTL bounds staleness if a message is missed.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10_000) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl_seconds: Lifetime of an entry. 0 disables caching.
+            max_entries: Maximum number of cached projects.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation.
+
+        Read it before loading a project from the database and pass it to
+        set(), so that a row loaded concurrently with an invalidation is
+        not cached.
+        """
+        return self._generation
+
+    def get(self, slug: str) -> dict[str, Any] | None:
+        """Get the cached column values of a project.
+
+        Args:
+            slug: The project slug.
+
+        Returns:
+            Column values if cached and not expired, None otherwise.
+        """
+        entry = self._entries.get(slug)
+        if entry is None:
+            return None
+        expires_at, values = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(slug, None)
+            return None
+        return values
+
+    def set(self, slug: str, values: dict[str, Any], generation: int) -> None:
+        """Cache the column values of a project.
+
+        Args:
+            slug: The project slug.
+            values: Column values of the project.
+            generation: Value of ``generation`` read before the project was
+                loaded. The entry is dropped if an invalidation happened since.
+        """
+        if self.ttl_seconds <= 0 or generation != self._generation:
+            return
+        if slug not in self._entries and len(self._entries) >= self.max_entries:
+            # Evict the oldest insertion
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[slug] = (time.monotonic() + self.ttl_seconds, values)
+
+    def discard(self, slug: str) -> None:
+        """Drop a project from this process's cache only.
+
+        Args:
+            slug: The project slug.
+        """
+        self._generation += 1
+        self._entries.pop(slug, None)
+
+    def clear(self) -> None:
+        """Drop every entry from this process's cache."""
+        self._generation += 1
+        self._entries.clear()
+
+    async def invalidate(self, slug: str) -> None:
+        """Drop a project from the cache of every worker.
+
+        Publishing is best effort: if Redis is unavailable, other workers
+        pick up the change once their entry expires.
+
+        Args:
+            slug: The project slug.
+        """
+        self.discard(slug)
+        try:
+            client = await get_redis()
+            await client.publish(INVALIDATION_CHANNEL, slug)
+        except (RedisError, OSError) as e:
+            logger.warning(f"Failed to publish project cache invalidation: {e}")
+
+    async def listen(self) -> None:
+        """Apply invalidations published by other workers until cancelled.
+
+        The local cache is cleared on every (re)subscribe, since messages
+        published while disconnected are lost.
+        """
+        while True:
+            try:
+                client = await get_redis()
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(INVALIDATION_CHANNEL)
+                    self.clear()
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self.discard(message["data"])
+            except (RedisError, OSError) as e:
+                logger.warning(f"Project cache invalidation listener failed: {e}")
+                self.clear()
+                await asyncio.sleep(1)
+
+
+project_cache = ProjectCache(settings.project_cache_ttl_seconds)
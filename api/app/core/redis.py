@@ -1,6 +1,7 @@
-"""Redis client for token blacklist management."""
+"""Redis client for token blacklist, upload sessions and background job state."""
 
 from datetime import timedelta
+from uuid import UUID
 
 import redis.asyncio as redis
 
@@ -12,6 +13,56 @@ redis_client: redis.Redis | None = None
 # Key prefix for token blacklist
 BLACKLIST_PREFIX = "token_blacklist:"
 
+# Key prefixes for project deletion jobs
+PROJECT_DELETION_PREFIX = "project_deletion:"
+PROJECT_DELETION_LOCK_PREFIX = "project_deletion_lock:"
+
+# How long deletion progress is kept after the last update
+PROJECT_DELETION_PROGRESS_TTL = timedelta(days=1)
+
+# Key prefixes for direct upload sessions
+DIRECT_UPLOAD_PREFIX = "direct_upload:"
+DIRECT_UPLOAD_LOCK_PREFIX = "direct_upload_lock:"
+
+# Sorted set of direct upload tokens scored by when their URL expires,
+# consumed by the sweep that deletes files of abandoned uploads
+DIRECT_UPLOAD_EXPIRY_KEY = "direct_upload_expiry"
+
+# How long a direct upload session is kept after its URL expires or, if
+# later, after the last update
+DIRECT_UPLOAD_TTL = timedelta(days=1)
+
+# Claims an existing session; HSETNX alone would recreate an expired key
+# without a TTL
+CLAIM_DIRECT_UPLOAD_SCRIPT = """
+if redis.call("exists", KEYS[1]) == 0 then
+    return -1
+end
+return redis.call("hsetnx", KEYS[1], "claimed", "1")
+"""
+
+# Claims an existing session and records why it failed, in one step
+EXPIRE_DIRECT_UPLOAD_SCRIPT = """
+if redis.call("exists", KEYS[1]) == 0 then
+    return -1
+end
+if redis.call("hsetnx", KEYS[1], "claimed", "1") == 0 then
+    return 0
+end
+redis.call("hset", KEYS[1], "status", ARGV[1], "error", ARGV[2])
+return 1
+"""
+
+# Keys for the orphaned upload collector, of which one job runs at a time
+UPLOAD_GC_KEY = "upload_gc"
+UPLOAD_GC_LOCK_KEY = "upload_gc_lock"
+
+# How long the last collection's report is kept
+UPLOAD_GC_PROGRESS_TTL = timedelta(days=7)
+
+# Key for the storage total reconciliation, of which one job runs at a time
+STORAGE_RECONCILE_LOCK_KEY = "storage_reconcile_lock"
+
 
 async def get_redis() -> redis.Redis:
     """Get or create Redis client.
@@ -62,3 +113,271 @@ async def is_token_blacklisted(token: str) -> bool:
     key = f"{BLACKLIST_PREFIX}{token}"
     result = await client.get(key)
     return result is not None
+
+
+async def set_project_deletion_progress(
+    project_id: UUID, progress: dict[str, str | int]
+) -> None:
+    """Store progress of a project deletion job.
+
+    Args:
+        project_id: The project being deleted.
+        progress: Fields to set (status, phase and per-table counters).
+    """
+    client = await get_redis()
+    key = f"{PROJECT_DELETION_PREFIX}{project_id}"
+    async with client.pipeline(transaction=True) as pipe:
+        pipe.hset(key, mapping=progress)
+        pipe.expire(key, PROJECT_DELETION_PROGRESS_TTL)
+        await pipe.execute()
+
+
+async def get_project_deletion_progress(project_id: UUID) -> dict[str, str]:
+    """Get progress of a project deletion job.
+
+    Args:
+        project_id: The project being deleted.
+
+    Returns:
+        Stored progress fields (empty if the job has not reported yet).
+    """
+    client = await get_redis()
+    return await client.hgetall(f"{PROJECT_DELETION_PREFIX}{project_id}")
+
+
+async def acquire_project_deletion_lock(project_id: UUID, ttl: timedelta) -> bool:
+    """Claim a project deletion job so that only one worker runs it.
+
+    Args:
+        project_id: The project being deleted.
+        ttl: Lock lifetime; lets another worker resume if this one dies.
+
+    Returns:
+        True if the lock was acquired, False if another worker holds it.
+    """
+    client = await get_redis()
+    key = f"{PROJECT_DELETION_LOCK_PREFIX}{project_id}"
+    return bool(await client.set(key, "1", ex=ttl, nx=True))
+
+
+async def release_project_deletion_lock(project_id: UUID) -> None:
+    """Release a project deletion job claim.
+
+    Args:
+        project_id: The project being deleted.
+    """
+    client = await get_redis()
+    await client.delete(f"{PROJECT_DELETION_LOCK_PREFIX}{project_id}")
+
+
+async def refresh_project_deletion_lock(project_id: UUID, ttl: timedelta) -> None:
+    """Extend a held project deletion job claim.
+
+    Args:
+        project_id: The project being deleted.
+        ttl: New lock lifetime from now.
+    """
+    client = await get_redis()
+    await client.expire(f"{PROJECT_DELETION_LOCK_PREFIX}{project_id}", ttl)
+
+
+async def set_direct_upload(token: str, fields: dict[str, str | int]) -> None:
+    """Create or update a direct upload session.
+
+    A session is kept for DIRECT_UPLOAD_TTL after its URL expires, and
+    updates only ever extend that. Setting ``expires_at`` also indexes
+    the session for sweep_expired_direct_uploads().
+
+    Args:
+        token: The session token.
+        fields: Fields to set (owner, declared file, status and result).
+    """
+    client = await get_redis()
+    key = f"{DIRECT_UPLOAD_PREFIX}{token}"
+    async with client.pipeline(transaction=True) as pipe:
+        pipe.hset(key, mapping=fields)
+        if "expires_at" in fields:
+            expires_at = int(fields["expires_at"])
+            pipe.expireat(key, expires_at + int(DIRECT_UPLOAD_TTL.total_seconds()))
+            pipe.zadd(DIRECT_UPLOAD_EXPIRY_KEY, {token: expires_at})
+        else:
+            pipe.expire(key, DIRECT_UPLOAD_TTL, gt=True)
+        await pipe.execute()
+
+
+async def get_direct_upload(token: str) -> dict[str, str]:
+    """Get a direct upload session.
+
+    Args:
+        token: The session token.
+
+    Returns:
+        Stored session fields (empty if the session is unknown or expired).
+    """
+    client = await get_redis()
+    return await client.hgetall(f"{DIRECT_UPLOAD_PREFIX}{token}")
+
+
+async def claim_direct_upload(token: str) -> bool:
+    """Claim a direct upload for finalisation so that it runs once.
+
+    Args:
+        token: The session token.
+
+    Returns:
+        True if the claim was taken, False if the upload was already
+        claimed or the session no longer exists.
+    """
+    client = await get_redis()
+    key = f"{DIRECT_UPLOAD_PREFIX}{token}"
+    return await client.eval(CLAIM_DIRECT_UPLOAD_SCRIPT, 1, key) == 1
+
+
+async def expire_direct_upload(token: str, status: str, error: str) -> bool | None:
+    """Claim an expired direct upload so that it is never finalised.
+
+    Args:
+        token: The session token.
+        status: Status recorded on the session.
+        error: Error recorded on the session.
+
+    Returns:
+        True if the upload was claimed and marked failed, False if it was
+        already claimed for finalisation, None if the session is gone.
+    """
+    client = await get_redis()
+    key = f"{DIRECT_UPLOAD_PREFIX}{token}"
+    result = await client.eval(EXPIRE_DIRECT_UPLOAD_SCRIPT, 1, key, status, error)
+    return None if result == -1 else result == 1
+
+
+async def get_expired_direct_uploads(expired_before: float, limit: int) -> list[str]:
+    """Get direct uploads whose URL expired before a time.
+
+    Args:
+        expired_before: Unix time the URLs must have expired by.
+        limit: Maximum number of tokens to return.
+
+    Returns:
+        Tokens of the expired uploads, oldest first.
+    """
+    client = await get_redis()
+    return await client.zrangebyscore(
+        DIRECT_UPLOAD_EXPIRY_KEY, "-inf", expired_before, start=0, num=limit
+    )
+
+
+async def remove_direct_upload_expiry(token: str) -> None:
+    """Drop a direct upload from the expiry index once it is cleaned up.
+
+    Args:
+        token: The session token.
+    """
+    client = await get_redis()
+    await client.zrem(DIRECT_UPLOAD_EXPIRY_KEY, token)
+
+
+async def acquire_direct_upload_lock(token: str, ttl: timedelta) -> bool:
+    """Claim a direct upload so that only one request writes to it at a time.
+
+    Args:
+        token: The session token.
+        ttl: Lock lifetime; frees the upload if the request is dropped.
+
+    Returns:
+        True if the lock was acquired, False if another request holds it.
+    """
+    client = await get_redis()
+    key = f"{DIRECT_UPLOAD_LOCK_PREFIX}{token}"
+    return bool(await client.set(key, "1", ex=ttl, nx=True))
+
+
+async def release_direct_upload_lock(token: str) -> None:
+    """Release a direct upload write claim.
+
+    Args:
+        token: The session token.
+    """
+    client = await get_redis()
+    await client.delete(f"{DIRECT_UPLOAD_LOCK_PREFIX}{token}")
+
+
+async def set_upload_gc_progress(progress: dict[str, str | int]) -> None:
+    """Store progress of the orphaned upload collection job.
+
+    Args:
+        progress: Fields to set (status, phase, counters and report).
+    """
+    client = await get_redis()
+    async with client.pipeline(transaction=True) as pipe:
+        pipe.hset(UPLOAD_GC_KEY, mapping=progress)
+        pipe.expire(UPLOAD_GC_KEY, UPLOAD_GC_PROGRESS_TTL)
+        await pipe.execute()
+
+
+async def get_upload_gc_progress() -> dict[str, str]:
+    """Get progress of the last orphaned upload collection job.
+
+    Returns:
+        Stored progress fields (empty if no job has reported recently).
+    """
+    client = await get_redis()
+    return await client.hgetall(UPLOAD_GC_KEY)
+
+
+async def acquire_upload_gc_lock(ttl: timedelta) -> bool:
+    """Claim the orphaned upload collection so that only one worker runs it.
+
+    Args:
+        ttl: Lock lifetime; lets another worker run if this one dies.
+
+    Returns:
+        True if the lock was acquired, False if another worker holds it.
+    """
+    client = await get_redis()
+    return bool(await client.set(UPLOAD_GC_LOCK_KEY, "1", ex=ttl, nx=True))
+
+
+async def release_upload_gc_lock() -> None:
+    """Release the orphaned upload collection claim."""
+    client = await get_redis()
+    await client.delete(UPLOAD_GC_LOCK_KEY)
+
+
+async def refresh_upload_gc_lock(ttl: timedelta) -> None:
+    """Extend the orphaned upload collection claim while the job progresses.
+
+    Args:
+        ttl: New lock lifetime.
+    """
+    client = await get_redis()
+    await client.expire(UPLOAD_GC_LOCK_KEY, ttl)
+
+
+async def acquire_storage_reconcile_lock(ttl: timedelta) -> bool:
+    """Claim the storage total reconciliation so that one worker runs it.
+
+    Args:
+        ttl: Lock lifetime; lets another worker run if this one dies.
+
+    Returns:
+        True if the lock was acquired, False if another worker holds it.
+    """
+    client = await get_redis()
+    return bool(await client.set(STORAGE_RECONCILE_LOCK_KEY, "1", ex=ttl, nx=True))
+
+
+async def release_storage_reconcile_lock() -> None:
+    """Release the storage total reconciliation claim."""
+    client = await get_redis()
+    await client.delete(STORAGE_RECONCILE_LOCK_KEY)
+
+
+async def refresh_storage_reconcile_lock(ttl: timedelta) -> None:
+    """Extend the storage total reconciliation claim while it progresses.
+
+    Args:
+        ttl: New lock lifetime.
+    """
+    client = await get_redis()
+    await client.expire(STORAGE_RECONCILE_LOCK_KEY, ttl)
@@ -0,0 +1,22 @@
+"""Text search helpers."""
+
+# Characters with special meaning in LIKE patterns, escaped with a backslash
+_LIKE_SPECIAL = ("\\", "%", "_")
+
+
+def contains_pattern(query: str) -> str:
+    """Build an ILIKE pattern matching ``query`` anywhere in a value.
+
+    LIKE wildcards in the query are escaped so they match literally.
+    Use it with ``ILIKE ... ESCAPE '\\'``, which pg_trgm GIN indexes
+    serve for both prefix and substring matches.
+
+    Args:
+        query: Raw search text.
+
+    Returns:
+        The ILIKE pattern.
+    """
+    for char in _LIKE_SPECIAL:
+        query = query.replace(char, f"\\{char}")
+    return f"%{query}%"
@@ -0,0 +1,41 @@
+"""Collapse concurrent calls for the same key into one execution."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Run at most one job per key at a time within a process.
+
+    Callers arriving while a job for their key is running wait for that
+    job's result instead of starting another. The job runs in its own
+    task, so a caller that gives up does not cancel it for the others.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no jobs in flight."""
+        self._tasks: dict[str, asyncio.Task[Any]] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn, or join the run already in flight for key.
+
+        Args:
+            key: Identifies the work; equal keys must produce equal results.
+            fn: Coroutine function doing the work.
+
+        Returns:
+            The result of fn, shared by every concurrent caller.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        """Get the number of jobs currently running."""
+        return len(self._tasks)
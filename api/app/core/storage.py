@@ -1,25 +1,51 @@
 """Storage provider interface and implementations."""
 
 import abc
+import asyncio
+import contextlib
+import logging
+import mimetypes
 import os
 import re
 import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import BinaryIO, TypeVar
+from urllib.parse import quote, urlsplit
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+import httpx
 
 from app.config import settings
+from app.core.aws_sigv4 import UNSIGNED_PAYLOAD, presign_url, sign_request
 from app.services.exceptions import StorageError
 
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# Threads for local file I/O. Separate from the default executor so a slow
+# disk cannot starve other work that runs in threads.
+storage_io_executor = ThreadPoolExecutor(
+    max_workers=settings.storage_io_threads,
+    thread_name_prefix="storage-io",
+)
+
 
 class StorageProvider(abc.ABC):
     """Abstract base class for storage providers."""
 
     @abc.abstractmethod
-    async def save(self, content: bytes, filename: str, content_type: str) -> str:
+    async def save(
+        self, content: bytes | memoryview, filename: str, content_type: str
+    ) -> str:
         """Save file and return storage path.
 
         Args:
-            content: File content as bytes.
+            content: File content, as bytes or a view of a buffer.
             filename: Original filename.
             content_type: MIME type of the file.
 
@@ -28,6 +54,49 @@ class StorageProvider(abc.ABC):
         """
         ...
 
+    @abc.abstractmethod
+    async def save_blob(
+        self, content: bytes | memoryview, content_hash: str, content_type: str
+    ) -> str:
+        """Save content at a path derived from its hash and return the path.
+
+        Saving the same content twice writes it once.
+
+        Args:
+            content: File content, as bytes or a view of a buffer.
+            content_hash: SHA-256 hex digest of content.
+            content_type: MIME type of the file.
+
+        Returns:
+            Storage path for the saved file.
+        """
+        ...
+
+    @abc.abstractmethod
+    async def put(self, storage_path: str, content: bytes | memoryview) -> None:
+        """Save content at a given path, replacing any existing file.
+
+        Args:
+            storage_path: Path to store the file at.
+            content: File content, as bytes or a view of a buffer.
+
+        Raises:
+            StorageError: If the path is invalid or the write fails.
+        """
+        ...
+
+    @abc.abstractmethod
+    async def get_size(self, storage_path: str) -> int | None:
+        """Get the size of a stored file.
+
+        Args:
+            storage_path: Path to the stored file.
+
+        Returns:
+            Size in bytes, or None if the file does not exist.
+        """
+        ...
+
     @abc.abstractmethod
     async def get(self, storage_path: str) -> bytes:
         """Get file content by storage path.
@@ -43,6 +112,25 @@ class StorageProvider(abc.ABC):
         """
         ...
 
+    @abc.abstractmethod
+    async def move(self, source_path: str, destination_path: str) -> bool:
+        """Move a file to another path, replacing any file there.
+
+        The moved file is a snapshot: writing to source_path afterwards
+        creates a new file and leaves it unchanged.
+
+        Args:
+            source_path: Path to the stored file.
+            destination_path: Path to move the file to.
+
+        Returns:
+            True if the file was moved, False if it does not exist.
+
+        Raises:
+            StorageError: If a path is invalid or the move fails.
+        """
+        ...
+
     @abc.abstractmethod
     async def delete(self, storage_path: str) -> None:
         """Delete file by storage path.
@@ -52,6 +140,45 @@ class StorageProvider(abc.ABC):
         """
         ...
 
+    async def delete_many(self, storage_paths: list[str]) -> list[str]:
+        """Delete files, with at most settings.storage_delete_concurrency in flight.
+
+        Unlike delete(), failures are not ignored: each one is logged and
+        reported, so callers can tell which files are left behind.
+        Missing files count as deleted.
+
+        Args:
+            storage_paths: Paths to the stored files.
+
+        Returns:
+            Paths of the files that could not be deleted.
+        """
+        semaphore = asyncio.Semaphore(settings.storage_delete_concurrency)
+        failed: list[str] = []
+
+        async def remove(storage_path: str) -> None:
+            async with semaphore:
+                try:
+                    await self._remove(storage_path)
+                except StorageError as e:
+                    logger.warning(f"Failed to delete {storage_path}: {e}")
+                    failed.append(storage_path)
+
+        await asyncio.gather(*(remove(path) for path in storage_paths))
+        return failed
+
+    @abc.abstractmethod
+    async def _remove(self, storage_path: str) -> None:
+        """Delete a file, reporting failures.
+
+        Args:
+            storage_path: Path to the stored file.
+
+        Raises:
+            StorageError: If the path is invalid or the delete fails.
+        """
+        ...
+
     @abc.abstractmethod
     def get_url(self, storage_path: str) -> str:
         """Get URL for accessing the file.
@@ -64,9 +191,161 @@ class StorageProvider(abc.ABC):
         """
         ...
 
+    async def get_local_file(
+        self, storage_path: str
+    ) -> tuple[Path, os.stat_result] | None:
+        """Locate a stored file on the local filesystem.
+
+        Lets the API stream the file from disk instead of loading it into
+        memory. Providers that do not keep files on local disk return None.
+
+        Args:
+            storage_path: Path to the stored file.
+
+        Returns:
+            Tuple of (absolute path, stat result), or None.
+
+        Raises:
+            StorageError: If the file does not exist.
+        """
+        return None
+
+    async def stream(
+        self, storage_path: str, chunk_size: int = 64 * 1024
+    ) -> AsyncIterator[bytes]:
+        """Read a stored file in chunks.
+
+        Providers that can stream override this; by default the whole
+        file is read first.
+
+        Args:
+            storage_path: Path to the stored file.
+            chunk_size: Preferred chunk size in bytes.
+
+        Yields:
+            Consecutive chunks of the file.
+
+        Raises:
+            StorageError: If file not found or read fails.
+        """
+        yield await self.get(storage_path)
+
+    def get_download_url(self, storage_path: str) -> str | None:
+        """Get a short-lived URL clients can download the file from directly.
+
+        Unlike get_url(), the URL bypasses the API and expires, so it must
+        not be stored. Providers without direct downloads return None.
+
+        Args:
+            storage_path: Path to the stored file.
+
+        Returns:
+            Signed download URL, or None.
+        """
+        return None
+
+    async def put_stream(self, storage_path: str, chunks: AsyncIterable[bytes]) -> int:
+        """Save content arriving in chunks at a given path.
+
+        Providers that can write incrementally override this; by default
+        the chunks are collected and saved with put(). If iterating the
+        chunks raises, nothing is saved and the exception propagates.
+
+        Args:
+            storage_path: Path to store the file at.
+            chunks: Consecutive chunks of the content.
+
+        Returns:
+            Number of bytes written.
+
+        Raises:
+            StorageError: If the path is invalid or the write fails.
+        """
+        content = b"".join([chunk async for chunk in chunks])
+        await self.put(storage_path, content)
+        return len(content)
+
+    def get_upload_url(
+        self, storage_path: str, content_type: str, size_bytes: int
+    ) -> str | None:
+        """Get a short-lived URL clients can PUT a file to directly.
+
+        The URL accepts exactly one body of ``size_bytes`` bytes sent with
+        the given Content-Type. Providers without direct uploads return
+        None, and the file is received by the API instead.
+
+        Args:
+            storage_path: Path to store the file at.
+            content_type: Content-Type the client must send.
+            size_bytes: Exact body size the client must send.
+
+        Returns:
+            Signed upload URL, or None.
+        """
+        return None
+
+    def _dated_path(self, filename: str) -> str:
+        """Build a unique storage path for a named file.
+
+        Storage path format: {year}/{month}/{uuid}_{sanitized_filename}
+
+        Args:
+            filename: Original filename.
+
+        Returns:
+            Relative storage path.
+        """
+        now = datetime.now(UTC)
+        unique_id = uuid.uuid4().hex[:8]
+        sanitized = self._sanitize_filename(filename)
+        return f"{now.year}/{now.month:02d}/{unique_id}_{sanitized}"
+
+    def blob_path(self, content_hash: str, content_type: str) -> str:
+        """Build the storage path of content-addressed content.
+
+        Storage path format: blobs/{hash[:2]}/{hash}{extension}
+
+        Args:
+            content_hash: SHA-256 hex digest of the content.
+            content_type: MIME type of the content.
+
+        Returns:
+            Relative storage path.
+        """
+        extension = mimetypes.guess_extension(content_type) or ""
+        return f"blobs/{content_hash[:2]}/{content_hash}{extension}"
+
+    def _sanitize_filename(self, filename: str) -> str:
+        """Sanitize filename to prevent path traversal and invalid chars.
+
+        Args:
+            filename: Original filename.
+
+        Returns:
+            Sanitized filename.
+        """
+        # Remove path components
+        filename = os.path.basename(filename)
+
+        # Replace unsafe characters with underscore
+        filename = re.sub(r"[^\w.\-]", "_", filename)
+
+        # Limit length
+        name, ext = os.path.splitext(filename)
+        if len(name) > 100:
+            name = name[:100]
+
+        return f"{name}{ext}"
+
 
 class LocalStorageProvider(StorageProvider):
-    """Local filesystem storage provider."""
+    """Local filesystem storage provider.
+
+    File I/O runs in ``storage_io_executor`` so a slow disk never blocks
+    the event loop. Writes go to a temporary file that is fsynced and then
+    renamed into place, so a crash leaves either the old file or the
+    complete new one, never a truncated file.
+    """
 
     def __init__(self, base_path: str | None = None) -> None:
         """Initialize local storage provider.
@@ -77,34 +356,118 @@ class LocalStorageProvider(StorageProvider):
         """
         self.base_path = Path(base_path or settings.upload_storage_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self._root = self.base_path.resolve()
 
-    async def save(self, content: bytes, filename: str, content_type: str) -> str:
+    async def save(
+        self, content: bytes | memoryview, filename: str, content_type: str
+    ) -> str:
         """Save file to local filesystem.
 
         Storage path format: {year}/{month}/{uuid}_{sanitized_filename}
 
         Args:
-            content: File content as bytes.
+            content: File content, as bytes or a view of a buffer.
             filename: Original filename.
             content_type: MIME type of the file.
 
         Returns:
             Relative storage path.
+
+        Raises:
+            StorageError: If the write fails.
         """
-        now = datetime.now(UTC)
-        unique_id = uuid.uuid4().hex[:8]
-        sanitized = self._sanitize_filename(filename)
+        relative_path = self._dated_path(filename)
+        await self.put(relative_path, content)
+        return relative_path
+
+    async def save_blob(
+        self, content: bytes | memoryview, content_hash: str, content_type: str
+    ) -> str:
+        """Save content-addressed file to local filesystem.
+
+        Storage path format: blobs/{hash[:2]}/{hash}{extension}
+
+        Content already stored is not written again.
+
+        Args:
+            content: File content, as bytes or a view of a buffer.
+            content_hash: SHA-256 hex digest of content.
+            content_type: MIME type of the file.
+
+        Returns:
+            Relative storage path.
+
+        Raises:
+            StorageError: If the write fails.
+        """
+        relative_path = self.blob_path(content_hash, content_type)
+        if await self.get_size(relative_path) is not None:
+            return relative_path
+
+        await self.put(relative_path, content)
+        return relative_path
+
+    async def put(self, storage_path: str, content: bytes | memoryview) -> None:
+        """Save content at a given path on the local filesystem.
+
+        The file is written to a temporary name, flushed to disk and
+        renamed into place, so neither a crash nor a concurrent writer of
+        the same path ever exposes a partial file.
+
+        Args:
+            storage_path: Relative path to store the file at.
+            content: File content, as bytes or a view of a buffer.
 
-        relative_path = f"{now.year}/{now.month:02d}/{unique_id}_{sanitized}"
-        full_path = self.base_path / relative_path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
+        Raises:
+            StorageError: If the path is invalid or the write fails.
+        """
+        await self._run(self._write_atomic, storage_path, content)
+
+    async def put_stream(self, storage_path: str, chunks: AsyncIterable[bytes]) -> int:
+        """Write chunks to the local filesystem as they arrive.
+
+        Only one chunk is held in memory at a time. The file is committed
+        as by put(), and a stream that fails midway leaves nothing behind.
+
+        Args:
+            storage_path: Relative path to store the file at.
+            chunks: Consecutive chunks of the content.
+
+        Returns:
+            Number of bytes written.
 
+        Raises:
+            StorageError: If the path is invalid or the write fails.
+        """
+        full_path, file = await self._run(self._open_temp, storage_path)
+        size = 0
         try:
-            full_path.write_bytes(content)
+            async for chunk in chunks:
+                await self._run(file.write, chunk)
+                size += len(chunk)
+            await self._run(self._commit_temp, file, full_path)
         except OSError as e:
+            await self._run(self._discard_temp, file)
             raise StorageError(f"Failed to save file: {e}") from e
+        except BaseException:
+            await self._run(self._discard_temp, file)
+            raise
+        return size
 
-        return relative_path
+    async def get_size(self, storage_path: str) -> int | None:
+        """Get the size of a file on the local filesystem.
+
+        Args:
+            storage_path: Relative path to the stored file.
+
+        Returns:
+            Size in bytes, or None if the file does not exist.
+        """
+        try:
+            _, stat_result = await self.get_local_file(storage_path)
+        except StorageError:
+            return None
+        return stat_result.st_size
 
     async def get(self, storage_path: str) -> bytes:
         """Get file content from local filesystem.
@@ -116,43 +479,246 @@ class LocalStorageProvider(StorageProvider):
             File content as bytes.
 
         Raises:
-            StorageError: If file not found or read fails.
+            StorageError: If the path is invalid, or the file is not found
+                or cannot be read.
         """
-        full_path = self.base_path / storage_path
+        return await self._run(self._read, storage_path)
 
-        if not full_path.exists():
-            raise StorageError(f"File not found: {storage_path}")
+    async def move(self, source_path: str, destination_path: str) -> bool:
+        """Rename a file on the local filesystem, replacing any file there.
+
+        Args:
+            source_path: Relative path to the stored file.
+            destination_path: Relative path to move the file to.
+
+        Returns:
+            True if the file was moved, False if it does not exist.
+
+        Raises:
+            StorageError: If a path is invalid or the rename fails.
+        """
+        return await self._run(self._rename, source_path, destination_path)
+
+    async def delete(self, storage_path: str) -> None:
+        """Delete file from local filesystem.
+
+        Invalid paths, missing files and deletion errors are ignored.
+
+        Args:
+            storage_path: Relative path to the stored file.
+        """
+        await self._run(self._unlink, storage_path)
+
+    async def _remove(self, storage_path: str) -> None:
+        """Delete a file off the event loop, reporting failures.
+
+        Args:
+            storage_path: Relative path to the stored file.
+
+        Raises:
+            StorageError: If the path is invalid or the file cannot be deleted.
+        """
+        await self._run(self._unlink_strict, storage_path)
+
+    async def get_local_file(self, storage_path: str) -> tuple[Path, os.stat_result]:
+        """Locate a stored file and stat it off the event loop.
+
+        Args:
+            storage_path: Relative path to the stored file.
+
+        Returns:
+            Tuple of (absolute path, stat result).
+
+        Raises:
+            StorageError: If the path is invalid or the file does not exist.
+        """
+        return await self._run(self._stat, storage_path)
+
+    async def _run(self, fn: Callable[..., T], *args: object) -> T:
+        """Run blocking file I/O in the storage thread pool.
+
+        Args:
+            fn: Function to run.
+            *args: Arguments for fn.
+
+        Returns:
+            The result of fn.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(storage_io_executor, fn, *args)
+
+    def _resolve(self, storage_path: str) -> Path:
+        """Resolve a storage path, rejecting paths outside the base directory.
 
-        # Prevent path traversal
+        Args:
+            storage_path: Relative path to a stored file.
+
+        Returns:
+            Absolute path with symlinks resolved.
+
+        Raises:
+            StorageError: If the path escapes the base directory.
+        """
+        full_path = (self._root / storage_path).resolve()
+        if not full_path.is_relative_to(self._root):
+            raise StorageError("Invalid storage path")
+        return full_path
+
+    def _write_atomic(self, storage_path: str, content: bytes | memoryview) -> None:
+        """Write a file via a temporary file, fsync and rename. Blocking.
+
+        Args:
+            storage_path: Relative path to store the file at.
+            content: File content.
+
+        Raises:
+            StorageError: If the path is invalid or the write fails.
+        """
+        full_path, file = self._open_temp(storage_path)
+        try:
+            file.write(content)
+            self._commit_temp(file, full_path)
+        except OSError as e:
+            self._discard_temp(file)
+            raise StorageError(f"Failed to save file: {e}") from e
+
+    def _open_temp(self, storage_path: str) -> tuple[Path, BinaryIO]:
+        """Create a temporary file next to where a file will be stored. Blocking.
+
+        Args:
+            storage_path: Relative path the file will be stored at.
+
+        Returns:
+            Tuple of (absolute final path, temporary file open for writing).
+
+        Raises:
+            StorageError: If the path is invalid or the file cannot be created.
+        """
+        full_path = self._resolve(storage_path)
+        temp_path = full_path.with_name(f".{full_path.name}.{uuid.uuid4().hex}")
+        try:
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            return full_path, open(temp_path, "xb")
+        except OSError as e:
+            raise StorageError(f"Failed to save file: {e}") from e
+
+    def _commit_temp(self, file: BinaryIO, full_path: Path) -> None:
+        """Flush a temporary file to disk and rename it into place. Blocking.
+
+        Args:
+            file: Temporary file from _open_temp().
+            full_path: Absolute final path.
+
+        Raises:
+            OSError: If flushing or renaming fails.
+        """
+        with file:
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(file.name, full_path)
+        # Persist the rename itself, which lives in the directory entry
+        directory = os.open(full_path.parent, os.O_RDONLY)
         try:
-            full_path.resolve().relative_to(self.base_path.resolve())
-        except ValueError as e:
-            raise StorageError("Invalid storage path") from e
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+    def _discard_temp(self, file: BinaryIO) -> None:
+        """Close and remove a temporary file that will not be committed. Blocking.
+
+        Args:
+            file: Temporary file from _open_temp().
+        """
+        with contextlib.suppress(OSError):
+            file.close()
+        Path(file.name).unlink(missing_ok=True)
+
+    def _read(self, storage_path: str) -> bytes:
+        """Read a whole file. Blocking.
 
+        Args:
+            storage_path: Relative path to the stored file.
+
+        Returns:
+            File content.
+
+        Raises:
+            StorageError: If the path is invalid, or the file is not found
+                or cannot be read.
+        """
+        full_path = self._resolve(storage_path)
         try:
             return full_path.read_bytes()
+        except FileNotFoundError as e:
+            raise StorageError(f"File not found: {storage_path}") from e
         except OSError as e:
             raise StorageError(f"Failed to read file: {e}") from e
 
-    async def delete(self, storage_path: str) -> None:
-        """Delete file from local filesystem.
+    def _rename(self, source_path: str, destination_path: str) -> bool:
+        """Rename a file atomically. Blocking.
+
+        Args:
+            source_path: Relative path to the stored file.
+            destination_path: Relative path to move the file to.
+
+        Returns:
+            True if the file was moved, False if it does not exist.
+
+        Raises:
+            StorageError: If a path is invalid or the rename fails.
+        """
+        source = self._resolve(source_path)
+        destination = self._resolve(destination_path)
+        try:
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(source, destination)
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            raise StorageError(f"Failed to move file: {e}") from e
+        return True
+
+    def _unlink(self, storage_path: str) -> None:
+        """Delete a file, ignoring invalid paths and errors. Blocking.
 
         Args:
             storage_path: Relative path to the stored file.
         """
-        full_path = self.base_path / storage_path
+        with contextlib.suppress(StorageError):
+            self._unlink_strict(storage_path)
+
+    def _unlink_strict(self, storage_path: str) -> None:
+        """Delete a file; a missing file is not an error. Blocking.
+
+        Args:
+            storage_path: Relative path to the stored file.
 
-        # Prevent path traversal
+        Raises:
+            StorageError: If the path is invalid or the file cannot be deleted.
+        """
+        full_path = self._resolve(storage_path)
         try:
-            full_path.resolve().relative_to(self.base_path.resolve())
-        except ValueError:
-            return  # Silently ignore invalid paths
+            full_path.unlink(missing_ok=True)
+        except OSError as e:
+            raise StorageError(f"Failed to delete file: {e}") from e
 
-        if full_path.exists():
-            try:
-                full_path.unlink()
-            except OSError:
-                pass  # Silently ignore deletion errors
+    def _stat(self, storage_path: str) -> tuple[Path, os.stat_result]:
+        """Stat a stored file. Blocking.
+
+        Args:
+            storage_path: Relative path to the stored file.
+
+        Returns:
+            Tuple of (absolute path, stat result).
+
+        Raises:
+            StorageError: If the path is invalid or the file does not exist.
+        """
+        full_path = self._resolve(storage_path)
+        try:
+            return full_path, full_path.stat()
+        except OSError as e:
+            raise StorageError(f"File not found: {storage_path}") from e
 
     def get_url(self, storage_path: str) -> str:
         """Get URL for local file (served via API endpoint).
@@ -165,27 +731,523 @@ class LocalStorageProvider(StorageProvider):
         """
         return f"/api/v1/uploads/file/{storage_path}"
 
-    def _sanitize_filename(self, filename: str) -> str:
-        """Sanitize filename to prevent path traversal and invalid chars.
+
+class S3StorageProvider(StorageProvider):
+    """S3-compatible object storage provider (AWS S3, MinIO, Ceph, R2, ...).
+
+    Talks to the S3 REST API through one pooled HTTP client, so API nodes
+    can scale out without a shared disk. Objects larger than
+    ``multipart_threshold`` are uploaded in parallel parts. Downloads are
+    streamed, and get_download_url() hands clients a presigned URL so
+    file bytes need not pass through the API at all.
+    """
+
+    def __init__(
+        self,
+        bucket: str | None = None,
+        endpoint_url: str | None = None,
+        region: str | None = None,
+        access_key_id: str | None = None,
+        secret_access_key: str | None = None,
+        public_endpoint_url: str | None = None,
+        path_style: bool | None = None,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """Initialize the provider. Defaults come from the s3_* settings.
+
+        Args:
+            bucket: Bucket holding the files.
+            endpoint_url: S3 endpoint, e.g. ``http://minio:9000``. Defaults
+                to AWS S3 in the region.
+            region: Region used for request signing.
+            access_key_id: Access key ID.
+            secret_access_key: Secret access key.
+            public_endpoint_url: Endpoint as reachable by clients, for
+                presigned URLs. Defaults to endpoint_url.
+            path_style: Address the bucket in the path instead of the host.
+            client: HTTP client to use, mainly for tests.
+        """
+        self.bucket = bucket or settings.s3_bucket
+        self.region = region or settings.s3_region
+        self.access_key_id = access_key_id or settings.s3_access_key_id
+        self.secret_access_key = secret_access_key or settings.s3_secret_access_key
+        self.path_style = settings.s3_path_style if path_style is None else path_style
+        self.multipart_threshold = settings.s3_multipart_threshold
+        self.multipart_part_size = settings.s3_multipart_part_size
+        self.multipart_concurrency = settings.s3_multipart_concurrency
+        self.presign_expires_seconds = settings.s3_presign_expires_seconds
+
+        endpoint = (
+            endpoint_url
+            or settings.s3_endpoint_url
+            or f"https://s3.{self.region}.amazonaws.com"
+        )
+        public_endpoint = (
+            public_endpoint_url or settings.s3_public_endpoint_url or endpoint
+        )
+        self._bucket_url = self._make_bucket_url(endpoint)
+        self._public_bucket_url = self._make_bucket_url(public_endpoint)
+        self._client = client or httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.s3_max_connections,
+                max_keepalive_connections=settings.s3_max_connections,
+            ),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
+
+    async def save(
+        self, content: bytes | memoryview, filename: str, content_type: str
+    ) -> str:
+        """Save file as an object.
+
+        Storage path format: {year}/{month}/{uuid}_{sanitized_filename}
 
         Args:
+            content: File content, as bytes or a view of a buffer.
             filename: Original filename.
+            content_type: MIME type of the file.
 
         Returns:
-            Sanitized filename.
+            Object key, used as the storage path.
+
+        Raises:
+            StorageError: If the upload fails.
         """
-        # Remove path components
-        filename = os.path.basename(filename)
+        storage_path = self._dated_path(filename)
+        await self.put(storage_path, content)
+        return storage_path
 
-        # Replace unsafe characters with underscore
-        filename = re.sub(r"[^\w.\-]", "_", filename)
+    async def save_blob(
+        self, content: bytes | memoryview, content_hash: str, content_type: str
+    ) -> str:
+        """Save content-addressed content as an object.
 
-        # Limit length
-        name, ext = os.path.splitext(filename)
-        if len(name) > 100:
-            name = name[:100]
+        Storage path format: blobs/{hash[:2]}/{hash}{extension}
 
-        return f"{name}{ext}"
+        Content already stored is not uploaded again.
+
+        Args:
+            content: File content, as bytes or a view of a buffer.
+            content_hash: SHA-256 hex digest of content.
+            content_type: MIME type of the file.
+
+        Returns:
+            Object key, used as the storage path.
+
+        Raises:
+            StorageError: If the upload fails.
+        """
+        storage_path = self.blob_path(content_hash, content_type)
+        if await self.get_size(storage_path) is not None:
+            return storage_path
+
+        await self.put(storage_path, content)
+        return storage_path
+
+    async def put(self, storage_path: str, content: bytes | memoryview) -> None:
+        """Upload an object, replacing any existing one.
+
+        Objects become visible only once fully uploaded. They are stored
+        with a content type guessed from the key and an immutable cache
+        lifetime, since stored files are never modified in place.
+
+        Args:
+            storage_path: Object key.
+            content: File content, as bytes or a view of a buffer.
+
+        Raises:
+            StorageError: If the key is invalid or the upload fails.
+        """
+        self._check_key(storage_path)
+        headers = {
+            "content-type": mimetypes.guess_type(storage_path)[0]
+            or "application/octet-stream",
+            "cache-control": "public, max-age=31536000, immutable",
+        }
+        if len(content) > self.multipart_threshold:
+            await self._put_multipart(storage_path, memoryview(content), headers)
+            return
+
+        response = await self._request(
+            "PUT", storage_path, content=bytes(content), headers=headers
+        )
+        self._raise_for_status(response, "upload", storage_path)
+
+    async def get_size(self, storage_path: str) -> int | None:
+        """Get the size of an object.
+
+        Args:
+            storage_path: Object key.
+
+        Returns:
+            Size in bytes, or None if the object does not exist.
+
+        Raises:
+            StorageError: If the request fails.
+        """
+        self._check_key(storage_path)
+        response = await self._request("HEAD", storage_path)
+        if response.status_code == 404:
+            return None
+        self._raise_for_status(response, "stat", storage_path)
+        return int(response.headers["content-length"])
+
+    async def get(self, storage_path: str) -> bytes:
+        """Download a whole object.
+
+        Args:
+            storage_path: Object key.
+
+        Returns:
+            File content as bytes.
+
+        Raises:
+            StorageError: If the object is not found or the download fails.
+        """
+        self._check_key(storage_path)
+        response = await self._request("GET", storage_path)
+        self._raise_for_status(response, "read", storage_path)
+        return response.content
+
+    async def stream(
+        self, storage_path: str, chunk_size: int = 64 * 1024
+    ) -> AsyncIterator[bytes]:
+        """Download an object in chunks without buffering it.
+
+        Args:
+            storage_path: Object key.
+            chunk_size: Preferred chunk size in bytes.
+
+        Yields:
+            Consecutive chunks of the object.
+
+        Raises:
+            StorageError: If the object is not found or the download fails.
+        """
+        self._check_key(storage_path)
+        url = self._object_url(storage_path)
+        try:
+            async with self._client.stream(
+                "GET", url, headers=self._sign("GET", url, {})
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                    self._raise_for_status(response, "read", storage_path)
+                async for chunk in response.aiter_bytes(chunk_size):
+                    yield chunk
+        except httpx.HTTPError as e:
+            raise StorageError(f"Failed to read file: {e}") from e
+
+    async def move(self, source_path: str, destination_path: str) -> bool:
+        """Copy an object to another key server-side, then delete it.
+
+        Args:
+            source_path: Object key.
+            destination_path: Key to move the object to.
+
+        Returns:
+            True if the object was moved, False if it does not exist.
+
+        Raises:
+            StorageError: If a key is invalid or a request fails.
+        """
+        self._check_key(source_path)
+        self._check_key(destination_path)
+        copy_source = quote(f"/{self.bucket}/{source_path}", safe="/~")
+        response = await self._request(
+            "PUT", destination_path, headers={"x-amz-copy-source": copy_source}
+        )
+        if response.status_code == 404:
+            return False
+        self._raise_for_status(response, "copy", source_path)
+        # A copy can still fail after its 200 status was sent
+        if b"<Error>" in response.content:
+            code = self._xml_value(response.content, "Code")
+            raise StorageError(f"Failed to copy {source_path}: {code}")
+        await self._remove(source_path)
+        return True
+
+    async def delete(self, storage_path: str) -> None:
+        """Delete an object. Missing objects and errors are ignored.
+
+        Args:
+            storage_path: Object key.
+        """
+        with contextlib.suppress(StorageError):
+            # Silently ignore deletion errors, as local storage does
+            await self._remove(storage_path)
+
+    async def _remove(self, storage_path: str) -> None:
+        """Delete an object, reporting failures. Missing objects are ignored.
+
+        Args:
+            storage_path: Object key.
+
+        Raises:
+            StorageError: If the key is invalid or the request fails.
+        """
+        self._check_key(storage_path)
+        response = await self._request("DELETE", storage_path)
+        if response.status_code != 404:
+            self._raise_for_status(response, "delete", storage_path)
+
+    def get_url(self, storage_path: str) -> str:
+        """Get the stable URL of an object (served via API endpoint).
+
+        The endpoint redirects to get_download_url(), so the URL can be
+        embedded in documents while the bytes still come from object
+        storage.
+
+        Args:
+            storage_path: Object key.
+
+        Returns:
+            API URL to access the file.
+        """
+        return f"/api/v1/uploads/file/{storage_path}"
+
+    def get_download_url(self, storage_path: str) -> str | None:
+        """Presign a GET of an object on the public endpoint.
+
+        Args:
+            storage_path: Object key.
+
+        Returns:
+            URL valid for ``presign_expires_seconds``, or None if presigned
+            downloads are disabled.
+        """
+        if not settings.s3_presign_downloads:
+            return None
+        return presign_url(
+            "GET",
+            self._object_url(storage_path, self._public_bucket_url),
+            access_key=self.access_key_id,
+            secret_key=self.secret_access_key,
+            region=self.region,
+            now=datetime.now(UTC),
+            expires_seconds=self.presign_expires_seconds,
+        )
+
+    def get_upload_url(
+        self, storage_path: str, content_type: str, size_bytes: int
+    ) -> str:
+        """Presign a PUT of an object on the public endpoint.
+
+        Content-Type and Content-Length are signed, so object storage
+        rejects a body of any other size or type.
+
+        Args:
+            storage_path: Object key.
+            content_type: Content-Type the client must send.
+            size_bytes: Exact body size the client must send.
+
+        Returns:
+            URL valid for ``upload_direct_expires_seconds``.
+
+        Raises:
+            StorageError: If the key is invalid.
+        """
+        self._check_key(storage_path)
+        return presign_url(
+            "PUT",
+            self._object_url(storage_path, self._public_bucket_url),
+            access_key=self.access_key_id,
+            secret_key=self.secret_access_key,
+            region=self.region,
+            now=datetime.now(UTC),
+            expires_seconds=settings.upload_direct_expires_seconds,
+            headers={
+                "content-length": str(size_bytes),
+                "content-type": content_type,
+            },
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self._client.aclose()
+
+    async def _put_multipart(
+        self, storage_path: str, content: memoryview, headers: dict[str, str]
+    ) -> None:
+        """Upload a large object in parts, several at a time.
+
+        An upload that fails is aborted, so its parts do not linger in the
+        bucket.
+
+        Args:
+            storage_path: Object key.
+            content: File content.
+            headers: Headers for the object, such as its content type.
+
+        Raises:
+            StorageError: If any part of the upload fails.
+        """
+        response = await self._request(
+            "POST", storage_path, query="uploads", headers=headers
+        )
+        self._raise_for_status(response, "upload", storage_path)
+        upload_id = self._xml_value(response.content, "UploadId")
+        upload_query = f"uploadId={quote(upload_id, safe='')}"
+        slots = asyncio.Semaphore(self.multipart_concurrency)
+
+        async def upload_part(number: int, offset: int) -> str:
+            async with slots:
+                part = bytes(content[offset : offset + self.multipart_part_size])
+                response = await self._request(
+                    "PUT",
+                    storage_path,
+                    query=f"partNumber={number}&{upload_query}",
+                    content=part,
+                )
+            self._raise_for_status(response, "upload", storage_path)
+            return response.headers["etag"]
+
+        offsets = range(0, len(content), self.multipart_part_size)
+        tasks = [
+            asyncio.ensure_future(upload_part(number, offset))
+            for number, offset in enumerate(offsets, start=1)
+        ]
+        try:
+            try:
+                etags = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+
+            parts = "".join(
+                f"<Part><PartNumber>{number}</PartNumber>"
+                f"<ETag>{escape(etag)}</ETag></Part>"
+                for number, etag in enumerate(etags, start=1)
+            )
+            response = await self._request(
+                "POST",
+                storage_path,
+                query=upload_query,
+                content=(
+                    f"<CompleteMultipartUpload>{parts}</CompleteMultipartUpload>"
+                ).encode(),
+                headers={"content-type": "application/xml"},
+            )
+            self._raise_for_status(response, "upload", storage_path)
+            # Completion can also fail after a 200 status, with an error body
+            if b"<Error>" in response.content:
+                code = self._xml_value(response.content, "Code")
+                raise StorageError(f"Failed to upload {storage_path}: {code}")
+        except BaseException:
+            with contextlib.suppress(StorageError):
+                await self._request("DELETE", storage_path, query=upload_query)
+            raise
+
+    async def _request(
+        self,
+        method: str,
+        storage_path: str,
+        *,
+        query: str = "",
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send a signed request for an object.
+
+        Args:
+            method: HTTP method.
+            storage_path: Object key.
+            query: Encoded query string, without the ``?``.
+            content: Request body.
+            headers: Extra headers, with lowercase names.
+
+        Returns:
+            The response, whatever its status.
+
+        Raises:
+            StorageError: If the request cannot be sent.
+        """
+        url = self._object_url(storage_path)
+        if query:
+            url = f"{url}?{query}"
+        try:
+            return await self._client.request(
+                method,
+                url,
+                content=content,
+                headers=self._sign(method, url, headers or {}),
+            )
+        except httpx.HTTPError as e:
+            raise StorageError(f"Storage request failed: {e}") from e
+
+    def _sign(self, method: str, url: str, headers: dict[str, str]) -> dict[str, str]:
+        """Add SigV4 authentication to request headers.
+
+        Bodies are sent unhashed: hashing them would take CPU time on the
+        event loop, and TLS already protects their integrity.
+        """
+        return sign_request(
+            method,
+            url,
+            {**headers, "x-amz-content-sha256": UNSIGNED_PAYLOAD},
+            access_key=self.access_key_id,
+            secret_key=self.secret_access_key,
+            region=self.region,
+            now=datetime.now(UTC),
+        )
+
+    def _make_bucket_url(self, endpoint: str) -> str:
+        """Build the base URL of the bucket on an endpoint."""
+        parts = urlsplit(endpoint.rstrip("/"))
+        if self.path_style:
+            return f"{parts.scheme}://{parts.netloc}{parts.path}/{self.bucket}"
+        return f"{parts.scheme}://{self.bucket}.{parts.netloc}{parts.path}"
+
+    def _object_url(self, storage_path: str, bucket_url: str | None = None) -> str:
+        """Build the URL of an object."""
+        return f"{bucket_url or self._bucket_url}/{quote(storage_path, safe='/~')}"
+
+    def _check_key(self, storage_path: str) -> None:
+        """Reject keys that local storage would treat as path traversal.
+
+        Keeps storage paths portable between providers.
+
+        Raises:
+            StorageError: If the key is absolute or has ``..`` segments.
+        """
+        if storage_path.startswith("/") or ".." in storage_path.split("/"):
+            raise StorageError("Invalid storage path")
+
+    def _raise_for_status(
+        self, response: httpx.Response, action: str, storage_path: str
+    ) -> None:
+        """Turn an error response into a StorageError.
+
+        Raises:
+            StorageError: If the response is an error.
+        """
+        if response.status_code == 404:
+            raise StorageError(f"File not found: {storage_path}")
+        if response.is_error:
+            code = (
+                self._xml_value(response.content, "Code")
+                if response.content
+                else response.reason_phrase
+            )
+            raise StorageError(
+                f"Failed to {action} {storage_path}: {response.status_code} {code}"
+            )
+
+    def _xml_value(self, document: bytes, tag: str) -> str:
+        """Get the text of the first element with a tag, ignoring namespaces."""
+        try:
+            root = ElementTree.fromstring(document)
+        except ElementTree.ParseError as e:
+            raise StorageError(f"Invalid storage response: {e}") from e
+        for element in root.iter():
+            if element.tag.rsplit("}", 1)[-1] == tag:
+                return element.text or ""
+        raise StorageError(f"Storage response has no {tag}")
+
+
+# Shared so all requests use one connection pool
+_s3_provider: S3StorageProvider | None = None
 
 
 def get_storage_provider() -> StorageProvider:
@@ -194,5 +1256,17 @@ def get_storage_provider() -> StorageProvider:
     Returns:
         Configured storage provider instance.
     """
-    # Future: switch based on settings.storage_type for S3, MinIO, etc.
+    global _s3_provider
+    if settings.storage_type == "s3":
+        if _s3_provider is None:
+            _s3_provider = S3StorageProvider()
+        return _s3_provider
     return LocalStorageProvider()
+
+
+async def close_storage_provider() -> None:
+    """Close the shared S3 provider's connections, if one was created."""
+    global _s3_provider
+    if _s3_provider is not None:
+        await _s3_provider.aclose()
+        _s3_provider = None
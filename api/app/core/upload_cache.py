@@ -0,0 +1,156 @@
+"""Two-level cache for upload file metadata looked up by storage path."""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix for cached upload metadata
+UPLOAD_FILE_PREFIX = "upload_file:"
+
+
+@dataclass(frozen=True)
+class UploadFileInfo:
+    """Metadata needed to serve an upload's file."""
+
+    storage_path: str
+    mime_type: str
+    size_bytes: int
+    etag: str
+    last_modified: datetime
+
+    def to_json(self) -> str:
+        """Serialize for storage in Redis."""
+        return json.dumps(
+            {
+                "storage_path": self.storage_path,
+                "mime_type": self.mime_type,
+                "size_bytes": self.size_bytes,
+                "etag": self.etag,
+                "last_modified": self.last_modified.isoformat(),
+            }
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> "UploadFileInfo":
+        """Deserialize a value written by to_json()."""
+        values = json.loads(data)
+        values["last_modified"] = datetime.fromisoformat(values["last_modified"])
+        return cls(**values)
+
+
+class UploadFileCache:
+    """Cache of upload metadata, per worker in memory and shared in Redis.
+
+    Upload rows are never modified after creation, so entries only need
+    to be dropped when an upload is deleted. Deletion clears this worker
+    and Redis; another worker may keep serving metadata for a deleted
+    upload until its local entry expires, but the file itself is already
+    gone, so the request still ends in a 404.
+
+    Redis is best effort: if it is unavailable, lookups fall through to
+    the database.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10_000) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl_seconds: Lifetime of an entry. 0 disables caching.
+            max_entries: Maximum number of entries kept in memory.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, UploadFileInfo]] = OrderedDict()
+
+    async def get(self, storage_path: str) -> UploadFileInfo | None:
+        """Get cached metadata, from memory first and then Redis.
+
+        Args:
+            storage_path: Storage path of the upload.
+
+        Returns:
+            Cached metadata, or None on a miss.
+        """
+        if self.ttl_seconds <= 0:
+            return None
+
+        entry = self._entries.get(storage_path)
+        if entry is not None:
+            expires_at, info = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(storage_path)
+                return info
+            self._entries.pop(storage_path, None)
+
+        try:
+            client = await get_redis()
+            data = await client.get(f"{UPLOAD_FILE_PREFIX}{storage_path}")
+        except (RedisError, OSError) as e:
+            logger.warning(f"Failed to read upload metadata cache: {e}")
+            return None
+        if data is None:
+            return None
+
+        info = UploadFileInfo.from_json(data)
+        self._store(info)
+        return info
+
+    async def set(self, info: UploadFileInfo) -> None:
+        """Cache metadata in memory and in Redis.
+
+        Args:
+            info: Metadata to cache.
+        """
+        if self.ttl_seconds <= 0:
+            return
+
+        self._store(info)
+        try:
+            client = await get_redis()
+            await client.setex(
+                f"{UPLOAD_FILE_PREFIX}{info.storage_path}",
+                int(self.ttl_seconds),
+                info.to_json(),
+            )
+        except (RedisError, OSError) as e:
+            logger.warning(f"Failed to write upload metadata cache: {e}")
+
+    async def invalidate(self, storage_path: str) -> None:
+        """Drop an entry from this worker and from Redis.
+
+        Args:
+            storage_path: Storage path of the upload.
+        """
+        self._entries.pop(storage_path, None)
+        try:
+            client = await get_redis()
+            await client.delete(f"{UPLOAD_FILE_PREFIX}{storage_path}")
+        except (RedisError, OSError) as e:
+            logger.warning(f"Failed to invalidate upload metadata cache: {e}")
+
+    def clear(self) -> None:
+        """Drop every entry from this worker's memory."""
+        self._entries.clear()
+
+    def _store(self, info: UploadFileInfo) -> None:
+        """Add an entry to memory, evicting the least recently used."""
+        self._entries[info.storage_path] = (
+            time.monotonic() + self.ttl_seconds,
+            info,
+        )
+        self._entries.move_to_end(info.storage_path)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+upload_file_cache = UploadFileCache(settings.upload_cache_ttl_seconds)
@@ -1,6 +1,7 @@
 """FastAPI application entry point."""
 
 import asyncio
+import contextlib
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
@@ -9,9 +10,16 @@ from fastapi import FastAPI
 
 from app.api.v1.router import api_router
 from app.config import settings
+from app.core.image_pool import image_pool
 from app.core.migration import MigrationError, run_migrations
 from app.core.openapi import generate_simple_operation_id
+from app.core.project_cache import project_cache
 from app.core.redis import close_redis, get_redis
+from app.core.storage import close_storage_provider
+from app.services.project_deletion import resume_project_deletions
+from app.services.storage_usage import schedule_storage_reconciliation
+from app.services.upload import schedule_direct_upload_sweep
+from app.services.upload_gc import schedule_upload_gc
 
 logger = logging.getLogger(__name__)
 
@@ -33,9 +41,36 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # 2. Initialize Redis
     await get_redis()
 
+    # 3. Follow project cache invalidations from other workers
+    cache_listener = asyncio.create_task(project_cache.listen())
+
+    # 4. Resume project deletions interrupted by a restart
+    deletion_resumer = asyncio.create_task(resume_project_deletions())
+
+    # 5. Collect orphaned uploads on a schedule, if configured
+    upload_gc = asyncio.create_task(schedule_upload_gc())
+
+    # 6. Recount per-project storage totals on a schedule
+    storage_reconciler = asyncio.create_task(schedule_storage_reconciliation())
+
+    # 7. Delete files of direct uploads that were never completed
+    direct_upload_sweeper = asyncio.create_task(schedule_direct_upload_sweep())
+
     yield
 
     # Shutdown
+    for task in (
+        cache_listener,
+        deletion_resumer,
+        upload_gc,
+        storage_reconciler,
+        direct_upload_sweeper,
+    ):
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    image_pool.shutdown()
+    await close_storage_provider()
     await close_redis()
 
 
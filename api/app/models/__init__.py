@@ -3,11 +3,13 @@
 from app.models.base import Base
 from app.models.document import Document
 from app.models.document_revision import ChangeType, DocumentRevision
+from app.models.effective_project_access import EffectiveProjectAccess
 from app.models.project import Project, ProjectVisibility
 from app.models.project_bookmark import ProjectBookmark
 from app.models.project_member import MemberRole, ProjectMember
 from app.models.revision_batch import RevisionBatch
 from app.models.upload import Upload
+from app.models.upload_blob import UploadBlob
 from app.models.user import User
 
 __all__ = [
@@ -15,6 +17,7 @@ __all__ = [
     "ChangeType",
     "Document",
     "DocumentRevision",
+    "EffectiveProjectAccess",
     "MemberRole",
     "Project",
     "ProjectBookmark",
@@ -22,5 +25,6 @@ __all__ = [
     "ProjectVisibility",
     "RevisionBatch",
     "Upload",
+    "UploadBlob",
     "User",
 ]
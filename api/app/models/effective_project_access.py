@@ -0,0 +1,50 @@
+"""Effective project access model."""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+from app.models.project_member import MemberRole
+
+
+class EffectiveProjectAccess(Base):
+    """Materialised effective role of a user on a project.
+
+    One row per (user, project) pair that has at least one membership
+    grant. The role is the strongest role across all grants, so access
+    checks and "which projects can this user see" queries are single
+    index lookups instead of joins over every grant source.
+
+    Rows are maintained incrementally by the repositories that write grant
+    sources (see EffectiveProjectAccessRepository.refresh). Project
+    ownership is not stored here; it is resolved from projects.owner_id.
+    Direct memberships are the only grant source, as there are no group
+    tables yet.
+    """
+
+    __tablename__ = "effective_project_access"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    role: Mapped[MemberRole] = mapped_column(
+        Enum(MemberRole, values_callable=lambda x: [e.value for e in x])
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    __table_args__ = (
+        Index("effective_project_access_project_idx", "project_id", "user_id"),
+    )
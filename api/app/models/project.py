@@ -5,7 +5,19 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, String, Text, func
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -49,6 +61,26 @@ class Project(Base):
     git_branch: Mapped[str | None] = mapped_column(String(100), nullable=True)
     git_doc_root: Mapped[str | None] = mapped_column(String(200), nullable=True)
     chat_enabled: Mapped[bool] = mapped_column(Boolean, default=True)
+    # Denormalized counters, maintained by the document and revision repositories
+    document_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    last_activity_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Storage totals in bytes, maintained by the upload, document and revision
+    # repositories and corrected by the periodic reconciliation job
+    upload_bytes: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    document_bytes: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default="0"
+    )
+    revision_bytes: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default="0"
+    )
+    # NULL uses settings.project_storage_quota_bytes; 0 means unlimited
+    storage_quota_bytes: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    # Set when deletion is requested; the row is removed by a background job
+    deleting_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -73,3 +105,13 @@ class Project(Base):
     uploads: Mapped[list["Upload"]] = relationship(
         back_populates="project", passive_deletes=True
     )
+
+    __table_args__ = (
+        Index("projects_owner_created_idx", "owner_id", "created_at", "id"),
+        Index(
+            "projects_public_created_idx",
+            "created_at",
+            "id",
+            postgresql_where=text("visibility = 'public'"),
+        ),
+    )
@@ -65,4 +65,5 @@ class ProjectMember(Base):
 
     __table_args__ = (
         Index("project_members_project_user_key", "project_id", "user_id", unique=True),
+        Index("project_members_project_created_idx", "project_id", "created_at", "id"),
     )
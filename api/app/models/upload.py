@@ -4,7 +4,16 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, String, func
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -33,6 +42,15 @@ class Upload(Base):
     storage_path: Mapped[str] = mapped_column(String(500))
     mime_type: Mapped[str] = mapped_column(String(100))
     size_bytes: Mapped[int] = mapped_column(BigInteger)
+    # Intrinsic size and inline preview; NULL for uploads stored before
+    # they were recorded
+    width: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    height: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    placeholder: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # NULL for uploads stored before content-addressed storage
+    content_hash: Mapped[str | None] = mapped_column(
+        String(64), ForeignKey("upload_blobs.content_hash"), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -44,4 +62,5 @@ class Upload(Base):
     __table_args__ = (
         Index("uploads_user_idx", "user_id", "created_at"),
         Index("uploads_project_idx", "project_id", "created_at"),
+        Index("uploads_storage_path_idx", "storage_path"),
     )
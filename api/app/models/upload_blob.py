@@ -0,0 +1,38 @@
+"""Upload blob model for content-addressed file storage."""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class UploadBlob(Base):
+    """Stored file shared by every upload with the same content.
+
+    ``ref_count`` is the number of uploads referencing the blob; the blob
+    and its file are removed when it drops to zero.
+    """
+
+    __tablename__ = "upload_blobs"
+
+    # SHA-256 of the stored (processed) bytes
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    # SHA-256 of the bytes as uploaded, to skip reprocessing repeat uploads
+    source_hash: Mapped[str] = mapped_column(String(64))
+    storage_path: Mapped[str] = mapped_column(String(500))
+    mime_type: Mapped[str] = mapped_column(String(100))
+    size_bytes: Mapped[int] = mapped_column(BigInteger)
+    width: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    height: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    placeholder: Mapped[str | None] = mapped_column(Text, nullable=True)
+    ref_count: Mapped[int] = mapped_column(Integer, default=1)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    __table_args__ = (
+        Index("upload_blobs_source_hash_idx", "source_hash"),
+        Index("upload_blobs_storage_path_idx", "storage_path", unique=True),
+    )
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, Integer, String, func
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -54,3 +54,20 @@ class User(Base):
     )
     bookmarks: Mapped[list["ProjectBookmark"]] = relationship(back_populates="user")
     uploads: Mapped[list["Upload"]] = relationship(back_populates="user")
+
+    __table_args__ = (
+        Index("users_created_idx", "created_at", "id"),
+        # Trigram indexes back ILIKE prefix/substring search on users
+        Index(
+            "users_name_trgm_idx",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "users_email_trgm_idx",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+    )
@@ -2,10 +2,27 @@
 
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.document import Document
+from app.models.document_revision import DocumentRevision
+from app.models.project import Project
+
+
+def content_size(content: str | None) -> int:
+    """Get the stored size of document content, in UTF-8 bytes.
+
+    Matches PostgreSQL's octet_length(), which the reconciliation of the
+    projects' storage totals uses.
+
+    Args:
+        content: Document or revision content.
+
+    Returns:
+        Size in bytes (0 for no content).
+    """
+    return len(content.encode()) if content else 0
 
 
 class DocumentRepository:
@@ -52,6 +69,12 @@ class DocumentRepository:
             index=index,
         )
         self.db.add(document)
+        pages = 0 if is_folder else 1
+        size = content_size(content)
+        if pages or size:
+            await self._adjust_project_counters(
+                project_id, documents=pages, document_bytes=size
+            )
         await self.db.commit()
         await self.db.refresh(document)
         return document
@@ -147,6 +170,9 @@ class DocumentRepository:
     ) -> Document:
         """Update a document.
 
+        A change in content size is applied to the project's storage total
+        in the same transaction.
+
         Args:
             document: The document to update.
             title: New title (optional).
@@ -158,7 +184,12 @@ class DocumentRepository:
         if title is not None:
             document.title = title
         if content is not None:
+            delta = content_size(content) - content_size(document.content)
             document.content = content
+            if delta:
+                await self._adjust_project_counters(
+                    document.project_id, document_bytes=delta
+                )
         await self.db.commit()
         await self.db.refresh(document)
         return document
@@ -166,9 +197,21 @@ class DocumentRepository:
     async def delete(self, document: Document) -> None:
         """Delete a document (and descendants via CASCADE).
 
+        Their revisions are removed by CASCADE too, so the subtree's pages,
+        content and revision bytes are subtracted from the project's
+        counters in the same transaction.
+
         Args:
             document: The document to delete.
         """
+        pages, document_bytes, revision_bytes = await self._measure_subtree(document)
+        if pages or document_bytes or revision_bytes:
+            await self._adjust_project_counters(
+                document.project_id,
+                documents=-pages,
+                document_bytes=-document_bytes,
+                revision_bytes=-revision_bytes,
+            )
         await self.db.delete(document)
         await self.db.commit()
 
@@ -226,3 +269,64 @@ class DocumentRepository:
             The parent document if found, None otherwise.
         """
         return await self.get_by_path(project_id, parent_path)
+
+    async def _measure_subtree(self, document: Document) -> tuple[int, int, int]:
+        """Measure what deleting a subtree, including its root, removes.
+
+        Args:
+            document: Root of the subtree.
+
+        Returns:
+            Tuple of (non-folder documents, content bytes, revision bytes).
+        """
+        subtree = and_(
+            Document.project_id == document.project_id,
+            or_(
+                Document.id == document.id,
+                Document.path.startswith(f"{document.path}/", autoescape=True),
+            ),
+        )
+        revision_bytes = (
+            select(
+                func.coalesce(func.sum(func.octet_length(DocumentRevision.content)), 0)
+            )
+            .where(DocumentRevision.document_id.in_(select(Document.id).where(subtree)))
+            .scalar_subquery()
+        )
+        stmt = select(
+            func.count(Document.id).filter(Document.is_folder.is_(False)),
+            func.coalesce(func.sum(func.octet_length(Document.content)), 0),
+            revision_bytes,
+        ).where(subtree)
+        result = await self.db.execute(stmt)
+        pages, document_bytes, revisions = result.one()
+        return pages, int(document_bytes), int(revisions)
+
+    async def _adjust_project_counters(
+        self,
+        project_id: UUID,
+        documents: int = 0,
+        document_bytes: int = 0,
+        revision_bytes: int = 0,
+    ) -> None:
+        """Apply deltas to the project's denormalized counters.
+
+        Runs as an atomic UPDATE in the caller's transaction.
+
+        Args:
+            project_id: The project UUID.
+            documents: Number of documents added (positive) or removed
+                (negative).
+            document_bytes: Change in document content bytes.
+            revision_bytes: Change in revision content bytes.
+        """
+        values = {}
+        if documents:
+            values["document_count"] = Project.document_count + documents
+        if document_bytes:
+            values["document_bytes"] = Project.document_bytes + document_bytes
+        if revision_bytes:
+            values["revision_bytes"] = Project.revision_bytes + revision_bytes
+        await self.db.execute(
+            update(Project).where(Project.id == project_id).values(values)
+        )
@@ -0,0 +1,129 @@
+"""Effective project access repository for database operations."""
+
+from uuid import UUID
+
+from sqlalchemy import Select, and_, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.effective_project_access import EffectiveProjectAccess
+from app.models.project_member import MemberRole, ProjectMember
+
+
+class EffectiveProjectAccessRepository:
+    """Repository for the materialised effective project access table.
+
+    Write methods do not commit; they are meant to run inside the same
+    transaction as the grant change that triggered them.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """Initialize the repository with a database session."""
+        self.db = db
+
+    async def get_role(self, project_id: UUID, user_id: UUID) -> MemberRole | None:
+        """Get a user's effective role on a project.
+
+        Args:
+            project_id: UUID of the project.
+            user_id: UUID of the user.
+
+        Returns:
+            The effective role if the user has any grant, None otherwise.
+        """
+        stmt = select(EffectiveProjectAccess.role).where(
+            EffectiveProjectAccess.project_id == project_id,
+            EffectiveProjectAccess.user_id == user_id,
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_project_ids(self, user_id: UUID) -> list[UUID]:
+        """Get IDs of all projects a user has been granted access to.
+
+        Does not include owned or public projects.
+
+        Args:
+            user_id: UUID of the user.
+
+        Returns:
+            List of project UUIDs.
+        """
+        stmt = select(EffectiveProjectAccess.project_id).where(
+            EffectiveProjectAccess.user_id == user_id
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def refresh(self, project_id: UUID, user_ids: list[UUID]) -> None:
+        """Recompute effective roles for users on a project.
+
+        Upserts the strongest role across all grant sources and removes
+        rows for users that no longer have any grant.
+
+        Args:
+            project_id: UUID of the project.
+            user_ids: UUIDs of the users whose grants changed.
+        """
+        if not user_ids:
+            return
+
+        grants = self._grants().where(
+            ProjectMember.project_id == project_id,
+            ProjectMember.user_id.in_(user_ids),
+        )
+        await self._apply(grants)
+
+        await self.db.execute(
+            delete(EffectiveProjectAccess).where(
+                EffectiveProjectAccess.project_id == project_id,
+                EffectiveProjectAccess.user_id.in_(user_ids),
+                ~select(ProjectMember.id)
+                .where(
+                    and_(
+                        ProjectMember.project_id == EffectiveProjectAccess.project_id,
+                        ProjectMember.user_id == EffectiveProjectAccess.user_id,
+                    )
+                )
+                .exists(),
+            )
+        )
+        await self.db.flush()
+
+    async def rebuild(self) -> None:
+        """Rebuild the whole table from grant sources.
+
+        Used for backfills and periodic reconciliation.
+        """
+        await self.db.execute(delete(EffectiveProjectAccess))
+        await self._apply(self._grants())
+        await self.db.flush()
+
+    def _grants(self) -> Select[tuple[UUID, UUID, MemberRole]]:
+        """Build the select of (project_id, user_id, role) grants.
+
+        Returns:
+            Select statement aggregating the strongest role per pair.
+        """
+        # memberrole enum values are declared weakest-first, so MAX()
+        # picks the strongest role when several grants apply.
+        return select(
+            ProjectMember.project_id,
+            ProjectMember.user_id,
+            func.max(ProjectMember.role).label("role"),
+        ).group_by(ProjectMember.project_id, ProjectMember.user_id)
+
+    async def _apply(self, grants: Select[tuple[UUID, UUID, MemberRole]]) -> None:
+        """Upsert aggregated grants into the table.
+
+        Args:
+            grants: Select of (project_id, user_id, role) rows.
+        """
+        stmt = insert(EffectiveProjectAccess).from_select(
+            ["project_id", "user_id", "role"], grants
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "project_id"],
+            set_={"role": stmt.excluded.role, "updated_at": func.now()},
+        )
+        await self.db.execute(stmt)
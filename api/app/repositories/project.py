@@ -1,12 +1,17 @@
 """Project repository for database operations."""
 
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import or_, select
+from sqlalchemy import Select, Subquery, and_, func, inspect, select, tuple_, union
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
+from app.core.project_cache import project_cache
+from app.models.effective_project_access import EffectiveProjectAccess
 from app.models.project import Project, ProjectVisibility
-from app.models.project_member import ProjectMember
+from app.models.project_bookmark import ProjectBookmark
+from app.models.project_member import MemberRole
 from app.schemas.project import ProjectCreate, ProjectUpdate
 
 
@@ -46,15 +51,27 @@ class ProjectRepository:
     async def get_by_slug(self, slug: str) -> Project | None:
         """Get a project by slug.
 
+        Served from the process-local project cache when possible.
+
         Args:
             slug: The project slug.
 
         Returns:
             The project if found, None otherwise.
         """
-        stmt = select(Project).where(Project.slug == slug)
+        cached = await self._get_cached(slug)
+        if cached is not None:
+            return cached
+
+        generation = project_cache.generation
+        stmt = select(Project).where(
+            Project.slug == slug, Project.deleting_at.is_(None)
+        )
         result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        project = result.scalar_one_or_none()
+        if project is not None:
+            self._put_cached(project, generation)
+        return project
 
     async def get_by_id(self, project_id: UUID) -> Project | None:
         """Get a project by ID.
@@ -65,10 +82,63 @@ class ProjectRepository:
         Returns:
             The project if found, None otherwise.
         """
-        stmt = select(Project).where(Project.id == project_id)
+        stmt = select(Project).where(
+            Project.id == project_id, Project.deleting_at.is_(None)
+        )
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_by_slug_with_role(
+        self, slug: str, user_id: UUID
+    ) -> tuple[Project, MemberRole | None] | None:
+        """Get a project by slug together with a user's member role.
+
+        Resolves both with a single LEFT JOIN on effective_project_access
+        so that access checks do not need a second round trip. When the
+        project is cached, only the role is queried.
+
+        Args:
+            slug: The project slug.
+            user_id: UUID of the user whose role to load.
+
+        Returns:
+            Tuple of (project, member role or None), or None if not found.
+        """
+        cached = await self._get_cached(slug)
+        if cached is not None:
+            role_stmt = select(EffectiveProjectAccess.role).where(
+                EffectiveProjectAccess.project_id == cached.id,
+                EffectiveProjectAccess.user_id == user_id,
+            )
+            role_result = await self.db.execute(role_stmt)
+            return cached, role_result.scalar_one_or_none()
+
+        generation = project_cache.generation
+        stmt = self._with_member_role(user_id).where(Project.slug == slug)
+        result = await self.db.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            return None
+        self._put_cached(row[0], generation)
+        return row[0], row[1]
+
+    async def get_by_id_with_role(
+        self, project_id: UUID, user_id: UUID
+    ) -> tuple[Project, MemberRole | None] | None:
+        """Get a project by ID together with a user's member role.
+
+        Args:
+            project_id: The UUID of the project.
+            user_id: UUID of the user whose role to load.
+
+        Returns:
+            Tuple of (project, member role or None), or None if not found.
+        """
+        stmt = self._with_member_role(user_id).where(Project.id == project_id)
+        result = await self.db.execute(stmt)
+        row = result.one_or_none()
+        return (row[0], row[1]) if row is not None else None
+
     async def get_by_owner(
         self, owner_id: UUID, skip: int = 0, limit: int = 100
     ) -> list[Project]:
@@ -84,7 +154,7 @@ class ProjectRepository:
         """
         stmt = (
             select(Project)
-            .where(Project.owner_id == owner_id)
+            .where(Project.owner_id == owner_id, Project.deleting_at.is_(None))
             .offset(skip)
             .limit(limit)
             .order_by(Project.created_at.desc())
@@ -107,16 +177,23 @@ class ProjectRepository:
             setattr(project, field, value)
         await self.db.commit()
         await self.db.refresh(project)
+        await project_cache.invalidate(project.slug)
         return project
 
-    async def delete(self, project: Project) -> None:
-        """Delete a project.
+    async def mark_deleting(self, project: Project) -> Project:
+        """Hide a project from all lookups ahead of background deletion.
 
         Args:
             project: The project to delete.
+
+        Returns:
+            The project with deleting_at set.
         """
-        await self.db.delete(project)
+        project.deleting_at = func.now()
         await self.db.commit()
+        await self.db.refresh(project)
+        await project_cache.invalidate(project.slug)
+        return project
 
     async def slug_exists(self, slug: str) -> bool:
         """Check if a slug already exists.
@@ -127,11 +204,17 @@ class ProjectRepository:
         Returns:
             True if slug exists, False otherwise.
         """
-        project = await self.get_by_slug(slug)
-        return project is not None
+        # Projects being deleted still hold their slug until the row is gone
+        stmt = select(Project.id).where(Project.slug == slug)
+        result = await self.db.execute(stmt)
+        return result.first() is not None
 
     async def get_accessible_projects(
-        self, user_id: UUID, skip: int = 0, limit: int = 100
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: tuple[datetime, UUID] | None = None,
     ) -> list[Project]:
         """Get all projects accessible by a user.
 
@@ -144,28 +227,160 @@ class ProjectRepository:
             user_id: The UUID of the user.
             skip: Number of records to skip (pagination).
             limit: Maximum number of records to return.
+            cursor: Keyset position (created_at, id) of the last row on the
+                previous page. Preferred over skip for deep pages.
 
         Returns:
-            List of accessible projects.
+            List of accessible projects, newest first.
         """
-        # Subquery for projects where user is a member
-        member_subquery = select(ProjectMember.project_id).where(
-            ProjectMember.user_id == user_id
+        accessible = self._accessible_ids(user_id, skip + limit, cursor)
+        stmt = (
+            select(Project)
+            .join(accessible, accessible.c.id == Project.id)
+            .order_by(Project.created_at.desc(), Project.id.desc())
+            .offset(skip)
+            .limit(limit)
         )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_accessible_projects_enriched(
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: tuple[datetime, UUID] | None = None,
+    ) -> list[tuple[Project, MemberRole | None, bool]]:
+        """Get accessible projects with the user's role and bookmark state.
 
+        Same listing as get_accessible_projects, with effective_project_access
+        and project_bookmarks left-joined in so that permissions and bookmark
+        state for the whole page are resolved in one query.
+
+        Args:
+            user_id: The UUID of the user.
+            skip: Number of records to skip (pagination).
+            limit: Maximum number of records to return.
+            cursor: Keyset position (created_at, id) of the last row on the
+                previous page.
+
+        Returns:
+            List of (project, member role or None, is bookmarked) tuples,
+            newest first.
+        """
+        accessible = self._accessible_ids(user_id, skip + limit, cursor)
         stmt = (
-            select(Project)
-            .where(
-                or_(
-                    Project.owner_id == user_id,
-                    Project.id.in_(member_subquery),
-                    Project.visibility == ProjectVisibility.PUBLIC,
-                )
+            self._with_member_role(user_id)
+            .add_columns(ProjectBookmark.user_id.is_not(None))
+            .outerjoin(
+                ProjectBookmark,
+                and_(
+                    ProjectBookmark.project_id == Project.id,
+                    ProjectBookmark.user_id == user_id,
+                ),
             )
-            .distinct()
+            .join(accessible, accessible.c.id == Project.id)
+            .order_by(Project.created_at.desc(), Project.id.desc())
             .offset(skip)
             .limit(limit)
-            .order_by(Project.created_at.desc())
         )
         result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return [(row[0], row[1], row[2]) for row in result.all()]
+
+    async def _get_cached(self, slug: str) -> Project | None:
+        """Attach a cached project snapshot to the session without a query.
+
+        Args:
+            slug: The project slug.
+
+        Returns:
+            Persistent project instance, or None on a cache miss.
+        """
+        values = project_cache.get(slug)
+        if values is None:
+            return None
+        project = Project(**values)
+        make_transient_to_detached(project)
+        return await self.db.merge(project, load=False)
+
+    def _put_cached(self, project: Project, generation: int) -> None:
+        """Store a snapshot of a loaded project's columns in the cache.
+
+        Denormalized counters are cached too and may lag by up to the TTL.
+
+        Args:
+            project: Project freshly loaded from the database.
+            generation: Cache generation read before the project was loaded.
+        """
+        values = {
+            attr.key: getattr(project, attr.key)
+            for attr in inspect(Project).column_attrs
+        }
+        project_cache.set(project.slug, values, generation)
+
+    def _accessible_ids(
+        self,
+        user_id: UUID,
+        limit: int,
+        cursor: tuple[datetime, UUID] | None,
+    ) -> Subquery:
+        """Build the IDs of projects a user can access, as a UNION.
+
+        Each branch (owned, granted, public) is served by its own index
+        and is cut to the page size before the UNION, instead of one
+        OR-filter that forces a scan over every project.
+
+        Args:
+            user_id: The UUID of the user.
+            limit: Number of rows each branch needs to produce.
+            cursor: Keyset position (created_at, id) to continue after.
+
+        Returns:
+            Subquery with an ``id`` column.
+        """
+
+        def page(stmt: Select[tuple[UUID, datetime]]) -> Select[tuple[UUID, datetime]]:
+            stmt = stmt.where(Project.deleting_at.is_(None))
+            if cursor is not None:
+                stmt = stmt.where(
+                    tuple_(Project.created_at, Project.id) < tuple_(*cursor)
+                )
+            return stmt.order_by(Project.created_at.desc(), Project.id.desc()).limit(
+                limit
+            )
+
+        columns = (Project.id, Project.created_at)
+        owned = select(*columns).where(Project.owner_id == user_id)
+        granted = (
+            select(*columns)
+            .join(
+                EffectiveProjectAccess,
+                EffectiveProjectAccess.project_id == Project.id,
+            )
+            .where(EffectiveProjectAccess.user_id == user_id)
+        )
+        public = select(*columns).where(Project.visibility == ProjectVisibility.PUBLIC)
+        return union(page(owned), page(granted), page(public)).subquery("accessible")
+
+    def _with_member_role(
+        self, user_id: UUID
+    ) -> Select[tuple[Project, MemberRole | None]]:
+        """Build a select of projects joined with a user's member role.
+
+        Args:
+            user_id: UUID of the user whose role to load.
+
+        Returns:
+            Select statement yielding (project, role) rows.
+        """
+        return (
+            select(Project, EffectiveProjectAccess.role)
+            .outerjoin(
+                EffectiveProjectAccess,
+                and_(
+                    EffectiveProjectAccess.project_id == Project.id,
+                    EffectiveProjectAccess.user_id == user_id,
+                ),
+            )
+            .where(Project.deleting_at.is_(None))
+        )
@@ -1,11 +1,14 @@
 """Project bookmark repository for database operations."""
 
+from collections.abc import Collection
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import and_, delete, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import contains_eager
 
+from app.models.project import Project
 from app.models.project_bookmark import ProjectBookmark
 
 
@@ -16,28 +19,36 @@ class ProjectBookmarkRepository:
         """Initialize the repository with a database session."""
         self.db = db
 
-    async def create(self, user_id: UUID, project_id: UUID) -> ProjectBookmark:
-        """Create a bookmark.
+    async def create_if_absent(
+        self, user_id: UUID, project_id: UUID
+    ) -> ProjectBookmark | None:
+        """Create a bookmark unless it already exists.
+
+        Uses a single INSERT ... ON CONFLICT DO NOTHING RETURNING statement.
 
         Args:
             user_id: UUID of the user.
             project_id: UUID of the project to bookmark.
 
         Returns:
-            The created bookmark.
+            The created bookmark, or None if it already existed.
         """
-        bookmark = ProjectBookmark(
-            user_id=user_id,
-            project_id=project_id,
+        stmt = (
+            insert(ProjectBookmark)
+            .values(user_id=user_id, project_id=project_id)
+            .on_conflict_do_nothing(index_elements=["user_id", "project_id"])
+            .returning(ProjectBookmark)
         )
-        self.db.add(bookmark)
+        result = await self.db.execute(stmt)
+        bookmark = result.scalar_one_or_none()
         await self.db.commit()
-        await self.db.refresh(bookmark)
         return bookmark
 
     async def delete(self, user_id: UUID, project_id: UUID) -> bool:
         """Delete a bookmark.
 
+        Uses a single DELETE ... RETURNING statement.
+
         Args:
             user_id: UUID of the user.
             project_id: UUID of the project.
@@ -45,12 +56,18 @@ class ProjectBookmarkRepository:
         Returns:
             True if deleted, False if bookmark didn't exist.
         """
-        bookmark = await self.get(user_id, project_id)
-        if bookmark is None:
-            return False
-        await self.db.delete(bookmark)
+        stmt = (
+            delete(ProjectBookmark)
+            .where(
+                ProjectBookmark.user_id == user_id,
+                ProjectBookmark.project_id == project_id,
+            )
+            .returning(ProjectBookmark.project_id)
+        )
+        result = await self.db.execute(stmt)
+        deleted = result.first() is not None
         await self.db.commit()
-        return True
+        return deleted
 
     async def get(self, user_id: UUID, project_id: UUID) -> ProjectBookmark | None:
         """Get a bookmark by user and project.
@@ -69,18 +86,34 @@ class ProjectBookmarkRepository:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def exists(self, user_id: UUID, project_id: UUID) -> bool:
-        """Check if a bookmark exists.
+    async def get_statuses_by_slugs(
+        self, user_id: UUID, slugs: Collection[str]
+    ) -> dict[str, bool]:
+        """Get the user's bookmark state for many projects in one query.
 
         Args:
             user_id: UUID of the user.
-            project_id: UUID of the project.
+            slugs: Project slugs to check.
 
         Returns:
-            True if bookmark exists, False otherwise.
+            Bookmark state per slug. Slugs of missing projects, or projects
+            pending deletion, are left out.
         """
-        bookmark = await self.get(user_id, project_id)
-        return bookmark is not None
+        if not slugs:
+            return {}
+        stmt = (
+            select(Project.slug, ProjectBookmark.user_id.is_not(None))
+            .outerjoin(
+                ProjectBookmark,
+                and_(
+                    ProjectBookmark.project_id == Project.id,
+                    ProjectBookmark.user_id == user_id,
+                ),
+            )
+            .where(Project.slug.in_(list(slugs)), Project.deleting_at.is_(None))
+        )
+        result = await self.db.execute(stmt)
+        return {slug: bookmarked for slug, bookmarked in result.all()}
 
     async def get_by_user(
         self, user_id: UUID, skip: int = 0, limit: int = 100
@@ -93,12 +126,17 @@ class ProjectBookmarkRepository:
             limit: Maximum number of records to return.
 
         Returns:
-            List of bookmarks with project details.
+            List of bookmarks with project details, excluding projects
+            pending deletion.
         """
         stmt = (
             select(ProjectBookmark)
-            .options(joinedload(ProjectBookmark.project))
-            .where(ProjectBookmark.user_id == user_id)
+            .join(ProjectBookmark.project)
+            .options(contains_eager(ProjectBookmark.project))
+            .where(
+                ProjectBookmark.user_id == user_id,
+                Project.deleting_at.is_(None),
+            )
             .offset(skip)
             .limit(limit)
             .order_by(ProjectBookmark.created_at.desc())
@@ -0,0 +1,195 @@
+"""Project deletion repository for chunked background deletion."""
+
+from collections import Counter
+from contextlib import AbstractAsyncContextManager
+from uuid import UUID
+
+from sqlalchemy import Select, delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.document import Document
+from app.models.document_revision import DocumentRevision
+from app.models.project import Project
+from app.models.revision_batch import RevisionBatch
+from app.models.upload import Upload
+from app.repositories.upload import UploadRepository
+
+
+class ProjectDeletionRepository:
+    """Repository for deleting a project's data in bounded chunks.
+
+    Every chunk method deletes at most ``limit`` rows and commits, so no
+    single transaction holds locks on the whole project.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """Initialize the repository with a database session."""
+        self.db = db
+
+    async def get_by_slug(self, slug: str) -> Project | None:
+        """Get a project that is pending deletion by slug.
+
+        Args:
+            slug: The project slug.
+
+        Returns:
+            The project if it exists and is being deleted, None otherwise.
+        """
+        stmt = select(Project).where(
+            Project.slug == slug, Project.deleting_at.is_not(None)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_pending_ids(self) -> list[UUID]:
+        """Get IDs of all projects pending deletion.
+
+        Returns:
+            Project IDs, oldest request first.
+        """
+        stmt = (
+            select(Project.id)
+            .where(Project.deleting_at.is_not(None))
+            .order_by(Project.deleting_at)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def delete_revisions_chunk(self, project_id: UUID, limit: int) -> int:
+        """Delete a chunk of the project's document revisions.
+
+        Args:
+            project_id: The project UUID.
+            limit: Maximum number of rows to delete.
+
+        Returns:
+            Number of rows deleted.
+        """
+        ids = (
+            select(DocumentRevision.id)
+            .join(RevisionBatch, RevisionBatch.id == DocumentRevision.batch_id)
+            .where(RevisionBatch.project_id == project_id)
+            .limit(limit)
+        )
+        return await self._delete_ids(DocumentRevision, ids)
+
+    async def delete_documents_chunk(self, project_id: UUID, limit: int) -> int:
+        """Delete a chunk of the project's documents, deepest paths first.
+
+        A child's path always extends its parent's, so ordering by path
+        length removes children before their parents and the ON DELETE
+        CASCADE on parent_id never fans out beyond the chunk.
+
+        Args:
+            project_id: The project UUID.
+            limit: Maximum number of rows to delete.
+
+        Returns:
+            Number of rows deleted.
+        """
+        ids = (
+            select(Document.id)
+            .where(Document.project_id == project_id)
+            .order_by(func.length(Document.path).desc())
+            .limit(limit)
+        )
+        return await self._delete_ids(Document, ids)
+
+    def unused_files(
+        self, storage_paths: list[str]
+    ) -> AbstractAsyncContextManager[list[str]]:
+        """Lock released files and yield those no blob uses any more.
+
+        See UploadRepository.unused_files.
+
+        Args:
+            storage_paths: Storage paths of released files.
+
+        Returns:
+            Context manager yielding the paths that are safe to remove.
+        """
+        return UploadRepository(self.db).unused_files(storage_paths)
+
+    async def delete_uploads_chunk(
+        self, project_id: UUID, limit: int
+    ) -> tuple[int, list[str]]:
+        """Delete a chunk of the project's upload records.
+
+        References to shared blobs are released in the same transaction.
+
+        Args:
+            project_id: The project UUID.
+            limit: Maximum number of rows to delete.
+
+        Returns:
+            Tuple of (number of uploads deleted, storage paths of files no
+            longer referenced, for file cleanup).
+        """
+        ids = select(Upload.id).where(Upload.project_id == project_id).limit(limit)
+        stmt = (
+            delete(Upload)
+            .where(Upload.id.in_(ids.scalar_subquery()))
+            .returning(Upload.storage_path, Upload.content_hash)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        rows = result.all()
+
+        # Uploads stored before content hashing own their file
+        paths = [row.storage_path for row in rows if row.content_hash is None]
+        released = Counter(row.content_hash for row in rows if row.content_hash)
+        paths += await UploadRepository(self.db).release_blobs(released)
+        await self.db.commit()
+        return len(rows), paths
+
+    async def delete_batches_chunk(self, project_id: UUID, limit: int) -> int:
+        """Delete a chunk of the project's revision batches.
+
+        Args:
+            project_id: The project UUID.
+            limit: Maximum number of rows to delete.
+
+        Returns:
+            Number of rows deleted.
+        """
+        ids = (
+            select(RevisionBatch.id)
+            .where(RevisionBatch.project_id == project_id)
+            .limit(limit)
+        )
+        return await self._delete_ids(RevisionBatch, ids)
+
+    async def delete_project(self, project_id: UUID) -> None:
+        """Delete the project row itself.
+
+        Remaining dependents (members, bookmarks, access rows) are small and
+        removed by ON DELETE CASCADE.
+
+        Args:
+            project_id: The project UUID.
+        """
+        await self.db.execute(delete(Project).where(Project.id == project_id))
+        await self.db.commit()
+
+    async def _delete_ids(
+        self,
+        model: type[DocumentRevision] | type[Document] | type[RevisionBatch],
+        ids: Select[tuple[UUID]],
+    ) -> int:
+        """Delete the rows selected by an ID subquery and commit.
+
+        Args:
+            model: Model whose table to delete from.
+            ids: Select of at most one chunk of primary keys.
+
+        Returns:
+            Number of rows deleted.
+        """
+        stmt = (
+            delete(model)
+            .where(model.id.in_(ids.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        await self.db.commit()
+        return result.rowcount
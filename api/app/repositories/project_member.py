@@ -1,20 +1,31 @@
 """Project member repository for database operations."""
 
+import uuid
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Text, func, literal_column, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import contains_eager, joinedload
 
+from app.core.search import contains_pattern
 from app.models.project_member import MemberRole, ProjectMember
+from app.models.user import User
+from app.repositories.effective_project_access import EffectiveProjectAccessRepository
 
 
 class ProjectMemberRepository:
-    """Repository for project member database operations."""
+    """Repository for project member database operations.
+
+    Every membership write also refreshes the materialised
+    effective_project_access rows in the same transaction.
+    """
 
     def __init__(self, db: AsyncSession) -> None:
         """Initialize the repository with a database session."""
         self.db = db
+        self.access_repo = EffectiveProjectAccessRepository(db)
 
     async def create(
         self, project_id: UUID, user_id: UUID, role: MemberRole
@@ -35,10 +46,69 @@ class ProjectMemberRepository:
             role=role,
         )
         self.db.add(member)
+        await self.db.flush()
+        await self.access_repo.refresh(project_id, [user_id])
         await self.db.commit()
         await self.db.refresh(member)
         return member
 
+    async def bulk_upsert(
+        self,
+        project_id: UUID,
+        roles: dict[UUID, MemberRole],
+        update_existing: bool = False,
+    ) -> dict[UUID, tuple[UUID, bool]]:
+        """Add many members to a project with a single INSERT.
+
+        Existing members are left untouched, or have their role updated
+        when ``update_existing`` is set. Rows whose role would not change
+        are never rewritten.
+
+        Args:
+            project_id: UUID of the project.
+            roles: Role to assign per user UUID.
+            update_existing: Whether to update the role of existing members.
+
+        Returns:
+            For every inserted or updated row, the user UUID mapped to
+            (member UUID, whether the row was newly inserted).
+        """
+        if not roles:
+            return {}
+
+        stmt = insert(ProjectMember).values(
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "project_id": project_id,
+                    "user_id": user_id,
+                    "role": role,
+                }
+                for user_id, role in roles.items()
+            ]
+        )
+        if update_existing:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["project_id", "user_id"],
+                set_={"role": stmt.excluded.role, "updated_at": func.now()},
+                where=ProjectMember.role != stmt.excluded.role,
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=["project_id", "user_id"])
+        # xmax is 0 only for tuples created by this statement's INSERT
+        stmt = stmt.returning(
+            ProjectMember.user_id,
+            ProjectMember.id,
+            literal_column("xmax").cast(Text) == "0",
+        )
+        result = await self.db.execute(stmt)
+        written = {row[0]: (row[1], row[2]) for row in result.all()}
+
+        if written:
+            await self.access_repo.refresh(project_id, list(written))
+        await self.db.commit()
+        return written
+
     async def get_by_id(self, member_id: UUID) -> ProjectMember | None:
         """Get a project member by ID.
 
@@ -93,31 +163,58 @@ class ProjectMemberRepository:
         return result.scalar_one_or_none()
 
     async def get_members_by_project(
-        self, project_id: UUID, skip: int = 0, limit: int = 100
+        self,
+        project_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        query: str | None = None,
+        cursor: tuple[datetime, UUID] | None = None,
     ) -> list[ProjectMember]:
-        """Get all members of a project with user details.
+        """Get members of a project with user details.
 
         Args:
             project_id: UUID of the project.
             skip: Number of records to skip (pagination).
             limit: Maximum number of records to return.
+            query: Optional text matched case-insensitively anywhere in the
+                member's name or email.
+            cursor: Keyset position (created_at, id) of the last row on the
+                previous page. Preferred over skip for deep pages.
 
         Returns:
-            List of project members with user details.
+            List of project members with user details, oldest first.
         """
         stmt = (
             select(ProjectMember)
-            .options(joinedload(ProjectMember.user))
+            .join(ProjectMember.user)
+            .options(contains_eager(ProjectMember.user))
             .where(ProjectMember.project_id == project_id)
+        )
+        if query:
+            pattern = contains_pattern(query)
+            stmt = stmt.where(
+                or_(
+                    User.name.ilike(pattern, escape="\\"),
+                    User.email.ilike(pattern, escape="\\"),
+                )
+            )
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(ProjectMember.created_at, ProjectMember.id) > tuple_(*cursor)
+            )
+        stmt = (
+            stmt.order_by(ProjectMember.created_at.asc(), ProjectMember.id.asc())
             .offset(skip)
             .limit(limit)
-            .order_by(ProjectMember.created_at.asc())
         )
         result = await self.db.execute(stmt)
-        return list(result.scalars().unique().all())
+        return list(result.scalars().all())
 
     async def get_user_role(self, project_id: UUID, user_id: UUID) -> MemberRole | None:
-        """Get user's role in a project.
+        """Get user's effective role in a project.
+
+        Reads the materialised effective_project_access table, so the
+        result covers every grant source with a single primary key lookup.
 
         Args:
             project_id: UUID of the project.
@@ -126,12 +223,7 @@ class ProjectMemberRepository:
         Returns:
             The user's role if they are a member, None otherwise.
         """
-        stmt = select(ProjectMember.role).where(
-            ProjectMember.project_id == project_id,
-            ProjectMember.user_id == user_id,
-        )
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        return await self.access_repo.get_role(project_id, user_id)
 
     async def update_role(
         self, member: ProjectMember, role: MemberRole
@@ -146,6 +238,8 @@ class ProjectMemberRepository:
             The updated project member.
         """
         member.role = role
+        await self.db.flush()
+        await self.access_repo.refresh(member.project_id, [member.user_id])
         await self.db.commit()
         await self.db.refresh(member)
         return member
@@ -156,5 +250,8 @@ class ProjectMemberRepository:
         Args:
             member: The project member to remove.
         """
+        project_id, user_id = member.project_id, member.user_id
         await self.db.delete(member)
+        await self.db.flush()
+        await self.access_repo.refresh(project_id, [user_id])
         await self.db.commit()
@@ -2,12 +2,14 @@
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.models.document_revision import ChangeType, DocumentRevision
+from app.models.project import Project
 from app.models.revision_batch import RevisionBatch
+from app.repositories.document import content_size
 
 
 class RevisionRepository:
@@ -25,6 +27,9 @@ class RevisionRepository:
     ) -> RevisionBatch:
         """Create a new revision batch.
 
+        Also bumps the project's denormalized last_activity_at in the same
+        transaction.
+
         Args:
             project_id: The project UUID.
             user_id: The user UUID (can be None if user was deleted).
@@ -39,6 +44,11 @@ class RevisionRepository:
             message=message,
         )
         self.db.add(batch)
+        await self.db.execute(
+            update(Project)
+            .where(Project.id == project_id)
+            .values(last_activity_at=func.now())
+        )
         await self.db.commit()
         await self.db.refresh(batch)
         return batch
@@ -53,6 +63,9 @@ class RevisionRepository:
     ) -> DocumentRevision:
         """Create a document revision.
 
+        Its content size is added to the project's storage total in the
+        same transaction.
+
         Args:
             batch_id: The revision batch UUID.
             document_id: The document UUID.
@@ -71,6 +84,18 @@ class RevisionRepository:
             content=content,
         )
         self.db.add(revision)
+        size = content_size(content)
+        if size:
+            project_id = (
+                select(RevisionBatch.project_id)
+                .where(RevisionBatch.id == batch_id)
+                .scalar_subquery()
+            )
+            await self.db.execute(
+                update(Project)
+                .where(Project.id == project_id)
+                .values(revision_bytes=Project.revision_bytes + size)
+            )
         await self.db.commit()
         await self.db.refresh(revision)
         return revision
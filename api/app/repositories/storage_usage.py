@@ -0,0 +1,135 @@
+"""Repository for the projects' denormalized storage totals."""
+
+from uuid import UUID
+
+from sqlalchemy import Row, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models.document import Document
+from app.models.document_revision import DocumentRevision
+from app.models.project import Project
+from app.models.revision_batch import RevisionBatch
+from app.models.upload import Upload
+
+
+class StorageUsageRepository:
+    """Repository for reading and recounting per-project storage totals.
+
+    The totals are kept up to date by the upload, document and revision
+    repositories; this repository only reads them and corrects drift.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """Initialize the repository with a database session."""
+        self.db = db
+
+    async def get_largest_projects(
+        self, limit: int
+    ) -> list[Row[tuple[UUID, str, str, int, int, int, int | None]]]:
+        """Get the projects using the most storage.
+
+        Args:
+            limit: Maximum number of projects to return.
+
+        Returns:
+            Rows of (id, slug, name, upload_bytes, document_bytes,
+            revision_bytes, storage_quota_bytes), largest first.
+        """
+        stmt = (
+            select(
+                Project.id,
+                Project.slug,
+                Project.name,
+                Project.upload_bytes,
+                Project.document_bytes,
+                Project.revision_bytes,
+                Project.storage_quota_bytes,
+            )
+            .order_by(
+                (
+                    Project.upload_bytes
+                    + Project.document_bytes
+                    + Project.revision_bytes
+                ).desc(),
+                Project.id,
+            )
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.all())
+
+    async def reconcile_chunk(
+        self, after_id: UUID | None, limit: int
+    ) -> tuple[UUID | None, int]:
+        """Recount the storage totals of a chunk of projects and commit.
+
+        The project rows are locked first, so the recount runs in a
+        statement that sees every write committed before the lock, and
+        writes waiting on the lock apply their deltas to the recounted
+        totals. Only totals that drifted are rewritten.
+
+        Args:
+            after_id: ID of the last project of the previous chunk, if any.
+            limit: Maximum number of projects to recount.
+
+        Returns:
+            Tuple of (ID of the last project in the chunk, or None when no
+            projects are left, number of projects corrected).
+        """
+        ids_stmt = select(Project.id).order_by(Project.id).limit(limit)
+        if after_id is not None:
+            ids_stmt = ids_stmt.where(Project.id > after_id)
+        result = await self.db.execute(ids_stmt.with_for_update())
+        ids = list(result.scalars().all())
+        if not ids:
+            await self.db.commit()
+            return None, 0
+
+        counted = aliased(Project)
+        totals = (
+            select(
+                counted.id,
+                select(func.coalesce(func.sum(Upload.size_bytes), 0))
+                .where(Upload.project_id == counted.id)
+                .scalar_subquery()
+                .label("upload_bytes"),
+                select(func.coalesce(func.sum(func.octet_length(Document.content)), 0))
+                .where(Document.project_id == counted.id)
+                .scalar_subquery()
+                .label("document_bytes"),
+                select(
+                    func.coalesce(
+                        func.sum(func.octet_length(DocumentRevision.content)), 0
+                    )
+                )
+                .join(RevisionBatch, RevisionBatch.id == DocumentRevision.batch_id)
+                .where(RevisionBatch.project_id == counted.id)
+                .scalar_subquery()
+                .label("revision_bytes"),
+            )
+            .where(counted.id.in_(ids))
+            .subquery()
+        )
+        stmt = (
+            update(Project)
+            .where(
+                Project.id == totals.c.id,
+                or_(
+                    Project.upload_bytes != totals.c.upload_bytes,
+                    Project.document_bytes != totals.c.document_bytes,
+                    Project.revision_bytes != totals.c.revision_bytes,
+                ),
+            )
+            # A recount is not a change to the project
+            .values(
+                upload_bytes=totals.c.upload_bytes,
+                document_bytes=totals.c.document_bytes,
+                revision_bytes=totals.c.revision_bytes,
+                updated_at=Project.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        await self.db.commit()
+        return ids[-1], result.rowcount
@@ -1,11 +1,16 @@
 """Upload repository for database operations."""
 
+import contextlib
+from collections.abc import AsyncIterator, Iterable, Mapping
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.project import Project
 from app.models.upload import Upload
+from app.models.upload_blob import UploadBlob
 
 
 class UploadRepository:
@@ -23,29 +28,133 @@ class UploadRepository:
         storage_path: str,
         mime_type: str,
         size_bytes: int,
+        content_hash: str,
+        source_hash: str,
+        width: int,
+        height: int,
+        placeholder: str,
     ) -> Upload:
-        """Create a new upload record.
+        """Create a new upload record and take a reference on its blob.
+
+        The blob row is created on first use of the content, otherwise its
+        reference count is incremented and its source hash replaced, in the
+        same transaction as the upload row and the project's storage total.
 
         Args:
             user_id: UUID of the uploader.
             project_id: UUID of the project.
             filename: Original filename.
-            storage_path: Path where file is stored.
+            storage_path: Path where the blob is stored.
             mime_type: MIME type of the file.
             size_bytes: File size in bytes.
+            content_hash: SHA-256 hex digest of the stored bytes.
+            source_hash: SHA-256 hex digest of the bytes as uploaded.
+            width: Image width in pixels.
+            height: Image height in pixels.
+            placeholder: Inline preview data URI.
 
         Returns:
             The created upload record.
         """
+        stmt = insert(UploadBlob).values(
+            content_hash=content_hash,
+            source_hash=source_hash,
+            storage_path=storage_path,
+            mime_type=mime_type,
+            size_bytes=size_bytes,
+            width=width,
+            height=height,
+            placeholder=placeholder,
+            ref_count=1,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UploadBlob.content_hash],
+            set_={
+                "ref_count": UploadBlob.ref_count + 1,
+                "source_hash": stmt.excluded.source_hash,
+            },
+        ).returning(UploadBlob.storage_path)
+        result = await self.db.execute(stmt)
+
         upload = Upload(
             user_id=user_id,
             project_id=project_id,
             filename=filename,
-            storage_path=storage_path,
+            storage_path=result.scalar_one(),
             mime_type=mime_type,
             size_bytes=size_bytes,
+            width=width,
+            height=height,
+            placeholder=placeholder,
+            content_hash=content_hash,
         )
         self.db.add(upload)
+        await self.adjust_upload_bytes(project_id, size_bytes)
+        await self.db.commit()
+        await self.db.refresh(upload)
+        return upload
+
+    async def create_from_source(
+        self,
+        user_id: UUID,
+        project_id: UUID,
+        filename: str,
+        source_hash: str,
+    ) -> Upload | None:
+        """Create an upload reusing the blob of an identical earlier upload.
+
+        The upload counts towards the project's storage total in full,
+        although its file is shared.
+
+        Args:
+            user_id: UUID of the uploader.
+            project_id: UUID of the project.
+            filename: Original filename.
+            source_hash: SHA-256 hex digest of the bytes as uploaded.
+
+        Returns:
+            The created upload record, or None if no blob was produced from
+            the same source bytes.
+        """
+        blob_hash = (
+            select(UploadBlob.content_hash)
+            .where(UploadBlob.source_hash == source_hash)
+            .limit(1)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(UploadBlob)
+            .where(UploadBlob.content_hash == blob_hash)
+            .values(ref_count=UploadBlob.ref_count + 1)
+            .returning(
+                UploadBlob.content_hash,
+                UploadBlob.storage_path,
+                UploadBlob.mime_type,
+                UploadBlob.size_bytes,
+                UploadBlob.width,
+                UploadBlob.height,
+                UploadBlob.placeholder,
+            )
+        )
+        result = await self.db.execute(stmt)
+        blob = result.one_or_none()
+        if blob is None:
+            return None
+
+        upload = Upload(
+            user_id=user_id,
+            project_id=project_id,
+            filename=filename,
+            storage_path=blob.storage_path,
+            mime_type=blob.mime_type,
+            size_bytes=blob.size_bytes,
+            width=blob.width,
+            height=blob.height,
+            placeholder=blob.placeholder,
+            content_hash=blob.content_hash,
+        )
+        self.db.add(upload)
+        await self.adjust_upload_bytes(project_id, blob.size_bytes)
         await self.db.commit()
         await self.db.refresh(upload)
         return upload
@@ -72,7 +181,13 @@ class UploadRepository:
         Returns:
             The upload if found, None otherwise.
         """
-        stmt = select(Upload).where(Upload.storage_path == storage_path)
+        # Uploads of the same content share a path; any of them describes it
+        stmt = (
+            select(Upload)
+            .where(Upload.storage_path == storage_path)
+            .order_by(Upload.created_at)
+            .limit(1)
+        )
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -122,11 +237,163 @@ class UploadRepository:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
-    async def delete(self, upload: Upload) -> None:
-        """Delete an upload record.
+    async def delete(self, upload: Upload) -> str | None:
+        """Delete an upload record, release its blob and its project storage.
 
         Args:
             upload: The upload to delete.
+
+        Returns:
+            Storage path of the file to remove, or None if other uploads
+            still reference it.
         """
         await self.db.delete(upload)
+        if upload.project_id is not None:
+            await self.adjust_upload_bytes(upload.project_id, -upload.size_bytes)
+        if upload.content_hash is None:
+            await self.db.commit()
+            return upload.storage_path
+
+        await self.db.flush()
+        paths = await self.release_blobs({upload.content_hash: 1})
         await self.db.commit()
+        return paths[0] if paths else None
+
+    async def release_blobs(self, counts: Mapping[str, int]) -> list[str]:
+        """Drop references to blobs and delete the ones no longer used.
+
+        Does not commit, so it runs in the transaction that deleted the
+        referencing uploads.
+
+        Args:
+            counts: Number of references dropped per content hash.
+
+        Returns:
+            Storage paths of the deleted blobs, for file cleanup.
+        """
+        if not counts:
+            return []
+        for content_hash, count in counts.items():
+            await self.db.execute(
+                update(UploadBlob)
+                .where(UploadBlob.content_hash == content_hash)
+                .values(ref_count=UploadBlob.ref_count - count)
+            )
+        stmt = (
+            delete(UploadBlob)
+            .where(
+                UploadBlob.content_hash.in_(list(counts)),
+                UploadBlob.ref_count <= 0,
+            )
+            .returning(UploadBlob.storage_path)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def lock_blob_files(self, storage_paths: Iterable[str]) -> None:
+        """Lock stored files against concurrent saving and removal.
+
+        Takes a transaction-scoped advisory lock per path, in sorted order
+        so concurrent callers cannot deadlock. Does not commit; the locks
+        are held until the caller's transaction ends.
+
+        Args:
+            storage_paths: Storage paths of the files.
+        """
+        for storage_path in sorted(set(storage_paths)):
+            await self.db.execute(
+                select(func.pg_advisory_xact_lock(func.hashtext(storage_path)))
+            )
+
+    @contextlib.asynccontextmanager
+    async def unused_files(self, storage_paths: list[str]) -> AsyncIterator[list[str]]:
+        """Lock released files and yield those no blob uses any more.
+
+        A concurrent upload of the same content may have created a new
+        blob row for a path after its old row was deleted. The file locks
+        make such an upload wait, or make this check wait for it to
+        commit, so a file is never removed under a live blob. The locks
+        are held until the block exits.
+
+        Args:
+            storage_paths: Storage paths of released files.
+
+        Yields:
+            The paths that are safe to remove from storage.
+        """
+        try:
+            await self.lock_blob_files(storage_paths)
+            result = await self.db.execute(
+                select(UploadBlob.storage_path).where(
+                    UploadBlob.storage_path.in_(storage_paths)
+                )
+            )
+            in_use = set(result.scalars().all())
+            yield [path for path in storage_paths if path not in in_use]
+        finally:
+            await self.db.commit()
+
+    async def adjust_upload_bytes(self, project_id: UUID, delta: int) -> None:
+        """Apply a delta to the project's denormalized upload byte total.
+
+        Runs as an atomic UPDATE in the caller's transaction and does not
+        commit.
+
+        Args:
+            project_id: The project UUID.
+            delta: Bytes added (positive) or removed (negative).
+        """
+        await self.db.execute(
+            update(Project)
+            .where(Project.id == project_id)
+            .values(upload_bytes=Project.upload_bytes + delta)
+        )
+
+    async def get_project_storage(self, project_id: UUID) -> tuple[int, int | None]:
+        """Get a project's storage in use and its own quota.
+
+        Reads the denormalized totals from the project row, so no uploads,
+        documents or revisions are summed.
+
+        Args:
+            project_id: The project UUID.
+
+        Returns:
+            Tuple of (bytes in use, the project's quota in bytes, or None
+            if it has no quota of its own). Zeros for an unknown project.
+        """
+        stmt = select(
+            Project.upload_bytes + Project.document_bytes + Project.revision_bytes,
+            Project.storage_quota_bytes,
+        ).where(Project.id == project_id)
+        result = await self.db.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            return 0, None
+        used, quota = row
+        return int(used), quota
+
+    async def get_storage_stats(self) -> tuple[int, int, int, int]:
+        """Get totals comparing uploaded bytes with bytes actually stored.
+
+        Uploads from before content-addressed storage own their file and
+        count towards both totals.
+
+        Returns:
+            Tuple of (upload count, blob count, uploaded bytes, stored bytes).
+        """
+        legacy_bytes = (
+            select(func.coalesce(func.sum(Upload.size_bytes), 0))
+            .where(Upload.content_hash.is_(None))
+            .scalar_subquery()
+        )
+        stmt = select(
+            select(func.count()).select_from(Upload).scalar_subquery(),
+            select(func.count()).select_from(UploadBlob).scalar_subquery(),
+            select(func.coalesce(func.sum(Upload.size_bytes), 0)).scalar_subquery(),
+            select(func.coalesce(func.sum(UploadBlob.size_bytes), 0)).scalar_subquery()
+            + legacy_bytes,
+        )
+        result = await self.db.execute(stmt)
+        upload_count, blob_count, uploaded_bytes, stored_bytes = result.one()
+        return upload_count, blob_count, int(uploaded_bytes), int(stored_bytes)
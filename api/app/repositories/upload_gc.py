@@ -0,0 +1,156 @@
+"""Repository for collecting uploads no document references."""
+
+from collections import Counter
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Row, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.document import Document
+from app.models.document_revision import DocumentRevision
+from app.models.upload import Upload
+from app.repositories.upload import UploadRepository
+
+# Every reference to an uploaded file contains this URL path
+UPLOAD_URL_MARKER = "/api/v1/uploads/file/"
+
+
+class UploadGCRepository:
+    """Repository for the orphaned upload collector.
+
+    Content is streamed through a server-side cursor, so scanning every
+    document and revision holds one fetch batch in memory at a time.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """Initialize the repository with a database session."""
+        self.db = db
+
+    async def stream_document_contents(
+        self, batch_size: int, since: datetime | None = None
+    ) -> AsyncIterator[str]:
+        """Stream the content of documents that link to uploaded files.
+
+        Args:
+            batch_size: Rows fetched from the cursor at a time.
+            since: Only documents changed at or after this time, if given.
+
+        Yields:
+            Document contents.
+        """
+        stmt = select(Document.content).where(
+            Document.content.contains(UPLOAD_URL_MARKER)
+        )
+        if since is not None:
+            stmt = stmt.where(Document.updated_at >= since)
+        result = await self.db.stream_scalars(
+            stmt.execution_options(yield_per=batch_size)
+        )
+        async for content in result:
+            yield content
+
+    async def stream_revision_contents(
+        self, batch_size: int, since: datetime | None = None
+    ) -> AsyncIterator[str]:
+        """Stream the content of revisions that link to uploaded files.
+
+        Args:
+            batch_size: Rows fetched from the cursor at a time.
+            since: Only revisions created at or after this time, if given.
+
+        Yields:
+            Revision contents.
+        """
+        stmt = select(DocumentRevision.content).where(
+            DocumentRevision.content.contains(UPLOAD_URL_MARKER)
+        )
+        if since is not None:
+            stmt = stmt.where(DocumentRevision.created_at >= since)
+        result = await self.db.stream_scalars(
+            stmt.execution_options(yield_per=batch_size)
+        )
+        async for content in result:
+            yield content
+
+    async def get_uploads_chunk(
+        self, created_before: datetime, after_id: UUID | None, limit: int
+    ) -> list[Row[tuple[UUID, str, int]]]:
+        """Get a chunk of uploads old enough to be collected, in ID order.
+
+        Args:
+            created_before: Only uploads created before this time.
+            after_id: ID of the last upload of the previous chunk, if any.
+            limit: Maximum number of uploads to return.
+
+        Returns:
+            Rows of (id, storage_path, size_bytes).
+        """
+        stmt = (
+            select(Upload.id, Upload.storage_path, Upload.size_bytes)
+            .where(Upload.created_at < created_before)
+            .order_by(Upload.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            stmt = stmt.where(Upload.id > after_id)
+        result = await self.db.execute(stmt)
+        return list(result.all())
+
+    def unused_files(
+        self, storage_paths: list[str]
+    ) -> AbstractAsyncContextManager[list[str]]:
+        """Lock released files and yield those no blob uses any more.
+
+        See UploadRepository.unused_files.
+
+        Args:
+            storage_paths: Storage paths of released files.
+
+        Returns:
+            Context manager yielding the paths that are safe to remove.
+        """
+        return UploadRepository(self.db).unused_files(storage_paths)
+
+    async def delete_uploads(self, upload_ids: list[UUID]) -> tuple[int, list[str]]:
+        """Delete upload records and release their blobs in one transaction.
+
+        The projects' upload byte totals are reduced in the same transaction.
+
+        Args:
+            upload_ids: IDs of the uploads to delete.
+
+        Returns:
+            Tuple of (number of uploads deleted, storage paths of files no
+            longer referenced, for file cleanup).
+        """
+        stmt = (
+            delete(Upload)
+            .where(Upload.id.in_(upload_ids))
+            .returning(
+                Upload.storage_path,
+                Upload.content_hash,
+                Upload.project_id,
+                Upload.size_bytes,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        rows = result.all()
+        upload_repo = UploadRepository(self.db)
+
+        freed: Counter[UUID] = Counter()
+        for row in rows:
+            if row.project_id is not None:
+                freed[row.project_id] += row.size_bytes
+        for project_id, size in freed.items():
+            await upload_repo.adjust_upload_bytes(project_id, -size)
+
+        # Uploads stored before content hashing own their file
+        paths = [row.storage_path for row in rows if row.content_hash is None]
+        released = Counter(row.content_hash for row in rows if row.content_hash)
+        paths += await upload_repo.release_blobs(released)
+        await self.db.commit()
+        return len(rows), paths
@@ -1,11 +1,14 @@
 """User repository for database operations."""
 
+from collections.abc import Collection
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.search import contains_pattern
 from app.models.user import User
 
 
@@ -42,6 +45,62 @@ class UserRepository:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_by_ids_or_emails(
+        self, user_ids: Collection[UUID], emails: Collection[str]
+    ) -> list[User]:
+        """Get all users matching any of the given IDs or email addresses.
+
+        Args:
+            user_ids: User UUIDs to look up.
+            emails: Email addresses to look up.
+
+        Returns:
+            Matching users, in no particular order.
+        """
+        if not user_ids and not emails:
+            return []
+        stmt = select(User).where(
+            or_(User.id.in_(list(user_ids)), User.email.in_(list(emails)))
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def search(
+        self,
+        query: str | None = None,
+        limit: int = 100,
+        cursor: tuple[datetime, UUID] | None = None,
+    ) -> list[User]:
+        """List users, optionally filtered by name or email.
+
+        The query matches case-insensitively anywhere in the name or email,
+        served by the trigram indexes on both columns. Results are keyset
+        paginated on (created_at, id).
+
+        Args:
+            query: Optional search text.
+            limit: Maximum number of records to return.
+            cursor: Keyset position (created_at, id) of the last row on the
+                previous page.
+
+        Returns:
+            Matching users, oldest first.
+        """
+        stmt = select(User)
+        if query:
+            pattern = contains_pattern(query)
+            stmt = stmt.where(
+                or_(
+                    User.name.ilike(pattern, escape="\\"),
+                    User.email.ilike(pattern, escape="\\"),
+                )
+            )
+        if cursor is not None:
+            stmt = stmt.where(tuple_(User.created_at, User.id) > tuple_(*cursor))
+        stmt = stmt.order_by(User.created_at.asc(), User.id.asc()).limit(limit)
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
     async def create(
         self,
         email: str,
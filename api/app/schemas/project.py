@@ -1,6 +1,7 @@
 """Project Pydantic schemas."""
 
 from datetime import datetime
+from enum import Enum
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -49,6 +50,8 @@ class ProjectRead(ProjectBase):
     git_branch: str | None
     git_doc_root: str | None
     chat_enabled: bool
+    document_count: int = 0
+    last_activity_at: datetime | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -65,3 +68,50 @@ class ProjectPermissionsRead(BaseModel):
         None,
         description="User's role: 'owner', 'admin', 'editor', 'viewer', or null for non-members",
     )
+
+
+class ProjectListInclude(str, Enum):
+    """Optional extra data for the project list endpoint."""
+
+    PERMISSIONS = "permissions"
+    BOOKMARK = "bookmark"
+
+
+class ProjectListItemRead(ProjectRead):
+    """Schema for a project in the project list.
+
+    Optional fields are only populated when requested via ``include``.
+    """
+
+    permissions: ProjectPermissionsRead | None = Field(
+        None,
+        description="Current user's permissions (only with include=permissions)",
+    )
+    is_bookmarked: bool | None = Field(
+        None,
+        description="Whether the current user bookmarked it (only with include=bookmark)",
+    )
+
+
+class ProjectDeletionStatus(str, Enum):
+    """State of a background project deletion."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ProjectDeletionRead(BaseModel):
+    """Schema for reading the progress of a background project deletion."""
+
+    project_id: UUID
+    status: ProjectDeletionStatus
+    phase: str | None = Field(
+        None,
+        description="Table currently being cleared: revisions, documents, uploads or batches",
+    )
+    revisions_deleted: int = 0
+    documents_deleted: int = 0
+    uploads_deleted: int = 0
+    batches_deleted: int = 0
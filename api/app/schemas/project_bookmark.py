@@ -33,3 +33,9 @@ class BookmarkStatusRead(BaseModel):
     """Schema for bookmark status check response."""
 
     is_bookmarked: bool
+
+
+class ProjectBookmarkStatusRead(BookmarkStatusRead):
+    """Schema for one project's entry in a batch bookmark status response."""
+
+    slug: str
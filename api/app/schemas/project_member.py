@@ -1,10 +1,11 @@
 """Project member Pydantic schemas."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING
+from enum import Enum
+from typing import TYPE_CHECKING, Self
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, model_validator
 
 from app.models.project_member import MemberRole
 
@@ -19,6 +20,59 @@ class ProjectMemberCreate(BaseModel):
     role: MemberRole = MemberRole.VIEWER
 
 
+class ProjectMemberInvite(BaseModel):
+    """Schema for one entry of a bulk member invitation.
+
+    Exactly one of ``user_id`` or ``email`` identifies the user.
+    """
+
+    user_id: UUID | None = None
+    email: EmailStr | None = None
+    role: MemberRole = MemberRole.VIEWER
+
+    @model_validator(mode="after")
+    def check_identifier(self) -> Self:
+        """Ensure exactly one of user_id or email is given."""
+        if (self.user_id is None) == (self.email is None):
+            raise ValueError("Provide exactly one of user_id or email")
+        return self
+
+
+class BulkInviteConflict(str, Enum):
+    """What to do when an invited user is already a member."""
+
+    SKIP = "skip"
+    UPDATE_ROLE = "update_role"
+
+
+class ProjectMemberBulkCreate(BaseModel):
+    """Schema for adding many project members at once."""
+
+    members: list[ProjectMemberInvite] = Field(..., min_length=1, max_length=500)
+    on_conflict: BulkInviteConflict = BulkInviteConflict.SKIP
+
+
+class BulkInviteOutcome(str, Enum):
+    """Result of one entry of a bulk member invitation."""
+
+    ADDED = "added"
+    ROLE_UPDATED = "role_updated"
+    ALREADY_MEMBER = "already_member"
+    USER_NOT_FOUND = "user_not_found"
+    IS_OWNER = "is_owner"
+    DUPLICATE = "duplicate"
+
+
+class ProjectMemberInviteResult(BaseModel):
+    """Outcome of one entry of a bulk member invitation, in request order."""
+
+    user_id: UUID | None
+    email: str | None
+    role: MemberRole
+    outcome: BulkInviteOutcome
+    member_id: UUID | None = None
+
+
 class ProjectMemberUpdate(BaseModel):
     """Schema for updating a project member's role."""
 
@@ -1,6 +1,7 @@
 """Upload Pydantic schemas."""
 
 from datetime import datetime
+from enum import Enum
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -17,6 +18,12 @@ class UploadRead(BaseModel):
     filename: str
     mime_type: str
     size_bytes: int
+    width: int | None = Field(default=None, description="Image width in pixels")
+    height: int | None = Field(default=None, description="Image height in pixels")
+    placeholder: str | None = Field(
+        default=None,
+        description="Tiny preview as a data: URI, to paint while loading",
+    )
     created_at: datetime
     url: str = Field(description="URL to access the uploaded file")
 
@@ -28,5 +35,110 @@ class UploadCreateResponse(BaseModel):
     filename: str
     mime_type: str
     size_bytes: int
+    width: int | None = Field(default=None, description="Image width in pixels")
+    height: int | None = Field(default=None, description="Image height in pixels")
+    placeholder: str | None = Field(
+        default=None,
+        description="Tiny preview as a data: URI, to paint while loading",
+    )
     url: str
     created_at: datetime
+
+
+class UploadStorageStatsRead(BaseModel):
+    """Schema for storage saved by content-addressed deduplication."""
+
+    upload_count: int
+    blob_count: int = Field(description="Number of distinct stored files")
+    uploaded_bytes: int = Field(description="Total size of all uploads")
+    stored_bytes: int = Field(description="Bytes actually kept in storage")
+    saved_bytes: int = Field(description="uploaded_bytes - stored_bytes")
+
+
+class ProjectStorageUsageRead(BaseModel):
+    """Schema for reading a project's storage use."""
+
+    project_id: UUID
+    slug: str
+    name: str
+    upload_bytes: int
+    document_bytes: int
+    revision_bytes: int
+    total_bytes: int
+    quota_bytes: int | None = Field(
+        default=None, description="Storage quota in bytes; null when unlimited"
+    )
+
+
+class DirectUploadCreate(BaseModel):
+    """Schema for starting an upload sent straight to storage."""
+
+    filename: str = Field(min_length=1, max_length=255)
+    mime_type: str = Field(description="Content-Type the file will be sent with")
+    size_bytes: int = Field(gt=0, description="Exact size of the file in bytes")
+
+
+class DirectUploadStatus(str, Enum):
+    """State of a direct upload."""
+
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class DirectUploadTicket(BaseModel):
+    """Schema telling the client where and how to send the file."""
+
+    id: str = Field(description="Direct upload token")
+    upload_url: str = Field(description="URL to send the file to")
+    method: str = Field(default="PUT", description="HTTP method to send it with")
+    headers: dict[str, str] = Field(description="Headers the request must carry")
+    expires_at: datetime = Field(description="When upload_url stops accepting")
+
+
+class DirectUploadRead(BaseModel):
+    """Schema for reading the state of a direct upload."""
+
+    id: str = Field(description="Direct upload token")
+    status: DirectUploadStatus
+    error: str | None = Field(default=None, description="Why the upload failed")
+    upload: UploadCreateResponse | None = Field(
+        default=None, description="The created upload, once completed"
+    )
+
+
+class UploadGCStatus(str, Enum):
+    """State of an orphaned upload collection job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class UploadGCRead(BaseModel):
+    """Schema for reading the progress of an orphaned upload collection."""
+
+    status: UploadGCStatus
+    dry_run: bool = Field(description="Whether orphans are only reported")
+    phase: str | None = Field(
+        None,
+        description="Current step: scan (collect references) or sweep (uploads)",
+    )
+    documents_scanned: int = 0
+    revisions_scanned: int = 0
+    references_found: int = Field(0, description="Distinct referenced file paths")
+    uploads_checked: int = 0
+    orphans_found: int = Field(
+        0, description="Unreferenced uploads older than the grace period"
+    )
+    orphan_bytes: int = 0
+    uploads_deleted: int = 0
+    files_deleted: int = Field(
+        0, description="Uploaded files removed from storage, variants excluded"
+    )
+    orphan_sample: list[str] = Field(
+        default_factory=list,
+        description="Storage paths of the first orphans found",
+    )
@@ -42,6 +42,14 @@ class UserProfileUpdate(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserSummaryRead(UserBase):
+    """Schema for a user in search results, e.g. the member invite dialog."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+
+
 class UserRead(UserBase):
     """Schema for reading a user."""
 
@@ -1,11 +1,14 @@
 """Authorization helper for project access control."""
 
+from dataclasses import dataclass
 from enum import Enum
 from uuid import UUID
 
 from app.models.project import Project
 from app.models.project_member import MemberRole
+from app.repositories.project import ProjectRepository
 from app.repositories.project_member import ProjectMemberRepository
+from app.services.exceptions import ProjectNotFoundError
 
 
 class Permission(str, Enum):
@@ -93,15 +96,131 @@ async def get_user_permissions(
     if project.owner_id == user_id:
         return OWNER_PERMISSIONS.copy()
 
+    # Check member role
+    role = await member_repo.get_user_role(project.id, user_id)
+    return resolve_permissions(project, user_id, role)
+
+
+def resolve_permissions(
+    project: Project,
+    user_id: UUID,
+    member_role: MemberRole | None,
+) -> set[Permission]:
+    """Resolve permissions from an already loaded member role.
+
+    Applies the same rules as get_user_permissions without any
+    database access.
+
+    Args:
+        project: The project to check.
+        user_id: UUID of the user.
+        member_role: The user's member role, or None for non-members.
+
+    Returns:
+        Set of permissions the user has.
+    """
+    # Owner has all permissions
+    if project.owner_id == user_id:
+        return OWNER_PERMISSIONS.copy()
+
     permissions: set[Permission] = set()
 
     # Public projects allow view access
     if project.visibility.value == "public":
         permissions.add(Permission.VIEW)
 
-    # Check member role
-    role = await member_repo.get_user_role(project.id, user_id)
-    if role is not None:
-        permissions.update(ROLE_PERMISSIONS.get(role, set()))
+    if member_role is not None:
+        permissions.update(ROLE_PERMISSIONS.get(member_role, set()))
 
     return permissions
+
+
+@dataclass(frozen=True)
+class ProjectAccess:
+    """A project together with the requesting user's effective role.
+
+    Loaded with a single query so that project-scoped requests do not need
+    a separate membership lookup before doing any real work.
+    """
+
+    project: Project
+    user_id: UUID
+    member_role: MemberRole | None
+
+    @property
+    def is_owner(self) -> bool:
+        """Whether the requesting user owns the project."""
+        return self.project.owner_id == self.user_id
+
+    @property
+    def role(self) -> str | None:
+        """Effective role: 'owner', a member role value, or None."""
+        if self.is_owner:
+            return "owner"
+        return self.member_role.value if self.member_role else None
+
+    @property
+    def permissions(self) -> set[Permission]:
+        """All permissions the requesting user has on the project."""
+        return resolve_permissions(self.project, self.user_id, self.member_role)
+
+    def has_permission(self, permission: Permission) -> bool:
+        """Check if the requesting user has a specific permission.
+
+        Args:
+            permission: The required permission.
+
+        Returns:
+            True if user has the permission, False otherwise.
+        """
+        return permission in self.permissions
+
+
+async def get_project_access(
+    project_repo: ProjectRepository,
+    slug: str,
+    user_id: UUID,
+) -> ProjectAccess:
+    """Load a project and the user's member role in one round trip.
+
+    Args:
+        project_repo: Project repository instance.
+        slug: The project slug.
+        user_id: UUID of the requesting user.
+
+    Returns:
+        The project with the user's effective role.
+
+    Raises:
+        ProjectNotFoundError: If project is not found.
+    """
+    row = await project_repo.get_by_slug_with_role(slug, user_id)
+    if row is None:
+        raise ProjectNotFoundError(f"Project with slug '{slug}' not found")
+    project, member_role = row
+    return ProjectAccess(project=project, user_id=user_id, member_role=member_role)
+
+
+async def get_project_access_by_id(
+    project_repo: ProjectRepository,
+    project_id: UUID,
+    user_id: UUID,
+) -> ProjectAccess:
+    """Load a project by ID and the user's member role in one round trip.
+
+    Args:
+        project_repo: Project repository instance.
+        project_id: The UUID of the project.
+        user_id: UUID of the requesting user.
+
+    Returns:
+        The project with the user's effective role.
+
+    Raises:
+        ProjectNotFoundError: If project is not found.
+    """
+    row = await project_repo.get_by_id_with_role(project_id, user_id)
+    if row is None:
+        raise ProjectNotFoundError(f"Project with ID '{project_id}' not found")
+    project, member_role = row
+    return ProjectAccess(project=project, user_id=user_id, member_role=member_role)
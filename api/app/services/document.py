@@ -7,7 +7,6 @@ from app.models.document_revision import ChangeType
 from app.models.project import Project
 from app.repositories.document import DocumentRepository
 from app.repositories.project import ProjectRepository
-from app.repositories.project_member import ProjectMemberRepository
 from app.repositories.revision import RevisionRepository
 from app.schemas.document import (
     DocumentPutRequest,
@@ -16,13 +15,12 @@ from app.schemas.document import (
     RevisionBatchRead,
     RevisionDocumentSummary,
 )
-from app.services.authorization import Permission, check_project_permission
+from app.services.authorization import Permission, get_project_access
 from app.services.exceptions import (
     DocumentNotFoundError,
     InvalidPathError,
     ParentNotFoundError,
     PermissionDeniedError,
-    ProjectNotFoundError,
 )
 
 
@@ -34,7 +32,6 @@ class DocumentService:
         document_repo: DocumentRepository,
         revision_repo: RevisionRepository,
         project_repo: ProjectRepository,
-        member_repo: ProjectMemberRepository,
     ) -> None:
         """Initialize the service with repositories.
 
@@ -42,12 +39,10 @@ class DocumentService:
             document_repo: Repository for document database operations.
             revision_repo: Repository for revision database operations.
             project_repo: Repository for project database operations.
-            member_repo: Repository for project member database operations.
         """
         self.document_repo = document_repo
         self.revision_repo = revision_repo
         self.project_repo = project_repo
-        self.member_repo = member_repo
 
     async def get_document_tree(
         self, project_slug: str, user_id: UUID
@@ -363,19 +358,13 @@ class DocumentService:
             ProjectNotFoundError: If project is not found.
             PermissionDeniedError: If user does not have access.
         """
-        project = await self.project_repo.get_by_slug(project_slug)
-        if project is None:
-            raise ProjectNotFoundError(f"Project with slug '{project_slug}' not found")
+        # Load project and member role in a single query
+        access = await get_project_access(self.project_repo, project_slug, user_id)
 
         # Determine required permission
         permission = Permission.EDIT if require_write else Permission.VIEW
 
-        # Check permission using authorization helper
-        has_permission = await check_project_permission(
-            project, user_id, permission, self.member_repo
-        )
-
-        if not has_permission:
+        if not access.has_permission(permission):
             if require_write:
                 raise PermissionDeniedError(
                     "You do not have permission to modify documents in this project"
@@ -385,7 +374,7 @@ class DocumentService:
                     "You do not have permission to view this project"
                 )
 
-        return project
+        return access.project
 
     def _parse_path(self, path: str) -> tuple[str | None, str]:
         """Parse path into (parent_path, slug).
@@ -178,7 +178,51 @@ class InvalidFileTypeError(UploadServiceError):
     pass
 
 
+class StorageQuotaExceededError(UploadServiceError):
+    """Raised when an upload would take a project over its storage quota."""
+
+    pass
+
+
+class ImageTooLargeError(UploadServiceError):
+    """Raised when an image's pixel dimensions exceed the decode budget."""
+
+    pass
+
+
+class InvalidVariantError(UploadServiceError):
+    """Raised when a requested image variant is not offered."""
+
+    pass
+
+
 class StorageError(UploadServiceError):
     """Raised when storage operation fails."""
 
     pass
+
+
+class ImageProcessingUnavailableError(UploadServiceError):
+    """Raised when an image cannot be processed right now.
+
+    Covers a full processing queue, a job exceeding its time limit and a
+    crashed worker process.
+    """
+
+    pass
+
+
+class DirectUploadNotFoundError(UploadServiceError):
+    """Raised when a direct upload session is unknown or has expired."""
+
+    pass
+
+
+class DirectUploadStateError(UploadServiceError):
+    """Raised when a direct upload is not in a state that allows the request.
+
+    Covers sending the file again after it was received, and completing
+    an upload whose file has not arrived.
+    """
+
+    pass
@@ -1,12 +1,31 @@
 """Image processing service."""
 
+import base64
 import io
+import math
+import shutil
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
 from typing import BinaryIO
 
-from PIL import Image
+from PIL import Image, ImageChops, ImageSequence
 
 from app.config import settings
-from app.services.exceptions import InvalidFileTypeError
+from app.services.exceptions import ImageTooLargeError, InvalidFileTypeError
+
+
+@dataclass(frozen=True)
+class ProcessedImage:
+    """Result of processing an upload, picklable for worker processes."""
+
+    content: bytes
+    mime_type: str
+    size_bytes: int
+    width: int
+    height: int
+    placeholder: str
 
 
 class ImageProcessor:
@@ -14,12 +33,69 @@ class ImageProcessor:
 
     SUPPORTED_FORMATS = {"PNG", "JPEG", "GIF", "WEBP"}
 
+    # Longest side of the inline preview painted while the image loads
+    PLACEHOLDER_SIZE = 16
+
+    # Output formats of responsive variants, by MIME type
+    VARIANT_FORMATS = {
+        "image/avif": "AVIF",
+        "image/webp": "WEBP",
+        "image/jpeg": "JPEG",
+        "image/png": "PNG",
+    }
+
+    # Output formats an animated GIF can be transcoded to, by MIME type
+    ANIMATION_FORMATS = {
+        "image/webp": "WEBP",
+        "video/mp4": "MP4",
+        "video/webm": "WEBM",
+    }
+
+    # ffmpeg output options per video type. Dimensions are rounded down to
+    # even numbers, which 4:2:0 chroma subsampling requires.
+    VIDEO_ENCODER_ARGS = {
+        "video/mp4": (
+            "-c:v",
+            "libx264",
+            "-crf",
+            "28",
+            "-preset",
+            "medium",
+            "-pix_fmt",
+            "yuv420p",
+            "-movflags",
+            "+faststart",
+        ),
+        "video/webm": (
+            "-c:v",
+            "libvpx-vp9",
+            "-crf",
+            "40",
+            "-b:v",
+            "0",
+            "-pix_fmt",
+            "yuv420p",
+        ),
+    }
+
+    # Frame duration assumed when a GIF frame does not specify one, in ms
+    DEFAULT_FRAME_DURATION = 100
+
+    # Downscale by cheap integer reduction until the image is within this
+    # factor of the target size, then finish with LANCZOS. 3.0 is visually
+    # indistinguishable from a full LANCZOS resize.
+    REDUCING_GAP = 3.0
+
     def __init__(
         self,
         max_dimension: int | None = None,
         jpeg_quality: int | None = None,
         webp_quality: int | None = None,
         png_compression: int | None = None,
+        max_pixels: int | None = None,
+        avif_quality: int | None = None,
+        max_animation_pixels: int | None = None,
+        ffmpeg_path: str | None = None,
     ) -> None:
         """Initialize image processor with configuration.
 
@@ -28,11 +104,22 @@ class ImageProcessor:
             jpeg_quality: JPEG compression quality (1-100).
             webp_quality: WebP compression quality (1-100).
             png_compression: PNG compression level (0-9).
+            max_pixels: Maximum decoded width x height accepted.
+            avif_quality: AVIF compression quality (1-100).
+            max_animation_pixels: Maximum width x height x frames accepted
+                for animated images.
+            ffmpeg_path: ffmpeg executable used to encode video.
         """
         self.max_dimension = max_dimension or settings.upload_max_dimension
+        self.max_pixels = max_pixels or settings.upload_max_image_pixels
         self.jpeg_quality = jpeg_quality or settings.upload_jpeg_quality
         self.webp_quality = webp_quality or settings.upload_webp_quality
         self.png_compression = png_compression or settings.upload_png_compression
+        self.avif_quality = avif_quality or settings.upload_avif_quality
+        self.max_animation_pixels = (
+            max_animation_pixels or settings.upload_max_animation_pixels
+        )
+        self.ffmpeg_path = ffmpeg_path or settings.upload_ffmpeg_path
 
     def process(self, file: BinaryIO, mime_type: str) -> tuple[io.BytesIO, str, int]:
         """Process image: resize and compress.
@@ -46,15 +133,31 @@ class ImageProcessor:
 
         Raises:
             InvalidFileTypeError: If image format is not supported.
+            ImageTooLargeError: If the image exceeds the pixel budget.
         """
-        try:
-            img = Image.open(file)
-        except Exception as e:
-            raise InvalidFileTypeError(f"Failed to open image: {e}") from e
+        _, output, output_mime, size = self._process(file, mime_type)
+        return output, output_mime, size
 
-        # Validate format
-        if img.format not in self.SUPPORTED_FORMATS:
-            raise InvalidFileTypeError(f"Unsupported image format: {img.format}")
+    def _process(
+        self, file: BinaryIO, mime_type: str
+    ) -> tuple[Image.Image, io.BytesIO, str, int]:
+        """Resize and compress an image, keeping the resized image.
+
+        Args:
+            file: Input file object.
+            mime_type: Original MIME type.
+
+        Returns:
+            Tuple of (resized image, processed file buffer, mime_type,
+            size_bytes).
+
+        Raises:
+            InvalidFileTypeError: If image format is not supported.
+            ImageTooLargeError: If the image exceeds the pixel budget.
+        """
+        img = self._open(file)
+        if getattr(img, "n_frames", 1) > 1 and img.format in ("GIF", "WEBP"):
+            return self._process_animation(file, img)
 
         # Resize if needed
         img = self._resize_if_needed(img)
@@ -76,33 +179,455 @@ class ImageProcessor:
             img.save(output, format="PNG", compress_level=self.png_compression)
             output_mime = "image/png"
         elif img.format == "GIF" or mime_type == "image/gif":
-            # GIF: preserve animation if present
-            if hasattr(img, "n_frames") and img.n_frames > 1:
-                # Animated GIF
-                img.save(output, format="GIF", save_all=True)
-            else:
-                img.save(output, format="GIF")
+            img.save(output, format="GIF")
             output_mime = "image/gif"
         else:
             raise InvalidFileTypeError(f"Cannot process format: {img.format}")
 
         output.seek(0)
         size = output.getbuffer().nbytes
-        return output, output_mime, size
+        return img, output, output_mime, size
+
+    def _process_animation(
+        self, file: BinaryIO, img: Image.Image
+    ) -> tuple[Image.Image, io.BytesIO, str, int]:
+        """Fit an animated GIF or WebP within the dimension limit.
+
+        Animations that already fit are kept byte for byte, since
+        re-encoding them would only lose quality. Larger ones have every
+        frame resized, keeping frame durations and the loop count. Either
+        way the result stays in the original format, so it can always be
+        served as a fallback for transcoded copies.
+
+        Args:
+            file: Input file object.
+            img: Animated image opened from file, not yet loaded.
+
+        Returns:
+            Tuple of (first frame, processed file buffer, mime_type,
+            size_bytes).
+
+        Raises:
+            ImageTooLargeError: If all frames together exceed the pixel
+                budget for animations.
+        """
+        self._check_animation_pixels(img)
+        mime_type = "image/gif" if img.format == "GIF" else "image/webp"
+
+        size = self._fit_within_max_dimension(img.width, img.height)
+        if size is None:
+            file.seek(0)
+            output = io.BytesIO(file.read())
+            return img, output, mime_type, output.getbuffer().nbytes
+
+        frames, durations = self._frames(img, size)
+        options: dict = {
+            "save_all": True,
+            "duration": durations,
+        }
+        if "loop" in img.info:
+            options["loop"] = img.info["loop"]
+
+        if img.format == "WEBP":
+            options["quality"] = self.webp_quality
+        elif frames[0].mode == "RGB":
+            # Mapping every frame to one palette keeps unchanged pixels
+            # identical between frames, so the encoder only stores what
+            # changed. Per-frame palettes (Pillow's default) dither each
+            # frame differently and make the GIF many times larger.
+            palette = frames[0].quantize(dither=Image.Dither.NONE)
+            frames = [
+                frame.quantize(palette=palette, dither=Image.Dither.NONE)
+                for frame in frames
+            ]
+            # Skip Pillow's per-frame palette optimization, which is slow
+            # on large frames and pointless with a shared palette
+            options["optimize"] = False
+
+        output = io.BytesIO()
+        frames[0].save(output, format=img.format, append_images=frames[1:], **options)
+        output.seek(0)
+        return frames[0], output, mime_type, output.getbuffer().nbytes
+
+    def _check_animation_pixels(self, img: Image.Image) -> None:
+        """Check an animation against the pixel budget for all its frames.
+
+        Args:
+            img: Image, not yet loaded.
+
+        Raises:
+            ImageTooLargeError: If width x height x frames exceeds the limit.
+        """
+        n_frames = getattr(img, "n_frames", 1)
+        if img.width * img.height * n_frames > self.max_animation_pixels:
+            raise ImageTooLargeError(
+                f"Animation is {img.width}x{img.height} pixels over {n_frames} "
+                f"frames, exceeding the limit of {self.max_animation_pixels} pixels"
+            )
+
+    def _frames(
+        self, img: Image.Image, size: tuple[int, int] | None = None
+    ) -> tuple[list[Image.Image], list[int]]:
+        """Decode every frame of an animation, optionally resized.
+
+        Consecutive frames of an animation, screen recordings especially,
+        mostly differ in a small region. Only that region is resized; the
+        rest is copied from the previous resized frame. The region is
+        padded beyond the resampling filter's reach, so the result matches
+        resizing each frame in full.
+
+        Args:
+            img: Animated image.
+            size: Size to resize each frame to, or None to keep it.
+
+        Returns:
+            Tuple of (RGB or RGBA frames, frame durations in milliseconds).
+        """
+        has_alpha = "A" in img.getbands() or "transparency" in img.info
+        mode = "RGBA" if has_alpha else "RGB"
+        frames: list[Image.Image] = []
+        durations = []
+        previous = None
+        for frame in ImageSequence.Iterator(img):
+            current = frame.convert(mode)
+            # WebP frames set their duration only once loaded
+            durations.append(frame.info.get("duration") or self.DEFAULT_FRAME_DURATION)
+            if size is None:
+                frames.append(current)
+                continue
+
+            bbox = None
+            if previous is not None:
+                bbox = ImageChops.difference(current, previous).getbbox()
+                if bbox is None:
+                    frames.append(frames[-1])
+                    previous = current
+                    continue
+
+            if bbox is None:
+                resized = current.resize(
+                    size, Image.Resampling.LANCZOS, reducing_gap=self.REDUCING_GAP
+                )
+            else:
+                resized = frames[-1].copy()
+                box = self._scaled_box(bbox, current.size, size)
+                scale_x = size[0] / current.width
+                scale_y = size[1] / current.height
+                region = current.resize(
+                    (box[2] - box[0], box[3] - box[1]),
+                    Image.Resampling.LANCZOS,
+                    box=(
+                        box[0] / scale_x,
+                        box[1] / scale_y,
+                        box[2] / scale_x,
+                        box[3] / scale_y,
+                    ),
+                    reducing_gap=self.REDUCING_GAP,
+                )
+                resized.paste(region, box[:2])
+            frames.append(resized)
+            previous = current
+        return frames, durations
+
+    def _scaled_box(
+        self,
+        bbox: tuple[int, int, int, int],
+        source_size: tuple[int, int],
+        target_size: tuple[int, int],
+    ) -> tuple[int, int, int, int]:
+        """Map a changed region to the pixels it affects after resizing.
+
+        Args:
+            bbox: Changed region in source pixels.
+            source_size: Size of the source frame.
+            target_size: Size of the resized frame.
+
+        Returns:
+            Region of the resized frame to recompute, padded by the reach
+            of the LANCZOS filter (3 target pixels when downscaling).
+        """
+        padding = 4
+        scale_x = target_size[0] / source_size[0]
+        scale_y = target_size[1] / source_size[1]
+        return (
+            max(0, math.floor(bbox[0] * scale_x) - padding),
+            max(0, math.floor(bbox[1] * scale_y) - padding),
+            min(target_size[0], math.ceil(bbox[2] * scale_x) + padding),
+            min(target_size[1], math.ceil(bbox[3] * scale_y) + padding),
+        )
+
+    def process_bytes(self, content: bytes, mime_type: str) -> ProcessedImage:
+        """Process an image held in memory.
+
+        Variant of process() with picklable input and output, for running
+        in a worker process. Also measures the processed image and renders
+        its placeholder, so neither needs another decode later.
+
+        Args:
+            content: Original image bytes.
+            mime_type: Original MIME type.
+
+        Returns:
+            Processed image bytes with their dimensions and placeholder.
+
+        Raises:
+            InvalidFileTypeError: If image format is not supported.
+            ImageTooLargeError: If the image exceeds the pixel budget.
+        """
+        img, output, output_mime, size = self._process(io.BytesIO(content), mime_type)
+        return ProcessedImage(
+            content=output.getvalue(),
+            mime_type=output_mime,
+            size_bytes=size,
+            width=img.width,
+            height=img.height,
+            placeholder=self._placeholder(img),
+        )
+
+    def _placeholder(self, img: Image.Image) -> str:
+        """Render a tiny blurred-looking preview as a data URI.
+
+        Browsers upscale the 16px image smoothly, which reads as a blur of
+        the real image. Animated images use their first frame.
+
+        Args:
+            img: Processed image.
+
+        Returns:
+            WebP ``data:`` URI, typically 100-300 characters.
+        """
+        has_alpha = "A" in img.getbands() or "transparency" in img.info
+        preview = img.convert("RGBA" if has_alpha else "RGB")
+        preview.thumbnail((self.PLACEHOLDER_SIZE, self.PLACEHOLDER_SIZE))
+        output = io.BytesIO()
+        preview.save(output, format="WEBP", quality=40)
+        encoded = base64.b64encode(output.getvalue()).decode("ascii")
+        return f"data:image/webp;base64,{encoded}"
+
+    def create_variant(
+        self, content: bytes, width: int, mime_type: str
+    ) -> tuple[bytes, str, int]:
+        """Create a resized copy of a stored image in another format.
+
+        Images are only ever scaled down; a width above the original just
+        re-encodes it. Animated images keep their first frame only.
+
+        Args:
+            content: Stored image bytes.
+            width: Target width in pixels.
+            mime_type: Output MIME type, one of VARIANT_FORMATS.
+
+        Returns:
+            Tuple of (variant bytes, mime_type, size_bytes).
+
+        Raises:
+            InvalidFileTypeError: If the image or output type is not supported.
+            ImageTooLargeError: If the image exceeds the pixel budget.
+        """
+        output_format = self.VARIANT_FORMATS.get(mime_type)
+        if output_format is None:
+            raise InvalidFileTypeError(f"Cannot create {mime_type} variant")
+
+        img = self._open(io.BytesIO(content))
+        if img.width > width:
+            img = self._downscale(
+                img, width, max(1, round(img.height * width / img.width))
+            )
+
+        output = io.BytesIO()
+        if output_format == "JPEG":
+            if img.mode != "RGB":
+                img = img.convert("RGB")
+            img.save(output, format="JPEG", quality=self.jpeg_quality, optimize=True)
+        else:
+            if img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGBA")
+            if output_format == "AVIF":
+                img.save(output, format="AVIF", quality=self.avif_quality)
+            elif output_format == "WEBP":
+                img.save(output, format="WEBP", quality=self.webp_quality)
+            else:
+                img.save(output, format="PNG", compress_level=self.png_compression)
+
+        return output.getvalue(), mime_type, output.getbuffer().nbytes
+
+    def video_available(self) -> bool:
+        """Check whether an ffmpeg executable is available to encode video.
+
+        Returns:
+            True if animated GIFs can be transcoded to MP4 and WebM.
+        """
+        return shutil.which(self.ffmpeg_path) is not None
+
+    def transcode_animation(
+        self, content: bytes, mime_type: str
+    ) -> tuple[bytes, str, int]:
+        """Transcode a stored GIF to animated WebP or to video.
+
+        The GIF has already been resized to the dimension limit on upload,
+        so frames keep their size. Video needs ffmpeg (see
+        ``video_available``); WebP is encoded by Pillow.
+
+        Args:
+            content: Stored GIF bytes.
+            mime_type: Output MIME type, one of ANIMATION_FORMATS.
+
+        Returns:
+            Tuple of (transcoded bytes, mime_type, size_bytes).
+
+        Raises:
+            InvalidFileTypeError: If the input is not a GIF, the output type
+                is not supported, or the encoder fails.
+            ImageTooLargeError: If the animation exceeds the pixel budget.
+        """
+        if mime_type not in self.ANIMATION_FORMATS:
+            raise InvalidFileTypeError(f"Cannot transcode GIF to {mime_type}")
+
+        img = self._open(io.BytesIO(content))
+        if img.format != "GIF":
+            raise InvalidFileTypeError(f"Cannot transcode {img.format} animation")
+        self._check_animation_pixels(img)
+
+        if mime_type in self.VIDEO_ENCODER_ARGS:
+            output = self._encode_video(content, mime_type)
+            return output, mime_type, len(output)
+
+        frames, durations = self._frames(img)
+        buffer = io.BytesIO()
+        frames[0].save(
+            buffer,
+            format="WEBP",
+            save_all=True,
+            append_images=frames[1:],
+            duration=durations,
+            # A GIF without a loop count plays once
+            loop=img.info.get("loop", 1),
+            quality=self.webp_quality,
+            # Lets the encoder store each frame lossless or lossy, whichever
+            # is smaller: flat screen recordings compress far better
+            # lossless, dithered photographic GIFs lossy
+            allow_mixed=True,
+            # gif2webp's keyframe spacing; Pillow's default of a keyframe
+            # every 3-5 frames doubles the size of screen recordings.
+            # Method 2 compresses as well as 4 here in three quarters of
+            # the time.
+            kmin=9,
+            kmax=17,
+            method=2,
+        )
+        return buffer.getvalue(), mime_type, buffer.getbuffer().nbytes
+
+    def _encode_video(self, content: bytes, mime_type: str) -> bytes:
+        """Encode a GIF as video with ffmpeg.
+
+        Args:
+            content: GIF bytes.
+            mime_type: Output MIME type, one of VIDEO_ENCODER_ARGS.
+
+        Returns:
+            Encoded video bytes.
+
+        Raises:
+            InvalidFileTypeError: If ffmpeg is missing or fails.
+        """
+        extension = "mp4" if mime_type == "video/mp4" else "webm"
+        with tempfile.TemporaryDirectory() as workdir:
+            source = Path(workdir) / "source.gif"
+            target = Path(workdir) / f"output.{extension}"
+            source.write_bytes(content)
+            try:
+                subprocess.run(
+                    [
+                        self.ffmpeg_path,
+                        "-hide_banner",
+                        "-loglevel",
+                        "error",
+                        "-i",
+                        str(source),
+                        "-vf",
+                        "scale=trunc(iw/2)*2:trunc(ih/2)*2",
+                        "-an",
+                        *self.VIDEO_ENCODER_ARGS[mime_type],
+                        str(target),
+                    ],
+                    check=True,
+                    capture_output=True,
+                )
+            except FileNotFoundError as e:
+                raise InvalidFileTypeError(
+                    f"ffmpeg not found at {self.ffmpeg_path}"
+                ) from e
+            except subprocess.CalledProcessError as e:
+                stderr = e.stderr.decode(errors="replace").strip()
+                raise InvalidFileTypeError(f"ffmpeg failed: {stderr}") from e
+            return target.read_bytes()
+
+    def _open(self, file: BinaryIO) -> Image.Image:
+        """Open an image and check it against the format and pixel limits.
+
+        Args:
+            file: Input file object.
+
+        Returns:
+            PIL Image object, not yet loaded.
+
+        Raises:
+            InvalidFileTypeError: If image format is not supported.
+            ImageTooLargeError: If the image exceeds the pixel budget.
+        """
+        try:
+            img = Image.open(file)
+        except Exception as e:
+            raise InvalidFileTypeError(f"Failed to open image: {e}") from e
+
+        # Validate format
+        if img.format not in self.SUPPORTED_FORMATS:
+            raise InvalidFileTypeError(f"Unsupported image format: {img.format}")
+
+        # Image.open only parses the header, so this rejects decompression
+        # bombs before any pixel data is decoded
+        width, height = img.size
+        if width * height > self.max_pixels:
+            raise ImageTooLargeError(
+                f"Image is {width}x{height} pixels, exceeding the limit of "
+                f"{self.max_pixels} pixels"
+            )
+        return img
 
     def _resize_if_needed(self, img: Image.Image) -> Image.Image:
         """Resize image if either dimension exceeds max.
 
+        JPEGs are decoded at a reduced scale (1/2, 1/4 or 1/8) by libjpeg
+        itself, which is far cheaper than decoding at full size.
+        Other formats are reduced by integer box downscaling before the
+        final LANCZOS pass. Must run before the image is loaded.
+
         Args:
-            img: PIL Image object.
+            img: PIL Image object, not yet loaded.
 
         Returns:
             Resized image or original if no resize needed.
         """
-        width, height = img.size
+        size = self._fit_within_max_dimension(img.width, img.height)
+        if size is None:
+            return img
+        return self._downscale(img, *size)
+
+    def _fit_within_max_dimension(
+        self, width: int, height: int
+    ) -> tuple[int, int] | None:
+        """Compute the size that fits within max_dimension.
+
+        Args:
+            width: Current width in pixels.
+            height: Current height in pixels.
 
+        Returns:
+            New (width, height) keeping the aspect ratio, or None if the
+            image already fits.
+        """
         if width <= self.max_dimension and height <= self.max_dimension:
-            return img
+            return None
 
         # Calculate new dimensions maintaining aspect ratio
         if width > height:
@@ -111,6 +636,29 @@ class ImageProcessor:
         else:
             new_height = self.max_dimension
             new_width = int(width * (self.max_dimension / height))
+        return new_width, new_height
+
+    def _downscale(
+        self, img: Image.Image, new_width: int, new_height: int
+    ) -> Image.Image:
+        """Downscale an image that has not been loaded yet.
+
+        Args:
+            img: PIL Image object, not yet loaded.
+            new_width: Target width in pixels.
+            new_height: Target height in pixels.
+
+        Returns:
+            Resized image.
+        """
+        if img.format == "JPEG":
+            # libjpeg scales in the DCT domain while decoding, which is a
+            # proper downscale in itself; it stops at the largest 1/2, 1/4
+            # or 1/8 scale that still covers the target size
+            img.draft(None, (new_width, new_height))
 
-        # Use high-quality resampling
-        return img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        return img.resize(
+            (new_width, new_height),
+            Image.Resampling.LANCZOS,
+            reducing_gap=self.REDUCING_GAP,
+        )
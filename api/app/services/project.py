@@ -1,10 +1,12 @@
 """Project service for business logic."""
 
+from datetime import datetime
 from uuid import UUID
 
 from app.models.project import Project
 from app.repositories.project import ProjectRepository
 from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.services.authorization import ProjectAccess, get_project_access
 from app.services.exceptions import (
     PermissionDeniedError,
     ProjectNotFoundError,
@@ -62,6 +64,21 @@ class ProjectService:
             raise ProjectNotFoundError(f"Project with slug '{slug}' not found")
         return project
 
+    async def get_project_access(self, slug: str, user_id: UUID) -> ProjectAccess:
+        """Get a project by slug together with the user's effective role.
+
+        Args:
+            slug: The project slug.
+            user_id: UUID of the requesting user.
+
+        Returns:
+            The project with the user's effective role.
+
+        Raises:
+            ProjectNotFoundError: If project is not found.
+        """
+        return await get_project_access(self.project_repo, slug, user_id)
+
     async def get_projects_by_owner(
         self, owner_id: UUID, skip: int = 0, limit: int = 100
     ) -> list[Project]:
@@ -78,7 +95,11 @@ class ProjectService:
         return await self.project_repo.get_by_owner(owner_id, skip, limit)
 
     async def get_accessible_projects(
-        self, user_id: UUID, skip: int = 0, limit: int = 100
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: tuple[datetime, UUID] | None = None,
     ) -> list[Project]:
         """Get all projects accessible by a user.
 
@@ -91,11 +112,46 @@ class ProjectService:
             user_id: The UUID of the user.
             skip: Number of records to skip (pagination).
             limit: Maximum number of records to return.
+            cursor: Keyset position (created_at, id) to continue after.
 
         Returns:
             List of accessible projects.
         """
-        return await self.project_repo.get_accessible_projects(user_id, skip, limit)
+        return await self.project_repo.get_accessible_projects(
+            user_id, skip, limit, cursor
+        )
+
+    async def get_accessible_projects_enriched(
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: tuple[datetime, UUID] | None = None,
+    ) -> list[tuple[ProjectAccess, bool]]:
+        """Get accessible projects with the user's role and bookmark state.
+
+        Roles and bookmarks for the whole page are loaded by the listing
+        query itself, so dashboards need no extra request per project.
+
+        Args:
+            user_id: The UUID of the user.
+            skip: Number of records to skip (pagination).
+            limit: Maximum number of records to return.
+            cursor: Keyset position (created_at, id) to continue after.
+
+        Returns:
+            List of (project access, is bookmarked) tuples.
+        """
+        rows = await self.project_repo.get_accessible_projects_enriched(
+            user_id, skip, limit, cursor
+        )
+        return [
+            (
+                ProjectAccess(project=project, user_id=user_id, member_role=role),
+                is_bookmarked,
+            )
+            for project, role, is_bookmarked in rows
+        ]
 
     async def update_project(
         self, slug: str, update_data: ProjectUpdate, user_id: UUID
@@ -125,13 +181,19 @@ class ProjectService:
 
         return await self.project_repo.update(project, update_data)
 
-    async def delete_project(self, slug: str, user_id: UUID) -> None:
-        """Delete a project.
+    async def delete_project(self, slug: str, user_id: UUID) -> Project:
+        """Request deletion of a project.
+
+        The project is hidden immediately; its data is removed afterwards by
+        a background job (see app.services.project_deletion).
 
         Args:
             slug: The project slug.
             user_id: UUID of the requesting user.
 
+        Returns:
+            The project, marked as deleting.
+
         Raises:
             ProjectNotFoundError: If project is not found.
             PermissionDeniedError: If user is not the owner.
@@ -145,4 +207,4 @@ class ProjectService:
                 "Only the project owner can delete this project"
             )
 
-        await self.project_repo.delete(project)
+        return await self.project_repo.mark_deleting(project)
@@ -1,12 +1,13 @@
 """Project bookmark service for business logic."""
 
+from collections.abc import Sequence
 from uuid import UUID
 
 from app.models.project import Project
 from app.models.project_bookmark import ProjectBookmark
 from app.repositories.project import ProjectRepository
 from app.repositories.project_bookmark import ProjectBookmarkRepository
-from app.repositories.project_member import ProjectMemberRepository
+from app.services.authorization import Permission, get_project_access
 from app.services.exceptions import PermissionDeniedError, ProjectNotFoundError
 
 
@@ -17,18 +18,15 @@ class ProjectBookmarkService:
         self,
         bookmark_repo: ProjectBookmarkRepository,
         project_repo: ProjectRepository,
-        member_repo: ProjectMemberRepository,
     ) -> None:
         """Initialize the service with repositories.
 
         Args:
             bookmark_repo: Repository for bookmark database operations.
             project_repo: Repository for project database operations.
-            member_repo: Repository for project member database operations.
         """
         self.bookmark_repo = bookmark_repo
         self.project_repo = project_repo
-        self.member_repo = member_repo
 
     async def _get_project_or_raise(self, slug: str) -> Project:
         """Get a project by slug or raise ProjectNotFoundError.
@@ -47,36 +45,36 @@ class ProjectBookmarkService:
             raise ProjectNotFoundError(f"Project with slug '{slug}' not found")
         return project
 
-    async def _check_access(self, project: Project, user_id: UUID) -> None:
-        """Check if user has access to the project.
+    async def _get_accessible_project(self, slug: str, user_id: UUID) -> Project:
+        """Get a project by slug and check the user can access it.
 
         Args:
-            project: The project to check access for.
+            slug: The project slug.
             user_id: UUID of the user.
 
+        Returns:
+            The project.
+
         Raises:
+            ProjectNotFoundError: If project is not found.
             PermissionDeniedError: If user cannot access the project.
         """
-        # Public projects are accessible to everyone
-        if project.visibility.value == "public":
-            return
+        # Load project and member role in a single query
+        access = await get_project_access(self.project_repo, slug, user_id)
 
-        # Owner has access
-        if project.owner_id == user_id:
-            return
+        # Public projects, owners and members all have view access
+        if not access.has_permission(Permission.VIEW):
+            raise PermissionDeniedError("You do not have access to this project")
 
-        # Members have access
-        member = await self.member_repo.get_by_project_and_user(project.id, user_id)
-        if member is not None:
-            return
-
-        raise PermissionDeniedError("You do not have access to this project")
+        return access.project
 
     async def add_bookmark(self, slug: str, user_id: UUID) -> ProjectBookmark:
         """Add a bookmark for a project.
 
         This operation is idempotent - if bookmark already exists,
-        returns the existing bookmark.
+        returns the existing bookmark. The insert is a single
+        ON CONFLICT DO NOTHING statement; the existing row is only read
+        back when the bookmark was already there.
 
         Args:
             slug: The project slug.
@@ -89,15 +87,13 @@ class ProjectBookmarkService:
             ProjectNotFoundError: If project is not found.
             PermissionDeniedError: If user cannot access the project.
         """
-        project = await self._get_project_or_raise(slug)
-        await self._check_access(project, user_id)
+        project = await self._get_accessible_project(slug, user_id)
 
-        # Check if bookmark already exists (idempotent)
-        existing = await self.bookmark_repo.get(user_id, project.id)
-        if existing is not None:
-            return existing
-
-        return await self.bookmark_repo.create(user_id, project.id)
+        bookmark = await self.bookmark_repo.create_if_absent(user_id, project.id)
+        if bookmark is None:
+            # Already bookmarked (idempotent)
+            bookmark = await self.bookmark_repo.get(user_id, project.id)
+        return bookmark
 
     async def remove_bookmark(self, slug: str, user_id: UUID) -> bool:
         """Remove a bookmark for a project.
@@ -131,8 +127,26 @@ class ProjectBookmarkService:
         Raises:
             ProjectNotFoundError: If project is not found.
         """
-        project = await self._get_project_or_raise(slug)
-        return await self.bookmark_repo.exists(user_id, project.id)
+        statuses = await self.bookmark_repo.get_statuses_by_slugs(user_id, [slug])
+        if slug not in statuses:
+            raise ProjectNotFoundError(f"Project with slug '{slug}' not found")
+        return statuses[slug]
+
+    async def get_bookmark_statuses(
+        self, slugs: Sequence[str], user_id: UUID
+    ) -> dict[str, bool]:
+        """Check the bookmark state of many projects at once.
+
+        Args:
+            slugs: Project slugs to check.
+            user_id: UUID of the user.
+
+        Returns:
+            Bookmark state per slug, in request order. Unknown slugs are
+            left out.
+        """
+        statuses = await self.bookmark_repo.get_statuses_by_slugs(user_id, slugs)
+        return {slug: statuses[slug] for slug in slugs if slug in statuses}
 
     async def get_bookmarked_projects(
         self, user_id: UUID, skip: int = 0, limit: int = 100
@@ -0,0 +1,215 @@
+"""Project deletion service for chunked background deletion."""
+
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.core.database import async_session_maker
+from app.core.redis import (
+    acquire_project_deletion_lock,
+    get_project_deletion_progress,
+    refresh_project_deletion_lock,
+    release_project_deletion_lock,
+    set_project_deletion_progress,
+)
+from app.core.storage import StorageProvider, get_storage_provider
+from app.repositories.project_deletion import ProjectDeletionRepository
+from app.schemas.project import ProjectDeletionRead, ProjectDeletionStatus
+from app.services.exceptions import PermissionDeniedError, ProjectNotFoundError
+from app.services.upload import variant_storage_paths
+
+logger = logging.getLogger(__name__)
+
+# Lock lifetime, refreshed after every chunk; a crashed worker's job
+# becomes resumable once it expires
+DELETION_LOCK_TTL = timedelta(minutes=5)
+
+# Order matters: revisions reference batches and documents
+DELETION_PHASES = ("revisions", "documents", "uploads", "batches")
+
+
+class ProjectDeletionService:
+    """Service that removes a project's data in bounded chunks."""
+
+    def __init__(
+        self,
+        deletion_repo: ProjectDeletionRepository,
+        storage: StorageProvider,
+        chunk_size: int | None = None,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            deletion_repo: Repository for chunked deletes.
+            storage: Storage provider holding the project's upload files.
+            chunk_size: Maximum rows per transaction.
+                Defaults to settings.project_deletion_chunk_size.
+        """
+        self.deletion_repo = deletion_repo
+        self.storage = storage
+        self.chunk_size = chunk_size or settings.project_deletion_chunk_size
+
+    async def get_status(self, slug: str, user_id: UUID) -> ProjectDeletionRead:
+        """Get progress of a pending project deletion.
+
+        Once the deletion completes the project no longer exists and this
+        raises ProjectNotFoundError.
+
+        Args:
+            slug: The project slug.
+            user_id: UUID of the requesting user.
+
+        Returns:
+            Deletion progress.
+
+        Raises:
+            ProjectNotFoundError: If no deletion is pending for the slug.
+            PermissionDeniedError: If user is not the owner.
+        """
+        project = await self.deletion_repo.get_by_slug(slug)
+        if project is None:
+            raise ProjectNotFoundError(f"No deletion pending for project '{slug}'")
+
+        if project.owner_id != user_id:
+            raise PermissionDeniedError(
+                "Only the project owner can view deletion progress"
+            )
+
+        progress = await get_project_deletion_progress(project.id)
+        return ProjectDeletionRead.model_validate(
+            {
+                "status": ProjectDeletionStatus.PENDING,
+                **progress,
+                "project_id": project.id,
+            }
+        )
+
+    async def run(self, project_id: UUID) -> None:
+        """Delete a project marked as deleting, chunk by chunk.
+
+        Each chunk commits on its own and progress is reported after it.
+        Failures are logged and recorded as the job status; the project
+        stays hidden and the job is picked up again on the next startup.
+
+        Args:
+            project_id: The project to delete.
+        """
+        if not await acquire_project_deletion_lock(project_id, DELETION_LOCK_TTL):
+            logger.info(f"Deletion of project {project_id} is already running")
+            return
+
+        counts = {f"{phase}_deleted": 0 for phase in DELETION_PHASES}
+        steps: dict[str, Callable[[], Awaitable[int]]] = {
+            "revisions": lambda: self.deletion_repo.delete_revisions_chunk(
+                project_id, self.chunk_size
+            ),
+            "documents": lambda: self.deletion_repo.delete_documents_chunk(
+                project_id, self.chunk_size
+            ),
+            "uploads": lambda: self._delete_uploads_chunk(project_id),
+            "batches": lambda: self.deletion_repo.delete_batches_chunk(
+                project_id, self.chunk_size
+            ),
+        }
+        running = ProjectDeletionStatus.RUNNING
+        phase = DELETION_PHASES[0]
+        try:
+            for phase in DELETION_PHASES:
+                await self._report(project_id, running, phase, counts)
+                while deleted := await steps[phase]():
+                    counts[f"{phase}_deleted"] += deleted
+                    await self._report(project_id, running, phase, counts)
+                    await refresh_project_deletion_lock(project_id, DELETION_LOCK_TTL)
+
+            await self.deletion_repo.delete_project(project_id)
+            await self._report(
+                project_id, ProjectDeletionStatus.COMPLETED, phase, counts
+            )
+        except Exception:
+            logger.exception(f"Deletion of project {project_id} failed")
+            with contextlib.suppress(RedisError, OSError):
+                await self._report(
+                    project_id, ProjectDeletionStatus.FAILED, phase, counts
+                )
+        finally:
+            with contextlib.suppress(RedisError, OSError):
+                await release_project_deletion_lock(project_id)
+
+    async def _report(
+        self,
+        project_id: UUID,
+        status: ProjectDeletionStatus,
+        phase: str,
+        counts: dict[str, int],
+    ) -> None:
+        """Publish job progress for the status endpoint.
+
+        Args:
+            project_id: The project being deleted.
+            status: Current job status.
+            phase: Table currently being cleared.
+            counts: Rows deleted so far per table.
+        """
+        await set_project_deletion_progress(
+            project_id, {"status": status.value, "phase": phase, **counts}
+        )
+
+    async def _delete_uploads_chunk(self, project_id: UUID) -> int:
+        """Delete a chunk of upload records, then their stored files and variants.
+
+        Files are removed only after the rows are committed, so a failure
+        can leave an orphaned file but never a record without its file,
+        and not while a concurrent upload of the same content stores it.
+        Deletes run with bounded concurrency, and files that could not be
+        deleted are logged.
+
+        Args:
+            project_id: The project UUID.
+
+        Returns:
+            Number of uploads deleted.
+        """
+        deleted, paths = await self.deletion_repo.delete_uploads_chunk(
+            project_id, self.chunk_size
+        )
+        async with self.deletion_repo.unused_files(paths) as unused:
+            files = [
+                file for path in unused for file in (path, *variant_storage_paths(path))
+            ]
+            failed = await self.storage.delete_many(files)
+        if failed:
+            logger.warning(
+                f"Deletion of project {project_id} left {len(failed)} files in storage"
+            )
+        return deleted
+
+
+async def run_project_deletion(project_id: UUID) -> None:
+    """Run a project deletion job in its own database session.
+
+    Used as a FastAPI background task, after the request session is closed.
+
+    Args:
+        project_id: The project to delete.
+    """
+    async with async_session_maker() as session:
+        service = ProjectDeletionService(
+            ProjectDeletionRepository(session), get_storage_provider()
+        )
+        await service.run(project_id)
+
+
+async def resume_project_deletions() -> None:
+    """Resume deletions interrupted by a restart.
+
+    Jobs still held by a live worker are skipped through the job lock.
+    """
+    async with async_session_maker() as session:
+        project_ids = await ProjectDeletionRepository(session).get_pending_ids()
+    for project_id in project_ids:
+        await run_project_deletion(project_id)
@@ -1,21 +1,30 @@
 """Project member service for business logic."""
 
+from datetime import datetime
 from uuid import UUID
 
-from app.models.project import Project
 from app.models.project_member import MemberRole, ProjectMember
 from app.repositories.project import ProjectRepository
 from app.repositories.project_member import ProjectMemberRepository
 from app.repositories.user import UserRepository
-from app.schemas.project_member import ProjectMemberWithUserRead
-from app.services.authorization import Permission, check_project_permission
+from app.schemas.project_member import (
+    BulkInviteConflict,
+    BulkInviteOutcome,
+    ProjectMemberInvite,
+    ProjectMemberInviteResult,
+    ProjectMemberWithUserRead,
+)
+from app.services.authorization import (
+    Permission,
+    ProjectAccess,
+    get_project_access,
+)
 from app.services.exceptions import (
     CannotModifyOwnerError,
     CannotModifySelfError,
     MemberAlreadyExistsError,
     MemberNotFoundError,
     PermissionDeniedError,
-    ProjectNotFoundError,
     UserNotFoundError,
 )
 
@@ -46,6 +55,8 @@ class ProjectMemberService:
         requesting_user_id: UUID,
         skip: int = 0,
         limit: int = 100,
+        query: str | None = None,
+        cursor: tuple[datetime, UUID] | None = None,
     ) -> list[ProjectMemberWithUserRead]:
         """List project members.
 
@@ -56,6 +67,9 @@ class ProjectMemberService:
             requesting_user_id: UUID of the requesting user.
             skip: Number of records to skip (pagination).
             limit: Maximum number of records to return.
+            query: Optional name or email search text.
+            cursor: Keyset position (created_at, id) of the last member on
+                the previous page.
 
         Returns:
             List of project members with user details.
@@ -64,12 +78,12 @@ class ProjectMemberService:
             ProjectNotFoundError: If project is not found.
             PermissionDeniedError: If user does not have view access.
         """
-        project = await self._get_project_with_view_permission(
+        access = await self._get_project_with_view_permission(
             project_slug, requesting_user_id
         )
 
         members = await self.member_repo.get_members_by_project(
-            project.id, skip=skip, limit=limit
+            access.project.id, skip=skip, limit=limit, query=query, cursor=cursor
         )
 
         return [ProjectMemberWithUserRead.from_member(m) for m in members]
@@ -101,9 +115,10 @@ class ProjectMemberService:
             CannotModifyOwnerError: If trying to add the owner as a member.
             MemberAlreadyExistsError: If user is already a member.
         """
-        project = await self._get_project_with_manage_permission(
+        access = await self._get_project_with_manage_permission(
             project_slug, requesting_user_id
         )
+        project = access.project
 
         # Check if target user exists
         target_user = await self.user_repo.get_by_id(user_id)
@@ -125,6 +140,97 @@ class ProjectMemberService:
 
         return await self.member_repo.create(project.id, user_id, role)
 
+    async def add_members_bulk(
+        self,
+        project_slug: str,
+        invites: list[ProjectMemberInvite],
+        on_conflict: BulkInviteConflict,
+        requesting_user_id: UUID,
+    ) -> list[ProjectMemberInviteResult]:
+        """Add many members to a project at once.
+
+        Users are resolved with one query and memberships written with one
+        INSERT, regardless of the number of invites. Invalid entries do not
+        fail the request; each gets its own outcome instead.
+
+        Only admin and owner can add members.
+
+        Args:
+            project_slug: The project slug.
+            invites: Users (by ID or email) and roles to add.
+            on_conflict: Whether to skip existing members or update their role.
+            requesting_user_id: UUID of the requesting user.
+
+        Returns:
+            One result per invite, in request order.
+
+        Raises:
+            ProjectNotFoundError: If project is not found.
+            PermissionDeniedError: If user does not have manage_members permission.
+        """
+        access = await self._get_project_with_manage_permission(
+            project_slug, requesting_user_id
+        )
+        project = access.project
+
+        users = await self.user_repo.get_by_ids_or_emails(
+            {i.user_id for i in invites if i.user_id is not None},
+            {i.email for i in invites if i.email is not None},
+        )
+        ids_by_email = {u.email: u.id for u in users}
+        known_ids = {u.id for u in users}
+
+        # Resolve each invite to a user, keeping the first invite per user
+        resolved: list[UUID | None] = []
+        outcomes: list[BulkInviteOutcome | None] = []
+        roles: dict[UUID, MemberRole] = {}
+        for invite in invites:
+            user_id = (
+                invite.user_id
+                if invite.user_id in known_ids
+                else ids_by_email.get(invite.email or "")
+            )
+            resolved.append(user_id)
+            if user_id is None:
+                outcomes.append(BulkInviteOutcome.USER_NOT_FOUND)
+            elif user_id == project.owner_id:
+                outcomes.append(BulkInviteOutcome.IS_OWNER)
+            elif user_id in roles:
+                outcomes.append(BulkInviteOutcome.DUPLICATE)
+            else:
+                roles[user_id] = invite.role
+                outcomes.append(None)
+
+        written = await self.member_repo.bulk_upsert(
+            project.id,
+            roles,
+            update_existing=on_conflict == BulkInviteConflict.UPDATE_ROLE,
+        )
+
+        results = []
+        for invite, user_id, outcome in zip(invites, resolved, outcomes, strict=True):
+            member_id = None
+            if outcome is None and user_id is not None:
+                if user_id in written:
+                    member_id, inserted = written[user_id]
+                    outcome = (
+                        BulkInviteOutcome.ADDED
+                        if inserted
+                        else BulkInviteOutcome.ROLE_UPDATED
+                    )
+                else:
+                    outcome = BulkInviteOutcome.ALREADY_MEMBER
+            results.append(
+                ProjectMemberInviteResult(
+                    user_id=user_id,
+                    email=invite.email,
+                    role=invite.role,
+                    outcome=outcome,
+                    member_id=member_id,
+                )
+            )
+        return results
+
     async def update_member_role(
         self,
         project_slug: str,
@@ -152,17 +258,16 @@ class ProjectMemberService:
             MemberNotFoundError: If member is not found.
             CannotModifySelfError: If admin tries to modify their own role.
         """
-        project = await self._get_project_with_manage_permission(
+        access = await self._get_project_with_manage_permission(
             project_slug, requesting_user_id
         )
 
         member = await self.member_repo.get_by_id(member_id)
-        if member is None or member.project_id != project.id:
+        if member is None or member.project_id != access.project.id:
             raise MemberNotFoundError(f"Member with ID '{member_id}' not found")
 
         # Admin cannot modify their own role (owner can)
-        is_owner = project.owner_id == requesting_user_id
-        if not is_owner and member.user_id == requesting_user_id:
+        if not access.is_owner and member.user_id == requesting_user_id:
             raise CannotModifySelfError(
                 "You cannot modify your own role. "
                 "Ask the project owner or another admin."
@@ -191,10 +296,12 @@ class ProjectMemberService:
             PermissionDeniedError: If user does not have permission.
             MemberNotFoundError: If member is not found.
         """
-        project = await self._get_project(project_slug)
+        access = await get_project_access(
+            self.project_repo, project_slug, requesting_user_id
+        )
 
         member = await self.member_repo.get_by_id(member_id)
-        if member is None or member.project_id != project.id:
+        if member is None or member.project_id != access.project.id:
             raise MemberNotFoundError(f"Member with ID '{member_id}' not found")
 
         # Allow self-removal (leaving the project)
@@ -202,10 +309,7 @@ class ProjectMemberService:
 
         if not is_self_removal:
             # Check manage_members permission for removing others
-            has_permission = await check_project_permission(
-                project, requesting_user_id, Permission.MANAGE_MEMBERS, self.member_repo
-            )
-            if not has_permission:
+            if not access.has_permission(Permission.MANAGE_MEMBERS):
                 raise PermissionDeniedError(
                     "You do not have permission to remove members from this project"
                 )
@@ -214,26 +318,9 @@ class ProjectMemberService:
 
     # --- Helper methods ---
 
-    async def _get_project(self, project_slug: str) -> Project:
-        """Get project by slug.
-
-        Args:
-            project_slug: The project slug.
-
-        Returns:
-            The project.
-
-        Raises:
-            ProjectNotFoundError: If project is not found.
-        """
-        project = await self.project_repo.get_by_slug(project_slug)
-        if project is None:
-            raise ProjectNotFoundError(f"Project with slug '{project_slug}' not found")
-        return project
-
     async def _get_project_with_view_permission(
         self, project_slug: str, user_id: UUID
-    ) -> Project:
+    ) -> ProjectAccess:
         """Get project and validate view permission.
 
         Args:
@@ -241,27 +328,24 @@ class ProjectMemberService:
             user_id: UUID of the user.
 
         Returns:
-            The project.
+            The project with the user's effective role.
 
         Raises:
             ProjectNotFoundError: If project is not found.
             PermissionDeniedError: If user does not have view access.
         """
-        project = await self._get_project(project_slug)
+        access = await get_project_access(self.project_repo, project_slug, user_id)
 
-        has_permission = await check_project_permission(
-            project, user_id, Permission.VIEW, self.member_repo
-        )
-        if not has_permission:
+        if not access.has_permission(Permission.VIEW):
             raise PermissionDeniedError(
                 "You do not have permission to view this project"
             )
 
-        return project
+        return access
 
     async def _get_project_with_manage_permission(
         self, project_slug: str, user_id: UUID
-    ) -> Project:
+    ) -> ProjectAccess:
         """Get project and validate manage_members permission.
 
         Args:
@@ -269,20 +353,17 @@ class ProjectMemberService:
             user_id: UUID of the user.
 
         Returns:
-            The project.
+            The project with the user's effective role.
 
         Raises:
             ProjectNotFoundError: If project is not found.
             PermissionDeniedError: If user does not have manage_members permission.
         """
-        project = await self._get_project(project_slug)
+        access = await get_project_access(self.project_repo, project_slug, user_id)
 
-        has_permission = await check_project_permission(
-            project, user_id, Permission.MANAGE_MEMBERS, self.member_repo
-        )
-        if not has_permission:
+        if not access.has_permission(Permission.MANAGE_MEMBERS):
             raise PermissionDeniedError(
                 "You do not have permission to manage members in this project"
             )
 
-        return project
+        return access
@@ -0,0 +1,139 @@
+"""Per-project storage usage and the periodic recount of its totals."""
+
+import asyncio
+import contextlib
+import logging
+from datetime import timedelta
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.core.database import async_session_maker
+from app.core.redis import (
+    acquire_storage_reconcile_lock,
+    refresh_storage_reconcile_lock,
+    release_storage_reconcile_lock,
+)
+from app.repositories.storage_usage import StorageUsageRepository
+from app.schemas.upload import ProjectStorageUsageRead
+
+logger = logging.getLogger(__name__)
+
+# Lock lifetime, refreshed after every chunk; a crashed worker's lock
+# expires so a later run can start
+RECONCILE_LOCK_TTL = timedelta(minutes=5)
+
+
+def effective_storage_quota(project_quota: int | None) -> int | None:
+    """Resolve the storage quota that applies to a project.
+
+    Args:
+        project_quota: The project's own quota, or None to use the default.
+
+    Returns:
+        Quota in bytes, or None if storage is unlimited.
+    """
+    quota = (
+        project_quota
+        if project_quota is not None
+        else settings.project_storage_quota_bytes
+    )
+    return quota or None
+
+
+class StorageUsageService:
+    """Service for reading and reconciling per-project storage totals."""
+
+    def __init__(
+        self, usage_repo: StorageUsageRepository, batch_size: int | None = None
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            usage_repo: Repository for the storage totals.
+            batch_size: Projects recounted per transaction.
+                Defaults to settings.storage_reconcile_batch_size.
+        """
+        self.usage_repo = usage_repo
+        self.batch_size = batch_size or settings.storage_reconcile_batch_size
+
+    async def get_largest_projects(self, limit: int) -> list[ProjectStorageUsageRead]:
+        """Get the projects using the most storage.
+
+        Reads the maintained totals, so the cost does not grow with the
+        number of uploads, documents or revisions.
+
+        Args:
+            limit: Maximum number of projects to return.
+
+        Returns:
+            Storage usage of each project, largest first.
+        """
+        rows = await self.usage_repo.get_largest_projects(limit)
+        return [
+            ProjectStorageUsageRead(
+                project_id=row.id,
+                slug=row.slug,
+                name=row.name,
+                upload_bytes=row.upload_bytes,
+                document_bytes=row.document_bytes,
+                revision_bytes=row.revision_bytes,
+                total_bytes=row.upload_bytes + row.document_bytes + row.revision_bytes,
+                quota_bytes=effective_storage_quota(row.storage_quota_bytes),
+            )
+            for row in rows
+        ]
+
+    async def reconcile(self) -> int:
+        """Recount the storage totals of every project, chunk by chunk.
+
+        The caller must hold the reconciliation lock.
+
+        Returns:
+            Number of projects whose totals had drifted.
+        """
+        corrected = 0
+        after_id: UUID | None = None
+        while True:
+            after_id, count = await self.usage_repo.reconcile_chunk(
+                after_id, self.batch_size
+            )
+            if after_id is None:
+                break
+            corrected += count
+            await refresh_storage_reconcile_lock(RECONCILE_LOCK_TTL)
+        logger.info(f"Storage totals reconciled: {corrected} projects corrected")
+        return corrected
+
+
+async def run_storage_reconciliation() -> None:
+    """Recount storage totals in its own database session.
+
+    Does nothing if another worker is already recounting.
+    """
+    if not await acquire_storage_reconcile_lock(RECONCILE_LOCK_TTL):
+        logger.info("Storage total reconciliation is already running")
+        return
+    try:
+        async with async_session_maker() as session:
+            await StorageUsageService(StorageUsageRepository(session)).reconcile()
+    finally:
+        with contextlib.suppress(RedisError, OSError):
+            await release_storage_reconcile_lock()
+
+
+async def schedule_storage_reconciliation() -> None:
+    """Recount storage totals every settings.storage_reconcile_interval_seconds.
+
+    Returns at once when reconciliation is disabled. Every worker runs
+    the schedule; the lock lets one of them recount at a time.
+    """
+    if settings.storage_reconcile_interval_seconds <= 0:
+        return
+    while True:
+        await asyncio.sleep(settings.storage_reconcile_interval_seconds)
+        try:
+            await run_storage_reconciliation()
+        except Exception:
+            logger.exception("Scheduled storage total reconciliation failed")
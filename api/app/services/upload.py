@@ -1,22 +1,193 @@
 """Upload service for business logic."""
 
-import io
+import asyncio
+import hashlib
+import logging
+import mimetypes
+import os
+import secrets
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path, PurePosixPath
 from uuid import UUID
 
 import filetype
 from fastapi import UploadFile
+from PIL import features
 
 from app.config import settings
-from app.core.storage import StorageProvider
+from app.core.database import async_session_maker
+from app.core.image_pool import ImageProcessingPool, image_pool
+from app.core.redis import (
+    acquire_direct_upload_lock,
+    claim_direct_upload,
+    expire_direct_upload,
+    get_direct_upload,
+    get_expired_direct_uploads,
+    release_direct_upload_lock,
+    remove_direct_upload_expiry,
+    set_direct_upload,
+)
+from app.core.single_flight import SingleFlight
+from app.core.storage import StorageProvider, get_storage_provider
+from app.core.upload_cache import UploadFileCache, UploadFileInfo, upload_file_cache
 from app.models.upload import Upload
 from app.repositories.upload import UploadRepository
+from app.schemas.upload import (
+    DirectUploadRead,
+    DirectUploadStatus,
+    DirectUploadTicket,
+    UploadCreateResponse,
+    UploadStorageStatsRead,
+)
 from app.services.exceptions import (
+    DirectUploadNotFoundError,
+    DirectUploadStateError,
     FileTooLargeError,
+    ImageTooLargeError,
     InvalidFileTypeError,
+    InvalidVariantError,
     PermissionDeniedError,
+    StorageError,
+    StorageQuotaExceededError,
     UploadNotFoundError,
+    UploadServiceError,
 )
 from app.services.image_processor import ImageProcessor
+from app.services.storage_usage import effective_storage_quota
+
+logger = logging.getLogger(__name__)
+
+# Bytes read per chunk when streaming an upload
+UPLOAD_READ_CHUNK_SIZE = 64 * 1024
+
+# Leading bytes inspected to detect the file type (covers every signature
+# the filetype library knows)
+UPLOAD_SNIFF_SIZE = 8192
+
+# Where files sent for direct uploads wait to be processed
+DIRECT_UPLOAD_STORAGE_PREFIX = "incoming/"
+
+# Body type of resumable upload chunks, as in the tus protocol
+RESUMABLE_CONTENT_TYPE = "application/offset+octet-stream"
+
+# Lock lifetime while a chunk is stored; a dropped request's lock expires
+RESUMABLE_CHUNK_LOCK_TTL = timedelta(minutes=10)
+
+# How long after its URL expires an abandoned direct upload's files are
+# deleted; longer than a body or chunk started before expiry takes to arrive
+DIRECT_UPLOAD_SWEEP_GRACE = timedelta(hours=1)
+
+# Expired direct uploads cleaned up per sweep
+DIRECT_UPLOAD_SWEEP_BATCH_SIZE = 500
+
+# Variant types served when the client accepts them, most preferred first;
+# AVIF only where this Pillow build can encode it
+VARIANT_PREFERRED_TYPES = (
+    ("image/avif", "image/webp") if features.check("avif") else ("image/webp",)
+)
+
+# Collapses concurrent first requests for the same variant in this worker
+variant_flight = SingleFlight()
+
+
+async def _limit_size(
+    chunks: AsyncIterable[bytes], limit: int, message: str
+) -> AsyncIterator[bytes]:
+    """Pass chunks through, raising once more than limit bytes arrived.
+
+    Args:
+        chunks: Chunks to pass through.
+        limit: Most bytes allowed in total.
+        message: Error message when the limit is exceeded.
+
+    Yields:
+        The chunks, unchanged.
+
+    Raises:
+        FileTooLargeError: If the chunks exceed the limit.
+    """
+    received = 0
+    async for chunk in chunks:
+        received += len(chunk)
+        if received > limit:
+            raise FileTooLargeError(message)
+        yield chunk
+
+
+def _part_path(storage_path: str, part: int) -> str:
+    """Get where a chunk of a resumable upload is stored."""
+    return f"{storage_path}/{part:06d}"
+
+
+def _sealed_path(storage_path: str) -> str:
+    """Get where a direct upload's file is kept once it is completed."""
+    return f"{storage_path}.sealed"
+
+
+def _received_paths(session: dict[str, str]) -> list[str]:
+    """Get the stored pieces of a completed direct upload's file, in order."""
+    if "resumable" in session:
+        return [
+            _part_path(session["storage_path"], part)
+            for part in range(int(session["parts"]))
+        ]
+    return [_sealed_path(session["storage_path"])]
+
+
+def variant_storage_path(storage_path: str, width: int, mime_type: str) -> str:
+    """Get where a resized variant of a stored image is kept.
+
+    Args:
+        storage_path: Storage path of the original image.
+        width: Variant width in pixels.
+        mime_type: Variant MIME type.
+
+    Returns:
+        Storage path of the variant.
+    """
+    stem = PurePosixPath(storage_path).with_suffix("")
+    extension = mimetypes.guess_extension(mime_type) or ""
+    return f"variants/{stem}/{width}{extension}"
+
+
+def animation_storage_path(storage_path: str, mime_type: str) -> str:
+    """Get where a transcoded copy of a stored GIF is kept.
+
+    Args:
+        storage_path: Storage path of the original GIF.
+        mime_type: MIME type of the transcoded copy.
+
+    Returns:
+        Storage path of the transcoded copy.
+    """
+    stem = PurePosixPath(storage_path).with_suffix("")
+    extension = mimetypes.guess_extension(mime_type) or ""
+    return f"variants/{stem}/animated{extension}"
+
+
+def variant_storage_paths(storage_path: str) -> list[str]:
+    """Get every path a variant of a stored image may have been saved at.
+
+    Args:
+        storage_path: Storage path of the original image.
+
+    Returns:
+        Storage paths of all configured widths and formats, and of
+        transcoded animations.
+    """
+    return [
+        *(
+            variant_storage_path(storage_path, width, mime_type)
+            for width in settings.upload_variant_widths
+            for mime_type in ImageProcessor.VARIANT_FORMATS
+        ),
+        *(
+            animation_storage_path(storage_path, mime_type)
+            for mime_type in ImageProcessor.ANIMATION_FORMATS
+        ),
+    ]
 
 
 class UploadService:
@@ -27,6 +198,8 @@ class UploadService:
         upload_repo: UploadRepository,
         storage: StorageProvider,
         image_processor: ImageProcessor,
+        image_pool: ImageProcessingPool,
+        file_cache: UploadFileCache,
     ) -> None:
         """Initialize upload service.
 
@@ -34,10 +207,14 @@ class UploadService:
             upload_repo: Upload repository for database operations.
             storage: Storage provider for file operations.
             image_processor: Image processor for resize/compress.
+            image_pool: Process pool the image processor runs in.
+            file_cache: Cache of file metadata by storage path.
         """
         self.upload_repo = upload_repo
         self.storage = storage
         self.image_processor = image_processor
+        self.image_pool = image_pool
+        self.file_cache = file_cache
 
     async def upload_image(
         self,
@@ -49,10 +226,19 @@ class UploadService:
 
         Validation flow:
         1. Check file size (before reading full content)
-        2. Read content and validate MIME type via magic bytes
-        3. Process image (resize, compress)
-        4. Save to storage
-        5. Create DB record
+        2. Validate MIME type via magic bytes in the first bytes only
+        3. Stream the rest in chunks, rejecting it as soon as the size
+           limit is exceeded, then check the project's storage quota
+        4. Reuse the stored result of an earlier upload of the same bytes
+        5. Otherwise process image (resize, compress, measure, render a
+           placeholder) in the image process pool and save it under the
+           hash of the result, so identical results share one stored file
+        6. Create DB record referencing the stored file
+
+        The multipart parser spools the upload to a temporary file, which
+        is streamed for the size check. It is only read into memory once
+        a worker process is free to take it, so waiting uploads hold no
+        image data.
 
         Args:
             file: Uploaded file.
@@ -65,6 +251,10 @@ class UploadService:
         Raises:
             FileTooLargeError: If file exceeds size limit.
             InvalidFileTypeError: If file type is not allowed.
+            StorageQuotaExceededError: If the project has no room for the file.
+            ImageTooLargeError: If the image exceeds the pixel budget.
+            ImageProcessingUnavailableError: If the processing queue is full,
+                or processing times out or crashes.
             StorageError: If storage operation fails.
         """
         # 1. Check content-length header if available
@@ -73,47 +263,675 @@ class UploadService:
                 f"File exceeds maximum size of {settings.upload_max_file_size} bytes"
             )
 
-        # 2. Read and validate content
-        content = await file.read()
-
-        if len(content) > settings.upload_max_file_size:
-            raise FileTooLargeError(
-                f"File exceeds maximum size of {settings.upload_max_file_size} bytes"
-            )
-
-        # Validate MIME type using magic bytes
+        # 2. Validate MIME type using magic bytes
+        head = await file.read(UPLOAD_SNIFF_SIZE)
         claimed_mime = file.content_type or "application/octet-stream"
-        if not self._validate_mime_type(content, claimed_mime):
+        if not self._validate_mime_type(head, claimed_mime):
             raise InvalidFileTypeError("File content does not match declared MIME type")
 
         if claimed_mime not in settings.upload_allowed_mime_types:
             raise InvalidFileTypeError(f"File type {claimed_mime} is not allowed")
 
-        # 3. Process image
-        file_buffer = io.BytesIO(content)
-        processed_file, processed_mime, processed_size = self.image_processor.process(
-            file_buffer, claimed_mime
+        # 3. Enforce the size limit and quota on the actual content
+        source_hash, size_bytes = await self._hash_streamed(file, head)
+        await self._check_storage_quota(project_id, size_bytes)
+
+        async def read_file() -> bytes:
+            await file.seek(0)
+            return await file.read()
+
+        # 4-6. Reuse, or process and store
+        return await self._store_image(
+            user_id=user_id,
+            project_id=project_id,
+            filename=file.filename or "unnamed",
+            source_hash=source_hash,
+            mime_type=claimed_mime,
+            read_content=read_file,
+        )
+
+    async def _store_image(
+        self,
+        user_id: UUID,
+        project_id: UUID,
+        filename: str,
+        source_hash: str,
+        mime_type: str,
+        read_content: Callable[[], Awaitable[bytes | bytearray]],
+    ) -> Upload:
+        """Create an upload from validated source bytes.
+
+        Reuses the stored result of an earlier upload of the same bytes,
+        otherwise processes the image in the pool and stores the result
+        by content hash.
+
+        Args:
+            user_id: UUID of the uploader.
+            project_id: UUID of the project.
+            filename: Original filename.
+            source_hash: SHA-256 hex digest of the source bytes.
+            mime_type: Validated MIME type of the source bytes.
+            read_content: Reads the whole source; only called once a pool
+                slot is held.
+
+        Returns:
+            Created upload record.
+
+        Raises:
+            ImageTooLargeError: If the image exceeds the pixel budget.
+            ImageProcessingUnavailableError: If the processing queue is full,
+                or processing times out or crashes.
+            StorageError: If the source changed since it was hashed, or
+                storage operation fails.
+        """
+        # Skip processing for content that was uploaded before
+        upload = await self.upload_repo.create_from_source(
+            user_id=user_id,
+            project_id=project_id,
+            filename=filename,
+            source_hash=source_hash,
         )
+        if upload is not None:
+            return upload
 
-        # 4. Save to storage
-        storage_path = await self.storage.save(
-            processed_file.read(),
-            file.filename or "unnamed",
-            processed_mime,
+        # Process image off the event loop and store it by content hash
+        async with self.image_pool.slot():
+            content = await read_content()
+            # The source is read again here: check it is still what was
+            # validated and hashed, or other uploads of source_hash would
+            # reuse the result of different content
+            if hashlib.sha256(content).hexdigest() != source_hash or (
+                not self._validate_mime_type(content[:UPLOAD_SNIFF_SIZE], mime_type)
+            ):
+                raise StorageError("File changed while it was being read")
+            processed = await self.image_pool.run(
+                self.image_processor.process_bytes, content, mime_type
+            )
+            del content
+
+        # Lock the blob's file until create() commits, so a concurrent
+        # delete of the same content cannot remove it in between
+        content_hash = hashlib.sha256(processed.content).hexdigest()
+        storage_path = self.storage.blob_path(content_hash, processed.mime_type)
+        await self.upload_repo.lock_blob_files([storage_path])
+        storage_path = await self.storage.save_blob(
+            processed.content, content_hash, processed.mime_type
         )
 
-        # 5. Create DB record
         upload = await self.upload_repo.create(
             user_id=user_id,
             project_id=project_id,
-            filename=file.filename or "unnamed",
+            filename=filename,
             storage_path=storage_path,
-            mime_type=processed_mime,
-            size_bytes=processed_size,
+            mime_type=processed.mime_type,
+            size_bytes=processed.size_bytes,
+            content_hash=content_hash,
+            source_hash=source_hash,
+            width=processed.width,
+            height=processed.height,
+            placeholder=processed.placeholder,
         )
 
         return upload
 
+    async def _hash_streamed(self, file: UploadFile, head: bytes) -> tuple[str, int]:
+        """Hash the rest of an upload in chunks and enforce the size limit.
+
+        Only one chunk is held at a time, and reading stops at the first
+        chunk that crosses the limit.
+
+        Args:
+            file: Uploaded file, positioned after the bytes already read.
+            head: Bytes already read from the start of the file.
+
+        Returns:
+            Tuple of (SHA-256 hex digest, size) of the whole file.
+
+        Raises:
+            FileTooLargeError: If file exceeds size limit.
+        """
+        digest = hashlib.sha256(head)
+        size = len(head)
+        while chunk := await file.read(UPLOAD_READ_CHUNK_SIZE):
+            size += len(chunk)
+            if size > settings.upload_max_file_size:
+                raise FileTooLargeError(
+                    "File exceeds maximum size of "
+                    f"{settings.upload_max_file_size} bytes"
+                )
+            digest.update(chunk)
+        return digest.hexdigest(), size
+
+    async def _check_storage_quota(self, project_id: UUID, size_bytes: int) -> None:
+        """Check that a file fits in a project's storage quota.
+
+        Reads the project's maintained storage totals instead of summing
+        its content. Uploads running at the same time are checked against
+        the same totals, so together they can overshoot the quota by up
+        to their own size.
+
+        Args:
+            project_id: UUID of the project.
+            size_bytes: Size of the file to add.
+
+        Raises:
+            StorageQuotaExceededError: If the file does not fit.
+        """
+        used_bytes, project_quota = await self.upload_repo.get_project_storage(
+            project_id
+        )
+        quota = effective_storage_quota(project_quota)
+        if quota is not None and used_bytes + size_bytes > quota:
+            raise StorageQuotaExceededError(
+                f"Project storage quota of {quota} bytes exceeded "
+                f"({used_bytes} bytes used)"
+            )
+
+    async def start_direct_upload(
+        self,
+        user_id: UUID,
+        project_id: UUID,
+        filename: str,
+        mime_type: str,
+        size_bytes: int,
+        resumable: bool = False,
+    ) -> DirectUploadTicket:
+        """Start an upload whose file is sent to storage instead of the API.
+
+        The client PUTs the file to the returned URL: a presigned object
+        storage URL where the provider offers one, otherwise the API's
+        streaming receiver (see receive_direct_upload()). It then calls
+        complete_direct_upload(), and the file is validated and processed
+        in the background.
+
+        A resumable upload is instead sent in chunks with PATCH to the
+        API (see append_resumable_chunk()), and an interrupted chunk only
+        has to be sent again from the last stored offset.
+
+        Args:
+            user_id: UUID of the uploader.
+            project_id: UUID of the project.
+            filename: Original filename.
+            mime_type: Content-Type the file will be sent with.
+            size_bytes: Exact size of the file.
+            resumable: Whether the file is sent in chunks.
+
+        Returns:
+            Where and how to send the file.
+
+        Raises:
+            FileTooLargeError: If the declared size exceeds the limit.
+            InvalidFileTypeError: If the declared type is not allowed.
+            StorageQuotaExceededError: If the project has no room for the file.
+            StorageError: If storage cannot issue an upload URL.
+        """
+        if size_bytes > settings.upload_max_file_size:
+            raise FileTooLargeError(
+                f"File exceeds maximum size of {settings.upload_max_file_size} bytes"
+            )
+        if mime_type not in settings.upload_allowed_mime_types:
+            raise InvalidFileTypeError(f"File type {mime_type} is not allowed")
+        await self._check_storage_quota(project_id, size_bytes)
+
+        token = secrets.token_urlsafe(24)
+        storage_path = f"{DIRECT_UPLOAD_STORAGE_PREFIX}{token}"
+        fields: dict[str, str | int] = {
+            "user_id": str(user_id),
+            "project_id": str(project_id),
+            "filename": filename,
+            "mime_type": mime_type,
+            "size_bytes": size_bytes,
+            "storage_path": storage_path,
+            "status": DirectUploadStatus.PENDING.value,
+        }
+        if resumable:
+            expires_at = datetime.now(UTC) + timedelta(
+                seconds=settings.upload_resumable_expires_seconds
+            )
+            ticket = DirectUploadTicket(
+                id=token,
+                upload_url=f"/api/v1/uploads/resumable/{token}",
+                method="PATCH",
+                headers={"Content-Type": RESUMABLE_CONTENT_TYPE},
+                expires_at=expires_at,
+            )
+            fields |= {"resumable": 1, "offset": 0, "parts": 0}
+        else:
+            expires_at = datetime.now(UTC) + timedelta(
+                seconds=settings.upload_direct_expires_seconds
+            )
+            upload_url = self.storage.get_upload_url(
+                storage_path, mime_type, size_bytes
+            )
+            ticket = DirectUploadTicket(
+                id=token,
+                upload_url=upload_url or f"/api/v1/uploads/direct/{token}",
+                headers={"Content-Type": mime_type},
+                expires_at=expires_at,
+            )
+
+        fields["expires_at"] = int(expires_at.timestamp())
+        await set_direct_upload(token, fields)
+        return ticket
+
+    async def receive_direct_upload(
+        self, token: str, chunks: AsyncIterable[bytes]
+    ) -> None:
+        """Store the file of a direct upload sent to the API.
+
+        Used when the storage provider has no upload URLs. The body is
+        written to storage as it arrives, so memory use does not grow with
+        the file. The token in the URL authorizes the request.
+
+        Args:
+            token: Direct upload token.
+            chunks: The request body, in chunks.
+
+        Raises:
+            DirectUploadNotFoundError: If the upload is unknown or its URL
+                has expired.
+            DirectUploadStateError: If the upload was already completed,
+                or is resumable.
+            FileTooLargeError: If the body exceeds the declared size.
+            StorageError: If the file cannot be stored.
+        """
+        session = await get_direct_upload(token)
+        if not session or int(session["expires_at"]) < time.time():
+            raise DirectUploadNotFoundError("Upload URL is invalid or has expired")
+        if "resumable" in session:
+            raise DirectUploadStateError("Resumable uploads are sent with PATCH")
+        if session["status"] != DirectUploadStatus.PENDING.value:
+            raise DirectUploadStateError("Upload has already been completed")
+
+        declared_size = int(session["size_bytes"])
+        await self.storage.put_stream(
+            session["storage_path"],
+            _limit_size(
+                chunks,
+                declared_size,
+                f"File exceeds declared size of {declared_size} bytes",
+            ),
+        )
+
+    async def get_resumable_offset(self, token: str, user_id: UUID) -> tuple[int, int]:
+        """Get how much of a resumable upload has been stored.
+
+        Args:
+            token: Direct upload token.
+            user_id: UUID of the requesting user.
+
+        Returns:
+            Tuple of (bytes stored so far, declared file size).
+
+        Raises:
+            DirectUploadNotFoundError: If the upload is unknown, expired or
+                not resumable.
+            PermissionDeniedError: If user did not start the upload.
+        """
+        session = await self._get_resumable_session(token, user_id)
+        return int(session["offset"]), int(session["size_bytes"])
+
+    async def append_resumable_chunk(
+        self,
+        token: str,
+        user_id: UUID,
+        offset: int,
+        chunks: AsyncIterable[bytes],
+    ) -> int:
+        """Store the next chunk of a resumable upload.
+
+        Each chunk is written to storage as it arrives, as its own object
+        next to the earlier ones, so memory use does not grow with the
+        file. The offset only advances once the whole chunk is stored: a
+        chunk that is cut off is discarded and sent again from the
+        returned offset of get_resumable_offset().
+
+        Args:
+            token: Direct upload token.
+            user_id: UUID of the requesting user.
+            offset: Offset the chunk starts at; must equal the bytes
+                stored so far.
+            chunks: The request body, in chunks.
+
+        Returns:
+            Bytes stored so far, including this chunk.
+
+        Raises:
+            DirectUploadNotFoundError: If the upload is unknown, expired or
+                not resumable.
+            PermissionDeniedError: If user did not start the upload.
+            DirectUploadStateError: If the upload was completed, the offset
+                does not match, or another chunk is being stored.
+            FileTooLargeError: If the chunk is too large or runs past the
+                declared size.
+            StorageError: If the chunk cannot be stored.
+        """
+        session = await self._get_resumable_session(token, user_id)
+        if session["status"] != DirectUploadStatus.PENDING.value:
+            raise DirectUploadStateError("Upload has already been completed")
+        if not await acquire_direct_upload_lock(token, RESUMABLE_CHUNK_LOCK_TTL):
+            raise DirectUploadStateError("Another chunk of this upload is being sent")
+
+        try:
+            # Read again under the lock, after any chunk stored meanwhile
+            session = await get_direct_upload(token)
+            stored = int(session["offset"])
+            if offset != stored:
+                raise DirectUploadStateError(f"Upload offset is {stored}, not {offset}")
+
+            remaining = int(session["size_bytes"]) - stored
+            limit = min(remaining, settings.upload_resumable_max_chunk_size)
+            part = int(session["parts"])
+            part_path = _part_path(session["storage_path"], part)
+            written = await self.storage.put_stream(
+                part_path,
+                _limit_size(
+                    chunks,
+                    limit,
+                    f"Chunk exceeds {limit} bytes, the most accepted at this offset",
+                ),
+            )
+            if written == 0:
+                await self.storage.delete(part_path)
+                return stored
+
+            await set_direct_upload(
+                token, {"offset": stored + written, "parts": part + 1}
+            )
+            return stored + written
+        finally:
+            await release_direct_upload_lock(token)
+
+    async def complete_direct_upload(
+        self, token: str, user_id: UUID
+    ) -> DirectUploadRead:
+        """Mark a direct upload's file as sent, ready for processing.
+
+        A file sent in one PUT is first moved to a path of its own, so a
+        PUT still in flight, or sent later with the same URL, cannot
+        change what is processed. The caller then runs
+        finalize_direct_upload() in the background. Completing an upload
+        again returns its current state.
+
+        Args:
+            token: Direct upload token.
+            user_id: UUID of the requesting user.
+
+        Returns:
+            State of the upload.
+
+        Raises:
+            DirectUploadNotFoundError: If the upload is unknown or expired.
+            PermissionDeniedError: If user did not start the upload.
+            DirectUploadStateError: If the file has not been received in
+                full.
+            StorageError: If the file cannot be moved.
+        """
+        session = await self._get_direct_session(token, user_id)
+        if session["status"] != DirectUploadStatus.PENDING.value:
+            return await self._direct_upload_read(token, session)
+
+        if "resumable" in session:
+            size = int(session["offset"])
+        else:
+            # Nothing to move when completing again after a failed check
+            sealed_path = _sealed_path(session["storage_path"])
+            await self.storage.move(session["storage_path"], sealed_path)
+            size = await self.storage.get_size(sealed_path)
+        if size != int(session["size_bytes"]):
+            raise DirectUploadStateError("File has not been received in full")
+
+        await set_direct_upload(token, {"status": DirectUploadStatus.PROCESSING.value})
+        return DirectUploadRead(id=token, status=DirectUploadStatus.PROCESSING)
+
+    async def get_direct_upload_status(
+        self, token: str, user_id: UUID
+    ) -> DirectUploadRead:
+        """Get the state of a direct upload.
+
+        Args:
+            token: Direct upload token.
+            user_id: UUID of the requesting user.
+
+        Returns:
+            State of the upload, with the created upload once completed.
+
+        Raises:
+            DirectUploadNotFoundError: If the upload is unknown or expired.
+            PermissionDeniedError: If user did not start the upload.
+        """
+        session = await self._get_direct_session(token, user_id)
+        return await self._direct_upload_read(token, session)
+
+    async def finalize_direct_upload(self, token: str) -> None:
+        """Validate and process a completed direct upload.
+
+        Runs at most once per upload; the outcome is recorded in the
+        upload session and the received file is removed either way.
+
+        Args:
+            token: Direct upload token.
+        """
+        if not await claim_direct_upload(token):
+            return
+        session = await get_direct_upload(token)
+        if not session:
+            # Expired since the claim; the sweep removes its files
+            return
+        try:
+            upload = await self._store_received_file(session)
+        except UploadServiceError as e:
+            logger.info(f"Direct upload {token} rejected: {e}")
+            await set_direct_upload(
+                token, {"status": DirectUploadStatus.FAILED.value, "error": str(e)}
+            )
+        except Exception:
+            logger.exception(f"Direct upload {token} failed")
+            await set_direct_upload(
+                token,
+                {
+                    "status": DirectUploadStatus.FAILED.value,
+                    "error": "Upload could not be processed",
+                },
+            )
+        else:
+            await set_direct_upload(
+                token,
+                {
+                    "status": DirectUploadStatus.COMPLETED.value,
+                    "upload_id": str(upload.id),
+                },
+            )
+        finally:
+            paths = _received_paths(session)
+            if "resumable" not in session:
+                # Anything a late PUT wrote after the file was sealed
+                paths.append(session["storage_path"])
+            for path in paths:
+                await self.storage.delete(path)
+
+    async def sweep_expired_direct_uploads(self) -> int:
+        """Delete the files of direct uploads that expired unfinished.
+
+        An upload whose URL expired more than DIRECT_UPLOAD_SWEEP_GRACE ago
+        and was never finalised is marked failed, and its received file or
+        chunks are deleted. Files of finalised uploads were already removed
+        by finalize_direct_upload(); uploads still being finalised are left
+        for a later sweep.
+
+        Returns:
+            Number of uploads whose files were deleted.
+        """
+        expired_before = time.time() - DIRECT_UPLOAD_SWEEP_GRACE.total_seconds()
+        tokens = await get_expired_direct_uploads(
+            expired_before, DIRECT_UPLOAD_SWEEP_BATCH_SIZE
+        )
+        swept = 0
+        for token in tokens:
+            expired = await expire_direct_upload(
+                token,
+                DirectUploadStatus.FAILED.value,
+                "Upload expired before it was completed",
+            )
+            if expired is False:
+                session = await get_direct_upload(token)
+                if session.get("status") == DirectUploadStatus.PROCESSING.value:
+                    continue
+            try:
+                await self._delete_incoming(token)
+            except StorageError:
+                logger.exception(f"Could not delete files of direct upload {token}")
+                continue
+            await remove_direct_upload_expiry(token)
+            if expired is not False:
+                swept += 1
+        return swept
+
+    async def _delete_incoming(self, token: str) -> None:
+        """Delete whatever was received for a direct upload.
+
+        Works without the session: the file and its sealed copy, or the
+        chunks of a resumable upload, are found at the paths the token
+        determines. Chunks are numbered from zero without gaps, so they
+        are deleted until the first one that is missing.
+
+        Args:
+            token: Direct upload token.
+
+        Raises:
+            StorageError: If storage cannot be reached.
+        """
+        storage_path = f"{DIRECT_UPLOAD_STORAGE_PREFIX}{token}"
+        await self.storage.delete(storage_path)
+        await self.storage.delete(_sealed_path(storage_path))
+        part = 0
+        while await self.storage.get_size(_part_path(storage_path, part)) is not None:
+            await self.storage.delete(_part_path(storage_path, part))
+            part += 1
+
+    async def _store_received_file(self, session: dict[str, str]) -> Upload:
+        """Validate a file received for a direct upload and create the upload.
+
+        The file is streamed from storage to check its size and type and
+        to hash it, then read whole into a single buffer once a pool slot
+        is free, as upload_image() does with a request body. The chunks of
+        a resumable upload are read in order as one file.
+
+        Args:
+            session: Direct upload session fields.
+
+        Returns:
+            Created upload record.
+
+        Raises:
+            FileTooLargeError: If file exceeds size limit.
+            InvalidFileTypeError: If the content does not match its type.
+            ImageTooLargeError: If the image exceeds the pixel budget.
+            ImageProcessingUnavailableError: If processing fails.
+            StorageError: If the file cannot be read.
+        """
+        paths = _received_paths(session)
+        digest = hashlib.sha256()
+        head = b""
+        size = 0
+        for path in paths:
+            async for chunk in self.storage.stream(path):
+                size += len(chunk)
+                if size > settings.upload_max_file_size:
+                    raise FileTooLargeError(
+                        "File exceeds maximum size of "
+                        f"{settings.upload_max_file_size} bytes"
+                    )
+                if len(head) < UPLOAD_SNIFF_SIZE:
+                    head += chunk[: UPLOAD_SNIFF_SIZE - len(head)]
+                digest.update(chunk)
+
+        async def read_received() -> bytearray:
+            # Fill one buffer of the measured size: joining the pieces
+            # would hold the file in memory twice
+            content = bytearray(size)
+            offset = 0
+            with memoryview(content) as view:
+                for path in paths:
+                    async for chunk in self.storage.stream(path):
+                        end = offset + len(chunk)
+                        if end > size:
+                            raise StorageError("File changed while it was being read")
+                        view[offset:end] = chunk
+                        offset = end
+            if offset != size:
+                raise StorageError("File changed while it was being read")
+            return content
+
+        if not self._validate_mime_type(head, session["mime_type"]):
+            raise InvalidFileTypeError("File content does not match declared MIME type")
+
+        return await self._store_image(
+            user_id=UUID(session["user_id"]),
+            project_id=UUID(session["project_id"]),
+            filename=session["filename"],
+            source_hash=digest.hexdigest(),
+            mime_type=session["mime_type"],
+            read_content=read_received,
+        )
+
+    async def _get_direct_session(self, token: str, user_id: UUID) -> dict[str, str]:
+        """Load a direct upload session on behalf of a user.
+
+        Raises:
+            DirectUploadNotFoundError: If the upload is unknown or expired.
+            PermissionDeniedError: If user did not start the upload.
+        """
+        session = await get_direct_upload(token)
+        if not session:
+            raise DirectUploadNotFoundError(f"Direct upload {token} not found")
+        if session["user_id"] != str(user_id):
+            raise PermissionDeniedError(
+                "You don't have permission to access this upload"
+            )
+        return session
+
+    async def _get_resumable_session(self, token: str, user_id: UUID) -> dict[str, str]:
+        """Load a resumable upload session on behalf of a user.
+
+        Raises:
+            DirectUploadNotFoundError: If the upload is unknown, expired or
+                not resumable.
+            PermissionDeniedError: If user did not start the upload.
+        """
+        session = await self._get_direct_session(token, user_id)
+        if "resumable" not in session or int(session["expires_at"]) < time.time():
+            raise DirectUploadNotFoundError(
+                f"Resumable upload {token} not found or expired"
+            )
+        return session
+
+    async def _direct_upload_read(
+        self, token: str, session: dict[str, str]
+    ) -> DirectUploadRead:
+        """Build the state of a direct upload from its session."""
+        upload = None
+        if "upload_id" in session:
+            record = await self.upload_repo.get_by_id(UUID(session["upload_id"]))
+            if record is not None:
+                upload = UploadCreateResponse(
+                    id=record.id,
+                    filename=record.filename,
+                    mime_type=record.mime_type,
+                    size_bytes=record.size_bytes,
+                    width=record.width,
+                    height=record.height,
+                    placeholder=record.placeholder,
+                    url=self.get_url(record),
+                    created_at=record.created_at,
+                )
+        return DirectUploadRead(
+            id=token,
+            status=DirectUploadStatus(session["status"]),
+            error=session.get("error"),
+            upload=upload,
+        )
+
     async def get_upload(self, upload_id: UUID) -> Upload:
         """Get upload by ID.
 
@@ -167,11 +985,40 @@ class UploadService:
                 "You don't have permission to delete this upload"
             )
 
-        # Delete from storage
-        await self.storage.delete(upload.storage_path)
+        # Delete DB record, then the file once no upload references it
+        released_path = await self.upload_repo.delete(upload)
+        if released_path is None:
+            return
+        async with self.upload_repo.unused_files([released_path]) as unused:
+            files = [
+                file for path in unused for file in (path, *variant_storage_paths(path))
+            ]
+            failed = await self.storage.delete_many(files)
+        await self.file_cache.invalidate(released_path)
+        if failed:
+            logger.warning(
+                f"Deletion of upload {upload_id} left {len(failed)} files in storage"
+            )
 
-        # Delete DB record
-        await self.upload_repo.delete(upload)
+    async def get_storage_stats(self) -> UploadStorageStatsRead:
+        """Get how much storage deduplication saves.
+
+        Returns:
+            Uploaded and stored byte totals.
+        """
+        (
+            upload_count,
+            blob_count,
+            uploaded_bytes,
+            stored_bytes,
+        ) = await self.upload_repo.get_storage_stats()
+        return UploadStorageStatsRead(
+            upload_count=upload_count,
+            blob_count=blob_count,
+            uploaded_bytes=uploaded_bytes,
+            stored_bytes=stored_bytes,
+            saved_bytes=uploaded_bytes - stored_bytes,
+        )
 
     async def get_file_content(self, upload_id: UUID) -> tuple[bytes, str]:
         """Get file content for serving.
@@ -203,15 +1050,303 @@ class UploadService:
             UploadNotFoundError: If upload not found.
             StorageError: If file retrieval fails.
         """
-        upload = await self.get_upload_by_storage_path(storage_path)
-        content = await self.storage.get(upload.storage_path)
-        return content, upload.mime_type
+        info = await self.get_file_info(storage_path)
+        content = await self.storage.get(info.storage_path)
+        return content, info.mime_type
+
+    async def get_file_info(self, storage_path: str) -> UploadFileInfo:
+        """Get the metadata needed to serve a file.
+
+        Served from the file cache when possible, so hot files do not
+        touch the database.
+
+        Args:
+            storage_path: Storage path of the file.
+
+        Returns:
+            File metadata.
+
+        Raises:
+            UploadNotFoundError: If upload not found.
+        """
+        info = await self.file_cache.get(storage_path)
+        if info is None:
+            upload = await self.get_upload_by_storage_path(storage_path)
+            info = UploadFileInfo(
+                storage_path=upload.storage_path,
+                mime_type=upload.mime_type,
+                size_bytes=upload.size_bytes,
+                etag=self.get_etag(upload),
+                last_modified=upload.created_at,
+            )
+            await self.file_cache.set(info)
+        return info
+
+    async def get_variant(
+        self, storage_path: str, width: int, accept: str
+    ) -> UploadFileInfo:
+        """Get a resized variant of an image in the best format the client takes.
+
+        The variant is generated on first request and kept in storage.
+        Concurrent first requests for the same variant share one job.
+        GIFs have no resized variants; they are served as by
+        get_animation().
+
+        Args:
+            storage_path: Storage path of the original image.
+            width: Requested width, one of ``upload_variant_widths``.
+            accept: Value of the request's Accept header.
+
+        Returns:
+            Metadata of the variant file.
+
+        Raises:
+            InvalidVariantError: If the width is not offered.
+            UploadNotFoundError: If upload not found.
+            ImageProcessingUnavailableError: If the variant cannot be
+                generated right now.
+            StorageError: If the original cannot be read or the variant saved.
+        """
+        if width not in settings.upload_variant_widths:
+            raise InvalidVariantError(
+                f"Width must be one of {settings.upload_variant_widths}"
+            )
+
+        info = await self.get_file_info(storage_path)
+        if info.mime_type == "image/gif":
+            return await self._get_animation(info, accept, None)
+
+        mime_type = self._choose_variant_type(accept, info.mime_type)
+        path = variant_storage_path(info.storage_path, width, mime_type)
+        size = await variant_flight.do(
+            path,
+            lambda: self._ensure_variant(
+                info, path, self.image_processor.create_variant, width, mime_type
+            ),
+        )
+        subtype = mime_type.removeprefix("image/")
+        return UploadFileInfo(
+            storage_path=path,
+            mime_type=mime_type,
+            size_bytes=size,
+            etag=f'{info.etag[:-1]}-{width}-{subtype}"',
+            last_modified=info.last_modified,
+        )
+
+    async def get_animation(
+        self, storage_path: str, accept: str, video: str | None = None
+    ) -> UploadFileInfo:
+        """Get a GIF transcoded to a smaller animated format.
+
+        GIFs are served as animated WebP when the Accept header allows it,
+        or as MP4/WebM when ``video`` asks for it and ffmpeg is available.
+        The transcode is generated on first request and kept in storage.
+        The original GIF is the fallback whenever transcoding is disabled,
+        fails, or does not make the file smaller. Other images are
+        returned as is.
+
+        Args:
+            storage_path: Storage path of the original image.
+            accept: Value of the request's Accept header.
+            video: Requested video type, ``"mp4"`` or ``"webm"``.
+
+        Returns:
+            Metadata of the file to serve.
+
+        Raises:
+            UploadNotFoundError: If upload not found.
+            ImageProcessingUnavailableError: If the transcode cannot be
+                generated right now.
+            StorageError: If the original cannot be read or the transcode
+                saved.
+        """
+        info = await self.get_file_info(storage_path)
+        return await self._get_animation(info, accept, video)
+
+    async def _get_animation(
+        self, info: UploadFileInfo, accept: str, video: str | None
+    ) -> UploadFileInfo:
+        """Pick and generate the transcode of a GIF for get_animation().
+
+        Args:
+            info: Metadata of the original image.
+            accept: Value of the request's Accept header.
+            video: Requested video type, or None.
+
+        Returns:
+            Metadata of the transcode, or info itself as the fallback.
+        """
+        if info.mime_type != "image/gif" or not settings.upload_gif_transcode:
+            return info
+
+        if video is not None:
+            if not self.image_processor.video_available():
+                return info
+            mime_type = f"video/{video}"
+        elif "image/webp" in self._accepted_types(accept):
+            mime_type = "image/webp"
+        else:
+            return info
+
+        path = animation_storage_path(info.storage_path, mime_type)
+        try:
+            size = await variant_flight.do(
+                path,
+                lambda: self._ensure_variant(
+                    info, path, self.image_processor.transcode_animation, mime_type
+                ),
+            )
+        except (InvalidFileTypeError, ImageTooLargeError) as e:
+            logger.warning(f"Serving {info.storage_path} untranscoded: {e}")
+            return info
+        if size >= info.size_bytes:
+            return info
+
+        subtype = mime_type.split("/")[1]
+        return UploadFileInfo(
+            storage_path=path,
+            mime_type=mime_type,
+            size_bytes=size,
+            etag=f'{info.etag[:-1]}-animated-{subtype}"',
+            last_modified=info.last_modified,
+        )
+
+    async def _ensure_variant(
+        self,
+        info: UploadFileInfo,
+        path: str,
+        create: Callable[..., tuple[bytes, str, int]],
+        *args: object,
+    ) -> int:
+        """Generate and store a variant unless it already exists.
+
+        Args:
+            info: Metadata of the original image.
+            path: Storage path of the variant.
+            create: ImageProcessor method that makes the variant from the
+                original's bytes, run in the image pool.
+            *args: Further arguments for create.
+
+        Returns:
+            Size of the variant in bytes.
+        """
+        size = await self.storage.get_size(path)
+        if size is not None:
+            return size
+
+        async with self.image_pool.slot():
+            content = await self.storage.get(info.storage_path)
+            variant, _, size = await self.image_pool.run(create, content, *args)
+            del content
+
+        await self.storage.put(path, variant)
+        logger.info(
+            f"Generated {path}: {size} bytes, "
+            f"{size / max(info.size_bytes, 1):.0%} of the original"
+        )
+        return size
+
+    def _choose_variant_type(self, accept: str, source_mime: str) -> str:
+        """Pick the variant format from the Accept header.
+
+        Args:
+            accept: Value of the request's Accept header.
+            source_mime: MIME type of the original image.
+
+        Returns:
+            AVIF or WebP if accepted, otherwise PNG for PNG originals (to
+            keep transparency) and JPEG for everything else.
+        """
+        accepted = self._accepted_types(accept)
+        for mime_type in VARIANT_PREFERRED_TYPES:
+            if mime_type in accepted:
+                return mime_type
+        return "image/png" if source_mime == "image/png" else "image/jpeg"
+
+    def _accepted_types(self, accept: str) -> set[str]:
+        """Parse the media types an Accept header allows.
+
+        Args:
+            accept: Value of the request's Accept header.
+
+        Returns:
+            Lowercased media types with a non-zero quality. Wildcards are
+            kept as written, so only explicitly listed types match.
+        """
+        accepted = set()
+        for part in accept.split(","):
+            media_type, *params = part.split(";")
+            quality = 1.0
+            for param in params:
+                name, _, value = param.strip().partition("=")
+                if name == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            if quality > 0:
+                accepted.add(media_type.strip().lower())
+        return accepted
+
+    async def get_local_file(
+        self, storage_path: str
+    ) -> tuple[Path, os.stat_result] | None:
+        """Locate a stored file on local disk for streaming.
+
+        Args:
+            storage_path: Storage path of the file.
+
+        Returns:
+            Tuple of (absolute path, stat result), or None if the storage
+            provider does not keep files on local disk.
+
+        Raises:
+            StorageError: If the file is missing.
+        """
+        return await self.storage.get_local_file(storage_path)
+
+    def get_download_url(self, storage_path: str) -> str | None:
+        """Get a short-lived URL to download a file from storage directly.
+
+        Args:
+            storage_path: Storage path of the file.
+
+        Returns:
+            Signed URL, or None if the storage provider has none.
+        """
+        return self.storage.get_download_url(storage_path)
+
+    def stream_file(self, storage_path: str) -> AsyncIterator[bytes]:
+        """Read a stored file in chunks.
+
+        Args:
+            storage_path: Storage path of the file.
+
+        Returns:
+            Async iterator over the file's chunks.
+        """
+        return self.storage.stream(storage_path)
+
+    def get_etag(self, upload: Upload) -> str:
+        """Get the HTTP entity tag of an upload's content.
+
+        Stored files are never modified in place, so the content hash (or
+        the upload ID, for uploads stored before content hashing) identifies
+        the content.
+
+        Args:
+            upload: Upload record.
+
+        Returns:
+            Quoted strong ETag.
+        """
+        return f'"{upload.content_hash or upload.id.hex}"'
 
     def _validate_mime_type(self, content: bytes, claimed_mime: str) -> bool:
         """Validate file content matches claimed MIME type using magic bytes.
 
         Args:
-            content: File content bytes.
+            content: Leading bytes of the file.
             claimed_mime: MIME type claimed by the client.
 
         Returns:
@@ -249,3 +1384,50 @@ class UploadService:
             URL to access the file.
         """
         return self.storage.get_url(upload.storage_path)
+
+
+async def run_direct_upload_finalization(token: str) -> None:
+    """Finalize a direct upload in its own database session.
+
+    Used as a FastAPI background task, after the request session is closed.
+
+    Args:
+        token: Direct upload token.
+    """
+    async with async_session_maker() as session:
+        service = UploadService(
+            upload_repo=UploadRepository(session),
+            storage=get_storage_provider(),
+            image_processor=ImageProcessor(),
+            image_pool=image_pool,
+            file_cache=upload_file_cache,
+        )
+        await service.finalize_direct_upload(token)
+
+
+async def schedule_direct_upload_sweep() -> None:
+    """Delete abandoned direct upload files every sweep interval.
+
+    Runs every settings.upload_direct_sweep_interval_seconds and returns
+    at once when the sweep is disabled. Every worker runs the schedule;
+    claiming each expired upload in Redis keeps the workers from deleting
+    the same files twice.
+    """
+    if settings.upload_direct_sweep_interval_seconds <= 0:
+        return
+    while True:
+        await asyncio.sleep(settings.upload_direct_sweep_interval_seconds)
+        try:
+            async with async_session_maker() as session:
+                service = UploadService(
+                    upload_repo=UploadRepository(session),
+                    storage=get_storage_provider(),
+                    image_processor=ImageProcessor(),
+                    image_pool=image_pool,
+                    file_cache=upload_file_cache,
+                )
+                swept = await service.sweep_expired_direct_uploads()
+            if swept:
+                logger.info(f"Deleted files of {swept} expired direct uploads")
+        except Exception:
+            logger.exception("Scheduled direct upload sweep failed")
@@ -0,0 +1,326 @@
+"""Collector for uploads that no document or revision references."""
+
+import asyncio
+import contextlib
+import json
+import logging
+import re
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from urllib.parse import unquote
+from uuid import UUID
+
+from redis.exceptions import RedisError
+from sqlalchemy import Row
+
+from app.config import settings
+from app.core.database import async_session_maker
+from app.core.redis import (
+    acquire_upload_gc_lock,
+    get_upload_gc_progress,
+    refresh_upload_gc_lock,
+    release_upload_gc_lock,
+    set_upload_gc_progress,
+)
+from app.core.storage import StorageProvider, get_storage_provider
+from app.core.upload_cache import UploadFileCache, upload_file_cache
+from app.repositories.upload_gc import UPLOAD_URL_MARKER, UploadGCRepository
+from app.schemas.upload import UploadGCRead, UploadGCStatus
+from app.services.upload import variant_storage_paths
+
+logger = logging.getLogger(__name__)
+
+# A file URL ends where Markdown or HTML syntax, a query or a fragment starts
+UPLOAD_REFERENCE_PATTERN = re.compile(
+    re.escape(UPLOAD_URL_MARKER) + r"([^\s\"'<>()\[\]?#]+)"
+)
+
+# Lock lifetime, refreshed after every batch; a crashed worker's lock
+# expires so a later run can start
+GC_LOCK_TTL = timedelta(minutes=5)
+
+# Content saved this long before a scan started is rescanned before
+# deleting, to cover transactions that were still open during the scan
+GC_RESCAN_MARGIN = timedelta(minutes=5)
+
+# Orphan paths listed in the report
+GC_REPORT_SAMPLE_SIZE = 50
+
+
+def extract_upload_references(content: str) -> set[str]:
+    """Find the storage paths of uploaded files a text links to.
+
+    Both the path as written and its percent-decoded form are returned,
+    with and without trailing sentence punctuation, so a reference is
+    never missed because of how it was written.
+
+    Args:
+        content: Document or revision content.
+
+    Returns:
+        Storage paths referenced by the content.
+    """
+    references = set()
+    for match in UPLOAD_REFERENCE_PATTERN.finditer(content):
+        path = match.group(1)
+        for candidate in (path, path.rstrip(".,;:!")):
+            references.add(candidate)
+            references.add(unquote(candidate))
+    return references
+
+
+class UploadGCService:
+    """Service that deletes uploads no document or revision links to.
+
+    A run first streams every document and revision into a set of
+    referenced storage paths, then walks the uploads older than the grace
+    period in batches. Before each batch is deleted, content saved since
+    the previous scan is scanned again, so a link added while the job
+    runs keeps its upload.
+    """
+
+    def __init__(
+        self,
+        gc_repo: UploadGCRepository,
+        storage: StorageProvider,
+        file_cache: UploadFileCache,
+        batch_size: int | None = None,
+        grace_period: timedelta | None = None,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            gc_repo: Repository for scanning content and deleting uploads.
+            storage: Storage provider holding the upload files.
+            file_cache: Cache of file metadata to invalidate.
+            batch_size: Uploads per transaction, and rows per cursor fetch.
+                Defaults to settings.upload_gc_batch_size.
+            grace_period: How long unreferenced uploads are kept.
+                Defaults to settings.upload_gc_grace_seconds.
+        """
+        self.gc_repo = gc_repo
+        self.storage = storage
+        self.file_cache = file_cache
+        self.batch_size = batch_size or settings.upload_gc_batch_size
+        self.grace_period = grace_period or timedelta(
+            seconds=settings.upload_gc_grace_seconds
+        )
+
+    async def get_status(self) -> UploadGCRead | None:
+        """Get progress or the report of the latest collection.
+
+        Returns:
+            Job progress, or None if no job has run recently.
+        """
+        progress = await get_upload_gc_progress()
+        if not progress:
+            return None
+        return UploadGCRead.model_validate(
+            {
+                **progress,
+                "orphan_sample": json.loads(progress.get("orphan_sample", "[]")),
+            }
+        )
+
+    async def run(self, dry_run: bool) -> None:
+        """Collect orphaned uploads, or only report them.
+
+        Failures are logged and recorded as the job status. Batches
+        deleted before a failure stay deleted.
+
+        Args:
+            dry_run: Report what would be deleted without deleting it.
+        """
+        if not await acquire_upload_gc_lock(GC_LOCK_TTL):
+            logger.info("Orphaned upload collection is already running")
+            return
+
+        counts = {
+            "documents_scanned": 0,
+            "revisions_scanned": 0,
+            "references_found": 0,
+            "uploads_checked": 0,
+            "orphans_found": 0,
+            "orphan_bytes": 0,
+            "uploads_deleted": 0,
+            "files_deleted": 0,
+        }
+        sample: list[str] = []
+        running = UploadGCStatus.RUNNING
+        phase = "scan"
+        try:
+            await self._report(running, dry_run, phase, counts, sample)
+            created_before = datetime.now(UTC) - self.grace_period
+            scanned_at = datetime.now(UTC)
+            referenced: set[str] = set()
+            await self._scan(referenced, counts)
+            counts["references_found"] = len(referenced)
+
+            phase = "sweep"
+            after_id: UUID | None = None
+            while rows := await self.gc_repo.get_uploads_chunk(
+                created_before, after_id, self.batch_size
+            ):
+                after_id = rows[-1].id
+                counts["uploads_checked"] += len(rows)
+                orphans = [row for row in rows if row.storage_path not in referenced]
+                if orphans and not dry_run:
+                    since = scanned_at - GC_RESCAN_MARGIN
+                    scanned_at = datetime.now(UTC)
+                    await self._scan(referenced, since=since)
+                    counts["references_found"] = len(referenced)
+                    orphans = [
+                        row for row in orphans if row.storage_path not in referenced
+                    ]
+
+                counts["orphans_found"] += len(orphans)
+                counts["orphan_bytes"] += sum(row.size_bytes for row in orphans)
+                for row in orphans[: GC_REPORT_SAMPLE_SIZE - len(sample)]:
+                    sample.append(row.storage_path)
+                if dry_run:
+                    for row in orphans:
+                        logger.info(
+                            f"Orphaned upload {row.id} at {row.storage_path} "
+                            f"({row.size_bytes} bytes) would be deleted"
+                        )
+                elif orphans:
+                    await self._delete(orphans, counts)
+
+                await self._report(running, dry_run, phase, counts, sample)
+                await refresh_upload_gc_lock(GC_LOCK_TTL)
+
+            await self._report(UploadGCStatus.COMPLETED, dry_run, phase, counts, sample)
+            logger.info(
+                f"Orphaned upload collection finished (dry run: {dry_run}): "
+                f"{counts['orphans_found']} orphans, "
+                f"{counts['orphan_bytes']} bytes, "
+                f"{counts['uploads_deleted']} deleted"
+            )
+        except Exception:
+            logger.exception("Orphaned upload collection failed")
+            with contextlib.suppress(RedisError, OSError):
+                await self._report(
+                    UploadGCStatus.FAILED, dry_run, phase, counts, sample
+                )
+        finally:
+            with contextlib.suppress(RedisError, OSError):
+                await release_upload_gc_lock()
+
+    async def _scan(
+        self,
+        referenced: set[str],
+        counts: dict[str, int] | None = None,
+        since: datetime | None = None,
+    ) -> None:
+        """Add the storage paths linked from documents and revisions.
+
+        Args:
+            referenced: Set the referenced paths are added to.
+            counts: Counters of scanned rows to update, if any.
+            since: Only scan content saved at or after this time, if given.
+        """
+        sources: dict[str, AsyncIterator[str]] = {
+            "documents_scanned": self.gc_repo.stream_document_contents(
+                self.batch_size, since
+            ),
+            "revisions_scanned": self.gc_repo.stream_revision_contents(
+                self.batch_size, since
+            ),
+        }
+        rows = 0
+        for counter, contents in sources.items():
+            async for content in contents:
+                referenced |= extract_upload_references(content)
+                if counts is not None:
+                    counts[counter] += 1
+                rows += 1
+                if rows % self.batch_size == 0:
+                    await refresh_upload_gc_lock(GC_LOCK_TTL)
+
+    async def _delete(
+        self, orphans: list[Row[tuple[UUID, str, int]]], counts: dict[str, int]
+    ) -> None:
+        """Delete a batch of orphaned uploads, then their files and variants.
+
+        Files are removed only after the rows are committed, so a failure
+        can leave an orphaned file but never a record without its file,
+        and not while a concurrent upload of the same content stores it.
+        Only uploads whose original file was removed count as deleted
+        files; each failed path is logged by the storage provider.
+
+        Args:
+            orphans: Rows of the uploads to delete.
+            counts: Counters to update.
+        """
+        deleted, paths = await self.gc_repo.delete_uploads([row.id for row in orphans])
+        async with self.gc_repo.unused_files(paths) as unused:
+            files = [
+                file for path in unused for file in (path, *variant_storage_paths(path))
+            ]
+            failed = await self.storage.delete_many(files)
+        for path in paths:
+            await self.file_cache.invalidate(path)
+        if failed:
+            logger.warning(
+                f"Orphaned upload collection left {len(failed)} files in storage"
+            )
+        counts["uploads_deleted"] += deleted
+        counts["files_deleted"] += len(set(unused) - set(failed))
+
+    async def _report(
+        self,
+        status: UploadGCStatus,
+        dry_run: bool,
+        phase: str,
+        counts: dict[str, int],
+        sample: list[str],
+    ) -> None:
+        """Publish job progress for the status endpoint.
+
+        Args:
+            status: Current job status.
+            dry_run: Whether orphans are only reported.
+            phase: Current step of the job.
+            counts: Counters so far.
+            sample: Storage paths of the first orphans found.
+        """
+        await set_upload_gc_progress(
+            {
+                "status": status.value,
+                "dry_run": int(dry_run),
+                "phase": phase,
+                **counts,
+                "orphan_sample": json.dumps(sample),
+            }
+        )
+
+
+async def run_upload_gc(dry_run: bool) -> None:
+    """Run an orphaned upload collection in its own database session.
+
+    Used as a FastAPI background task, after the request session is closed.
+
+    Args:
+        dry_run: Report what would be deleted without deleting it.
+    """
+    async with async_session_maker() as session:
+        service = UploadGCService(
+            UploadGCRepository(session), get_storage_provider(), upload_file_cache
+        )
+        await service.run(dry_run)
+
+
+async def schedule_upload_gc() -> None:
+    """Collect orphaned uploads every settings.upload_gc_interval_seconds.
+
+    Returns at once when scheduled collection is disabled. Every worker
+    runs the schedule; the job lock lets one of them collect at a time.
+    """
+    if settings.upload_gc_interval_seconds <= 0:
+        return
+    while True:
+        await asyncio.sleep(settings.upload_gc_interval_seconds)
+        try:
+            await run_upload_gc(dry_run=False)
+        except Exception:
+            logger.exception("Scheduled orphaned upload collection failed")
@@ -1,5 +1,6 @@
 """User service for user operations."""
 
+from datetime import datetime
 from uuid import UUID
 
 from app.models.user import User
@@ -36,6 +37,25 @@ class UserService:
             raise UserNotFoundError(f"User {user_id} not found")
         return user
 
+    async def search_users(
+        self,
+        query: str | None = None,
+        limit: int = 100,
+        cursor: tuple[datetime, UUID] | None = None,
+    ) -> list[User]:
+        """Search users by name or email.
+
+        Args:
+            query: Optional search text; all users are listed when omitted.
+            limit: Maximum number of records to return.
+            cursor: Keyset position (created_at, id) of the last user on the
+                previous page.
+
+        Returns:
+            Matching users, oldest first.
+        """
+        return await self.user_repo.search(query, limit=limit, cursor=cursor)
+
     async def update_profile(self, user_id: UUID, data: UserProfileUpdate) -> User:
         """Update user profile with allowed fields only.
 
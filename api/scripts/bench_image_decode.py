@@ -0,0 +1,112 @@
+"""Benchmark image decode + downscale time and peak memory per format.
+
+Compares a full-resolution decode followed by a LANCZOS resize (the
+naive approach) with ImageProcessor's reduced-scale path (JPEG draft
+decoding, reducing_gap for everything). Each measurement runs in a fresh
+process so peak RSS is not shared between cases.
+
+Usage:
+    python scripts/bench_image_decode.py
+
+    # Fewer repetitions
+    python scripts/bench_image_decode.py --repeat 1
+"""
+
+import argparse
+import io
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.image_processor import ImageProcessor  # noqa: E402
+
+# (format, width, height) of the synthetic source images
+CASES: list[tuple[str, int, int]] = [
+    ("JPEG", 6000, 4000),
+    ("PNG", 4000, 3000),
+    ("WEBP", 4000, 3000),
+    ("GIF", 2000, 1500),
+]
+
+
+def _make_image(fmt: str, width: int, height: int) -> bytes:
+    """Create a photo-like test image (gradients plus noise)."""
+    size = (width, height)
+    img = Image.merge(
+        "RGB",
+        [
+            Image.linear_gradient("L").resize(size),
+            Image.effect_noise(size, 48),
+            Image.radial_gradient("L").resize(size),
+        ],
+    )
+    buffer = io.BytesIO()
+    if fmt == "GIF":
+        img = img.convert("P")
+    img.save(buffer, format=fmt, quality=90)
+    return buffer.getvalue()
+
+
+def _max_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KiB on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _measure(path: str, mode: str, repeat: int) -> tuple[float, float]:
+    """Decode and downscale one image; return (best seconds, peak RSS delta)."""
+    content = Path(path).read_bytes()
+    processor = ImageProcessor()
+    baseline = _max_rss_mb()
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        img = Image.open(io.BytesIO(content))
+        if mode == "full":
+            img.load()
+            scale = processor.max_dimension / max(img.size)
+            if scale < 1:
+                target = (int(img.width * scale), int(img.height * scale))
+                img = img.resize(target, Image.Resampling.LANCZOS)
+        else:
+            img = processor._resize_if_needed(img)
+            img.load()
+        best = min(best, time.perf_counter() - started)
+        del img
+    return best, _max_rss_mb() - baseline
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    print(f"{'format':<6} {'size':>10} {'mode':<9} {'time':>9} {'peak RSS':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt, width, height in CASES:
+            path = Path(tmp) / f"sample.{fmt.lower()}"
+            # Generate in a child too: Linux carries peak RSS across exec,
+            # so a large parent would mask the measured processes' peaks
+            with ctx.Pool(1) as pool:
+                path.write_bytes(pool.apply(_make_image, (fmt, width, height)))
+            for mode in ("full", "reduced"):
+                with ctx.Pool(1) as pool:
+                    seconds, peak = pool.apply(_measure, (str(path), mode, args.repeat))
+                print(
+                    f"{fmt:<6} {f'{width}x{height}':>10} {mode:<9} "
+                    f"{seconds * 1000:>7.0f}ms {peak:>7.0f} MiB"
+                )
+
+
+if __name__ == "__main__":
+    main()
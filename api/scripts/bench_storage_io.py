@@ -0,0 +1,134 @@
+"""Benchmark local storage I/O under concurrency on a slow disk.
+
+Writes and reads back many files concurrently through LocalStorageProvider
+and reports the elapsed time and the longest event loop stall, the time a
+request arriving meanwhile would have waited before the server even
+looked at it. A slow disk is simulated by adding latency to every fsync
+and read, as a network volume or a saturated disk would.
+
+Runs twice: with file I/O in the storage thread pool (the provider as
+shipped) and with the same I/O inline on the event loop, which is how
+blocking filesystem calls inside async methods behave.
+
+Usage:
+    # 200 concurrent 256 KiB files, 20 ms per fsync/read (defaults)
+    python scripts/bench_storage_io.py
+
+    # Custom load
+    python scripts/bench_storage_io.py --files 500 --latency-ms 50 --threads 16
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core import storage as storage_module  # noqa: E402
+from app.core.storage import LocalStorageProvider  # noqa: E402
+
+T = TypeVar("T")
+
+# Interval of the task that measures event loop stalls
+HEARTBEAT_SECONDS = 0.005
+
+
+class _InlineStorage(LocalStorageProvider):
+    """Storage provider that runs its file I/O on the event loop."""
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        return fn(*args)
+
+
+async def _heartbeat(stop: asyncio.Event, stalls: list[float]) -> None:
+    """Record how late each tick of a periodic timer fires."""
+    while not stop.is_set():
+        expected = time.perf_counter() + HEARTBEAT_SECONDS
+        await asyncio.sleep(HEARTBEAT_SECONDS)
+        stalls.append(max(0.0, time.perf_counter() - expected))
+
+
+async def _run(
+    storage: LocalStorageProvider, files: int, content: bytes
+) -> tuple[float, float]:
+    """Write and read back files concurrently.
+
+    Returns:
+        Tuple of (elapsed seconds, longest event loop stall in seconds).
+    """
+
+    async def roundtrip(index: int) -> None:
+        path = f"bench/{index // 100:02d}/{index}.bin"
+        await storage.put(path, content)
+        assert await storage.get(path) == content
+
+    stop = asyncio.Event()
+    stalls: list[float] = []
+    heartbeat = asyncio.create_task(_heartbeat(stop, stalls))
+    started = time.perf_counter()
+    await asyncio.gather(*(roundtrip(index) for index in range(files)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await heartbeat
+    return elapsed, max(stalls, default=0.0)
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--size-kb", type=int, default=256)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    content = os.urandom(args.size_kb * 1024)
+    latency = args.latency_ms / 1000
+    real_fsync = os.fsync
+    real_read_bytes = Path.read_bytes
+
+    def slow_fsync(fd: int) -> None:
+        time.sleep(latency)
+        real_fsync(fd)
+
+    def slow_read_bytes(path: Path) -> bytes:
+        time.sleep(latency)
+        return real_read_bytes(path)
+
+    executor = ThreadPoolExecutor(max_workers=args.threads)
+    results = {}
+    with (
+        patch.object(storage_module, "storage_io_executor", executor),
+        patch.object(storage_module.os, "fsync", slow_fsync),
+        patch.object(Path, "read_bytes", slow_read_bytes),
+    ):
+        for name, provider in (
+            ("thread pool", LocalStorageProvider),
+            ("inline", _InlineStorage),
+        ):
+            with tempfile.TemporaryDirectory() as storage_dir:
+                results[name] = await _run(provider(storage_dir), args.files, content)
+    executor.shutdown()
+
+    print(
+        f"Files:    {args.files} x {args.size_kb} KiB, write + read back, "
+        f"{args.latency_ms:g} ms per fsync/read"
+    )
+    print(f"Threads:  {args.threads}")
+    for name, (elapsed, stall) in results.items():
+        print(
+            f"{name:<12} elapsed {elapsed:6.2f} s   "
+            f"longest event loop stall {stall * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
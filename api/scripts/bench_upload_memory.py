@@ -0,0 +1,126 @@
+"""Benchmark peak memory of the image upload pipeline.
+
+Runs UploadService.upload_image for many concurrent uploads of a large
+PNG, the way the API receives them (each upload spooled by the multipart
+parser), and reports the API process's peak RSS. Image processing runs
+in a process pool, whose workers are not included. Storage writes go to a
+temporary directory and the database repository is stubbed out.
+
+Usage:
+    # 50 concurrent uploads of a ~10MB PNG (defaults)
+    python scripts/bench_upload_memory.py
+
+    # Custom load
+    python scripts/bench_upload_memory.py --concurrency 20 --size-mb 5
+"""
+
+import argparse
+import asyncio
+import io
+import math
+import os
+import resource
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from tempfile import SpooledTemporaryFile
+from types import SimpleNamespace
+from typing import Any
+
+from fastapi import UploadFile
+from PIL import Image
+from starlette.datastructures import Headers
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.image_pool import ImageProcessingPool  # noqa: E402
+from app.core.storage import LocalStorageProvider  # noqa: E402
+from app.services.image_processor import ImageProcessor  # noqa: E402
+from app.services.upload import UploadService  # noqa: E402
+
+# Starlette's MultiPartParser spools file parts larger than this to disk
+MULTIPART_SPOOL_MAX_SIZE = 1024 * 1024
+
+
+class _StubUploadRepository:
+    """Upload repository stand-in that skips the database."""
+
+    async def create(self, **values: Any) -> SimpleNamespace:
+        return SimpleNamespace(id=uuid.uuid4(), **values)
+
+
+def _make_png(size_mb: float) -> bytes:
+    """Create a noise PNG of roughly the given size (noise barely compresses)."""
+    side = int(math.sqrt(size_mb * 1024 * 1024 / 3))
+    img = Image.frombytes("RGB", (side, side), os.urandom(side * side * 3))
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG", compress_level=1)
+    return buffer.getvalue()
+
+
+def _spooled_upload(content: bytes) -> UploadFile:
+    """Wrap content in an UploadFile as the multipart parser would."""
+    spool = SpooledTemporaryFile(max_size=MULTIPART_SPOOL_MAX_SIZE)  # noqa: SIM115
+    spool.write(content)
+    spool.seek(0)
+    return UploadFile(
+        file=spool,
+        size=len(content),
+        filename="bench.png",
+        headers=Headers({"content-type": "image/png"}),
+    )
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KiB on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--size-mb", type=float, default=9.5)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    args = parser.parse_args()
+
+    content = _make_png(args.size_mb)
+    uploads = [_spooled_upload(content) for _ in range(args.concurrency)]
+    del content
+
+    pool = ImageProcessingPool(
+        max_workers=args.workers,
+        max_queued=args.concurrency,
+        timeout_seconds=300,
+    )
+    with tempfile.TemporaryDirectory() as storage_dir:
+        service = UploadService(
+            upload_repo=_StubUploadRepository(),  # type: ignore[arg-type]
+            storage=LocalStorageProvider(storage_dir),
+            image_processor=ImageProcessor(),
+            image_pool=pool,
+        )
+        baseline = _peak_rss_mb()
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(
+                service.upload_image(file, uuid.uuid4(), uuid.uuid4())
+                for file in uploads
+            )
+        )
+        elapsed = time.perf_counter() - started
+    pool.shutdown()
+
+    size_mb = uploads[0].size / (1024 * 1024)
+    print(f"Uploads:        {args.concurrency} x {size_mb:.1f} MiB PNG")
+    print(f"Elapsed:        {elapsed:.1f} s")
+    print(f"Peak RSS:       {_peak_rss_mb():.0f} MiB (API process only)")
+    print(f"Before uploads: {baseline:.0f} MiB")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
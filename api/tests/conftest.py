@@ -7,9 +7,11 @@ from typing import Any
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
 from app.core.database import get_db
+from app.core.project_cache import project_cache
 from app.main import app
 from app.models.base import Base
 
@@ -27,6 +29,16 @@ def anyio_backend() -> str:
     return "asyncio"
 
 
+@pytest.fixture(autouse=True)
+def clear_project_cache() -> None:
+    """Start every test with an empty project cache.
+
+    Tests reuse slugs across rolled-back transactions, so cached projects
+    must not leak from one test into the next.
+    """
+    project_cache.clear()
+
+
 @pytest_asyncio.fixture(scope="session")
 async def test_engine():
     """Create a test database engine and initialize schema.
@@ -35,6 +47,8 @@ async def test_engine():
     """
     engine = create_async_engine(TEST_DATABASE_URL)
     async with engine.begin() as conn:
+        # Trigram indexes on users need pg_trgm, installed by migrations
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
     yield engine
     async with engine.begin() as conn:
@@ -448,3 +448,67 @@ class TestGetBookmarkStatus:
         """Test getting bookmark status without auth."""
         response = await client.get("/api/v1/projects/some-project/bookmark")
         assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+class TestGetBookmarkStatuses:
+    """Tests for GET /api/v1/bookmarks/status."""
+
+    async def test_get_bookmark_statuses(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        public_project_data: dict[str, Any],
+        private_project_data: dict[str, Any],
+    ) -> None:
+        """Test statuses for many slugs are returned in request order."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            await client.post(
+                "/api/v1/projects", json=public_project_data, headers=auth_headers
+            )
+            await client.post(
+                "/api/v1/projects", json=private_project_data, headers=auth_headers
+            )
+            await client.post(
+                "/api/v1/projects/private-project/bookmark", headers=auth_headers
+            )
+
+            response = await client.get(
+                "/api/v1/bookmarks/status",
+                params={
+                    "slug": [
+                        "private-project",
+                        "nonexistent",
+                        "public-project",
+                        "private-project",
+                    ]
+                },
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {"slug": "private-project", "is_bookmarked": True},
+            {"slug": "public-project", "is_bookmarked": False},
+        ]
+
+    async def test_get_bookmark_statuses_requires_slug(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+    ) -> None:
+        """Test the slug parameter is required."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            response = await client.get(
+                "/api/v1/bookmarks/status", headers=auth_headers
+            )
+
+        assert response.status_code == 422
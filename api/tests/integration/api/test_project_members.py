@@ -86,6 +86,73 @@ class TestListMembers:
         assert response.status_code == 200
         assert response.json() == []
 
+    async def test_list_members_search_and_cursor(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        second_user_id: str,
+        test_project_data: dict[str, Any],
+    ) -> None:
+        """Test filtering members by name/email and paging by keyset cursor."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            with patch(
+                "app.services.auth.add_token_to_blacklist", new_callable=AsyncMock
+            ):
+                await client.post(
+                    "/api/v1/auth/register",
+                    json={
+                        "email": "third@example.com",
+                        "name": "Third User",
+                        "password": "ThirdPassword123",
+                    },
+                )
+            await client.post(
+                "/api/v1/projects", json=test_project_data, headers=auth_headers
+            )
+            await client.post(
+                "/api/v1/projects/test-project/members/bulk",
+                json={
+                    "members": [
+                        {"user_id": second_user_id},
+                        {"email": "third@example.com"},
+                    ]
+                },
+                headers=auth_headers,
+            )
+
+            search = await client.get(
+                "/api/v1/projects/test-project/members",
+                params={"q": "HIRD"},
+                headers=auth_headers,
+            )
+            first = await client.get(
+                "/api/v1/projects/test-project/members",
+                params={"limit": 1},
+                headers=auth_headers,
+            )
+            second = await client.get(
+                "/api/v1/projects/test-project/members",
+                params={"limit": 1, "cursor": first.headers["X-Next-Cursor"]},
+                headers=auth_headers,
+            )
+            bad_cursor = await client.get(
+                "/api/v1/projects/test-project/members",
+                params={"cursor": "not-a-cursor"},
+                headers=auth_headers,
+            )
+
+        assert search.status_code == 200
+        assert [m["user_email"] for m in search.json()] == ["third@example.com"]
+        assert first.status_code == 200
+        assert second.status_code == 200
+        paged = {m["user_id"] for m in first.json() + second.json()}
+        assert len(paged) == 2
+        assert bad_cursor.status_code == 400
+
     async def test_list_members_unauthorized(self, client: AsyncClient) -> None:
         """Test listing members without auth."""
         response = await client.get("/api/v1/projects/test-project/members")
@@ -284,6 +351,113 @@ class TestAddMember:
         assert response.status_code == 409
 
 
+@pytest.mark.asyncio
+class TestAddMembersBulk:
+    """Tests for POST /api/v1/projects/{slug}/members/bulk."""
+
+    async def test_bulk_invite_reports_each_row(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        second_user_id: str,
+        test_project_data: dict[str, Any],
+    ) -> None:
+        """Test users by email and ID are added with a per-row report."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            with patch(
+                "app.services.auth.add_token_to_blacklist", new_callable=AsyncMock
+            ):
+                await client.post(
+                    "/api/v1/auth/register",
+                    json={
+                        "email": "third@example.com",
+                        "name": "Third User",
+                        "password": "ThirdPassword123",
+                    },
+                )
+            await client.post(
+                "/api/v1/projects", json=test_project_data, headers=auth_headers
+            )
+
+            response = await client.post(
+                "/api/v1/projects/test-project/members/bulk",
+                json={
+                    "members": [
+                        {"user_id": second_user_id, "role": "editor"},
+                        {"email": "third@example.com"},
+                        {"email": "nobody@example.com"},
+                        {"email": "second@example.com"},
+                    ]
+                },
+                headers=auth_headers,
+            )
+            assert response.status_code == 200
+            assert [r["outcome"] for r in response.json()] == [
+                "added",
+                "added",
+                "user_not_found",
+                "duplicate",
+            ]
+
+            # Re-inviting skips existing members unless asked to update roles
+            skip_response = await client.post(
+                "/api/v1/projects/test-project/members/bulk",
+                json={"members": [{"user_id": second_user_id, "role": "admin"}]},
+                headers=auth_headers,
+            )
+            update_response = await client.post(
+                "/api/v1/projects/test-project/members/bulk",
+                json={
+                    "members": [{"user_id": second_user_id, "role": "admin"}],
+                    "on_conflict": "update_role",
+                },
+                headers=auth_headers,
+            )
+            members_response = await client.get(
+                "/api/v1/projects/test-project/members", headers=auth_headers
+            )
+
+        assert skip_response.json()[0]["outcome"] == "already_member"
+        assert update_response.json()[0]["outcome"] == "role_updated"
+        roles = {m["user_id"]: m["role"] for m in members_response.json()}
+        assert roles[second_user_id] == "admin"
+        assert len(roles) == 2
+
+    async def test_bulk_invite_rejects_ambiguous_entry(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_project_data: dict[str, Any],
+    ) -> None:
+        """Test an entry with both user_id and email is a validation error."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            await client.post(
+                "/api/v1/projects", json=test_project_data, headers=auth_headers
+            )
+            response = await client.post(
+                "/api/v1/projects/test-project/members/bulk",
+                json={
+                    "members": [
+                        {
+                            "user_id": "00000000-0000-0000-0000-000000000000",
+                            "email": "a@example.com",
+                        }
+                    ]
+                },
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 422
+
+
 @pytest.mark.asyncio
 class TestUpdateMemberRole:
     """Tests for PATCH /api/v1/projects/{slug}/members/{member_id}."""
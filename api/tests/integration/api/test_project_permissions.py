@@ -294,3 +294,70 @@ class TestGetProjectPermissions:
         """Test getting permissions without auth."""
         response = await client.get("/api/v1/projects/test-project/permissions")
         assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+class TestListProjectsWithPermissions:
+    """Tests for GET /api/v1/projects?include=permissions."""
+
+    async def test_list_includes_permissions_per_project(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        second_user_headers: dict[str, str],
+        second_user_id: str,
+        test_project_data: dict[str, Any],
+        public_project_data: dict[str, Any],
+    ) -> None:
+        """Test each project carries the caller's role and permissions."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            await client.post(
+                "/api/v1/projects", json=test_project_data, headers=auth_headers
+            )
+            await client.post(
+                "/api/v1/projects", json=public_project_data, headers=auth_headers
+            )
+
+            # Add second user as editor of the private project
+            await client.post(
+                "/api/v1/projects/test-project/members",
+                json={"user_id": second_user_id, "role": "editor"},
+                headers=auth_headers,
+            )
+
+            response = await client.get(
+                "/api/v1/projects",
+                params={"include": "permissions"},
+                headers=second_user_headers,
+            )
+
+        assert response.status_code == 200
+        by_slug = {p["slug"]: p["permissions"] for p in response.json()}
+        assert by_slug["test-project"]["role"] == "editor"
+        assert sorted(by_slug["test-project"]["permissions"]) == ["edit", "view"]
+        assert by_slug["public-project"]["role"] is None
+        assert by_slug["public-project"]["permissions"] == ["view"]
+
+    async def test_list_without_include_omits_permissions(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_project_data: dict[str, Any],
+    ) -> None:
+        """Test permissions are only returned when requested."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            await client.post(
+                "/api/v1/projects", json=test_project_data, headers=auth_headers
+            )
+            response = await client.get("/api/v1/projects", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json()[0]["permissions"] is None
@@ -1,10 +1,16 @@
 """Tests for project endpoints."""
 
 from typing import Any
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.storage import StorageProvider
+from app.repositories.project_deletion import ProjectDeletionRepository
+from app.services.project_deletion import ProjectDeletionService
 
 
 @pytest.fixture
@@ -214,6 +220,67 @@ class TestListProjects:
         assert "test-project" not in slugs
 
 
+@pytest.mark.asyncio
+class TestListProjectsEnriched:
+    """Tests for document counters and bookmark state in the project list."""
+
+    async def test_list_returns_counters_and_bookmark_state(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_project_data: dict[str, Any],
+    ) -> None:
+        """Test counters follow document writes and bookmarks are joined in."""
+        slug = test_project_data["slug"]
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            await client.post(
+                "/api/v1/projects", json=test_project_data, headers=auth_headers
+            )
+            await client.put(
+                f"/api/v1/projects/{slug}/docs/guide",
+                json={"title": "Guide", "is_folder": True},
+                headers=auth_headers,
+            )
+            for name in ("intro", "setup"):
+                await client.put(
+                    f"/api/v1/projects/{slug}/docs/guide/{name}",
+                    json={"title": name, "content": "# Hi", "is_folder": False},
+                    headers=auth_headers,
+                )
+            await client.put(
+                f"/api/v1/projects/{slug}/docs/readme",
+                json={"title": "Readme", "content": "# Hi", "is_folder": False},
+                headers=auth_headers,
+            )
+            await client.post(f"/api/v1/projects/{slug}/bookmark", headers=auth_headers)
+
+            response = await client.get(
+                "/api/v1/projects",
+                params={"include": "bookmark"},
+                headers=auth_headers,
+            )
+            assert response.status_code == 200
+            project = response.json()[0]
+            assert project["document_count"] == 3
+            assert project["last_activity_at"] is not None
+            assert project["is_bookmarked"] is True
+            assert project["permissions"] is None
+
+            # Deleting a folder removes its pages from the count
+            await client.delete(
+                f"/api/v1/projects/{slug}/docs/guide", headers=auth_headers
+            )
+            response = await client.get("/api/v1/projects", headers=auth_headers)
+
+        project = response.json()[0]
+        assert project["document_count"] == 1
+        assert project["is_bookmarked"] is None
+
+
 @pytest.mark.asyncio
 class TestCreateProject:
     """Tests for POST /api/v1/projects."""
@@ -443,46 +510,96 @@ class TestDeleteProject:
         auth_headers: dict[str, str],
         test_project_data: dict[str, Any],
     ) -> None:
-        """Test successful project deletion."""
-        with patch(
-            "app.api.deps.is_token_blacklisted",
-            new_callable=AsyncMock,
-            return_value=False,
+        """Test deletion is accepted and hides the project immediately."""
+        with (
+            patch(
+                "app.api.deps.is_token_blacklisted",
+                new_callable=AsyncMock,
+                return_value=False,
+            ),
+            patch(
+                "app.api.v1.endpoints.projects.run_project_deletion",
+                new_callable=AsyncMock,
+            ) as mock_run,
+            patch(
+                "app.services.project_deletion.get_project_deletion_progress",
+                new_callable=AsyncMock,
+                return_value={},
+            ),
         ):
             # Create project
-            await client.post(
+            create_response = await client.post(
                 "/api/v1/projects", json=test_project_data, headers=auth_headers
             )
+            project_id = create_response.json()["id"]
 
             # Delete project
             response = await client.delete(
                 "/api/v1/projects/test-project", headers=auth_headers
             )
 
-        assert response.status_code == 204
+            assert response.status_code == 202
+            assert response.json()["status"] == "pending"
+            mock_run.assert_called_once_with(UUID(project_id))
 
-        # Verify deletion
-        with patch(
-            "app.api.deps.is_token_blacklisted",
-            new_callable=AsyncMock,
-            return_value=False,
-        ):
+            # Hidden while the background job has not run yet
             get_response = await client.get(
                 "/api/v1/projects/test-project", headers=auth_headers
             )
+            list_response = await client.get("/api/v1/projects", headers=auth_headers)
+            status_response = await client.get(
+                "/api/v1/projects/test-project/deletion", headers=auth_headers
+            )
+
         assert get_response.status_code == 404
+        assert list_response.json() == []
+        assert status_response.status_code == 200
+        assert status_response.json()["project_id"] == project_id
 
     async def test_delete_project_with_documents(
         self,
         client: AsyncClient,
+        test_session: AsyncSession,
         auth_headers: dict[str, str],
         test_project_data: dict[str, Any],
     ) -> None:
-        """Test deleting a project that has related documents succeeds."""
-        with patch(
-            "app.api.deps.is_token_blacklisted",
-            new_callable=AsyncMock,
-            return_value=False,
+        """Test the background job removes a project with documents."""
+        storage = MagicMock(spec=StorageProvider)
+        storage.delete = AsyncMock()
+
+        async def run_in_test_session(project_id: UUID) -> None:
+            service = ProjectDeletionService(
+                ProjectDeletionRepository(test_session), storage, chunk_size=1
+            )
+            await service.run(project_id)
+
+        with (
+            patch(
+                "app.api.deps.is_token_blacklisted",
+                new_callable=AsyncMock,
+                return_value=False,
+            ),
+            patch(
+                "app.api.v1.endpoints.projects.run_project_deletion",
+                side_effect=run_in_test_session,
+            ),
+            patch(
+                "app.services.project_deletion.acquire_project_deletion_lock",
+                new_callable=AsyncMock,
+                return_value=True,
+            ),
+            patch(
+                "app.services.project_deletion.refresh_project_deletion_lock",
+                new_callable=AsyncMock,
+            ),
+            patch(
+                "app.services.project_deletion.release_project_deletion_lock",
+                new_callable=AsyncMock,
+            ),
+            patch(
+                "app.services.project_deletion.set_project_deletion_progress",
+                new_callable=AsyncMock,
+            ) as mock_progress,
         ):
             # Create project
             await client.post(
@@ -505,8 +622,22 @@ class TestDeleteProject:
             response = await client.delete(
                 "/api/v1/projects/test-project", headers=auth_headers
             )
+            assert response.status_code == 202
+
+            status_response = await client.get(
+                "/api/v1/projects/test-project/deletion", headers=auth_headers
+            )
+            # The slug is free again once the job has finished
+            recreate_response = await client.post(
+                "/api/v1/projects", json=test_project_data, headers=auth_headers
+            )
 
-        assert response.status_code == 204
+        final = mock_progress.call_args.args[1]
+        assert final["status"] == "completed"
+        assert final["documents_deleted"] == 2
+        assert final["revisions_deleted"] == 2
+        assert status_response.status_code == 404
+        assert recreate_response.status_code == 201
 
     async def test_delete_project_not_found(
         self, client: AsyncClient, auth_headers: dict[str, str]
@@ -2,12 +2,27 @@
 
 import io
 import uuid
+from collections.abc import Iterator
+from datetime import timedelta
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from httpx import AsyncClient
 from PIL import Image
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.image_pool import image_pool
+from app.core.storage import get_storage_provider
+from app.core.upload_cache import upload_file_cache
+from app.models.project import Project
+from app.models.user import User
+from app.repositories.upload import UploadRepository
+from app.repositories.upload_gc import UploadGCRepository
+from app.services.image_processor import ImageProcessor
+from app.services.upload import UploadService
+from app.services.upload_gc import UploadGCService
 
 
 @pytest.fixture
@@ -126,6 +141,9 @@ class TestUploadImage:
         assert data["mime_type"] == "image/png"
         assert "url" in data
         assert "created_at" in data
+        assert data["width"] == 100
+        assert data["height"] == 100
+        assert data["placeholder"].startswith("data:image/webp;base64,")
 
     async def test_upload_image_project_not_found(
         self,
@@ -249,6 +267,8 @@ class TestGetUpload:
         data = response.json()
         assert data["id"] == upload_id
         assert data["filename"] == "test.png"
+        assert (data["width"], data["height"]) == (100, 100)
+        assert data["placeholder"] == upload_response.json()["placeholder"]
 
     async def test_get_upload_not_found(
         self,
@@ -379,3 +399,1072 @@ class TestDeleteUpload:
         response = await client.delete(f"/api/v1/uploads/{fake_id}")
 
         assert response.status_code == 401
+
+
+@pytest.fixture
+async def uploaded_file_url(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    test_project: dict[str, Any],
+    test_image_bytes: bytes,
+) -> str:
+    """Upload a test image and return its file URL."""
+    with (
+        patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ),
+        mock_filetype_png(),
+    ):
+        files = {"file": ("test.png", test_image_bytes, "image/png")}
+        response = await client.post(
+            f"/api/v1/projects/{test_project['id']}/uploads",
+            files=files,
+            headers=auth_headers,
+        )
+    return response.json()["url"]
+
+
+@pytest.mark.asyncio
+class TestServeFile:
+    """Tests for GET /api/v1/uploads/file/{storage_path}."""
+
+    async def test_serve_file_success(
+        self,
+        client: AsyncClient,
+        uploaded_file_url: str,
+    ) -> None:
+        """Test file is served with validators and range support."""
+        response = await client.get(uploaded_file_url)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["etag"].startswith('"')
+        assert "last-modified" in response.headers
+        assert response.headers["accept-ranges"] == "bytes"
+        assert int(response.headers["content-length"]) == len(response.content)
+
+    async def test_serve_file_if_none_match(
+        self,
+        client: AsyncClient,
+        uploaded_file_url: str,
+    ) -> None:
+        """Test matching If-None-Match returns 304 without a body."""
+        first = await client.get(uploaded_file_url)
+        response = await client.get(
+            uploaded_file_url,
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == first.headers["etag"]
+
+    async def test_serve_file_if_modified_since(
+        self,
+        client: AsyncClient,
+        uploaded_file_url: str,
+    ) -> None:
+        """Test If-Modified-Since at Last-Modified returns 304."""
+        first = await client.get(uploaded_file_url)
+        response = await client.get(
+            uploaded_file_url,
+            headers={"If-Modified-Since": first.headers["last-modified"]},
+        )
+
+        assert response.status_code == 304
+
+    async def test_serve_file_range(
+        self,
+        client: AsyncClient,
+        uploaded_file_url: str,
+    ) -> None:
+        """Test byte-range request returns 206 with the requested slice."""
+        full = await client.get(uploaded_file_url)
+        response = await client.get(uploaded_file_url, headers={"Range": "bytes=0-9"})
+
+        assert response.status_code == 206
+        assert response.content == full.content[:10]
+        assert response.headers["content-range"].startswith("bytes 0-9/")
+
+    async def test_serve_file_x_accel(
+        self,
+        client: AsyncClient,
+        uploaded_file_url: str,
+    ) -> None:
+        """Test x-accel mode delegates the transfer to the proxy."""
+        storage_path = uploaded_file_url.removeprefix("/api/v1/uploads/file/")
+        with (
+            patch("app.api.v1.endpoints.uploads.settings.upload_serve_mode", "x-accel"),
+            patch(
+                "app.api.v1.endpoints.uploads.settings.upload_x_accel_prefix",
+                "/internal/uploads/",
+            ),
+        ):
+            response = await client.get(uploaded_file_url)
+
+        assert response.status_code == 200
+        assert response.content == b""
+        assert (
+            response.headers["x-accel-redirect"] == f"/internal/uploads/{storage_path}"
+        )
+        assert response.headers["content-type"] == "image/png"
+
+    async def test_serve_file_object_storage_redirect(
+        self,
+        client: AsyncClient,
+        uploaded_file_url: str,
+    ) -> None:
+        """Test files in object storage redirect to a presigned URL."""
+        with (
+            patch(
+                "app.services.upload.UploadService.get_local_file",
+                new_callable=AsyncMock,
+                return_value=None,
+            ),
+            patch(
+                "app.services.upload.UploadService.get_download_url",
+                return_value="https://files.example.com/uploads/a.png?X-Amz-Signature=x",
+            ),
+        ):
+            response = await client.get(uploaded_file_url)
+
+        assert response.status_code == 307
+        assert response.headers["location"].startswith("https://files.example.com/")
+        assert response.headers["cache-control"].startswith("private")
+
+    async def test_serve_file_object_storage_stream(
+        self,
+        client: AsyncClient,
+        uploaded_file_url: str,
+    ) -> None:
+        """Test files in object storage are streamed without presigning."""
+        full = await client.get(uploaded_file_url)
+        with (
+            patch(
+                "app.services.upload.UploadService.get_local_file",
+                new_callable=AsyncMock,
+                return_value=None,
+            ),
+            patch(
+                "app.services.upload.UploadService.get_download_url",
+                return_value=None,
+            ),
+        ):
+            response = await client.get(uploaded_file_url)
+
+        assert response.status_code == 200
+        assert response.content == full.content
+        assert int(response.headers["content-length"]) == len(full.content)
+
+    async def test_serve_file_variant(
+        self,
+        client: AsyncClient,
+        uploaded_file_url: str,
+    ) -> None:
+        """Test ?w= serves a resized variant in an accepted format."""
+        response = await client.get(
+            f"{uploaded_file_url}?w=320",
+            headers={"Accept": "image/avif,image/webp,*/*"},
+        )
+        fallback = await client.get(
+            f"{uploaded_file_url}?w=320", headers={"Accept": "*/*"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/avif"
+        assert response.headers["vary"] == "Accept"
+        assert Image.open(io.BytesIO(response.content)).format == "AVIF"
+        assert fallback.headers["content-type"] == "image/png"
+        assert fallback.headers["etag"] != response.headers["etag"]
+
+    async def test_serve_file_variant_invalid_width(
+        self,
+        client: AsyncClient,
+        uploaded_file_url: str,
+    ) -> None:
+        """Test widths that are not offered return 400."""
+        response = await client.get(f"{uploaded_file_url}?w=333")
+
+        assert response.status_code == 400
+
+    async def test_serve_file_gif_as_animated_webp(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_project: dict[str, Any],
+    ) -> None:
+        """Test GIFs are served as animated WebP, with the GIF as fallback."""
+        frames = []
+        for i in range(8):
+            frame = Image.new("RGB", (400, 300), "white")
+            frame.paste("blue", (i * 40, 100, i * 40 + 60, 160))
+            frames.append(frame)
+        buffer = io.BytesIO()
+        frames[0].save(
+            buffer, format="GIF", save_all=True, append_images=frames[1:], loop=0
+        )
+        mock_kind = MagicMock()
+        mock_kind.mime = "image/gif"
+        with (
+            patch(
+                "app.api.deps.is_token_blacklisted",
+                new_callable=AsyncMock,
+                return_value=False,
+            ),
+            patch("app.services.upload.filetype.guess", return_value=mock_kind),
+        ):
+            upload = await client.post(
+                f"/api/v1/projects/{test_project['id']}/uploads",
+                files={"file": ("demo.gif", buffer.getvalue(), "image/gif")},
+                headers=auth_headers,
+            )
+        url = upload.json()["url"]
+
+        response = await client.get(url, headers={"Accept": "image/webp,*/*"})
+        fallback = await client.get(url, headers={"Accept": "*/*"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/webp"
+        assert response.headers["vary"] == "Accept"
+        img = Image.open(io.BytesIO(response.content))
+        assert img.format == "WEBP"
+        assert img.n_frames == 8
+        assert len(response.content) < len(fallback.content)
+        assert fallback.headers["content-type"] == "image/gif"
+        assert fallback.headers["vary"] == "Accept"
+
+    async def test_serve_file_not_found(
+        self,
+        client: AsyncClient,
+    ) -> None:
+        """Test unknown storage path returns 404."""
+        response = await client.get("/api/v1/uploads/file/missing/file.png")
+
+        assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+class TestUploadDeduplication:
+    """Tests for content-addressed upload storage."""
+
+    async def _upload(
+        self,
+        client: AsyncClient,
+        headers: dict[str, str],
+        project_id: str,
+        content: bytes,
+        filename: str = "test.png",
+    ) -> dict[str, Any]:
+        """Upload an image and return the response body."""
+        with (
+            patch(
+                "app.api.deps.is_token_blacklisted",
+                new_callable=AsyncMock,
+                return_value=False,
+            ),
+            mock_filetype_png(),
+        ):
+            response = await client.post(
+                f"/api/v1/projects/{project_id}/uploads",
+                files={"file": (filename, content, "image/png")},
+                headers=headers,
+            )
+        assert response.status_code == 201
+        return response.json()
+
+    async def test_identical_uploads_share_a_file(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_project: dict[str, Any],
+        test_image_bytes: bytes,
+    ) -> None:
+        """Test the same image uploaded twice is stored once."""
+        first = await self._upload(
+            client, auth_headers, test_project["id"], test_image_bytes, "a.png"
+        )
+        second = await self._upload(
+            client, auth_headers, test_project["id"], test_image_bytes, "b.png"
+        )
+
+        assert first["id"] != second["id"]
+        assert second["filename"] == "b.png"
+        assert first["url"] == second["url"]
+
+    async def test_shared_file_kept_until_last_upload_deleted(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_project: dict[str, Any],
+        test_image_bytes: bytes,
+    ) -> None:
+        """Test deleting one of two identical uploads keeps the file."""
+        first = await self._upload(
+            client, auth_headers, test_project["id"], test_image_bytes
+        )
+        second = await self._upload(
+            client, auth_headers, test_project["id"], test_image_bytes
+        )
+
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            await client.delete(f"/api/v1/uploads/{first['id']}", headers=auth_headers)
+            kept = await client.get(second["url"])
+            await client.delete(f"/api/v1/uploads/{second['id']}", headers=auth_headers)
+            gone = await client.get(second["url"])
+
+        assert kept.status_code == 200
+        assert gone.status_code == 404
+
+    async def test_storage_stats_report_saved_bytes(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_session: AsyncSession,
+        test_user_data: dict[str, Any],
+        test_project: dict[str, Any],
+        test_image_bytes: bytes,
+    ) -> None:
+        """Test the admin stats endpoint reports deduplicated bytes."""
+        upload = await self._upload(
+            client, auth_headers, test_project["id"], test_image_bytes
+        )
+        await self._upload(client, auth_headers, test_project["id"], test_image_bytes)
+        await test_session.execute(
+            update(User)
+            .where(User.email == test_user_data["email"])
+            .values(is_admin=True)
+        )
+
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            response = await client.get("/api/v1/uploads/stats", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["upload_count"] == 2
+        assert data["blob_count"] == 1
+        assert data["saved_bytes"] == upload["size_bytes"]
+
+    async def test_storage_stats_requires_admin(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+    ) -> None:
+        """Test non-admin users cannot view storage stats."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            response = await client.get("/api/v1/uploads/stats", headers=auth_headers)
+
+        assert response.status_code == 403
+
+
+@pytest.fixture
+def direct_upload_sessions() -> Iterator[dict[str, dict[str, str]]]:
+    """Keep direct upload sessions in memory instead of Redis."""
+    sessions: dict[str, dict[str, str]] = {}
+
+    async def set_session(token: str, fields: dict[str, str | int]) -> None:
+        sessions.setdefault(token, {}).update(
+            {name: str(value) for name, value in fields.items()}
+        )
+
+    async def get_session(token: str) -> dict[str, str]:
+        return dict(sessions.get(token, {}))
+
+    async def claim_session(token: str) -> bool:
+        session = sessions.get(token)
+        if session is None or "claimed" in session:
+            return False
+        session["claimed"] = "1"
+        return True
+
+    locks: set[str] = set()
+
+    async def acquire_lock(token: str, ttl: timedelta) -> bool:
+        if token in locks:
+            return False
+        locks.add(token)
+        return True
+
+    async def release_lock(token: str) -> None:
+        locks.discard(token)
+
+    with (
+        patch("app.services.upload.set_direct_upload", side_effect=set_session),
+        patch("app.services.upload.get_direct_upload", side_effect=get_session),
+        patch("app.services.upload.claim_direct_upload", side_effect=claim_session),
+        patch(
+            "app.services.upload.acquire_direct_upload_lock", side_effect=acquire_lock
+        ),
+        patch(
+            "app.services.upload.release_direct_upload_lock", side_effect=release_lock
+        ),
+    ):
+        yield sessions
+
+
+@pytest.fixture
+def finalize_in_test_session(test_session: AsyncSession) -> Iterator[AsyncMock]:
+    """Run the direct upload background job in the test session."""
+
+    async def finalize(token: str) -> None:
+        service = UploadService(
+            upload_repo=UploadRepository(test_session),
+            storage=get_storage_provider(),
+            image_processor=ImageProcessor(),
+            image_pool=image_pool,
+            file_cache=upload_file_cache,
+        )
+        await service.finalize_direct_upload(token)
+
+    with patch(
+        "app.api.v1.endpoints.uploads.run_direct_upload_finalization",
+        side_effect=finalize,
+    ) as mock_run:
+        yield mock_run
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("direct_upload_sessions")
+class TestDirectUpload:
+    """Tests for the direct upload endpoints."""
+
+    async def _start(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        project_id: str,
+        content: bytes,
+        mime_type: str = "image/png",
+    ) -> Any:
+        return await client.post(
+            f"/api/v1/projects/{project_id}/uploads/direct",
+            json={
+                "filename": "test.png",
+                "mime_type": mime_type,
+                "size_bytes": len(content),
+            },
+            headers=auth_headers,
+        )
+
+    async def test_direct_upload_local_receiver(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_project: dict[str, Any],
+        test_image_bytes: bytes,
+        finalize_in_test_session: AsyncMock,
+    ) -> None:
+        """Test start, send, complete and poll with local storage."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            start = await self._start(
+                client, auth_headers, test_project["id"], test_image_bytes
+            )
+            ticket = start.json()
+            put = await client.put(
+                ticket["upload_url"],
+                content=test_image_bytes,
+                headers=ticket["headers"],
+            )
+            complete = await client.post(
+                f"/api/v1/uploads/direct/{ticket['id']}/complete",
+                headers=auth_headers,
+            )
+            status_response = await client.get(
+                f"/api/v1/uploads/direct/{ticket['id']}", headers=auth_headers
+            )
+
+        assert start.status_code == 201
+        assert ticket["upload_url"] == f"/api/v1/uploads/direct/{ticket['id']}"
+        assert ticket["method"] == "PUT"
+        assert put.status_code == 204
+        assert complete.status_code == 202
+        assert complete.json()["status"] == "processing"
+        finalize_in_test_session.assert_called_once_with(ticket["id"])
+        data = status_response.json()
+        assert data["status"] == "completed"
+        assert data["upload"]["width"] == 100
+        served = await client.get(data["upload"]["url"])
+        assert served.status_code == 200
+
+    async def test_direct_upload_invalid_content_fails(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_project: dict[str, Any],
+        finalize_in_test_session: AsyncMock,
+    ) -> None:
+        """Test content that is not the declared type fails in the background."""
+        content = b"not an image at all"
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            ticket = (
+                await self._start(client, auth_headers, test_project["id"], content)
+            ).json()
+            await client.put(ticket["upload_url"], content=content)
+            await client.post(
+                f"/api/v1/uploads/direct/{ticket['id']}/complete",
+                headers=auth_headers,
+            )
+            status_response = await client.get(
+                f"/api/v1/uploads/direct/{ticket['id']}", headers=auth_headers
+            )
+
+        data = status_response.json()
+        assert data["status"] == "failed"
+        assert "does not match" in data["error"]
+        assert data["upload"] is None
+
+    async def test_direct_upload_complete_before_file_sent(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_project: dict[str, Any],
+        test_image_bytes: bytes,
+        finalize_in_test_session: AsyncMock,
+    ) -> None:
+        """Test completing without the file returns 409."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            ticket = (
+                await self._start(
+                    client, auth_headers, test_project["id"], test_image_bytes
+                )
+            ).json()
+            response = await client.post(
+                f"/api/v1/uploads/direct/{ticket['id']}/complete",
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 409
+        finalize_in_test_session.assert_not_called()
+
+    async def test_direct_upload_body_larger_than_declared(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_project: dict[str, Any],
+        test_image_bytes: bytes,
+    ) -> None:
+        """Test the receiver refuses more bytes than were declared."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            ticket = (
+                await self._start(
+                    client, auth_headers, test_project["id"], test_image_bytes
+                )
+            ).json()
+            response = await client.put(
+                ticket["upload_url"], content=test_image_bytes + b"extra"
+            )
+
+        assert response.status_code == 413
+
+    async def test_direct_upload_unknown_token(self, client: AsyncClient) -> None:
+        """Test the receiver refuses unknown tokens."""
+        response = await client.put("/api/v1/uploads/direct/unknown", content=b"x")
+
+        assert response.status_code == 404
+
+    async def test_direct_upload_disallowed_type(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_project: dict[str, Any],
+    ) -> None:
+        """Test types that are not allowed are refused up front."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            response = await self._start(
+                client, auth_headers, test_project["id"], b"<svg/>", "image/svg+xml"
+            )
+
+        assert response.status_code == 415
+
+    async def test_direct_upload_other_user(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        second_user_headers: dict[str, str],
+        test_project: dict[str, Any],
+        test_image_bytes: bytes,
+    ) -> None:
+        """Test another user cannot see or complete the upload."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            ticket = (
+                await self._start(
+                    client, auth_headers, test_project["id"], test_image_bytes
+                )
+            ).json()
+            response = await client.get(
+                f"/api/v1/uploads/direct/{ticket['id']}",
+                headers=second_user_headers,
+            )
+
+        assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("direct_upload_sessions")
+class TestResumableUpload:
+    """Tests for the resumable upload endpoints."""
+
+    async def _start(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        project_id: str,
+        content: bytes,
+    ) -> Any:
+        return await client.post(
+            f"/api/v1/projects/{project_id}/uploads/resumable",
+            json={
+                "filename": "test.png",
+                "mime_type": "image/png",
+                "size_bytes": len(content),
+            },
+            headers=auth_headers,
+        )
+
+    async def _patch(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        upload_url: str,
+        offset: int,
+        chunk: bytes,
+    ) -> Any:
+        return await client.patch(
+            upload_url,
+            content=chunk,
+            headers={
+                **auth_headers,
+                "Content-Type": "application/offset+octet-stream",
+                "Upload-Offset": str(offset),
+            },
+        )
+
+    async def test_resumable_upload(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_project: dict[str, Any],
+        test_image_bytes: bytes,
+        finalize_in_test_session: AsyncMock,
+    ) -> None:
+        """Test a file sent in chunks, resumed after a refused chunk."""
+        half = len(test_image_bytes) // 2
+        with (
+            patch(
+                "app.api.deps.is_token_blacklisted",
+                new_callable=AsyncMock,
+                return_value=False,
+            ),
+            patch(
+                "app.services.upload.settings.upload_resumable_max_chunk_size",
+                half + 1,
+            ),
+        ):
+            start = await self._start(
+                client, auth_headers, test_project["id"], test_image_bytes
+            )
+            ticket = start.json()
+            first = await self._patch(
+                client, auth_headers, ticket["upload_url"], 0, test_image_bytes[:half]
+            )
+            replayed = await self._patch(
+                client, auth_headers, ticket["upload_url"], 0, test_image_bytes[:half]
+            )
+            head = await client.head(ticket["upload_url"], headers=auth_headers)
+            offset = int(head.headers["Upload-Offset"])
+            second = await self._patch(
+                client,
+                auth_headers,
+                ticket["upload_url"],
+                offset,
+                test_image_bytes[offset:],
+            )
+            complete = await client.post(
+                f"/api/v1/uploads/direct/{ticket['id']}/complete",
+                headers=auth_headers,
+            )
+            status_response = await client.get(
+                f"/api/v1/uploads/direct/{ticket['id']}", headers=auth_headers
+            )
+
+        assert start.status_code == 201
+        assert start.headers["Location"] == ticket["upload_url"]
+        assert ticket["method"] == "PATCH"
+        assert first.status_code == 204
+        assert first.headers["Upload-Offset"] == str(half)
+        assert replayed.status_code == 409
+        assert head.status_code == 200
+        assert offset == half
+        assert head.headers["Upload-Length"] == str(len(test_image_bytes))
+        assert second.status_code == 204
+        assert second.headers["Upload-Offset"] == str(len(test_image_bytes))
+        assert complete.status_code == 202
+        finalize_in_test_session.assert_called_once_with(ticket["id"])
+        data = status_response.json()
+        assert data["status"] == "completed"
+        assert data["upload"]["width"] == 100
+
+    async def test_resumable_upload_incomplete(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_project: dict[str, Any],
+        test_image_bytes: bytes,
+    ) -> None:
+        """Test an upload cannot be completed before every chunk arrived."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            ticket = (
+                await self._start(
+                    client, auth_headers, test_project["id"], test_image_bytes
+                )
+            ).json()
+            await self._patch(
+                client, auth_headers, ticket["upload_url"], 0, test_image_bytes[:10]
+            )
+            response = await client.post(
+                f"/api/v1/uploads/direct/{ticket['id']}/complete",
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 409
+
+    async def test_resumable_chunk_wrong_content_type(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_project: dict[str, Any],
+        test_image_bytes: bytes,
+    ) -> None:
+        """Test chunks must be sent as offset streams."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            ticket = (
+                await self._start(
+                    client, auth_headers, test_project["id"], test_image_bytes
+                )
+            ).json()
+            response = await client.patch(
+                ticket["upload_url"],
+                content=test_image_bytes,
+                headers={
+                    **auth_headers,
+                    "Content-Type": "image/png",
+                    "Upload-Offset": "0",
+                },
+            )
+
+        assert response.status_code == 415
+
+    async def test_resumable_upload_other_user(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        second_user_headers: dict[str, str],
+        test_project: dict[str, Any],
+        test_image_bytes: bytes,
+    ) -> None:
+        """Test another user cannot send chunks of the upload."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            ticket = (
+                await self._start(
+                    client, auth_headers, test_project["id"], test_image_bytes
+                )
+            ).json()
+            response = await self._patch(
+                client, second_user_headers, ticket["upload_url"], 0, b"x"
+            )
+
+        assert response.status_code == 403
+
+
+@pytest.fixture
+def gc_in_test_session(test_session: AsyncSession) -> Iterator[AsyncMock]:
+    """Run upload collections in the test session, with state in memory."""
+    progress: dict[str, str] = {}
+
+    async def set_progress(fields: dict[str, str | int]) -> None:
+        progress.update({name: str(value) for name, value in fields.items()})
+
+    async def get_progress() -> dict[str, str]:
+        return dict(progress)
+
+    async def collect(dry_run: bool) -> None:
+        service = UploadGCService(
+            UploadGCRepository(test_session),
+            get_storage_provider(),
+            upload_file_cache,
+            grace_period=timedelta(microseconds=1),
+        )
+        await service.run(dry_run)
+
+    with (
+        patch(
+            "app.services.upload_gc.set_upload_gc_progress", side_effect=set_progress
+        ),
+        patch(
+            "app.services.upload_gc.get_upload_gc_progress", side_effect=get_progress
+        ),
+        patch(
+            "app.services.upload_gc.acquire_upload_gc_lock",
+            new_callable=AsyncMock,
+            return_value=True,
+        ),
+        patch("app.services.upload_gc.refresh_upload_gc_lock", new_callable=AsyncMock),
+        patch("app.services.upload_gc.release_upload_gc_lock", new_callable=AsyncMock),
+        patch(
+            "app.api.v1.endpoints.uploads.run_upload_gc", side_effect=collect
+        ) as mock_run,
+    ):
+        yield mock_run
+
+
+@pytest.mark.asyncio
+class TestUploadGC:
+    """Tests for the orphaned upload collection endpoints."""
+
+    async def _upload(
+        self,
+        client: AsyncClient,
+        headers: dict[str, str],
+        project_id: str,
+        color: str,
+    ) -> dict[str, Any]:
+        """Upload a solid image of a color and return the response body."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (100, 100), color=color).save(buffer, format="PNG")
+        with mock_filetype_png():
+            response = await client.post(
+                f"/api/v1/projects/{project_id}/uploads",
+                files={"file": ("test.png", buffer.getvalue(), "image/png")},
+                headers=headers,
+            )
+        assert response.status_code == 201
+        return response.json()
+
+    async def test_collect_orphaned_uploads(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_session: AsyncSession,
+        test_user_data: dict[str, Any],
+        test_project: dict[str, Any],
+        gc_in_test_session: AsyncMock,
+    ) -> None:
+        """Test a dry run reports the orphan, and a real run deletes it."""
+        await test_session.execute(
+            update(User)
+            .where(User.email == test_user_data["email"])
+            .values(is_admin=True)
+        )
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            linked = await self._upload(client, auth_headers, test_project["id"], "red")
+            orphan = await self._upload(
+                client, auth_headers, test_project["id"], "blue"
+            )
+            await client.put(
+                f"/api/v1/projects/{test_project['slug']}/docs/guide",
+                json={"title": "Guide", "content": f"![diagram]({linked['url']})"},
+                headers=auth_headers,
+            )
+
+            dry_run = await client.post("/api/v1/uploads/gc", headers=auth_headers)
+            report = await client.get("/api/v1/uploads/gc", headers=auth_headers)
+            kept_after_dry_run = await client.get(orphan["url"])
+
+            collect = await client.post(
+                "/api/v1/uploads/gc?dry_run=false", headers=auth_headers
+            )
+            linked_after = await client.get(
+                f"/api/v1/uploads/{linked['id']}", headers=auth_headers
+            )
+            orphan_after = await client.get(
+                f"/api/v1/uploads/{orphan['id']}", headers=auth_headers
+            )
+
+        assert dry_run.status_code == 202
+        assert dry_run.json()["dry_run"] is True
+        data = report.json()
+        assert data["status"] == "completed"
+        assert data["dry_run"] is True
+        assert data["orphans_found"] == 1
+        assert data["orphan_sample"] == [
+            orphan["url"].removeprefix("/api/v1/uploads/file/")
+        ]
+        assert kept_after_dry_run.status_code == 200
+        assert collect.status_code == 202
+        gc_in_test_session.assert_called_with(False)
+        assert linked_after.status_code == 200
+        assert orphan_after.status_code == 404
+
+    async def test_collect_requires_admin(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+    ) -> None:
+        """Test non-admin users cannot collect uploads."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            response = await client.post("/api/v1/uploads/gc", headers=auth_headers)
+
+        assert response.status_code == 403
+
+
+class TestProjectStorageUsage:
+    """Tests for per-project storage totals and quotas."""
+
+    async def test_totals_follow_uploads_and_documents(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_session: AsyncSession,
+        test_user_data: dict[str, Any],
+        test_project: dict[str, Any],
+        test_image_bytes: bytes,
+    ) -> None:
+        """Test totals grow and shrink with uploads and document writes."""
+        await test_session.execute(
+            update(User)
+            .where(User.email == test_user_data["email"])
+            .values(is_admin=True)
+        )
+        with (
+            patch(
+                "app.api.deps.is_token_blacklisted",
+                new_callable=AsyncMock,
+                return_value=False,
+            ),
+            mock_filetype_png(),
+        ):
+            upload = await client.post(
+                f"/api/v1/projects/{test_project['id']}/uploads",
+                files={"file": ("test.png", test_image_bytes, "image/png")},
+                headers=auth_headers,
+            )
+            await client.put(
+                f"/api/v1/projects/{test_project['slug']}/docs/guide",
+                json={"title": "Guide", "content": "# Guide"},
+                headers=auth_headers,
+            )
+            after_writes = await client.get(
+                "/api/v1/uploads/stats/projects", headers=auth_headers
+            )
+            await client.delete(
+                f"/api/v1/uploads/{upload.json()['id']}", headers=auth_headers
+            )
+            after_delete = await client.get(
+                "/api/v1/uploads/stats/projects", headers=auth_headers
+            )
+
+        assert after_writes.status_code == 200
+        (usage,) = after_writes.json()
+        assert usage["slug"] == test_project["slug"]
+        assert usage["upload_bytes"] == upload.json()["size_bytes"]
+        assert usage["document_bytes"] == len(b"# Guide")
+        assert usage["total_bytes"] == (
+            usage["upload_bytes"] + usage["document_bytes"] + usage["revision_bytes"]
+        )
+        assert usage["quota_bytes"] is None
+        assert after_delete.json()[0]["upload_bytes"] == 0
+
+    async def test_upload_over_quota_is_refused(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_session: AsyncSession,
+        test_project: dict[str, Any],
+        test_image_bytes: bytes,
+    ) -> None:
+        """Test uploads that would exceed the project's quota get 413."""
+        await test_session.execute(
+            update(Project)
+            .where(Project.id == uuid.UUID(test_project["id"]))
+            .values(storage_quota_bytes=10)
+        )
+        with (
+            patch(
+                "app.api.deps.is_token_blacklisted",
+                new_callable=AsyncMock,
+                return_value=False,
+            ),
+            mock_filetype_png(),
+        ):
+            response = await client.post(
+                f"/api/v1/projects/{test_project['id']}/uploads",
+                files={"file": ("test.png", test_image_bytes, "image/png")},
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 413
+        assert "quota" in response.json()["detail"]
+
+    async def test_usage_requires_admin(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+    ) -> None:
+        """Test non-admin users cannot view storage usage."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            response = await client.get(
+                "/api/v1/uploads/stats/projects", headers=auth_headers
+            )
+
+        assert response.status_code == 403
@@ -5,6 +5,10 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
 
 
 @pytest.fixture
@@ -18,6 +22,119 @@ async def auth_headers(
         return {"Authorization": f"Bearer {access_token}"}
 
 
+@pytest.fixture
+async def admin_headers(
+    client: AsyncClient, test_session: AsyncSession
+) -> dict[str, str]:
+    """Register a user, promote them to admin and return auth headers."""
+    user_data = {
+        "email": "admin@example.com",
+        "name": "Admin User",
+        "password": "AdminPassword123",
+    }
+    with patch("app.services.auth.add_token_to_blacklist", new_callable=AsyncMock):
+        response = await client.post("/api/v1/auth/register", json=user_data)
+    await test_session.execute(
+        update(User).where(User.email == user_data["email"]).values(is_admin=True)
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+class TestListUsers:
+    """Tests for GET /api/v1/users."""
+
+    async def test_list_users_as_admin(
+        self,
+        client: AsyncClient,
+        admin_headers: dict[str, str],
+        auth_headers: dict[str, str],
+    ) -> None:
+        """Test admin can list, search and page through users."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            everyone = await client.get("/api/v1/users", headers=admin_headers)
+            search = await client.get(
+                "/api/v1/users", params={"q": "ADMIN@"}, headers=admin_headers
+            )
+            first = await client.get(
+                "/api/v1/users", params={"limit": 1}, headers=admin_headers
+            )
+            second = await client.get(
+                "/api/v1/users",
+                params={"limit": 1, "cursor": first.headers["X-Next-Cursor"]},
+                headers=admin_headers,
+            )
+
+        assert everyone.status_code == 200
+        assert len(everyone.json()) == 2
+        assert "X-Next-Cursor" not in everyone.headers
+        assert [u["email"] for u in search.json()] == ["admin@example.com"]
+        assert first.json()[0]["id"] != second.json()[0]["id"]
+
+    async def test_list_users_non_admin_forbidden(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+    ) -> None:
+        """Test regular users cannot list all users."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            response = await client.get("/api/v1/users", headers=auth_headers)
+
+        assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+class TestSearchUsers:
+    """Tests for GET /api/v1/users/search."""
+
+    async def test_search_users_returns_summary(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_user_data: dict[str, Any],
+    ) -> None:
+        """Test any user can search by name prefix and gets public fields."""
+        prefix = test_user_data["name"][:3]
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            response = await client.get(
+                "/api/v1/users/search", params={"q": prefix}, headers=auth_headers
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [u["email"] for u in data] == [test_user_data["email"]]
+        assert "is_admin" not in data[0]
+
+    async def test_search_users_query_too_short(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+    ) -> None:
+        """Test single-character searches are rejected."""
+        with patch(
+            "app.api.deps.is_token_blacklisted",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            response = await client.get(
+                "/api/v1/users/search", params={"q": "a"}, headers=auth_headers
+            )
+
+        assert response.status_code == 422
+
+
 @pytest.mark.asyncio
 class TestUpdateMyProfile:
     """Tests for PATCH /api/v1/users/me."""
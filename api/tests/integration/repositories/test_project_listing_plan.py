@@ -0,0 +1,126 @@
+"""Query plan regression tests for the accessible project listing."""
+
+import json
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import Project
+from app.models.user import User
+from app.repositories.project import ProjectRepository
+
+PROJECT_COUNT = 100_000
+
+
+def _walk(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield every node of an EXPLAIN (FORMAT JSON) plan tree."""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+@pytest.fixture
+async def seeded_user(test_session: AsyncSession) -> User:
+    """Create a user and 100k projects owned by someone else.
+
+    Every 10th project is public and every 1000th is owned by the user.
+    """
+    user = User(email="plan@example.com", name="Plan User")
+    other = User(email="other@example.com", name="Other User")
+    test_session.add_all([user, other])
+    await test_session.flush()
+
+    await test_session.execute(
+        text(
+            """
+            INSERT INTO projects (
+                id, slug, name, visibility, owner_id, chat_enabled,
+                created_at, updated_at
+            )
+            SELECT
+                gen_random_uuid(),
+                'plan-' || g,
+                'Plan ' || g,
+                (CASE WHEN g % 10 = 0 THEN 'public' ELSE 'private' END)
+                    ::projectvisibility,
+                CASE WHEN g % 1000 = 0 THEN :user_id ELSE :other_id END,
+                true,
+                now() - g * interval '1 second',
+                now()
+            FROM generate_series(1, :count) AS g
+            """
+        ),
+        {"user_id": user.id, "other_id": other.id, "count": PROJECT_COUNT},
+    )
+    await test_session.execute(text("ANALYZE projects"))
+    return user
+
+
+async def _explain(session: AsyncSession, stmt: Any) -> dict[str, Any]:
+    """Return the root plan node of a statement."""
+    sql = stmt.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    result = await session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    raw = result.scalar_one()
+    return (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+
+
+class TestAccessibleProjectsPlan:
+    """EXPLAIN-based regression tests for get_accessible_projects."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("with_cursor", [False, True])
+    async def test_no_sequential_scan_on_projects(
+        self,
+        test_session: AsyncSession,
+        seeded_user: User,
+        with_cursor: bool,
+    ) -> None:
+        """Test each UNION branch is served by an index, not a full scan."""
+        repo = ProjectRepository(test_session)
+        cursor = None
+        if with_cursor:
+            first_page = await repo.get_accessible_projects(seeded_user.id, limit=20)
+            last = first_page[-1]
+            cursor = (last.created_at, last.id)
+
+        accessible = repo._accessible_ids(seeded_user.id, 20, cursor)
+        stmt = Project.__table__.select().join(
+            accessible, accessible.c.id == Project.id
+        )
+        nodes = list(_walk(await _explain(test_session, stmt)))
+
+        seq_scans = [
+            n
+            for n in nodes
+            if n["Node Type"] == "Seq Scan" and n.get("Relation Name") == "projects"
+        ]
+        assert seq_scans == []
+
+        used_indexes = {n.get("Index Name") for n in nodes}
+        assert "projects_owner_created_idx" in used_indexes
+        assert "projects_public_created_idx" in used_indexes
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_do_not_overlap(
+        self, test_session: AsyncSession, seeded_user: User
+    ) -> None:
+        """Test keyset pages continue exactly where the previous page ended."""
+        repo = ProjectRepository(test_session)
+
+        first = await repo.get_accessible_projects(seeded_user.id, limit=50)
+        last = first[-1]
+        second = await repo.get_accessible_projects(
+            seeded_user.id, limit=50, cursor=(last.created_at, last.id)
+        )
+        by_offset = await repo.get_accessible_projects(
+            seeded_user.id, skip=50, limit=50
+        )
+
+        assert [p.id for p in second] == [p.id for p in by_offset]
+        assert not {p.id for p in first} & {p.id for p in second}
@@ -0,0 +1,112 @@
+"""Query plan regression tests for user search."""
+
+import json
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.search import contains_pattern
+from app.models.user import User
+from app.repositories.user import UserRepository
+
+USER_COUNT = 100_000
+
+
+def _walk(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield every node of an EXPLAIN (FORMAT JSON) plan tree."""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+@pytest.fixture
+async def seeded_users(test_session: AsyncSession) -> None:
+    """Create 100k users with distinct names and emails."""
+    await test_session.execute(
+        text(
+            """
+            INSERT INTO users (
+                id, email, name, auth_provider, is_active, is_admin,
+                created_at, updated_at
+            )
+            SELECT
+                gen_random_uuid(),
+                'member' || g || '@example.com',
+                'Member ' || g,
+                'local',
+                true,
+                false,
+                now() - g * interval '1 second',
+                now()
+            FROM generate_series(1, :count) AS g
+            """
+        ),
+        {"count": USER_COUNT},
+    )
+    await test_session.execute(text("ANALYZE users"))
+
+
+async def _explain(session: AsyncSession, stmt: Any) -> dict[str, Any]:
+    """Return the root plan node of a statement."""
+    sql = stmt.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    result = await session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    raw = result.scalar_one()
+    return (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+
+
+class TestUserSearchPlan:
+    """EXPLAIN-based regression tests for UserRepository.search."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("seeded_users")
+    @pytest.mark.parametrize("query", ["member4242", "ber 4242"])
+    async def test_search_uses_trigram_indexes(
+        self, test_session: AsyncSession, query: str
+    ) -> None:
+        """Test substring search is served by the trigram indexes."""
+        pattern = contains_pattern(query)
+        stmt = (
+            select(User)
+            .where(
+                User.name.ilike(pattern, escape="\\")
+                | User.email.ilike(pattern, escape="\\")
+            )
+            .order_by(User.created_at.asc(), User.id.asc())
+            .limit(50)
+        )
+        nodes = list(_walk(await _explain(test_session, stmt)))
+
+        seq_scans = [
+            n
+            for n in nodes
+            if n["Node Type"] == "Seq Scan" and n.get("Relation Name") == "users"
+        ]
+        assert seq_scans == []
+
+        used_indexes = {n.get("Index Name") for n in nodes}
+        assert "users_name_trgm_idx" in used_indexes
+        assert "users_email_trgm_idx" in used_indexes
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("seeded_users")
+    async def test_cursor_pages_do_not_overlap(
+        self, test_session: AsyncSession
+    ) -> None:
+        """Test keyset pages of search results continue where the last ended."""
+        repo = UserRepository(test_session)
+
+        first = await repo.search("member1", limit=50)
+        last = first[-1]
+        second = await repo.search(
+            "member1", limit=50, cursor=(last.created_at, last.id)
+        )
+
+        assert len(second) == 50
+        assert not {u.id for u in first} & {u.id for u in second}
+        assert (last.created_at, last.id) < (second[0].created_at, second[0].id)
@@ -0,0 +1,71 @@
+"""Tests for HTTP conditional request helpers."""
+
+from datetime import UTC, datetime
+
+from starlette.datastructures import Headers
+
+from app.core.http_cache import format_http_date, is_not_modified
+
+ETAG = '"abc123"'
+LAST_MODIFIED = datetime(2026, 10, 21, 7, 28, 0, 500_000, tzinfo=UTC)
+
+
+class TestFormatHttpDate:
+    """Tests for format_http_date."""
+
+    def test_formats_as_gmt(self) -> None:
+        """Test timestamp is formatted as an IMF-fixdate."""
+        assert format_http_date(LAST_MODIFIED) == "Wed, 21 Oct 2026 07:28:00 GMT"
+
+
+class TestIsNotModified:
+    """Tests for is_not_modified."""
+
+    def test_no_conditional_headers(self) -> None:
+        """Test unconditional request is modified."""
+        assert is_not_modified(Headers({}), ETAG, LAST_MODIFIED) is False
+
+    def test_if_none_match_matches(self) -> None:
+        """Test matching ETag in a list is not modified."""
+        headers = Headers({"if-none-match": '"other", "abc123"'})
+        assert is_not_modified(headers, ETAG, LAST_MODIFIED) is True
+
+    def test_if_none_match_weak(self) -> None:
+        """Test weak ETag matches under weak comparison."""
+        headers = Headers({"if-none-match": 'W/"abc123"'})
+        assert is_not_modified(headers, ETAG, LAST_MODIFIED) is True
+
+    def test_if_none_match_wildcard(self) -> None:
+        """Test wildcard matches any representation."""
+        headers = Headers({"if-none-match": "*"})
+        assert is_not_modified(headers, ETAG, LAST_MODIFIED) is True
+
+    def test_if_none_match_mismatch(self) -> None:
+        """Test differing ETag is modified."""
+        headers = Headers({"if-none-match": '"other"'})
+        assert is_not_modified(headers, ETAG, LAST_MODIFIED) is False
+
+    def test_if_none_match_takes_precedence(self) -> None:
+        """Test If-Modified-Since is ignored when If-None-Match is present."""
+        headers = Headers(
+            {
+                "if-none-match": '"other"',
+                "if-modified-since": "Wed, 21 Oct 2026 07:28:00 GMT",
+            }
+        )
+        assert is_not_modified(headers, ETAG, LAST_MODIFIED) is False
+
+    def test_if_modified_since_same_second(self) -> None:
+        """Test sub-second modification time does not defeat the check."""
+        headers = Headers({"if-modified-since": "Wed, 21 Oct 2026 07:28:00 GMT"})
+        assert is_not_modified(headers, ETAG, LAST_MODIFIED) is True
+
+    def test_if_modified_since_older(self) -> None:
+        """Test older cached copy is modified."""
+        headers = Headers({"if-modified-since": "Wed, 21 Oct 2026 07:27:59 GMT"})
+        assert is_not_modified(headers, ETAG, LAST_MODIFIED) is False
+
+    def test_if_modified_since_invalid(self) -> None:
+        """Test unparsable date is ignored."""
+        headers = Headers({"if-modified-since": "yesterday"})
+        assert is_not_modified(headers, ETAG, LAST_MODIFIED) is False
@@ -0,0 +1,86 @@
+"""Unit tests for the image processing process pool."""
+
+import asyncio
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from app.core.image_pool import ImageProcessingPool
+from app.services.exceptions import ImageProcessingUnavailableError
+
+
+class TestImageProcessingPoolSlot:
+    """Tests for ImageProcessingPool.slot admission control."""
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self) -> None:
+        """Test jobs beyond the worker and queue limits are rejected."""
+        pool = ImageProcessingPool(max_workers=1, max_queued=1, timeout_seconds=5)
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with pool.slot():
+                await release.wait()
+
+        running = asyncio.create_task(hold())
+        queued = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+
+        assert pool.stats().running == 1
+        assert pool.stats().queued == 1
+        with pytest.raises(ImageProcessingUnavailableError):
+            async with pool.slot():
+                pass
+
+        release.set()
+        await asyncio.gather(running, queued)
+        stats = pool.stats()
+        assert (stats.running, stats.queued, stats.rejected) == (0, 0, 1)
+
+
+class TestImageProcessingPoolRun:
+    """Tests for ImageProcessingPool.run in worker processes."""
+
+    @pytest.fixture
+    def pool(self) -> Iterator[ImageProcessingPool]:
+        """Create a single-worker pool and shut it down afterwards."""
+        pool = ImageProcessingPool(max_workers=1, max_queued=4, timeout_seconds=2)
+        yield pool
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_runs_job_and_records_duration(
+        self, pool: ImageProcessingPool
+    ) -> None:
+        """Test the job result is returned and metrics are updated."""
+        async with pool.slot():
+            result = await pool.run(pow, 2, 10)
+
+        assert result == 1024
+        stats = pool.stats()
+        assert stats.completed == 1
+        assert stats.job_seconds_total > 0
+
+    @pytest.mark.asyncio
+    async def test_job_exceptions_propagate(self, pool: ImageProcessingPool) -> None:
+        """Test an exception raised by the job reaches the caller."""
+        async with pool.slot():
+            with pytest.raises(ValueError):
+                await pool.run(int, "not a number")
+
+        assert pool.stats().failed == 1
+
+    @pytest.mark.asyncio
+    async def test_job_timeout(self, pool: ImageProcessingPool) -> None:
+        """Test a job running past the deadline is aborted in its worker."""
+        pool.timeout_seconds = 0.2
+
+        async with pool.slot():
+            with pytest.raises(ImageProcessingUnavailableError, match="longer"):
+                await pool.run(time.sleep, 5)
+
+        assert pool.stats().timed_out == 1
+        # The worker survived the timeout and takes new jobs
+        async with pool.slot():
+            assert await pool.run(pow, 3, 2) == 9
@@ -0,0 +1,33 @@
+"""Unit tests for pagination module."""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from app.core.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip() -> None:
+    """Test that a decoded cursor matches the encoded position."""
+    created_at = datetime(2026, 10, 18, 12, 30, 45, 123456, tzinfo=UTC)
+    row_id = uuid4()
+
+    assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+
+
+def test_cursor_is_url_safe() -> None:
+    """Test that cursors can be passed as query parameters unescaped."""
+    cursor = encode_cursor(datetime.now(UTC), uuid4())
+
+    assert all(c.isalnum() or c in "-_=" for c in cursor)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["", "not-a-cursor", "bm90LWEtY3Vyc29y", "MjAyNi0xMC0xOHxub3QtYS11dWlk"],
+)
+def test_decode_cursor_invalid(cursor: str) -> None:
+    """Test that malformed cursors raise ValueError."""
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        decode_cursor(cursor)
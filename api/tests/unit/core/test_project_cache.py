@@ -0,0 +1,79 @@
+"""Unit tests for project cache module."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.project_cache import INVALIDATION_CHANNEL, ProjectCache
+
+
+class TestProjectCache:
+    """Tests for the ProjectCache container."""
+
+    def test_entry_expires_after_ttl(self) -> None:
+        """Test entries are not served after their TTL."""
+        cache = ProjectCache(ttl_seconds=30)
+        with patch("app.core.project_cache.time.monotonic", return_value=100.0):
+            cache.set("p", {"slug": "p"}, cache.generation)
+        with patch("app.core.project_cache.time.monotonic", return_value=129.0):
+            assert cache.get("p") == {"slug": "p"}
+        with patch("app.core.project_cache.time.monotonic", return_value=131.0):
+            assert cache.get("p") is None
+
+    def test_set_ignored_after_concurrent_invalidation(self) -> None:
+        """Test a row loaded before an invalidation is not cached."""
+        cache = ProjectCache(ttl_seconds=30)
+        generation = cache.generation
+        cache.discard("p")
+        cache.set("p", {"slug": "p"}, generation)
+
+        assert cache.get("p") is None
+
+    def test_disabled_with_zero_ttl(self) -> None:
+        """Test a TTL of 0 disables caching."""
+        cache = ProjectCache(ttl_seconds=0)
+        cache.set("p", {"slug": "p"}, cache.generation)
+
+        assert cache.get("p") is None
+
+    def test_evicts_oldest_when_full(self) -> None:
+        """Test the oldest entry is evicted once max_entries is reached."""
+        cache = ProjectCache(ttl_seconds=30, max_entries=2)
+        for slug in ("a", "b", "c"):
+            cache.set(slug, {"slug": slug}, cache.generation)
+
+        assert cache.get("a") is None
+        assert cache.get("c") == {"slug": "c"}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_publishes_to_other_workers(self) -> None:
+        """Test invalidation drops the entry and publishes the slug."""
+        cache = ProjectCache(ttl_seconds=30)
+        cache.set("p", {"slug": "p"}, cache.generation)
+        mock_redis = MagicMock()
+        mock_redis.publish = AsyncMock()
+
+        with patch(
+            "app.core.project_cache.get_redis",
+            new_callable=AsyncMock,
+            return_value=mock_redis,
+        ):
+            await cache.invalidate("p")
+
+        assert cache.get("p") is None
+        mock_redis.publish.assert_called_once_with(INVALIDATION_CHANNEL, "p")
+
+    @pytest.mark.asyncio
+    async def test_invalidate_survives_redis_outage(self) -> None:
+        """Test a publish failure does not fail the write path."""
+        cache = ProjectCache(ttl_seconds=30)
+        mock_redis = MagicMock()
+        mock_redis.publish = AsyncMock(side_effect=RedisConnectionError("down"))
+
+        with patch(
+            "app.core.project_cache.get_redis",
+            new_callable=AsyncMock,
+            return_value=mock_redis,
+        ):
+            await cache.invalidate("p")
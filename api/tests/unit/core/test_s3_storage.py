@@ -0,0 +1,345 @@
+"""Tests for the S3-compatible storage provider."""
+
+import re
+from unittest.mock import patch
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import httpx
+import pytest
+
+from app.core.storage import S3StorageProvider
+from app.services.exceptions import StorageError
+
+
+class FakeS3:
+    """In-memory stand-in for the parts of the S3 API the provider uses."""
+
+    def __init__(self) -> None:
+        self.objects: dict[str, tuple[bytes, dict[str, str]]] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.requests: list[httpx.Request] = []
+        self.fail_part: int | None = None
+        self.deny_delete = False
+        self.fail_copy = False
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        """Answer one request."""
+        self.requests.append(request)
+        assert request.headers["authorization"].startswith(
+            "AWS4-HMAC-SHA256 Credential=test-key/"
+        )
+        url = urlsplit(str(request.url))
+        bucket, _, key = unquote(url.path).lstrip("/").partition("/")
+        assert bucket == "uploads"
+        query = parse_qs(url.query, keep_blank_values=True)
+
+        if "uploads" in query:
+            upload_id = f"upload-{len(self.uploads)}"
+            self.uploads[upload_id] = {}
+            return httpx.Response(
+                200,
+                content=(
+                    '<InitiateMultipartUploadResult xmlns="http://s3.amazonaws.com/'
+                    f'doc/2006-03-01/"><UploadId>{upload_id}</UploadId>'
+                    "</InitiateMultipartUploadResult>"
+                ).encode(),
+            )
+        if "uploadId" in query:
+            return self._multipart(request, key, query)
+
+        if request.method == "PUT" and "x-amz-copy-source" in request.headers:
+            return self._copy(request, key)
+        if request.method == "PUT":
+            self.objects[key] = (request.content, dict(request.headers))
+            return httpx.Response(200, headers={"etag": '"etag"'})
+        if request.method == "DELETE" and self.deny_delete:
+            return httpx.Response(
+                403, content=b"<Error><Code>AccessDenied</Code></Error>"
+            )
+        if key not in self.objects:
+            return httpx.Response(404, content=b"<Error><Code>NoSuchKey</Code></Error>")
+        content, _ = self.objects[key]
+        if request.method == "HEAD":
+            return httpx.Response(200, headers={"content-length": str(len(content))})
+        if request.method == "GET":
+            return httpx.Response(200, content=content)
+        if request.method == "DELETE":
+            del self.objects[key]
+            return httpx.Response(204)
+        return httpx.Response(405)
+
+    def _copy(self, request: httpx.Request, key: str) -> httpx.Response:
+        """Answer a server-side copy."""
+        bucket, _, source = (
+            unquote(request.headers["x-amz-copy-source"]).lstrip("/").partition("/")
+        )
+        assert bucket == "uploads"
+        if source not in self.objects:
+            return httpx.Response(404, content=b"<Error><Code>NoSuchKey</Code></Error>")
+        if self.fail_copy:
+            # S3 reports some copy failures in a 200 response
+            return httpx.Response(
+                200, content=b"<Error><Code>InternalError</Code></Error>"
+            )
+        self.objects[key] = self.objects[source]
+        return httpx.Response(200, content=b"<CopyObjectResult/>")
+
+    def _multipart(
+        self, request: httpx.Request, key: str, query: dict[str, list[str]]
+    ) -> httpx.Response:
+        """Answer part uploads, completion and aborts."""
+        upload_id = query["uploadId"][0]
+        parts = self.uploads[upload_id]
+        if request.method == "PUT":
+            number = int(query["partNumber"][0])
+            if number == self.fail_part:
+                return httpx.Response(
+                    500, content=b"<Error><Code>InternalError</Code></Error>"
+                )
+            parts[number] = request.content
+            return httpx.Response(200, headers={"etag": f'"part-{number}"'})
+        if request.method == "POST":
+            numbers = [
+                int(n) for n in re.findall(rb"<PartNumber>(\d+)<", request.content)
+            ]
+            assert numbers == sorted(parts)
+            self.objects[key] = (
+                b"".join(parts[n] for n in numbers),
+                dict(request.headers),
+            )
+            del self.uploads[upload_id]
+            return httpx.Response(200, content=b"<CompleteMultipartUploadResult/>")
+        if request.method == "DELETE":
+            del self.uploads[upload_id]
+            return httpx.Response(204)
+        return httpx.Response(405)
+
+
+@pytest.fixture
+def fake_s3() -> FakeS3:
+    """Create an empty fake S3 service."""
+    return FakeS3()
+
+
+@pytest.fixture
+def storage(fake_s3: FakeS3) -> S3StorageProvider:
+    """Create a provider talking to the fake S3 service."""
+    provider = S3StorageProvider(
+        bucket="uploads",
+        endpoint_url="http://minio:9000",
+        public_endpoint_url="https://files.example.com",
+        region="us-east-1",
+        access_key_id="test-key",
+        secret_access_key="test-secret",
+        path_style=True,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(fake_s3.handler)),
+    )
+    provider.multipart_threshold = 100
+    provider.multipart_part_size = 40
+    return provider
+
+
+class TestS3StorageProvider:
+    """Tests for S3StorageProvider."""
+
+    @pytest.mark.asyncio
+    async def test_put_get_and_size(
+        self, storage: S3StorageProvider, fake_s3: FakeS3
+    ) -> None:
+        """Test an object reads back with its metadata."""
+        await storage.put("blobs/ab/abc.png", b"content")
+
+        assert await storage.get("blobs/ab/abc.png") == b"content"
+        assert await storage.get_size("blobs/ab/abc.png") == 7
+        assert await storage.get_size("missing.png") is None
+        _, headers = fake_s3.objects["blobs/ab/abc.png"]
+        assert headers["content-type"] == "image/png"
+        assert "immutable" in headers["cache-control"]
+        assert headers["x-amz-content-sha256"] == "UNSIGNED-PAYLOAD"
+
+    @pytest.mark.asyncio
+    async def test_key_is_url_encoded(
+        self, storage: S3StorageProvider, fake_s3: FakeS3
+    ) -> None:
+        """Test keys with special characters are encoded in the URL."""
+        await storage.put("2026/10/abcd_my file+1.png", b"content")
+
+        assert fake_s3.requests[-1].url.raw_path == (
+            b"/uploads/2026/10/abcd_my%20file%2B1.png"
+        )
+        assert await storage.get("2026/10/abcd_my file+1.png") == b"content"
+
+    @pytest.mark.asyncio
+    async def test_multipart_upload(
+        self, storage: S3StorageProvider, fake_s3: FakeS3
+    ) -> None:
+        """Test large objects are uploaded in parts and reassembled."""
+        content = bytes(range(250))
+
+        await storage.put("big.png", memoryview(content))
+
+        assert fake_s3.objects["big.png"][0] == content
+        part_requests = [r for r in fake_s3.requests if b"partNumber" in r.url.query]
+        assert [len(r.content) for r in part_requests] == [40] * 6 + [10]
+        assert fake_s3.uploads == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_multipart_upload_is_aborted(
+        self, storage: S3StorageProvider, fake_s3: FakeS3
+    ) -> None:
+        """Test a failed part aborts the upload and leaves no object."""
+        fake_s3.fail_part = 2
+
+        with pytest.raises(StorageError, match="InternalError"):
+            await storage.put("big.png", bytes(250))
+
+        assert "big.png" not in fake_s3.objects
+        assert fake_s3.uploads == {}
+
+    @pytest.mark.asyncio
+    async def test_stream(self, storage: S3StorageProvider) -> None:
+        """Test objects can be read in chunks."""
+        await storage.put("file.png", b"x" * 50)
+
+        chunks = [chunk async for chunk in storage.stream("file.png", chunk_size=16)]
+
+        assert b"".join(chunks) == b"x" * 50
+
+    @pytest.mark.asyncio
+    async def test_missing_object(self, storage: S3StorageProvider) -> None:
+        """Test reading a missing object raises StorageError."""
+        with pytest.raises(StorageError, match="File not found"):
+            await storage.get("missing.png")
+        with pytest.raises(StorageError, match="File not found"):
+            async for _ in storage.stream("missing.png"):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_delete_ignores_missing(
+        self, storage: S3StorageProvider, fake_s3: FakeS3
+    ) -> None:
+        """Test delete removes objects and ignores missing ones."""
+        await storage.put("file.png", b"content")
+
+        await storage.delete("file.png")
+        await storage.delete("file.png")
+
+        assert fake_s3.objects == {}
+
+    @pytest.mark.asyncio
+    async def test_delete_many_reports_refused_deletes(
+        self, storage: S3StorageProvider, fake_s3: FakeS3
+    ) -> None:
+        """Test deletes the service refuses are reported, not ignored."""
+        await storage.put("a.png", b"a")
+        await storage.put("b.png", b"b")
+        fake_s3.deny_delete = True
+
+        failed = await storage.delete_many(["a.png", "b.png"])
+
+        assert sorted(failed) == ["a.png", "b.png"]
+        assert set(fake_s3.objects) == {"a.png", "b.png"}
+        with pytest.raises(StorageError, match="403 AccessDenied"):
+            await storage._remove("a.png")
+
+    @pytest.mark.asyncio
+    async def test_move(self, storage: S3StorageProvider, fake_s3: FakeS3) -> None:
+        """Test move copies an object server-side and deletes the original."""
+        await storage.put("incoming/token", b"first")
+
+        assert await storage.move("incoming/token", "incoming/token.sealed")
+        await storage.put("incoming/token", b"second")
+
+        assert fake_s3.objects["incoming/token.sealed"][0] == b"first"
+        assert await storage.move("missing.png", "moved.png") is False
+        assert "moved.png" not in fake_s3.objects
+
+    @pytest.mark.asyncio
+    async def test_move_reports_failed_copy(
+        self, storage: S3StorageProvider, fake_s3: FakeS3
+    ) -> None:
+        """Test a copy failing after its 200 status keeps the original."""
+        await storage.put("incoming/token", b"first")
+        fake_s3.fail_copy = True
+
+        with pytest.raises(StorageError, match="InternalError"):
+            await storage.move("incoming/token", "incoming/token.sealed")
+
+        assert "incoming/token" in fake_s3.objects
+
+    @pytest.mark.asyncio
+    async def test_save_blob_writes_once(
+        self, storage: S3StorageProvider, fake_s3: FakeS3
+    ) -> None:
+        """Test content-addressed saves skip objects already stored."""
+        content_hash = "ab" + "0" * 62
+
+        path = await storage.save_blob(b"first", content_hash, "image/png")
+        await storage.save_blob(b"second", content_hash, "image/png")
+
+        assert path == f"blobs/ab/{content_hash}.png"
+        assert fake_s3.objects[path][0] == b"first"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path", ["../escape.png", "/abs.png", "a/../b.png"])
+    async def test_invalid_keys_rejected(
+        self, storage: S3StorageProvider, path: str
+    ) -> None:
+        """Test keys local storage would treat as traversal are rejected."""
+        with pytest.raises(StorageError, match="Invalid storage path"):
+            await storage.put(path, b"content")
+
+    def test_download_url_is_presigned_on_public_endpoint(
+        self, storage: S3StorageProvider
+    ) -> None:
+        """Test download URLs point clients straight at object storage."""
+        url = storage.get_download_url("blobs/ab/abc.png")
+
+        assert url is not None
+        parts = urlsplit(url)
+        assert f"{parts.scheme}://{parts.netloc}{parts.path}" == (
+            "https://files.example.com/uploads/blobs/ab/abc.png"
+        )
+        query = parse_qs(parts.query)
+        assert query["X-Amz-Expires"] == ["3600"]
+        assert len(query["X-Amz-Signature"][0]) == 64
+
+    def test_upload_url_signs_size_and_type(self, storage: S3StorageProvider) -> None:
+        """Test direct upload URLs only accept the declared body."""
+        url = storage.get_upload_url("incoming/token", "image/png", 1024)
+
+        parts = urlsplit(url)
+        assert f"{parts.scheme}://{parts.netloc}{parts.path}" == (
+            "https://files.example.com/uploads/incoming/token"
+        )
+        query = parse_qs(parts.query)
+        assert query["X-Amz-SignedHeaders"] == ["content-length;content-type;host"]
+        assert query["X-Amz-Expires"] == ["900"]
+        assert url != storage.get_upload_url("incoming/token", "image/png", 2048)
+
+    def test_download_url_disabled(self, storage: S3StorageProvider) -> None:
+        """Test presigned downloads can be turned off."""
+        with patch("app.core.storage.settings.s3_presign_downloads", False):
+            assert storage.get_download_url("blobs/ab/abc.png") is None
+
+    def test_url_is_stable_api_path(self, storage: S3StorageProvider) -> None:
+        """Test stored URLs do not expire."""
+        assert storage.get_url("blobs/ab/abc.png") == (
+            "/api/v1/uploads/file/blobs/ab/abc.png"
+        )
+
+    def test_virtual_hosted_style(self) -> None:
+        """Test the bucket can be addressed in the host name."""
+        provider = S3StorageProvider(
+            bucket="uploads",
+            region="eu-west-1",
+            access_key_id="key",
+            secret_access_key="secret",
+            path_style=False,
+            client=httpx.AsyncClient(),
+        )
+
+        url = provider.get_download_url("a.png")
+
+        assert url is not None
+        assert url.startswith("https://uploads.s3.eu-west-1.amazonaws.com/a.png?")
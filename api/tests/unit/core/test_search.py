@@ -0,0 +1,19 @@
+"""Unit tests for text search helpers."""
+
+from app.core.search import contains_pattern
+
+
+class TestContainsPattern:
+    """Tests for contains_pattern."""
+
+    def test_wraps_query_in_wildcards(self) -> None:
+        """Test plain text matches anywhere in the value."""
+        assert contains_pattern("alice") == "%alice%"
+
+    def test_escapes_like_wildcards(self) -> None:
+        """Test LIKE wildcards in the query match literally."""
+        assert contains_pattern("50%_off") == "%50\\%\\_off%"
+
+    def test_escapes_backslash_first(self) -> None:
+        """Test backslashes are escaped without doubling wildcard escapes."""
+        assert contains_pattern("a\\%") == "%a\\\\\\%%"
@@ -0,0 +1,78 @@
+"""Unit tests for single flight module."""
+
+import asyncio
+
+import pytest
+
+from app.core.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    async def test_concurrent_calls_share_one_run(self) -> None:
+        """Test concurrent callers with the same key run the job once."""
+        flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def job() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "done"
+
+        waiters = [asyncio.create_task(flight.do("k", job)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert flight.in_flight() == 1
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["done"] * 5
+        assert calls == 1
+        assert flight.in_flight() == 0
+
+    async def test_different_keys_run_separately(self) -> None:
+        """Test jobs for different keys do not share results."""
+        flight = SingleFlight()
+
+        async def job(value: str) -> str:
+            return value
+
+        results = await asyncio.gather(
+            flight.do("a", lambda: job("a")), flight.do("b", lambda: job("b"))
+        )
+
+        assert results == ["a", "b"]
+
+    async def test_error_is_shared_and_not_cached(self) -> None:
+        """Test a failure reaches every waiter and the next call retries."""
+        flight = SingleFlight()
+
+        async def failing() -> str:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await flight.do("k", failing)
+
+        async def succeeding() -> str:
+            return "ok"
+
+        assert await flight.do("k", succeeding) == "ok"
+
+    async def test_cancelled_waiter_does_not_cancel_job(self) -> None:
+        """Test a caller giving up leaves the job running for others."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def job() -> str:
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(flight.do("k", job))
+        second = asyncio.create_task(flight.do("k", job))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
@@ -0,0 +1,234 @@
+"""Tests for the local storage provider."""
+
+import asyncio
+import os
+import threading
+from collections.abc import AsyncIterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.core.storage import LocalStorageProvider
+from app.services.exceptions import StorageError
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> LocalStorageProvider:
+    """Create a storage provider rooted in a temporary directory."""
+    return LocalStorageProvider(str(tmp_path / "uploads"))
+
+
+class TestLocalStorageProvider:
+    """Tests for LocalStorageProvider."""
+
+    @pytest.mark.asyncio
+    async def test_put_and_get(self, storage: LocalStorageProvider) -> None:
+        """Test content written with put() reads back unchanged."""
+        await storage.put("a/b/file.png", b"content")
+
+        assert await storage.get("a/b/file.png") == b"content"
+        assert await storage.get_size("a/b/file.png") == 7
+
+    @pytest.mark.asyncio
+    async def test_put_replaces_and_leaves_no_temp_files(
+        self, storage: LocalStorageProvider
+    ) -> None:
+        """Test an overwrite is complete and cleans up its temporary file."""
+        await storage.put("file.png", b"old")
+        await storage.put("file.png", memoryview(b"new content"))
+
+        assert await storage.get("file.png") == b"new content"
+        assert os.listdir(storage.base_path) == ["file.png"]
+
+    @pytest.mark.asyncio
+    async def test_put_fsyncs_before_rename(
+        self, storage: LocalStorageProvider
+    ) -> None:
+        """Test data and the directory entry are flushed to disk."""
+        events = []
+        real_fsync, real_replace = os.fsync, os.replace
+
+        def fsync(fd: int) -> None:
+            events.append("fsync")
+            real_fsync(fd)
+
+        def replace(src: str, dst: str) -> None:
+            events.append("replace")
+            real_replace(src, dst)
+
+        with (
+            patch("app.core.storage.os.fsync", side_effect=fsync),
+            patch("app.core.storage.os.replace", side_effect=replace),
+        ):
+            await storage.put("file.png", b"content")
+
+        assert events == ["fsync", "replace", "fsync"]
+
+    @pytest.mark.asyncio
+    async def test_failed_write_keeps_old_file(
+        self, storage: LocalStorageProvider
+    ) -> None:
+        """Test a write that fails midway leaves the previous content."""
+        await storage.put("file.png", b"old")
+
+        with (
+            patch("app.core.storage.os.fsync", side_effect=OSError("disk full")),
+            pytest.raises(StorageError),
+        ):
+            await storage.put("file.png", b"new")
+
+        assert await storage.get("file.png") == b"old"
+        assert os.listdir(storage.base_path) == ["file.png"]
+
+    @pytest.mark.asyncio
+    async def test_io_runs_off_event_loop(self, storage: LocalStorageProvider) -> None:
+        """Test file I/O runs in the storage thread pool."""
+        threads = []
+        real_read_bytes = Path.read_bytes
+
+        def read_bytes(path: Path) -> bytes:
+            threads.append(threading.current_thread().name)
+            return real_read_bytes(path)
+
+        await storage.put("file.png", b"content")
+        with patch.object(Path, "read_bytes", read_bytes):
+            await storage.get("file.png")
+
+        assert threads[0].startswith("storage-io")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path", ["../escape.png", "a/../../escape.png"])
+    async def test_path_traversal_rejected(
+        self, storage: LocalStorageProvider, path: str
+    ) -> None:
+        """Test paths outside the base directory are rejected."""
+        with pytest.raises(StorageError, match="Invalid storage path"):
+            await storage.put(path, b"content")
+        with pytest.raises(StorageError, match="Invalid storage path"):
+            await storage.get(path)
+        assert await storage.get_size(path) is None
+        assert not (storage.base_path.parent / "escape.png").exists()
+
+    @pytest.mark.asyncio
+    async def test_symlink_escape_rejected(
+        self, storage: LocalStorageProvider, tmp_path: Path
+    ) -> None:
+        """Test symlinks pointing outside the base directory are rejected."""
+        (tmp_path / "secret.txt").write_bytes(b"secret")
+        (storage.base_path / "link").symlink_to(tmp_path)
+
+        with pytest.raises(StorageError, match="Invalid storage path"):
+            await storage.get("link/secret.txt")
+
+    @pytest.mark.asyncio
+    async def test_get_missing_file(self, storage: LocalStorageProvider) -> None:
+        """Test reading a missing file raises StorageError."""
+        with pytest.raises(StorageError, match="File not found"):
+            await storage.get("missing.png")
+
+    @pytest.mark.asyncio
+    async def test_delete(self, storage: LocalStorageProvider) -> None:
+        """Test delete removes files and ignores missing or invalid paths."""
+        await storage.put("file.png", b"content")
+
+        await storage.delete("file.png")
+        await storage.delete("file.png")
+        await storage.delete("../escape.png")
+
+        assert await storage.get_size("file.png") is None
+
+    @pytest.mark.asyncio
+    async def test_move(self, storage: LocalStorageProvider) -> None:
+        """Test move renames a file and reports a missing source."""
+        await storage.put("incoming/token", b"first")
+
+        assert await storage.move("incoming/token", "incoming/token.sealed")
+        await storage.put("incoming/token", b"second")
+
+        assert await storage.get("incoming/token.sealed") == b"first"
+        assert await storage.move("missing.png", "moved.png") is False
+        with pytest.raises(StorageError, match="Invalid storage path"):
+            await storage.move("incoming/token", "../escape.png")
+
+    @pytest.mark.asyncio
+    async def test_delete_many_reports_failures(
+        self, storage: LocalStorageProvider
+    ) -> None:
+        """Test bulk deletes return the paths that could not be removed."""
+        await storage.put("a.png", b"a")
+        await storage.put("b.png", b"b")
+
+        failed = await storage.delete_many(
+            ["a.png", "b.png", "missing.png", "../escape.png"]
+        )
+
+        assert failed == ["../escape.png"]
+        assert await storage.get_size("a.png") is None
+        assert await storage.get_size("b.png") is None
+
+    @pytest.mark.asyncio
+    async def test_delete_many_bounds_concurrency(
+        self, storage: LocalStorageProvider
+    ) -> None:
+        """Test no more than the configured number of deletes run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def remove(storage_path: str) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        with (
+            patch("app.core.storage.settings.storage_delete_concurrency", 3),
+            patch.object(storage, "_remove", side_effect=remove),
+        ):
+            failed = await storage.delete_many([f"{n}.png" for n in range(20)])
+
+        assert failed == []
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_save_blob_writes_once(self, storage: LocalStorageProvider) -> None:
+        """Test content-addressed saves skip content already stored."""
+        content_hash = "ab" + "0" * 62
+
+        path = await storage.save_blob(b"first", content_hash, "image/png")
+        again = await storage.save_blob(b"second", content_hash, "image/png")
+
+        assert path == again == f"blobs/ab/{content_hash}.png"
+        assert await storage.get(path) == b"first"
+
+    @pytest.mark.asyncio
+    async def test_put_stream(self, storage: LocalStorageProvider) -> None:
+        """Test chunks are written as they arrive and committed at the end."""
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield b"first "
+            yield b"second"
+
+        size = await storage.put_stream("a/file.png", chunks())
+
+        assert size == 12
+        assert await storage.get("a/file.png") == b"first second"
+        assert os.listdir(storage.base_path / "a") == ["file.png"]
+
+    @pytest.mark.asyncio
+    async def test_put_stream_failure_leaves_nothing(
+        self, storage: LocalStorageProvider
+    ) -> None:
+        """Test a stream that fails midway leaves no file behind."""
+        await storage.put("file.png", b"old")
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield b"partial"
+            raise ValueError("client went away")
+
+        with pytest.raises(ValueError, match="client went away"):
+            await storage.put_stream("file.png", chunks())
+
+        assert await storage.get("file.png") == b"old"
+        assert os.listdir(storage.base_path) == ["file.png"]
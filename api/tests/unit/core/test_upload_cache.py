@@ -0,0 +1,124 @@
+"""Unit tests for upload file metadata cache module."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.upload_cache import UPLOAD_FILE_PREFIX, UploadFileCache, UploadFileInfo
+
+
+def make_info(storage_path: str = "2026/10/abc_test.png") -> UploadFileInfo:
+    """Create file metadata for a storage path."""
+    return UploadFileInfo(
+        storage_path=storage_path,
+        mime_type="image/png",
+        size_bytes=1024,
+        etag='"abc"',
+        last_modified=datetime(2026, 10, 19, 9, 0, tzinfo=UTC),
+    )
+
+
+@pytest.fixture
+def mock_redis() -> MagicMock:
+    """Create a mock Redis client with no stored keys."""
+    client = MagicMock()
+    client.get = AsyncMock(return_value=None)
+    client.setex = AsyncMock()
+    client.delete = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def patch_redis(mock_redis: MagicMock):
+    """Route the cache's Redis access to the mock client."""
+    with patch(
+        "app.core.upload_cache.get_redis",
+        new_callable=AsyncMock,
+        return_value=mock_redis,
+    ):
+        yield
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("patch_redis")
+class TestUploadFileCache:
+    """Tests for the UploadFileCache container."""
+
+    async def test_set_then_get_from_memory(self, mock_redis: MagicMock) -> None:
+        """Test a cached entry is served without asking Redis."""
+        cache = UploadFileCache(ttl_seconds=60)
+        info = make_info()
+
+        await cache.set(info)
+
+        assert await cache.get(info.storage_path) == info
+        mock_redis.get.assert_not_called()
+        mock_redis.setex.assert_called_once_with(
+            f"{UPLOAD_FILE_PREFIX}{info.storage_path}", 60, info.to_json()
+        )
+
+    async def test_get_falls_back_to_redis(self, mock_redis: MagicMock) -> None:
+        """Test a local miss is filled from Redis."""
+        cache = UploadFileCache(ttl_seconds=60)
+        info = make_info()
+        mock_redis.get.return_value = info.to_json()
+
+        assert await cache.get(info.storage_path) == info
+        assert await cache.get(info.storage_path) == info
+        mock_redis.get.assert_called_once()
+
+    async def test_entry_expires_after_ttl(self, mock_redis: MagicMock) -> None:
+        """Test local entries are not served after their TTL."""
+        cache = UploadFileCache(ttl_seconds=60)
+        info = make_info()
+        with patch("app.core.upload_cache.time.monotonic", return_value=100.0):
+            await cache.set(info)
+        with patch("app.core.upload_cache.time.monotonic", return_value=161.0):
+            assert await cache.get(info.storage_path) is None
+
+    async def test_evicts_least_recently_used(self) -> None:
+        """Test the least recently read entry is evicted when full."""
+        cache = UploadFileCache(ttl_seconds=60, max_entries=2)
+        for path in ("a", "b"):
+            await cache.set(make_info(path))
+        await cache.get("a")
+        await cache.set(make_info("c"))
+
+        assert await cache.get("a") is not None
+        assert await cache.get("b") is None
+
+    async def test_disabled_with_zero_ttl(self, mock_redis: MagicMock) -> None:
+        """Test a TTL of 0 disables caching."""
+        cache = UploadFileCache(ttl_seconds=0)
+        info = make_info()
+
+        await cache.set(info)
+
+        assert await cache.get(info.storage_path) is None
+        mock_redis.setex.assert_not_called()
+
+    async def test_invalidate(self, mock_redis: MagicMock) -> None:
+        """Test invalidation drops the local entry and the Redis key."""
+        cache = UploadFileCache(ttl_seconds=60)
+        info = make_info()
+        await cache.set(info)
+
+        await cache.invalidate(info.storage_path)
+
+        assert await cache.get(info.storage_path) is None
+        mock_redis.delete.assert_called_once_with(
+            f"{UPLOAD_FILE_PREFIX}{info.storage_path}"
+        )
+
+    async def test_survives_redis_outage(self, mock_redis: MagicMock) -> None:
+        """Test Redis failures degrade to a miss instead of an error."""
+        cache = UploadFileCache(ttl_seconds=60)
+        mock_redis.get.side_effect = RedisConnectionError("down")
+        mock_redis.setex.side_effect = RedisConnectionError("down")
+
+        await cache.set(make_info())
+        cache.clear()
+
+        assert await cache.get("2026/10/abc_test.png") is None
@@ -0,0 +1,103 @@
+"""Tests for document repository."""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.document import Document
+from app.repositories.document import DocumentRepository
+
+
+def _compiled(call: Any) -> str:
+    """Render the statement passed to a mocked execute() call."""
+    return str(call.args[0].compile(dialect=postgresql.dialect()))
+
+
+class TestDocumentRepositoryCounters:
+    """Tests for the denormalized project document and storage counters."""
+
+    @pytest.mark.asyncio
+    async def test_create_page_increments_count(self) -> None:
+        """Test creating a page bumps the project's document count and bytes."""
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock()
+        mock_db.commit = AsyncMock()
+        mock_db.refresh = AsyncMock()
+
+        repo = DocumentRepository(mock_db)
+        await repo.create(uuid4(), "intro", "intro", "Intro", content="# Hi")
+
+        mock_db.execute.assert_called_once()
+        sql = _compiled(mock_db.execute.call_args)
+        assert "UPDATE projects SET document_count=(projects.document_count +" in sql
+        assert "document_bytes=(projects.document_bytes +" in sql
+        params = mock_db.execute.call_args.args[0].compile().params
+        assert params["document_count_1"] == 1
+        assert params["document_bytes_1"] == len(b"# Hi")
+        mock_db.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_create_folder_keeps_count(self) -> None:
+        """Test folders are not counted as documents."""
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock()
+        mock_db.commit = AsyncMock()
+        mock_db.refresh = AsyncMock()
+
+        repo = DocumentRepository(mock_db)
+        await repo.create(uuid4(), "guide", "guide", "Guide", is_folder=True)
+
+        mock_db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_decrements_by_subtree_pages(self) -> None:
+        """Test deleting a folder subtracts every page and byte beneath it."""
+        document = MagicMock(spec=Document)
+        document.id = uuid4()
+        document.project_id = uuid4()
+        document.path = "guide"
+
+        count_result = MagicMock()
+        count_result.one.return_value = (4, 120, 300)
+
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(side_effect=[count_result, MagicMock()])
+        mock_db.delete = AsyncMock()
+        mock_db.commit = AsyncMock()
+
+        repo = DocumentRepository(mock_db)
+        await repo.delete(document)
+
+        count_call, update_call = mock_db.execute.call_args_list
+        assert "documents.path LIKE" in _compiled(count_call)
+        assert "octet_length(document_revisions.content)" in _compiled(count_call)
+        params = update_call.args[0].compile().params
+        assert params["document_count_1"] == -4
+        assert params["document_bytes_1"] == -120
+        assert params["revision_bytes_1"] == -300
+        mock_db.delete.assert_called_once_with(document)
+        mock_db.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_update_applies_content_size_delta(self) -> None:
+        """Test replacing content adjusts only the project's document bytes."""
+        document = MagicMock(spec=Document)
+        document.project_id = uuid4()
+        document.content = "short"
+
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock()
+        mock_db.commit = AsyncMock()
+        mock_db.refresh = AsyncMock()
+
+        repo = DocumentRepository(mock_db)
+        await repo.update(document, content="much longer")
+
+        mock_db.execute.assert_called_once()
+        sql = _compiled(mock_db.execute.call_args)
+        assert "document_count" not in sql
+        params = mock_db.execute.call_args.args[0].compile().params
+        assert params["document_bytes_1"] == len("much longer") - len("short")
@@ -0,0 +1,103 @@
+"""Tests for effective project access repository."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.models.project_member import MemberRole
+from app.repositories.effective_project_access import (
+    EffectiveProjectAccessRepository,
+)
+from app.repositories.project_member import ProjectMemberRepository
+
+
+class TestEffectiveProjectAccessRepositoryGetRole:
+    """Tests for EffectiveProjectAccessRepository.get_role method."""
+
+    @pytest.mark.asyncio
+    async def test_get_role_found(self) -> None:
+        """Test getting the materialised role for a granted user."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = MemberRole.EDITOR
+
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        repo = EffectiveProjectAccessRepository(mock_db)
+        result = await repo.get_role(uuid4(), uuid4())
+
+        assert result == MemberRole.EDITOR
+        mock_db.execute.assert_called_once()
+
+
+class TestEffectiveProjectAccessRepositoryRefresh:
+    """Tests for EffectiveProjectAccessRepository.refresh method."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_upserts_and_prunes(self) -> None:
+        """Test refresh upserts grants and removes revoked rows."""
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock()
+        mock_db.flush = AsyncMock()
+
+        repo = EffectiveProjectAccessRepository(mock_db)
+        await repo.refresh(uuid4(), [uuid4()])
+
+        assert mock_db.execute.call_count == 2
+        mock_db.flush.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_refresh_no_users_is_noop(self) -> None:
+        """Test refresh without users does not touch the database."""
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock()
+
+        repo = EffectiveProjectAccessRepository(mock_db)
+        await repo.refresh(uuid4(), [])
+
+        mock_db.execute.assert_not_called()
+
+
+class TestProjectMemberRepositoryMaintainsAccess:
+    """Tests that membership writes refresh effective access."""
+
+    @pytest.fixture
+    def mock_db(self) -> MagicMock:
+        """Create a mock database session."""
+        db = MagicMock()
+        db.add = MagicMock()
+        db.delete = AsyncMock()
+        db.flush = AsyncMock()
+        db.commit = AsyncMock()
+        db.refresh = AsyncMock()
+        return db
+
+    @pytest.mark.asyncio
+    async def test_create_refreshes_access(self, mock_db: MagicMock) -> None:
+        """Test adding a member refreshes that user's access row."""
+        repo = ProjectMemberRepository(mock_db)
+        repo.access_repo = MagicMock(spec=EffectiveProjectAccessRepository)
+        repo.access_repo.refresh = AsyncMock()
+        project_id, user_id = uuid4(), uuid4()
+
+        await repo.create(project_id, user_id, MemberRole.VIEWER)
+
+        repo.access_repo.refresh.assert_called_once_with(project_id, [user_id])
+        mock_db.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_delete_refreshes_access(self, mock_db: MagicMock) -> None:
+        """Test removing a member refreshes that user's access row."""
+        repo = ProjectMemberRepository(mock_db)
+        repo.access_repo = MagicMock(spec=EffectiveProjectAccessRepository)
+        repo.access_repo.refresh = AsyncMock()
+        member = MagicMock()
+        member.project_id, member.user_id = uuid4(), uuid4()
+
+        await repo.delete(member)
+
+        repo.access_repo.refresh.assert_called_once_with(
+            member.project_id, [member.user_id]
+        )
+        mock_db.delete.assert_called_once_with(member)
@@ -1,11 +1,16 @@
 """Tests for project repository."""
 
-from unittest.mock import AsyncMock, MagicMock
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
 
+from app.core.project_cache import project_cache
 from app.models.project import Project, ProjectVisibility
+from app.models.project_member import MemberRole
 from app.repositories.project import ProjectRepository
 from app.schemas.project import ProjectCreate, ProjectUpdate
 
@@ -115,6 +120,191 @@ class TestProjectRepositoryGet:
         assert len(result) == 2
 
 
+class TestProjectRepositoryGetWithRole:
+    """Tests for ProjectRepository.get_by_*_with_role methods."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_slug_with_role_found(self) -> None:
+        """Test project and member role are loaded with a single query."""
+        mock_project = MagicMock(spec=Project)
+
+        mock_result = MagicMock()
+        mock_result.one_or_none.return_value = (mock_project, MemberRole.EDITOR)
+
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        repo = ProjectRepository(mock_db)
+        result = await repo.get_by_slug_with_role("test-project", uuid4())
+
+        assert result == (mock_project, MemberRole.EDITOR)
+        mock_db.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_by_slug_with_role_not_found(self) -> None:
+        """Test getting project with role when project does not exist."""
+        mock_result = MagicMock()
+        mock_result.one_or_none.return_value = None
+
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        repo = ProjectRepository(mock_db)
+        result = await repo.get_by_slug_with_role("nonexistent", uuid4())
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_with_role_non_member(self) -> None:
+        """Test non-members get the project with a None role."""
+        mock_project = MagicMock(spec=Project)
+
+        mock_result = MagicMock()
+        mock_result.one_or_none.return_value = (mock_project, None)
+
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        repo = ProjectRepository(mock_db)
+        result = await repo.get_by_id_with_role(uuid4(), uuid4())
+
+        assert result == (mock_project, None)
+
+
+class TestProjectRepositoryGetAccessible:
+    """Tests for ProjectRepository.get_accessible_projects method."""
+
+    @staticmethod
+    def _compiled_sql(mock_db: MagicMock) -> str:
+        stmt = mock_db.execute.call_args[0][0]
+        return str(stmt.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.asyncio
+    async def test_get_accessible_projects_uses_union(self) -> None:
+        """Test owned, granted and public branches are combined with UNION."""
+        mock_project = MagicMock(spec=Project)
+
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [mock_project]
+
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        repo = ProjectRepository(mock_db)
+        result = await repo.get_accessible_projects(uuid4(), limit=20)
+
+        assert result == [mock_project]
+        sql = self._compiled_sql(mock_db)
+        assert sql.count("UNION") == 2
+        assert " OR " not in sql
+        assert "effective_project_access" in sql
+
+    @pytest.mark.asyncio
+    async def test_get_accessible_projects_with_cursor(self) -> None:
+        """Test cursor adds a keyset condition to every branch."""
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        repo = ProjectRepository(mock_db)
+        await repo.get_accessible_projects(
+            uuid4(), limit=20, cursor=(datetime.now(UTC), uuid4())
+        )
+
+        sql = self._compiled_sql(mock_db)
+        assert sql.count("(projects.created_at, projects.id) < (") == 3
+
+    @pytest.mark.asyncio
+    async def test_get_accessible_projects_enriched(self) -> None:
+        """Test rows are returned as (project, role, is_bookmarked) tuples."""
+        mock_project = MagicMock(spec=Project)
+
+        mock_result = MagicMock()
+        mock_result.all.return_value = [(mock_project, MemberRole.ADMIN, True)]
+
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        repo = ProjectRepository(mock_db)
+        result = await repo.get_accessible_projects_enriched(uuid4())
+
+        assert result == [(mock_project, MemberRole.ADMIN, True)]
+        sql = self._compiled_sql(mock_db)
+        assert sql.count("UNION") == 2
+        assert "LEFT OUTER JOIN project_bookmarks" in sql
+
+
+class TestProjectRepositoryCache:
+    """Tests for the slug cache in front of ProjectRepository lookups."""
+
+    @staticmethod
+    def _project_row() -> Project:
+        return Project(
+            id=uuid4(),
+            slug="cached-project",
+            name="Cached Project",
+            visibility=ProjectVisibility.PRIVATE,
+            owner_id=uuid4(),
+            chat_enabled=True,
+            document_count=0,
+        )
+
+    @pytest.mark.asyncio
+    async def test_second_lookup_skips_project_query(self) -> None:
+        """Test a cached slug is merged into the session without a query."""
+        project = self._project_row()
+
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = project
+
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=mock_result)
+        mock_db.merge = AsyncMock(side_effect=lambda obj, load: obj)
+
+        repo = ProjectRepository(mock_db)
+        first = await repo.get_by_slug("cached-project")
+        second = await repo.get_by_slug("cached-project")
+
+        assert first is project
+        assert second.id == project.id
+        assert second.name == "Cached Project"
+        mock_db.execute.assert_called_once()
+        mock_db.merge.assert_called_once()
+        assert mock_db.merge.call_args.kwargs == {"load": False}
+
+    @pytest.mark.asyncio
+    async def test_cached_lookup_with_role_queries_role_only(self) -> None:
+        """Test a cache hit still resolves the caller's current role."""
+        project = self._project_row()
+        project_cache.set(
+            project.slug,
+            {
+                attr.key: getattr(project, attr.key)
+                for attr in inspect(Project).column_attrs
+            },
+            project_cache.generation,
+        )
+
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = MemberRole.EDITOR
+
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=mock_result)
+        mock_db.merge = AsyncMock(side_effect=lambda obj, load: obj)
+
+        repo = ProjectRepository(mock_db)
+        result = await repo.get_by_slug_with_role(project.slug, uuid4())
+
+        assert result is not None
+        assert result[0].id == project.id
+        assert result[1] == MemberRole.EDITOR
+        sql = str(mock_db.execute.call_args.args[0])
+        assert "FROM effective_project_access" in sql
+        assert "projects" not in sql
+
+
 class TestProjectRepositoryUpdate:
     """Tests for ProjectRepository.update method."""
 
@@ -123,6 +313,7 @@ class TestProjectRepositoryUpdate:
         """Test successful project update."""
         mock_project = MagicMock(spec=Project)
         mock_project.name = "Old Name"
+        mock_project.slug = "test-project"
 
         mock_db = MagicMock()
         mock_db.commit = AsyncMock()
@@ -131,31 +322,56 @@ class TestProjectRepositoryUpdate:
         repo = ProjectRepository(mock_db)
         update_data = ProjectUpdate(name="New Name")
 
-        result = await repo.update(mock_project, update_data)
+        with patch.object(
+            project_cache, "invalidate", new_callable=AsyncMock
+        ) as mock_invalidate:
+            result = await repo.update(mock_project, update_data)
 
         assert result.name == "New Name"
         mock_db.commit.assert_called_once()
         mock_db.refresh.assert_called_once()
+        mock_invalidate.assert_called_once_with("test-project")
 
 
-class TestProjectRepositoryDelete:
-    """Tests for ProjectRepository.delete method."""
+class TestProjectRepositoryMarkDeleting:
+    """Tests for ProjectRepository.mark_deleting method."""
 
     @pytest.mark.asyncio
-    async def test_delete_project_success(self) -> None:
-        """Test successful project deletion."""
+    async def test_mark_deleting_hides_project(self) -> None:
+        """Test the project is flagged and dropped from the slug cache."""
         mock_project = MagicMock(spec=Project)
+        mock_project.slug = "test-project"
 
         mock_db = MagicMock()
-        mock_db.delete = AsyncMock()
         mock_db.commit = AsyncMock()
+        mock_db.refresh = AsyncMock()
 
         repo = ProjectRepository(mock_db)
 
-        await repo.delete(mock_project)
+        with patch.object(
+            project_cache, "invalidate", new_callable=AsyncMock
+        ) as mock_invalidate:
+            result = await repo.mark_deleting(mock_project)
 
-        mock_db.delete.assert_called_once_with(mock_project)
+        assert result is mock_project
+        assert mock_project.deleting_at is not None
         mock_db.commit.assert_called_once()
+        mock_invalidate.assert_called_once_with("test-project")
+
+    @pytest.mark.asyncio
+    async def test_lookups_exclude_deleting_projects(self) -> None:
+        """Test slug lookups filter out projects pending deletion."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        repo = ProjectRepository(mock_db)
+        await repo.get_by_slug("test-project")
+
+        sql = str(mock_db.execute.call_args.args[0])
+        assert "projects.deleting_at IS NULL" in sql
 
 
 class TestProjectRepositorySlugExists:
@@ -164,10 +380,8 @@ class TestProjectRepositorySlugExists:
     @pytest.mark.asyncio
     async def test_slug_exists_true(self) -> None:
         """Test slug exists returns true when found."""
-        mock_project = MagicMock(spec=Project)
-
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_project
+        mock_result.first.return_value = (uuid4(),)
 
         mock_db = MagicMock()
         mock_db.execute = AsyncMock(return_value=mock_result)
@@ -181,7 +395,7 @@ class TestProjectRepositorySlugExists:
     async def test_slug_exists_false(self) -> None:
         """Test slug exists returns false when not found."""
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
+        mock_result.first.return_value = None
 
         mock_db = MagicMock()
         mock_db.execute = AsyncMock(return_value=mock_result)
@@ -190,3 +404,5 @@ class TestProjectRepositorySlugExists:
         result = await repo.slug_exists("nonexistent")
 
         assert result is False
+        # Projects pending deletion still reserve their slug
+        assert "deleting_at" not in str(mock_db.execute.call_args.args[0])
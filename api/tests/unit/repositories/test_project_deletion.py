@@ -0,0 +1,89 @@
+"""Tests for project deletion repository."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.repositories.project_deletion import ProjectDeletionRepository
+
+
+def _mock_db(rowcount: int = 0) -> MagicMock:
+    """Create a mock session whose execute() reports a rowcount."""
+    mock_result = MagicMock()
+    mock_result.rowcount = rowcount
+
+    mock_db = MagicMock()
+    mock_db.execute = AsyncMock(return_value=mock_result)
+    mock_db.commit = AsyncMock()
+    return mock_db
+
+
+def _sql(mock_db: MagicMock) -> str:
+    """Render the statement passed to execute()."""
+    stmt = mock_db.execute.call_args.args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestProjectDeletionRepositoryChunks:
+    """Tests for the bounded chunk deletes."""
+
+    @pytest.mark.asyncio
+    async def test_delete_documents_chunk_deepest_first(self) -> None:
+        """Test documents are deleted children-first within a limit."""
+        mock_db = _mock_db(rowcount=3)
+        repo = ProjectDeletionRepository(mock_db)
+
+        deleted = await repo.delete_documents_chunk(uuid4(), 500)
+
+        assert deleted == 3
+        sql = _sql(mock_db)
+        assert sql.startswith("DELETE FROM documents")
+        assert "ORDER BY length(documents.path) DESC" in sql
+        assert "LIMIT" in sql
+        mock_db.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_delete_revisions_chunk_scoped_by_batch_project(self) -> None:
+        """Test revisions are selected through their batch's project."""
+        mock_db = _mock_db(rowcount=0)
+        repo = ProjectDeletionRepository(mock_db)
+
+        deleted = await repo.delete_revisions_chunk(uuid4(), 500)
+
+        assert deleted == 0
+        sql = _sql(mock_db)
+        assert sql.startswith("DELETE FROM document_revisions")
+        assert "revision_batches.project_id" in sql
+
+    @pytest.mark.asyncio
+    async def test_delete_uploads_chunk_returns_storage_paths(self) -> None:
+        """Test deleted uploads release blobs and hand back unused files."""
+        deleted = MagicMock()
+        deleted.all.return_value = [
+            SimpleNamespace(storage_path="2026/01/a.png", content_hash=None),
+            SimpleNamespace(storage_path="blobs/ab/ab.png", content_hash="ab"),
+            SimpleNamespace(storage_path="blobs/ab/ab.png", content_hash="ab"),
+            SimpleNamespace(storage_path="blobs/cd/cd.png", content_hash="cd"),
+        ]
+        released = MagicMock()
+        released.scalars.return_value.all.return_value = ["blobs/cd/cd.png"]
+        mock_db = _mock_db()
+        mock_db.execute.side_effect = [deleted, MagicMock(), MagicMock(), released]
+        repo = ProjectDeletionRepository(mock_db)
+
+        count, paths = await repo.delete_uploads_chunk(uuid4(), 500)
+
+        assert count == 4
+        # Legacy files are always removed, shared blobs only when unused
+        assert paths == ["2026/01/a.png", "blobs/cd/cd.png"]
+        statements = [
+            str(c.args[0].compile(dialect=postgresql.dialect()))
+            for c in mock_db.execute.call_args_list
+        ]
+        assert "RETURNING uploads.storage_path, uploads.content_hash" in statements[0]
+        assert "ref_count=(upload_blobs.ref_count - " in statements[1]
+        assert "DELETE FROM upload_blobs" in statements[3]
+        mock_db.commit.assert_called_once()
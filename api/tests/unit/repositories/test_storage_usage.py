@@ -0,0 +1,73 @@
+"""Tests for the per-project storage totals repository."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import ClauseElement
+
+from app.repositories.storage_usage import StorageUsageRepository
+
+
+def _sql(stmt: ClauseElement) -> str:
+    """Render a statement for PostgreSQL."""
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestStorageUsageRepository:
+    """Tests for StorageUsageRepository."""
+
+    @pytest.mark.asyncio
+    async def test_get_largest_projects_reads_totals(self) -> None:
+        """Test the ranking reads the maintained totals, not the content."""
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=MagicMock())
+        repo = StorageUsageRepository(mock_db)
+
+        await repo.get_largest_projects(20)
+
+        sql = _sql(mock_db.execute.call_args.args[0])
+        assert "FROM projects ORDER BY" in sql
+        assert "uploads" not in sql
+        assert "sum(" not in sql
+
+    @pytest.mark.asyncio
+    async def test_reconcile_chunk_locks_then_recounts(self) -> None:
+        """Test a chunk is locked, recounted and only drifted rows rewritten."""
+        ids = [UUID(int=1), UUID(int=2)]
+        locked = MagicMock()
+        locked.scalars.return_value.all.return_value = ids
+        updated = MagicMock()
+        updated.rowcount = 1
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(side_effect=[locked, updated])
+        mock_db.commit = AsyncMock()
+        repo = StorageUsageRepository(mock_db)
+
+        last_id, corrected = await repo.reconcile_chunk(UUID(int=0), 2)
+
+        assert (last_id, corrected) == (UUID(int=2), 1)
+        lock_call, update_call = mock_db.execute.call_args_list
+        lock_sql = _sql(lock_call.args[0])
+        assert "projects.id > " in lock_sql
+        assert lock_sql.endswith("FOR UPDATE")
+        update_sql = _sql(update_call.args[0])
+        assert update_sql.startswith("UPDATE projects SET upload_bytes=")
+        assert "sum(uploads.size_bytes)" in update_sql
+        assert "octet_length(document_revisions.content)" in update_sql
+        assert "projects.upload_bytes != " in update_sql
+        mock_db.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_reconcile_chunk_past_last_project(self) -> None:
+        """Test the end of the projects is reported without an update."""
+        locked = MagicMock()
+        locked.scalars.return_value.all.return_value = []
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=locked)
+        mock_db.commit = AsyncMock()
+        repo = StorageUsageRepository(mock_db)
+
+        assert await repo.reconcile_chunk(UUID(int=9), 100) == (None, 0)
+        mock_db.execute.assert_called_once()
@@ -0,0 +1,120 @@
+"""Tests for the orphaned upload collector repository."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import ClauseElement
+
+from app.repositories.upload_gc import UploadGCRepository
+
+
+def _sql(stmt: ClauseElement) -> str:
+    """Render a statement for PostgreSQL."""
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+async def _aiter(*items: str) -> AsyncIterator[str]:
+    """Yield items as an async iterator."""
+    for item in items:
+        yield item
+
+
+class TestUploadGCRepository:
+    """Tests for UploadGCRepository."""
+
+    @pytest.mark.asyncio
+    async def test_stream_document_contents_uses_cursor(self) -> None:
+        """Test only linking documents are streamed, a batch at a time."""
+        mock_db = MagicMock()
+        mock_db.stream_scalars = AsyncMock(return_value=_aiter("a", "b"))
+        repo = UploadGCRepository(mock_db)
+
+        contents = [c async for c in repo.stream_document_contents(200)]
+
+        assert contents == ["a", "b"]
+        stmt = mock_db.stream_scalars.call_args.args[0]
+        assert stmt.get_execution_options()["yield_per"] == 200
+        sql = _sql(stmt)
+        assert "FROM documents" in sql
+        assert "LIKE" in sql
+        assert "updated_at" not in sql
+
+    @pytest.mark.asyncio
+    async def test_stream_revision_contents_since(self) -> None:
+        """Test a rescan only reads revisions created since a time."""
+        mock_db = MagicMock()
+        mock_db.stream_scalars = AsyncMock(return_value=_aiter())
+        repo = UploadGCRepository(mock_db)
+
+        contents = [
+            c
+            async for c in repo.stream_revision_contents(
+                200, datetime(2026, 1, 1, tzinfo=UTC)
+            )
+        ]
+
+        assert contents == []
+        sql = _sql(mock_db.stream_scalars.call_args.args[0])
+        assert "FROM document_revisions" in sql
+        assert "document_revisions.created_at >=" in sql
+
+    @pytest.mark.asyncio
+    async def test_get_uploads_chunk_keyset(self) -> None:
+        """Test uploads are walked in ID order past the previous chunk."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=mock_result)
+        repo = UploadGCRepository(mock_db)
+
+        await repo.get_uploads_chunk(datetime.now(UTC), uuid4(), 500)
+
+        sql = _sql(mock_db.execute.call_args.args[0])
+        assert "uploads.created_at <" in sql
+        assert "uploads.id >" in sql
+        assert "ORDER BY uploads.id" in sql
+        assert "LIMIT" in sql
+
+    @pytest.mark.asyncio
+    async def test_delete_uploads_returns_storage_paths(self) -> None:
+        """Test deleted uploads release blobs and hand back unused files."""
+        project_id = uuid4()
+        deleted = MagicMock()
+        deleted.all.return_value = [
+            SimpleNamespace(
+                storage_path="2026/01/a.png",
+                content_hash=None,
+                project_id=project_id,
+                size_bytes=100,
+            ),
+            SimpleNamespace(
+                storage_path="blobs/ab/ab.png",
+                content_hash="ab",
+                project_id=project_id,
+                size_bytes=200,
+            ),
+        ]
+        released = MagicMock()
+        released.scalars.return_value.all.return_value = ["blobs/ab/ab.png"]
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(
+            side_effect=[deleted, MagicMock(), MagicMock(), released]
+        )
+        mock_db.commit = AsyncMock()
+        repo = UploadGCRepository(mock_db)
+
+        count, paths = await repo.delete_uploads([uuid4(), uuid4()])
+
+        assert count == 2
+        assert paths == ["2026/01/a.png", "blobs/ab/ab.png"]
+        first = _sql(mock_db.execute.call_args_list[0].args[0])
+        assert first.startswith("DELETE FROM uploads")
+        adjust = mock_db.execute.call_args_list[1].args[0]
+        assert _sql(adjust).startswith("UPDATE projects SET upload_bytes=")
+        assert adjust.compile().params["upload_bytes_1"] == -300
+        mock_db.commit.assert_called_once()
@@ -7,12 +7,17 @@ import pytest
 
 from app.models.project import Project
 from app.models.project_member import MemberRole
+from app.repositories.project import ProjectRepository
 from app.repositories.project_member import ProjectMemberRepository
 from app.services.authorization import (
+    OWNER_PERMISSIONS,
     Permission,
+    ProjectAccess,
     check_project_permission,
+    get_project_access,
     get_user_permissions,
 )
+from app.services.exceptions import ProjectNotFoundError
 
 
 class TestCheckProjectPermission:
@@ -238,3 +243,69 @@ class TestGetUserPermissions:
         assert Permission.VIEW in result
         assert Permission.EDIT in result
         assert Permission.MANAGE_MEMBERS not in result
+
+
+class TestProjectAccess:
+    """Tests for ProjectAccess and get_project_access."""
+
+    @pytest.fixture
+    def mock_project(self) -> MagicMock:
+        """Create a mock project."""
+        project = MagicMock(spec=Project)
+        project.id = uuid4()
+        project.owner_id = uuid4()
+        project.visibility = MagicMock()
+        project.visibility.value = "private"
+        return project
+
+    def test_owner_access(self, mock_project: MagicMock) -> None:
+        """Test owner has all permissions and 'owner' role."""
+        access = ProjectAccess(mock_project, mock_project.owner_id, None)
+
+        assert access.is_owner is True
+        assert access.role == "owner"
+        assert access.permissions == OWNER_PERMISSIONS
+
+    def test_member_access(self, mock_project: MagicMock) -> None:
+        """Test member permissions come from the preloaded role."""
+        access = ProjectAccess(mock_project, uuid4(), MemberRole.EDITOR)
+
+        assert access.role == "editor"
+        assert access.has_permission(Permission.EDIT) is True
+        assert access.has_permission(Permission.MANAGE_MEMBERS) is False
+
+    def test_public_non_member_access(self, mock_project: MagicMock) -> None:
+        """Test non-members of public projects only get view permission."""
+        mock_project.visibility.value = "public"
+        access = ProjectAccess(mock_project, uuid4(), None)
+
+        assert access.role is None
+        assert access.permissions == {Permission.VIEW}
+
+    @pytest.mark.asyncio
+    async def test_get_project_access_single_query(
+        self, mock_project: MagicMock
+    ) -> None:
+        """Test project and role are loaded through one repository call."""
+        user_id = uuid4()
+        project_repo = MagicMock(spec=ProjectRepository)
+        project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(mock_project, MemberRole.VIEWER)
+        )
+
+        access = await get_project_access(project_repo, "my-project", user_id)
+
+        assert access.project is mock_project
+        assert access.member_role == MemberRole.VIEWER
+        project_repo.get_by_slug_with_role.assert_called_once_with(
+            "my-project", user_id
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_project_access_not_found(self) -> None:
+        """Test get_project_access raises when project does not exist."""
+        project_repo = MagicMock(spec=ProjectRepository)
+        project_repo.get_by_slug_with_role = AsyncMock(return_value=None)
+
+        with pytest.raises(ProjectNotFoundError):
+            await get_project_access(project_repo, "nonexistent", uuid4())
@@ -35,27 +35,18 @@ class TestDocumentServiceGetTree:
         """Create mock project repository."""
         return MagicMock()
 
-    @pytest.fixture
-    def mock_member_repo(self) -> MagicMock:
-        """Create mock member repository."""
-        mock = MagicMock()
-        mock.get_user_role = AsyncMock(return_value=None)
-        return mock
-
     @pytest.fixture
     def document_service(
         self,
         mock_document_repo: MagicMock,
         mock_revision_repo: MagicMock,
         mock_project_repo: MagicMock,
-        mock_member_repo: MagicMock,
     ) -> DocumentService:
         """Create DocumentService with mocked repositories."""
         return DocumentService(
             mock_document_repo,
             mock_revision_repo,
             mock_project_repo,
-            mock_member_repo,
         )
 
     @pytest.mark.asyncio
@@ -65,7 +56,7 @@ class TestDocumentServiceGetTree:
         mock_project_repo: MagicMock,
     ) -> None:
         """Test get_document_tree raises error when project not found."""
-        mock_project_repo.get_by_slug = AsyncMock(return_value=None)
+        mock_project_repo.get_by_slug_with_role = AsyncMock(return_value=None)
 
         with pytest.raises(ProjectNotFoundError):
             await document_service.get_document_tree("non-existent", uuid4())
@@ -80,7 +71,9 @@ class TestDocumentServiceGetTree:
         project = MagicMock(spec=Project)
         project.owner_id = uuid4()
         project.visibility = ProjectVisibility.PRIVATE
-        mock_project_repo.get_by_slug = AsyncMock(return_value=project)
+        mock_project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(project, None)
+        )
 
         with pytest.raises(PermissionDeniedError):
             await document_service.get_document_tree("private-project", uuid4())
@@ -100,7 +93,9 @@ class TestDocumentServiceGetTree:
         project.id = project_id
         project.owner_id = owner_id
         project.visibility = ProjectVisibility.PRIVATE
-        mock_project_repo.get_by_slug = AsyncMock(return_value=project)
+        mock_project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(project, None)
+        )
 
         doc1 = MagicMock(spec=Document)
         doc1.id = uuid4()
@@ -125,7 +120,7 @@ class TestDocumentServiceParsePath:
     @pytest.fixture
     def document_service(self) -> DocumentService:
         """Create DocumentService with mocked repositories."""
-        return DocumentService(MagicMock(), MagicMock(), MagicMock(), MagicMock())
+        return DocumentService(MagicMock(), MagicMock(), MagicMock())
 
     def test_parse_path_root_level(self, document_service: DocumentService) -> None:
         """Test parsing root level path."""
@@ -159,7 +154,7 @@ class TestDocumentServiceDetermineChangeType:
     @pytest.fixture
     def document_service(self) -> DocumentService:
         """Create DocumentService with mocked repositories."""
-        return DocumentService(MagicMock(), MagicMock(), MagicMock(), MagicMock())
+        return DocumentService(MagicMock(), MagicMock(), MagicMock())
 
     def test_rename_only(self, document_service: DocumentService) -> None:
         """Test rename detection when only title changes."""
@@ -213,27 +208,18 @@ class TestDocumentServicePutDocument:
         """Create mock project repository."""
         return MagicMock()
 
-    @pytest.fixture
-    def mock_member_repo(self) -> MagicMock:
-        """Create mock member repository."""
-        mock = MagicMock()
-        mock.get_user_role = AsyncMock(return_value=None)
-        return mock
-
     @pytest.fixture
     def document_service(
         self,
         mock_document_repo: MagicMock,
         mock_revision_repo: MagicMock,
         mock_project_repo: MagicMock,
-        mock_member_repo: MagicMock,
     ) -> DocumentService:
         """Create DocumentService with mocked repositories."""
         return DocumentService(
             mock_document_repo,
             mock_revision_repo,
             mock_project_repo,
-            mock_member_repo,
         )
 
     @pytest.mark.asyncio
@@ -249,7 +235,9 @@ class TestDocumentServicePutDocument:
         project.id = uuid4()
         project.owner_id = owner_id
         project.visibility = ProjectVisibility.PRIVATE
-        mock_project_repo.get_by_slug = AsyncMock(return_value=project)
+        mock_project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(project, None)
+        )
 
         mock_document_repo.get_parent_by_path = AsyncMock(return_value=None)
 
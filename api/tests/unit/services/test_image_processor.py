@@ -1,11 +1,15 @@
 """Tests for ImageProcessor service."""
 
+import base64
 import io
+import subprocess
+from unittest.mock import patch
 
 import pytest
-from PIL import Image
+from PIL import Image, ImageChops, ImageDraw, ImageSequence
+from PIL.JpegImagePlugin import JpegImageFile
 
-from app.services.exceptions import InvalidFileTypeError
+from app.services.exceptions import ImageTooLargeError, InvalidFileTypeError
 from app.services.image_processor import ImageProcessor
 
 
@@ -45,6 +49,44 @@ def create_test_image(
     return buffer
 
 
+def create_test_animation(
+    width: int,
+    height: int,
+    frames: int = 6,
+    format: str = "GIF",
+    loop: int | None = 0,
+) -> bytes:
+    """Create an animation of a square moving over a white background.
+
+    Args:
+        width: Frame width.
+        height: Frame height.
+        frames: Number of frames.
+        format: Image format (GIF, WEBP).
+        loop: Loop count, or None to omit it.
+
+    Returns:
+        Encoded animation.
+    """
+    images = []
+    for i in range(frames):
+        img = Image.new("RGB", (width, height), "white")
+        x = i * width // (frames + 1)
+        ImageDraw.Draw(img).rectangle([x, 0, x + width // 8, height // 4], "blue")
+        images.append(img)
+    options = {} if loop is None else {"loop": loop}
+    buffer = io.BytesIO()
+    images[0].save(
+        buffer,
+        format=format,
+        save_all=True,
+        append_images=images[1:],
+        duration=[40 * (i + 1) for i in range(frames)],
+        **options,
+    )
+    return buffer.getvalue()
+
+
 class TestImageProcessor:
     """Tests for ImageProcessor."""
 
@@ -164,3 +206,265 @@ class TestImageProcessor:
         # Height should be 100, width should be 50 (maintaining 1:2 ratio)
         assert img.size[0] == 50
         assert img.size[1] == 100
+
+
+class TestImageProcessorDecodeBudget:
+    """Tests for reduced-scale decoding and the decode pixel budget."""
+
+    def test_rejects_image_over_pixel_budget(self) -> None:
+        """Test images above the pixel budget are rejected before decoding."""
+        processor = ImageProcessor(max_dimension=100, max_pixels=100 * 100)
+        img_buffer = create_test_image(101, 100, "PNG")
+
+        with (
+            patch.object(Image.Image, "load") as load,
+            pytest.raises(ImageTooLargeError, match="101x100"),
+        ):
+            processor.process(img_buffer, "image/png")
+
+        load.assert_not_called()
+
+    def test_accepts_image_at_pixel_budget(self) -> None:
+        """Test an image exactly at the budget is processed."""
+        processor = ImageProcessor(max_dimension=100, max_pixels=100 * 100)
+        img_buffer = create_test_image(100, 100, "PNG")
+
+        _, mime_type, _ = processor.process(img_buffer, "image/png")
+
+        assert mime_type == "image/png"
+
+    def test_jpeg_decoded_at_reduced_scale(self, processor: ImageProcessor) -> None:
+        """Test large JPEGs are drafted to a reduced scale before resizing."""
+        img_buffer = create_test_image(1600, 800, "JPEG")
+
+        with patch.object(
+            JpegImageFile, "draft", autospec=True, side_effect=JpegImageFile.draft
+        ) as draft:
+            result, mime_type, _ = processor.process(img_buffer, "image/jpeg")
+
+        draft.assert_called_once()
+        _, mode, requested = draft.call_args[0]
+        assert mode is None
+        assert requested == (100, 50)
+        assert mime_type == "image/jpeg"
+        assert Image.open(result).size == (100, 50)
+
+    def test_small_jpeg_not_drafted(self, processor: ImageProcessor) -> None:
+        """Test JPEGs within the max dimension are decoded at full scale."""
+        img_buffer = create_test_image(80, 60, "JPEG")
+
+        with patch.object(JpegImageFile, "draft") as draft:
+            result, _, _ = processor.process(img_buffer, "image/jpeg")
+
+        draft.assert_not_called()
+        assert Image.open(result).size == (80, 60)
+
+
+class TestImageProcessorProcessBytes:
+    """Tests for process_bytes and placeholders."""
+
+    def test_process_bytes_records_dimensions(self, processor: ImageProcessor) -> None:
+        """Test the processed size is reported, not the original size."""
+        content = create_test_image(400, 200, "PNG").getvalue()
+
+        result = processor.process_bytes(content, "image/png")
+
+        assert (result.width, result.height) == (100, 50)
+        assert Image.open(io.BytesIO(result.content)).size == (100, 50)
+        assert result.size_bytes == len(result.content)
+        assert result.mime_type == "image/png"
+
+    @pytest.mark.parametrize("mode", ["RGB", "RGBA", "P", "L"])
+    def test_placeholder_is_tiny_webp(
+        self, processor: ImageProcessor, mode: str
+    ) -> None:
+        """Test the placeholder is a 16px WebP data URI."""
+        content = create_test_image(100, 50, "PNG", mode=mode).getvalue()
+
+        placeholder = processor.process_bytes(content, "image/png").placeholder
+
+        prefix = "data:image/webp;base64,"
+        assert placeholder.startswith(prefix)
+        preview = Image.open(io.BytesIO(base64.b64decode(placeholder[len(prefix) :])))
+        assert preview.size == (16, 8)
+        assert len(placeholder) < 1000
+
+
+class TestImageProcessorVariants:
+    """Tests for create_variant."""
+
+    @pytest.mark.parametrize(
+        ("mime_type", "format"),
+        [
+            ("image/avif", "AVIF"),
+            ("image/webp", "WEBP"),
+            ("image/jpeg", "JPEG"),
+            ("image/png", "PNG"),
+        ],
+    )
+    def test_variant_resized_and_converted(
+        self, processor: ImageProcessor, mime_type: str, format: str
+    ) -> None:
+        """Test a variant is scaled to the width in the requested format."""
+        content = create_test_image(1000, 500, "PNG").getvalue()
+
+        result, result_mime, size = processor.create_variant(content, 320, mime_type)
+
+        img = Image.open(io.BytesIO(result))
+        assert img.format == format
+        assert img.size == (320, 160)
+        assert result_mime == mime_type
+        assert size == len(result)
+
+    def test_variant_never_upscales(self, processor: ImageProcessor) -> None:
+        """Test a width above the original keeps the original size."""
+        content = create_test_image(200, 100, "JPEG").getvalue()
+
+        result, _, _ = processor.create_variant(content, 640, "image/webp")
+
+        assert Image.open(io.BytesIO(result)).size == (200, 100)
+
+    def test_variant_jpeg_drops_alpha(self, processor: ImageProcessor) -> None:
+        """Test transparent images are flattened for JPEG output."""
+        content = create_test_image(400, 400, "PNG", mode="RGBA").getvalue()
+
+        result, _, _ = processor.create_variant(content, 320, "image/jpeg")
+
+        assert Image.open(io.BytesIO(result)).mode == "RGB"
+
+    def test_variant_unsupported_output(self, processor: ImageProcessor) -> None:
+        """Test unknown output types are rejected."""
+        content = create_test_image(400, 400, "PNG").getvalue()
+
+        with pytest.raises(InvalidFileTypeError):
+            processor.create_variant(content, 320, "image/gif")
+
+
+class TestImageProcessorAnimations:
+    """Tests for animated GIF and WebP processing and transcoding."""
+
+    @pytest.mark.parametrize("format", ["GIF", "WEBP"])
+    def test_animation_resized_keeps_frames(
+        self, processor: ImageProcessor, format: str
+    ) -> None:
+        """Test every frame is resized and frame timing is kept."""
+        content = create_test_animation(400, 200, format=format)
+
+        output, mime_type, _ = processor.process(io.BytesIO(content), "image/gif")
+
+        img = Image.open(output)
+        assert img.format == format
+        assert mime_type == f"image/{format.lower()}"
+        assert img.size == (100, 50)
+        assert img.n_frames == 6
+        assert img.info["loop"] == 0
+        durations = []
+        for frame in ImageSequence.Iterator(img):
+            frame.load()
+            durations.append(frame.info["duration"])
+        assert durations == [40, 80, 120, 160, 200, 240]
+
+    def test_animation_delta_resize_matches_full_resize(
+        self, processor: ImageProcessor
+    ) -> None:
+        """Test resizing only changed regions gives the full-resize result."""
+        img = Image.open(io.BytesIO(create_test_animation(400, 200)))
+
+        frames, _ = processor._frames(img, (100, 50))
+
+        for index, frame in enumerate(ImageSequence.Iterator(img)):
+            expected = frame.convert("RGB").resize(
+                (100, 50),
+                Image.Resampling.LANCZOS,
+                reducing_gap=processor.REDUCING_GAP,
+            )
+            difference = ImageChops.difference(expected, frames[index])
+            assert max(high for _, high in difference.getextrema()) <= 1
+
+    def test_animation_within_limit_kept_verbatim(
+        self, processor: ImageProcessor
+    ) -> None:
+        """Test animations that fit are not re-encoded."""
+        content = create_test_animation(80, 40)
+
+        result = processor.process_bytes(content, "image/gif")
+
+        assert result.content == content
+        assert (result.width, result.height) == (80, 40)
+
+    def test_animation_over_pixel_budget(self) -> None:
+        """Test long animations are rejected by their total pixel count."""
+        processor = ImageProcessor(max_dimension=100, max_animation_pixels=10_000)
+        content = create_test_animation(50, 50, frames=6)
+
+        with pytest.raises(ImageTooLargeError):
+            processor.process(io.BytesIO(content), "image/gif")
+
+    def test_transcode_to_animated_webp(self, processor: ImageProcessor) -> None:
+        """Test a GIF becomes an animated WebP with the same timing."""
+        content = create_test_animation(80, 40, loop=None)
+
+        result, mime_type, size = processor.transcode_animation(content, "image/webp")
+
+        img = Image.open(io.BytesIO(result))
+        assert img.format == "WEBP"
+        assert mime_type == "image/webp"
+        assert size == len(result)
+        assert img.n_frames == 6
+        # A GIF without a loop count plays once
+        assert img.info["loop"] == 1
+        img.seek(5)
+        img.load()
+        assert img.info["duration"] == 240
+
+    def test_transcode_rejects_non_gif(self, processor: ImageProcessor) -> None:
+        """Test only GIFs are transcoded."""
+        content = create_test_animation(80, 40, format="WEBP")
+
+        with pytest.raises(InvalidFileTypeError):
+            processor.transcode_animation(content, "image/webp")
+
+    def test_transcode_unsupported_output(self, processor: ImageProcessor) -> None:
+        """Test unknown output types are rejected."""
+        content = create_test_animation(80, 40)
+
+        with pytest.raises(InvalidFileTypeError):
+            processor.transcode_animation(content, "image/avif")
+
+    def test_transcode_to_video_runs_ffmpeg(self, processor: ImageProcessor) -> None:
+        """Test video is encoded by ffmpeg with even dimensions."""
+        content = create_test_animation(80, 40)
+
+        def fake_ffmpeg(args: list[str], **kwargs: object) -> None:
+            with open(args[-1], "wb") as output:
+                output.write(b"mp4 data")
+
+        with patch(
+            "app.services.image_processor.subprocess.run", side_effect=fake_ffmpeg
+        ) as run:
+            result, mime_type, size = processor.transcode_animation(
+                content, "video/mp4"
+            )
+
+        assert (result, mime_type, size) == (b"mp4 data", "video/mp4", 8)
+        args = run.call_args.args[0]
+        assert args[0] == "ffmpeg"
+        assert "libx264" in args
+        assert "scale=trunc(iw/2)*2:trunc(ih/2)*2" in args
+
+    def test_transcode_to_video_ffmpeg_failure(self, processor: ImageProcessor) -> None:
+        """Test encoder errors are reported as unprocessable input."""
+        content = create_test_animation(80, 40)
+        error = subprocess.CalledProcessError(1, "ffmpeg", stderr=b"bad input")
+
+        with (
+            patch("app.services.image_processor.subprocess.run", side_effect=error),
+            pytest.raises(InvalidFileTypeError, match="bad input"),
+        ):
+            processor.transcode_animation(content, "video/webm")
+
+    def test_video_available(self) -> None:
+        """Test video support follows the ffmpeg executable being found."""
+        processor = ImageProcessor(ffmpeg_path="/nonexistent/ffmpeg")
+
+        assert processor.video_available() is False
@@ -6,6 +6,7 @@ from uuid import uuid4
 import pytest
 
 from app.models.project import Project
+from app.models.project_member import MemberRole
 from app.repositories.project import ProjectRepository
 from app.schemas.project import ProjectCreate, ProjectUpdate
 from app.services import (
@@ -14,6 +15,7 @@ from app.services import (
     ProjectService,
     SlugAlreadyExistsError,
 )
+from app.services.authorization import Permission
 
 
 class TestProjectServiceCreate:
@@ -201,11 +203,12 @@ class TestProjectServiceDelete:
         mock_project.owner_id = owner_id
 
         mock_project_repo.get_by_slug = AsyncMock(return_value=mock_project)
-        mock_project_repo.delete = AsyncMock()
+        mock_project_repo.mark_deleting = AsyncMock(return_value=mock_project)
 
-        await project_service.delete_project("my-project", owner_id)
+        result = await project_service.delete_project("my-project", owner_id)
 
-        mock_project_repo.delete.assert_called_once_with(mock_project)
+        assert result is mock_project
+        mock_project_repo.mark_deleting.assert_called_once_with(mock_project)
 
     @pytest.mark.asyncio
     async def test_delete_project_not_found(
@@ -272,3 +275,47 @@ class TestProjectServiceGetByOwner:
         result = await project_service.get_projects_by_owner(uuid4())
 
         assert result == []
+
+
+class TestProjectServiceGetAccessibleEnriched:
+    """Tests for ProjectService.get_accessible_projects_enriched method."""
+
+    @pytest.fixture
+    def mock_project_repo(self) -> MagicMock:
+        """Create a mock project repository."""
+        return MagicMock(spec=ProjectRepository)
+
+    @pytest.fixture
+    def project_service(self, mock_project_repo: MagicMock) -> ProjectService:
+        """Create a ProjectService instance with mock repository."""
+        return ProjectService(mock_project_repo)
+
+    @pytest.mark.asyncio
+    async def test_resolves_permissions_from_joined_roles(
+        self, project_service: ProjectService, mock_project_repo: MagicMock
+    ) -> None:
+        """Test permissions come from the roles loaded with the listing."""
+        user_id = uuid4()
+
+        owned = MagicMock(spec=Project)
+        owned.owner_id = user_id
+        owned.visibility = MagicMock()
+        owned.visibility.value = "private"
+
+        shared = MagicMock(spec=Project)
+        shared.owner_id = uuid4()
+        shared.visibility = MagicMock()
+        shared.visibility.value = "private"
+
+        mock_project_repo.get_accessible_projects_enriched = AsyncMock(
+            return_value=[(owned, None, True), (shared, MemberRole.VIEWER, False)]
+        )
+
+        result = await project_service.get_accessible_projects_enriched(user_id)
+
+        assert [a.role for a, _ in result] == ["owner", "viewer"]
+        assert [b for _, b in result] == [True, False]
+        assert result[1][0].permissions == {Permission.VIEW}
+        mock_project_repo.get_accessible_projects_enriched.assert_called_once_with(
+            user_id, 0, 100, None
+        )
@@ -0,0 +1,235 @@
+"""Tests for project deletion service."""
+
+import contextlib
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.core.storage import StorageProvider
+from app.models.project import Project
+from app.repositories.project_deletion import ProjectDeletionRepository
+from app.schemas.project import ProjectDeletionStatus
+from app.services.exceptions import PermissionDeniedError, ProjectNotFoundError
+from app.services.project_deletion import ProjectDeletionService
+from app.services.upload import variant_storage_paths
+
+MODULE = "app.services.project_deletion"
+
+
+def _unused_files(*in_use: str) -> MagicMock:
+    """Mock unused_files() with the given paths stored again meanwhile."""
+
+    @contextlib.asynccontextmanager
+    async def unused_files(paths: list[str]) -> AsyncIterator[list[str]]:
+        yield [path for path in paths if path not in in_use]
+
+    return MagicMock(side_effect=unused_files)
+
+
+@pytest.fixture
+def mock_redis_state() -> Iterator[dict[str, AsyncMock]]:
+    """Patch the Redis-backed lock and progress helpers."""
+    with (
+        patch(
+            f"{MODULE}.acquire_project_deletion_lock",
+            new_callable=AsyncMock,
+            return_value=True,
+        ) as acquire,
+        patch(f"{MODULE}.refresh_project_deletion_lock", new_callable=AsyncMock),
+        patch(
+            f"{MODULE}.release_project_deletion_lock", new_callable=AsyncMock
+        ) as release,
+        patch(
+            f"{MODULE}.set_project_deletion_progress", new_callable=AsyncMock
+        ) as set_progress,
+        patch(
+            f"{MODULE}.get_project_deletion_progress",
+            new_callable=AsyncMock,
+            return_value={},
+        ) as get_progress,
+    ):
+        yield {
+            "acquire": acquire,
+            "release": release,
+            "set_progress": set_progress,
+            "get_progress": get_progress,
+        }
+
+
+class TestProjectDeletionServiceRun:
+    """Tests for ProjectDeletionService.run method."""
+
+    @pytest.fixture
+    def mock_deletion_repo(self) -> MagicMock:
+        """Create a mock deletion repository with two chunks of each table."""
+        repo = MagicMock(spec=ProjectDeletionRepository)
+        repo.delete_revisions_chunk = AsyncMock(side_effect=[2, 1, 0])
+        repo.delete_documents_chunk = AsyncMock(side_effect=[2, 0])
+        repo.delete_uploads_chunk = AsyncMock(
+            side_effect=[(3, ["2026/01/a.png", "2026/01/b.png"]), (0, [])]
+        )
+        repo.delete_batches_chunk = AsyncMock(side_effect=[1, 0])
+        repo.delete_project = AsyncMock()
+        repo.unused_files = _unused_files()
+        return repo
+
+    @pytest.fixture
+    def mock_storage(self) -> MagicMock:
+        """Create a mock storage provider."""
+        storage = MagicMock(spec=StorageProvider)
+        storage.delete_many = AsyncMock(return_value=[])
+        return storage
+
+    @pytest.mark.asyncio
+    async def test_run_deletes_in_chunks_and_reports_progress(
+        self,
+        mock_deletion_repo: MagicMock,
+        mock_storage: MagicMock,
+        mock_redis_state: dict[str, AsyncMock],
+    ) -> None:
+        """Test every table is drained chunk by chunk before the project row."""
+        project_id = uuid4()
+        service = ProjectDeletionService(mock_deletion_repo, mock_storage, 2)
+
+        await service.run(project_id)
+
+        assert mock_deletion_repo.delete_revisions_chunk.call_count == 3
+        mock_deletion_repo.delete_revisions_chunk.assert_called_with(project_id, 2)
+        mock_deletion_repo.delete_project.assert_called_once_with(project_id)
+        mock_storage.delete_many.assert_any_call(
+            [
+                "2026/01/a.png",
+                *variant_storage_paths("2026/01/a.png"),
+                "2026/01/b.png",
+                *variant_storage_paths("2026/01/b.png"),
+            ]
+        )
+
+        final = mock_redis_state["set_progress"].call_args.args[1]
+        assert final["status"] == ProjectDeletionStatus.COMPLETED.value
+        assert final["revisions_deleted"] == 3
+        assert final["documents_deleted"] == 2
+        assert final["uploads_deleted"] == 3
+        assert final["batches_deleted"] == 1
+        mock_redis_state["release"].assert_called_once_with(project_id)
+
+    @pytest.mark.asyncio
+    async def test_run_skips_when_already_locked(
+        self,
+        mock_deletion_repo: MagicMock,
+        mock_storage: MagicMock,
+        mock_redis_state: dict[str, AsyncMock],
+    ) -> None:
+        """Test a job held by another worker is not run twice."""
+        mock_redis_state["acquire"].return_value = False
+        service = ProjectDeletionService(mock_deletion_repo, mock_storage)
+
+        await service.run(uuid4())
+
+        mock_deletion_repo.delete_revisions_chunk.assert_not_called()
+        mock_redis_state["release"].assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_records_failure(
+        self,
+        mock_deletion_repo: MagicMock,
+        mock_storage: MagicMock,
+        mock_redis_state: dict[str, AsyncMock],
+    ) -> None:
+        """Test a failing chunk marks the job failed and keeps the project."""
+        mock_deletion_repo.delete_documents_chunk = AsyncMock(
+            side_effect=RuntimeError("lock timeout")
+        )
+        service = ProjectDeletionService(mock_deletion_repo, mock_storage)
+
+        await service.run(uuid4())
+
+        mock_deletion_repo.delete_project.assert_not_called()
+        final = mock_redis_state["set_progress"].call_args.args[1]
+        assert final["status"] == ProjectDeletionStatus.FAILED.value
+        assert final["phase"] == "documents"
+        mock_redis_state["release"].assert_called_once()
+
+
+class TestProjectDeletionServiceGetStatus:
+    """Tests for ProjectDeletionService.get_status method."""
+
+    @pytest.fixture
+    def mock_deletion_repo(self) -> MagicMock:
+        """Create a mock deletion repository."""
+        return MagicMock(spec=ProjectDeletionRepository)
+
+    @pytest.mark.asyncio
+    async def test_get_status_reports_progress(
+        self,
+        mock_deletion_repo: MagicMock,
+        mock_redis_state: dict[str, AsyncMock],
+    ) -> None:
+        """Test stored progress is returned to the owner."""
+        owner_id = uuid4()
+        project = MagicMock(spec=Project)
+        project.id = uuid4()
+        project.owner_id = owner_id
+        mock_deletion_repo.get_by_slug = AsyncMock(return_value=project)
+        mock_redis_state["get_progress"].return_value = {
+            "status": "running",
+            "phase": "documents",
+            "revisions_deleted": "120",
+            "documents_deleted": "40",
+        }
+        service = ProjectDeletionService(mock_deletion_repo, MagicMock())
+
+        result = await service.get_status("my-project", owner_id)
+
+        assert result.project_id == project.id
+        assert result.status == ProjectDeletionStatus.RUNNING
+        assert result.revisions_deleted == 120
+        assert result.uploads_deleted == 0
+
+    @pytest.mark.asyncio
+    async def test_get_status_pending_before_first_report(
+        self,
+        mock_deletion_repo: MagicMock,
+        mock_redis_state: dict[str, AsyncMock],
+    ) -> None:
+        """Test a job that has not reported yet is pending."""
+        owner_id = uuid4()
+        project = MagicMock(spec=Project)
+        project.id = uuid4()
+        project.owner_id = owner_id
+        mock_deletion_repo.get_by_slug = AsyncMock(return_value=project)
+        service = ProjectDeletionService(mock_deletion_repo, MagicMock())
+
+        result = await service.get_status("my-project", owner_id)
+
+        assert result.status == ProjectDeletionStatus.PENDING
+
+    @pytest.mark.asyncio
+    async def test_get_status_not_pending(
+        self,
+        mock_deletion_repo: MagicMock,
+        mock_redis_state: dict[str, AsyncMock],
+    ) -> None:
+        """Test unknown or fully deleted projects raise not found."""
+        mock_deletion_repo.get_by_slug = AsyncMock(return_value=None)
+        service = ProjectDeletionService(mock_deletion_repo, MagicMock())
+
+        with pytest.raises(ProjectNotFoundError):
+            await service.get_status("gone", uuid4())
+
+    @pytest.mark.asyncio
+    async def test_get_status_permission_denied(
+        self,
+        mock_deletion_repo: MagicMock,
+        mock_redis_state: dict[str, AsyncMock],
+    ) -> None:
+        """Test only the owner can see deletion progress."""
+        project = MagicMock(spec=Project)
+        project.owner_id = uuid4()
+        mock_deletion_repo.get_by_slug = AsyncMock(return_value=project)
+        service = ProjectDeletionService(mock_deletion_repo, MagicMock())
+
+        with pytest.raises(PermissionDeniedError):
+            await service.get_status("my-project", uuid4())
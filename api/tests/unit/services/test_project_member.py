@@ -1,9 +1,11 @@
 """Tests for project member service."""
 
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from pydantic import ValidationError
 
 from app.models.project import Project
 from app.models.project_member import MemberRole, ProjectMember
@@ -11,6 +13,11 @@ from app.models.user import User
 from app.repositories.project import ProjectRepository
 from app.repositories.project_member import ProjectMemberRepository
 from app.repositories.user import UserRepository
+from app.schemas.project_member import (
+    BulkInviteConflict,
+    BulkInviteOutcome,
+    ProjectMemberInvite,
+)
 from app.services import (
     CannotModifyOwnerError,
     CannotModifySelfError,
@@ -57,7 +64,9 @@ class TestProjectMemberServiceListMembers:
         mock_project.visibility = MagicMock()
         mock_project.visibility.value = "private"
 
-        project_repo.get_by_slug = AsyncMock(return_value=mock_project)
+        project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(mock_project, None)
+        )
 
         mock_member = MagicMock(spec=ProjectMember)
         mock_member.id = uuid4()
@@ -76,6 +85,34 @@ class TestProjectMemberServiceListMembers:
         assert len(result) == 1
         member_repo.get_members_by_project.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_list_members_forwards_search_and_cursor(
+        self,
+        service: ProjectMemberService,
+        mock_repos: tuple[MagicMock, MagicMock, MagicMock],
+    ) -> None:
+        """Test search text and keyset cursor are passed to the repository."""
+        member_repo, project_repo, _ = mock_repos
+        owner_id = uuid4()
+
+        mock_project = MagicMock(spec=Project)
+        mock_project.id = uuid4()
+        mock_project.owner_id = owner_id
+        project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(mock_project, None)
+        )
+        member_repo.get_members_by_project = AsyncMock(return_value=[])
+        cursor = (datetime(2026, 1, 1, tzinfo=UTC), uuid4())
+
+        result = await service.list_members(
+            "my-project", owner_id, limit=20, query="ali", cursor=cursor
+        )
+
+        assert result == []
+        member_repo.get_members_by_project.assert_called_once_with(
+            mock_project.id, skip=0, limit=20, query="ali", cursor=cursor
+        )
+
     @pytest.mark.asyncio
     async def test_list_members_project_not_found(
         self,
@@ -84,7 +121,7 @@ class TestProjectMemberServiceListMembers:
     ) -> None:
         """Test list members fails when project not found."""
         _, project_repo, _ = mock_repos
-        project_repo.get_by_slug = AsyncMock(return_value=None)
+        project_repo.get_by_slug_with_role = AsyncMock(return_value=None)
 
         with pytest.raises(ProjectNotFoundError):
             await service.list_members("nonexistent", uuid4())
@@ -125,9 +162,10 @@ class TestProjectMemberServiceAddMember:
         mock_project.visibility = MagicMock()
         mock_project.visibility.value = "private"
 
-        project_repo.get_by_slug = AsyncMock(return_value=mock_project)
+        project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(mock_project, None)
+        )
         user_repo.get_by_id = AsyncMock(return_value=MagicMock(spec=User))
-        member_repo.get_user_role = AsyncMock(return_value=None)
         member_repo.get_by_project_and_user = AsyncMock(return_value=None)
 
         mock_member = MagicMock(spec=ProjectMember)
@@ -159,8 +197,9 @@ class TestProjectMemberServiceAddMember:
         mock_project.visibility = MagicMock()
         mock_project.visibility.value = "private"
 
-        project_repo.get_by_slug = AsyncMock(return_value=mock_project)
-        member_repo.get_user_role = AsyncMock(return_value=MemberRole.VIEWER)
+        project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(mock_project, MemberRole.VIEWER)
+        )
 
         with pytest.raises(PermissionDeniedError):
             await service.add_member(
@@ -183,7 +222,9 @@ class TestProjectMemberServiceAddMember:
         mock_project.visibility = MagicMock()
         mock_project.visibility.value = "private"
 
-        project_repo.get_by_slug = AsyncMock(return_value=mock_project)
+        project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(mock_project, None)
+        )
         user_repo.get_by_id = AsyncMock(return_value=None)
 
         with pytest.raises(UserNotFoundError):
@@ -205,7 +246,9 @@ class TestProjectMemberServiceAddMember:
         mock_project.visibility = MagicMock()
         mock_project.visibility.value = "private"
 
-        project_repo.get_by_slug = AsyncMock(return_value=mock_project)
+        project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(mock_project, None)
+        )
         user_repo.get_by_id = AsyncMock(return_value=MagicMock(spec=User))
 
         with pytest.raises(CannotModifyOwnerError):
@@ -231,7 +274,9 @@ class TestProjectMemberServiceAddMember:
         existing_member = MagicMock(spec=ProjectMember)
         existing_member.role = MemberRole.VIEWER
 
-        project_repo.get_by_slug = AsyncMock(return_value=mock_project)
+        project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(mock_project, None)
+        )
         user_repo.get_by_id = AsyncMock(return_value=MagicMock(spec=User))
         member_repo.get_by_project_and_user = AsyncMock(return_value=existing_member)
 
@@ -241,6 +286,132 @@ class TestProjectMemberServiceAddMember:
             )
 
 
+class TestProjectMemberServiceAddMembersBulk:
+    """Tests for ProjectMemberService.add_members_bulk method."""
+
+    @pytest.fixture
+    def mock_repos(self) -> tuple[MagicMock, MagicMock, MagicMock]:
+        """Create mock repositories."""
+        member_repo = MagicMock(spec=ProjectMemberRepository)
+        project_repo = MagicMock(spec=ProjectRepository)
+        user_repo = MagicMock(spec=UserRepository)
+        return member_repo, project_repo, user_repo
+
+    @pytest.fixture
+    def service(
+        self, mock_repos: tuple[MagicMock, MagicMock, MagicMock]
+    ) -> ProjectMemberService:
+        """Create service with mock repositories."""
+        return ProjectMemberService(*mock_repos)
+
+    @staticmethod
+    def _user(email: str) -> MagicMock:
+        user = MagicMock(spec=User)
+        user.id = uuid4()
+        user.email = email
+        return user
+
+    @pytest.mark.asyncio
+    async def test_bulk_reports_outcome_per_invite(
+        self,
+        service: ProjectMemberService,
+        mock_repos: tuple[MagicMock, MagicMock, MagicMock],
+    ) -> None:
+        """Test each invite gets an outcome and users resolve in one call."""
+        member_repo, project_repo, user_repo = mock_repos
+        owner = self._user("owner@example.com")
+        new_user = self._user("new@example.com")
+        existing = self._user("existing@example.com")
+        promoted = self._user("promoted@example.com")
+
+        mock_project = MagicMock(spec=Project)
+        mock_project.id = uuid4()
+        mock_project.owner_id = owner.id
+        mock_project.visibility = MagicMock()
+        mock_project.visibility.value = "private"
+        project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(mock_project, None)
+        )
+        user_repo.get_by_ids_or_emails = AsyncMock(
+            return_value=[owner, new_user, existing, promoted]
+        )
+        new_member_id, promoted_member_id = uuid4(), uuid4()
+        member_repo.bulk_upsert = AsyncMock(
+            return_value={
+                new_user.id: (new_member_id, True),
+                promoted.id: (promoted_member_id, False),
+            }
+        )
+
+        invites = [
+            ProjectMemberInvite(email="new@example.com", role=MemberRole.EDITOR),
+            ProjectMemberInvite(user_id=existing.id),
+            ProjectMemberInvite(user_id=promoted.id, role=MemberRole.ADMIN),
+            ProjectMemberInvite(email="missing@example.com"),
+            ProjectMemberInvite(user_id=owner.id),
+            ProjectMemberInvite(user_id=new_user.id, role=MemberRole.VIEWER),
+        ]
+
+        results = await service.add_members_bulk(
+            "my-project", invites, BulkInviteConflict.UPDATE_ROLE, owner.id
+        )
+
+        assert [r.outcome for r in results] == [
+            BulkInviteOutcome.ADDED,
+            BulkInviteOutcome.ALREADY_MEMBER,
+            BulkInviteOutcome.ROLE_UPDATED,
+            BulkInviteOutcome.USER_NOT_FOUND,
+            BulkInviteOutcome.IS_OWNER,
+            BulkInviteOutcome.DUPLICATE,
+        ]
+        assert results[0].user_id == new_user.id
+        assert results[0].member_id == new_member_id
+        assert results[3].user_id is None
+        user_repo.get_by_ids_or_emails.assert_called_once()
+        member_repo.bulk_upsert.assert_called_once_with(
+            mock_project.id,
+            {
+                new_user.id: MemberRole.EDITOR,
+                existing.id: MemberRole.VIEWER,
+                promoted.id: MemberRole.ADMIN,
+            },
+            update_existing=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_bulk_permission_denied(
+        self,
+        service: ProjectMemberService,
+        mock_repos: tuple[MagicMock, MagicMock, MagicMock],
+    ) -> None:
+        """Test bulk invite requires manage_members permission."""
+        member_repo, project_repo, user_repo = mock_repos
+
+        mock_project = MagicMock(spec=Project)
+        mock_project.id = uuid4()
+        mock_project.owner_id = uuid4()
+        mock_project.visibility = MagicMock()
+        mock_project.visibility.value = "private"
+        project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(mock_project, MemberRole.EDITOR)
+        )
+
+        with pytest.raises(PermissionDeniedError):
+            await service.add_members_bulk(
+                "my-project",
+                [ProjectMemberInvite(user_id=uuid4())],
+                BulkInviteConflict.SKIP,
+                uuid4(),
+            )
+
+    def test_invite_requires_exactly_one_identifier(self) -> None:
+        """Test an invite must name a user by ID or email, not both."""
+        with pytest.raises(ValidationError):
+            ProjectMemberInvite()
+        with pytest.raises(ValidationError):
+            ProjectMemberInvite(user_id=uuid4(), email="a@example.com")
+
+
 class TestProjectMemberServiceUpdateRole:
     """Tests for ProjectMemberService.update_member_role method."""
 
@@ -282,7 +453,9 @@ class TestProjectMemberServiceUpdateRole:
         mock_member.user_id = member_user_id
         mock_member.role = MemberRole.VIEWER
 
-        project_repo.get_by_slug = AsyncMock(return_value=mock_project)
+        project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(mock_project, None)
+        )
         member_repo.get_by_id = AsyncMock(return_value=mock_member)
         member_repo.update_role = AsyncMock(return_value=mock_member)
 
@@ -308,7 +481,9 @@ class TestProjectMemberServiceUpdateRole:
         mock_project.visibility = MagicMock()
         mock_project.visibility.value = "private"
 
-        project_repo.get_by_slug = AsyncMock(return_value=mock_project)
+        project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(mock_project, None)
+        )
         member_repo.get_by_id = AsyncMock(return_value=None)
 
         with pytest.raises(MemberNotFoundError):
@@ -339,8 +514,9 @@ class TestProjectMemberServiceUpdateRole:
         mock_member.user_id = admin_id
         mock_member.role = MemberRole.ADMIN
 
-        project_repo.get_by_slug = AsyncMock(return_value=mock_project)
-        member_repo.get_user_role = AsyncMock(return_value=MemberRole.ADMIN)
+        project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(mock_project, MemberRole.ADMIN)
+        )
         member_repo.get_by_id = AsyncMock(return_value=mock_member)
 
         with pytest.raises(CannotModifySelfError):
@@ -388,7 +564,9 @@ class TestProjectMemberServiceRemoveMember:
         mock_member.project_id = mock_project.id
         mock_member.user_id = uuid4()
 
-        project_repo.get_by_slug = AsyncMock(return_value=mock_project)
+        project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(mock_project, None)
+        )
         member_repo.get_by_id = AsyncMock(return_value=mock_member)
         member_repo.delete = AsyncMock()
 
@@ -418,7 +596,9 @@ class TestProjectMemberServiceRemoveMember:
         mock_member.project_id = mock_project.id
         mock_member.user_id = member_user_id
 
-        project_repo.get_by_slug = AsyncMock(return_value=mock_project)
+        project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(mock_project, None)
+        )
         member_repo.get_by_id = AsyncMock(return_value=mock_member)
         member_repo.delete = AsyncMock()
 
@@ -450,9 +630,10 @@ class TestProjectMemberServiceRemoveMember:
         mock_member.project_id = mock_project.id
         mock_member.user_id = other_member_id
 
-        project_repo.get_by_slug = AsyncMock(return_value=mock_project)
+        project_repo.get_by_slug_with_role = AsyncMock(
+            return_value=(mock_project, MemberRole.VIEWER)
+        )
         member_repo.get_by_id = AsyncMock(return_value=mock_member)
-        member_repo.get_user_role = AsyncMock(return_value=MemberRole.VIEWER)
 
         with pytest.raises(PermissionDeniedError):
             await service.remove_member("my-project", mock_member.id, viewer_id)
@@ -0,0 +1,146 @@
+"""Tests for per-project storage usage and its reconciliation."""
+
+from collections.abc import Iterator
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+import pytest
+
+from app.repositories.storage_usage import StorageUsageRepository
+from app.services.storage_usage import (
+    StorageUsageService,
+    effective_storage_quota,
+    run_storage_reconciliation,
+)
+
+MODULE = "app.services.storage_usage"
+
+
+@pytest.fixture
+def mock_usage_repo() -> AsyncMock:
+    """Create a mock StorageUsageRepository."""
+    return AsyncMock(spec=StorageUsageRepository)
+
+
+@pytest.fixture
+def mock_locks() -> Iterator[dict[str, AsyncMock]]:
+    """Patch the Redis-backed reconciliation lock helpers."""
+    with (
+        patch(
+            f"{MODULE}.acquire_storage_reconcile_lock",
+            new_callable=AsyncMock,
+            return_value=True,
+        ) as acquire,
+        patch(f"{MODULE}.refresh_storage_reconcile_lock", new_callable=AsyncMock) as r,
+        patch(f"{MODULE}.release_storage_reconcile_lock", new_callable=AsyncMock) as rl,
+    ):
+        yield {"acquire": acquire, "refresh": r, "release": rl}
+
+
+class TestEffectiveStorageQuota:
+    """Tests for effective_storage_quota."""
+
+    @pytest.mark.parametrize(
+        ("project_quota", "default_quota", "expected"),
+        [
+            (None, 0, None),
+            (None, 500, 500),
+            (1000, 500, 1000),
+            (0, 500, None),
+        ],
+    )
+    def test_project_quota_overrides_default(
+        self, project_quota: int | None, default_quota: int, expected: int | None
+    ) -> None:
+        """Test a project's quota wins over the default and 0 is unlimited."""
+        with patch(f"{MODULE}.settings.project_storage_quota_bytes", default_quota):
+            assert effective_storage_quota(project_quota) == expected
+
+
+class TestStorageUsageService:
+    """Tests for StorageUsageService."""
+
+    @pytest.mark.asyncio
+    async def test_get_largest_projects(self, mock_usage_repo: AsyncMock) -> None:
+        """Test totals are summed and the effective quota is reported."""
+        mock_usage_repo.get_largest_projects.return_value = [
+            SimpleNamespace(
+                id=UUID(int=1),
+                slug="docs",
+                name="Docs",
+                upload_bytes=100,
+                document_bytes=20,
+                revision_bytes=3,
+                storage_quota_bytes=1000,
+            )
+        ]
+        service = StorageUsageService(mock_usage_repo)
+
+        (usage,) = await service.get_largest_projects(10)
+
+        mock_usage_repo.get_largest_projects.assert_called_once_with(10)
+        assert usage.slug == "docs"
+        assert usage.total_bytes == 123
+        assert usage.quota_bytes == 1000
+
+    @pytest.mark.asyncio
+    async def test_reconcile_walks_every_chunk(
+        self, mock_usage_repo: AsyncMock, mock_locks: dict[str, AsyncMock]
+    ) -> None:
+        """Test chunks are recounted in order until none are left."""
+        mock_usage_repo.reconcile_chunk.side_effect = [
+            (UUID(int=2), 1),
+            (UUID(int=4), 0),
+            (None, 0),
+        ]
+        service = StorageUsageService(mock_usage_repo, batch_size=2)
+
+        assert await service.reconcile() == 1
+
+        assert [c.args for c in mock_usage_repo.reconcile_chunk.call_args_list] == [
+            (None, 2),
+            (UUID(int=2), 2),
+            (UUID(int=4), 2),
+        ]
+        assert mock_locks["refresh"].call_count == 2
+
+
+class TestRunStorageReconciliation:
+    """Tests for run_storage_reconciliation."""
+
+    @pytest.mark.asyncio
+    async def test_skips_when_already_locked(
+        self, mock_locks: dict[str, AsyncMock]
+    ) -> None:
+        """Test a second worker does not start another recount."""
+        mock_locks["acquire"].return_value = False
+
+        with patch(f"{MODULE}.async_session_maker") as session_maker:
+            await run_storage_reconciliation()
+
+        session_maker.assert_not_called()
+        mock_locks["release"].assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_releases_lock_after_failure(
+        self, mock_locks: dict[str, AsyncMock]
+    ) -> None:
+        """Test the lock is released even when the recount fails."""
+        session = MagicMock()
+        session.__aenter__ = AsyncMock()
+        session.__aexit__ = AsyncMock(return_value=False)
+
+        with (
+            patch(f"{MODULE}.async_session_maker", return_value=session),
+            patch.object(
+                StorageUsageService,
+                "reconcile",
+                new_callable=AsyncMock,
+                side_effect=RuntimeError("boom"),
+            ),
+            pytest.raises(RuntimeError),
+        ):
+            await run_storage_reconciliation()
+
+        mock_locks["release"].assert_called_once()
@@ -1,27 +1,65 @@
 """Tests for UploadService."""
 
+import asyncio
+import contextlib
+import hashlib
 import io
+import logging
+import time
 import uuid
+from collections.abc import AsyncIterator, Iterator
 from datetime import UTC, datetime
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import UploadFile
+from starlette.datastructures import Headers
 
+from app.core.storage import LocalStorageProvider
+from app.core.upload_cache import UploadFileInfo
 from app.models.upload import Upload
+from app.schemas.upload import DirectUploadStatus
 from app.services.exceptions import (
+    DirectUploadNotFoundError,
+    DirectUploadStateError,
     FileTooLargeError,
+    ImageProcessingUnavailableError,
     InvalidFileTypeError,
+    InvalidVariantError,
     PermissionDeniedError,
+    StorageQuotaExceededError,
     UploadNotFoundError,
 )
-from app.services.upload import UploadService
+from app.services.image_processor import ProcessedImage
+from app.services.upload import (
+    UPLOAD_READ_CHUNK_SIZE,
+    UPLOAD_SNIFF_SIZE,
+    UploadService,
+    animation_storage_path,
+    variant_storage_path,
+    variant_storage_paths,
+)
+
+
+def _unused_files(*in_use: str) -> MagicMock:
+    """Mock unused_files() with the given paths stored again meanwhile."""
+
+    @contextlib.asynccontextmanager
+    async def unused_files(paths: list[str]) -> AsyncIterator[list[str]]:
+        yield [path for path in paths if path not in in_use]
+
+    return MagicMock(side_effect=unused_files)
 
 
 @pytest.fixture
 def mock_upload_repo() -> AsyncMock:
-    """Create a mock UploadRepository."""
-    return AsyncMock()
+    """Create a mock UploadRepository with no previously stored content."""
+    repo = AsyncMock()
+    repo.create_from_source.return_value = None
+    repo.get_project_storage.return_value = (0, None)
+    repo.unused_files = _unused_files()
+    return repo
 
 
 @pytest.fixture
@@ -29,6 +67,8 @@ def mock_storage() -> AsyncMock:
     """Create a mock StorageProvider."""
     storage = AsyncMock()
     storage.get_url = MagicMock(return_value="/api/v1/uploads/file/test/path")
+    storage.blob_path = MagicMock(return_value="blobs/ab/abc123.png")
+    storage.delete_many.return_value = []
     return storage
 
 
@@ -36,21 +76,48 @@ def mock_storage() -> AsyncMock:
 def mock_image_processor() -> MagicMock:
     """Create a mock ImageProcessor."""
     processor = MagicMock()
-    processor.process.return_value = (io.BytesIO(b"processed"), "image/png", 100)
+    processor.process_bytes.return_value = ProcessedImage(
+        content=b"processed",
+        mime_type="image/png",
+        size_bytes=100,
+        width=640,
+        height=480,
+        placeholder="data:image/webp;base64,AAAA",
+    )
     return processor
 
 
+@pytest.fixture
+def mock_image_pool() -> MagicMock:
+    """Create a mock ImageProcessingPool that runs jobs inline."""
+    pool = MagicMock()
+    pool.run = AsyncMock(side_effect=lambda fn, *args: fn(*args))
+    return pool
+
+
+@pytest.fixture
+def mock_file_cache() -> AsyncMock:
+    """Create a mock UploadFileCache that always misses."""
+    cache = AsyncMock()
+    cache.get.return_value = None
+    return cache
+
+
 @pytest.fixture
 def upload_service(
     mock_upload_repo: AsyncMock,
     mock_storage: AsyncMock,
     mock_image_processor: MagicMock,
+    mock_image_pool: MagicMock,
+    mock_file_cache: AsyncMock,
 ) -> UploadService:
     """Create an UploadService with mocked dependencies."""
     return UploadService(
         upload_repo=mock_upload_repo,
         storage=mock_storage,
         image_processor=mock_image_processor,
+        image_pool=mock_image_pool,
+        file_cache=mock_file_cache,
     )
 
 
@@ -74,15 +141,19 @@ def create_mock_upload_file(
     content: bytes = b"fake image data",
     filename: str = "test.png",
     content_type: str = "image/png",
-    size: int | None = None,
+    size: int | None = -1,
 ) -> UploadFile:
-    """Create a mock UploadFile."""
-    file = MagicMock(spec=UploadFile)
-    file.filename = filename
-    file.content_type = content_type
-    file.size = size or len(content)
-    file.read = AsyncMock(return_value=content)
-    return file
+    """Create an UploadFile over an in-memory buffer.
+
+    ``size`` defaults to the content length; pass None to simulate an
+    upload whose size is unknown up front.
+    """
+    return UploadFile(
+        file=io.BytesIO(content),
+        size=len(content) if size == -1 else size,
+        filename=filename,
+        headers=Headers({"content-type": content_type}),
+    )
 
 
 class TestUploadImage:
@@ -98,7 +169,7 @@ class TestUploadImage:
     ) -> None:
         """Test successful image upload."""
         mock_upload_repo.create.return_value = sample_upload
-        mock_storage.save.return_value = "2026/02/abc123_test.png"
+        mock_storage.save_blob.return_value = "blobs/ab/abc123.png"
 
         file = create_mock_upload_file()
         user_id = uuid.uuid4()
@@ -115,6 +186,112 @@ class TestUploadImage:
 
         assert result == sample_upload
         mock_upload_repo.create.assert_called_once()
+        kwargs = mock_upload_repo.create.call_args.kwargs
+        assert kwargs["storage_path"] == "blobs/ab/abc123.png"
+        assert kwargs["content_hash"] == hashlib.sha256(b"processed").hexdigest()
+        assert kwargs["source_hash"] == hashlib.sha256(b"fake image data").hexdigest()
+        assert (kwargs["width"], kwargs["height"]) == (640, 480)
+        assert kwargs["placeholder"] == "data:image/webp;base64,AAAA"
+        mock_upload_repo.lock_blob_files.assert_awaited_once_with(
+            ["blobs/ab/abc123.png"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_upload_image_reuses_identical_upload(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
+        mock_storage: AsyncMock,
+        mock_image_pool: MagicMock,
+        sample_upload: Upload,
+    ) -> None:
+        """Test re-uploading the same bytes skips processing and storage."""
+        mock_upload_repo.create_from_source.return_value = sample_upload
+        file = create_mock_upload_file()
+        user_id = uuid.uuid4()
+        project_id = uuid.uuid4()
+
+        with (
+            patch.object(upload_service, "_validate_mime_type", return_value=True),
+            patch("app.services.upload.settings") as mock_settings,
+        ):
+            mock_settings.upload_max_file_size = 10 * 1024 * 1024
+            mock_settings.upload_allowed_mime_types = ["image/png"]
+
+            result = await upload_service.upload_image(file, user_id, project_id)
+
+        assert result == sample_upload
+        mock_upload_repo.create_from_source.assert_called_once_with(
+            user_id=user_id,
+            project_id=project_id,
+            filename="test.png",
+            source_hash=hashlib.sha256(b"fake image data").hexdigest(),
+        )
+        mock_image_pool.run.assert_not_called()
+        mock_storage.save_blob.assert_not_called()
+        mock_upload_repo.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_upload_image_processes_in_pool(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        mock_image_processor: MagicMock,
+        mock_image_pool: MagicMock,
+        mock_upload_repo: AsyncMock,
+        sample_upload: Upload,
+    ) -> None:
+        """Test the image is sniffed from its head and processed in the pool."""
+        mock_upload_repo.create.return_value = sample_upload
+        mock_storage.save_blob.return_value = "blobs/ab/abc123.png"
+        content = b"x" * (300 * 1024)
+        file = create_mock_upload_file(content=content)
+
+        with (
+            patch.object(
+                upload_service, "_validate_mime_type", return_value=True
+            ) as validate,
+            patch("app.services.upload.settings") as mock_settings,
+        ):
+            mock_settings.upload_max_file_size = 10 * 1024 * 1024
+            mock_settings.upload_allowed_mime_types = ["image/png"]
+
+            await upload_service.upload_image(file, uuid.uuid4(), uuid.uuid4())
+
+        # Only the leading bytes are used for type detection
+        assert len(validate.call_args[0][0]) == UPLOAD_SNIFF_SIZE
+        # The whole file is processed in a pool slot
+        mock_image_pool.slot.assert_called_once()
+        mock_image_pool.run.assert_awaited_once_with(
+            mock_image_processor.process_bytes, content, "image/png"
+        )
+        assert mock_storage.save_blob.call_args[0][0] == b"processed"
+
+    @pytest.mark.asyncio
+    async def test_upload_image_pool_unavailable(
+        self,
+        upload_service: UploadService,
+        mock_image_pool: MagicMock,
+        mock_storage: AsyncMock,
+    ) -> None:
+        """Test a busy pool rejects the upload before anything is stored."""
+        mock_image_pool.slot.return_value.__aenter__.side_effect = (
+            ImageProcessingUnavailableError("busy")
+        )
+        file = create_mock_upload_file()
+
+        with (
+            patch.object(upload_service, "_validate_mime_type", return_value=True),
+            patch("app.services.upload.settings") as mock_settings,
+        ):
+            mock_settings.upload_max_file_size = 10 * 1024 * 1024
+            mock_settings.upload_allowed_mime_types = ["image/png"]
+
+            with pytest.raises(ImageProcessingUnavailableError):
+                await upload_service.upload_image(file, uuid.uuid4(), uuid.uuid4())
+
+        mock_image_pool.run.assert_not_called()
+        mock_storage.save_blob.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_upload_image_file_too_large_from_header(
@@ -139,12 +316,77 @@ class TestUploadImage:
         large_content = b"x" * (20 * 1024 * 1024)  # 20MB
         file = create_mock_upload_file(content=large_content, size=None)
 
-        with patch("app.services.upload.settings") as mock_settings:
+        with (
+            patch.object(upload_service, "_validate_mime_type", return_value=True),
+            patch("app.services.upload.settings") as mock_settings,
+        ):
             mock_settings.upload_max_file_size = 10 * 1024 * 1024
+            mock_settings.upload_allowed_mime_types = ["image/png"]
 
             with pytest.raises(FileTooLargeError):
                 await upload_service.upload_image(file, uuid.uuid4(), uuid.uuid4())
 
+        # Reading stopped at the first chunk past the limit
+        assert file.file.tell() < 10 * 1024 * 1024 + UPLOAD_READ_CHUNK_SIZE + 1
+
+    @pytest.mark.asyncio
+    async def test_upload_image_over_project_quota(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
+        mock_image_pool: MagicMock,
+    ) -> None:
+        """Test an upload that would exceed the project's quota is refused."""
+        project_id = uuid.uuid4()
+        mock_upload_repo.get_project_storage.return_value = (990, 1000)
+        file = create_mock_upload_file(content=b"x" * 20)
+
+        with (
+            patch.object(upload_service, "_validate_mime_type", return_value=True),
+            pytest.raises(StorageQuotaExceededError),
+        ):
+            await upload_service.upload_image(file, uuid.uuid4(), project_id)
+
+        mock_upload_repo.get_project_storage.assert_called_once_with(project_id)
+        mock_upload_repo.create_from_source.assert_not_called()
+        mock_image_pool.run.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("project_quota", "default_quota", "refused"),
+        [
+            (None, 1000, True),
+            (None, 0, False),
+            (0, 1000, False),
+            (5000, 1000, False),
+        ],
+    )
+    async def test_upload_image_quota_falls_back_to_default(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
+        project_quota: int | None,
+        default_quota: int,
+        refused: bool,
+    ) -> None:
+        """Test a project's own quota overrides the default, and 0 is unlimited."""
+        mock_upload_repo.get_project_storage.return_value = (990, project_quota)
+        file = create_mock_upload_file(content=b"x" * 20)
+
+        with (
+            patch.object(upload_service, "_validate_mime_type", return_value=True),
+            patch(
+                "app.services.storage_usage.settings.project_storage_quota_bytes",
+                default_quota,
+            ),
+        ):
+            if refused:
+                with pytest.raises(StorageQuotaExceededError):
+                    await upload_service.upload_image(file, uuid.uuid4(), uuid.uuid4())
+            else:
+                await upload_service.upload_image(file, uuid.uuid4(), uuid.uuid4())
+                mock_upload_repo.create.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_upload_image_invalid_mime_type(
         self,
@@ -181,104 +423,1579 @@ class TestUploadImage:
                 await upload_service.upload_image(file, uuid.uuid4(), uuid.uuid4())
 
 
-class TestGetUpload:
-    """Tests for get_upload method."""
+def direct_session(**fields: str) -> dict[str, str]:
+    """Build a direct upload session as stored in Redis."""
+    return {
+        "user_id": str(uuid.UUID(int=1)),
+        "project_id": str(uuid.UUID(int=2)),
+        "filename": "test.png",
+        "mime_type": "image/png",
+        "size_bytes": "15",
+        "storage_path": "incoming/token",
+        "expires_at": str(int(time.time()) + 900),
+        "status": "pending",
+        **fields,
+    }
+
+
+async def aiter_chunks(*chunks: bytes) -> AsyncIterator[bytes]:
+    """Yield chunks as an async iterator."""
+    for chunk in chunks:
+        yield chunk
+
+
+class TestDirectUpload:
+    """Tests for the direct upload flow."""
 
     @pytest.mark.asyncio
-    async def test_get_upload_success(
+    async def test_start_direct_upload_uses_receiver_without_upload_urls(
         self,
         upload_service: UploadService,
-        mock_upload_repo: AsyncMock,
-        sample_upload: Upload,
+        mock_storage: AsyncMock,
     ) -> None:
-        """Test successful upload retrieval."""
-        mock_upload_repo.get_by_id.return_value = sample_upload
+        """Test local storage sends the file to the API's receiver."""
+        mock_storage.get_upload_url = MagicMock(return_value=None)
+        user_id, project_id = uuid.uuid4(), uuid.uuid4()
+
+        with patch(
+            "app.services.upload.set_direct_upload", new_callable=AsyncMock
+        ) as set_session:
+            ticket = await upload_service.start_direct_upload(
+                user_id, project_id, "test.png", "image/png", 1024
+            )
+
+        assert ticket.upload_url == f"/api/v1/uploads/direct/{ticket.id}"
+        assert ticket.headers == {"Content-Type": "image/png"}
+        token, fields = set_session.call_args[0]
+        assert token == ticket.id
+        assert fields["user_id"] == str(user_id)
+        assert fields["storage_path"] == f"incoming/{ticket.id}"
+        assert fields["status"] == "pending"
+        mock_storage.get_upload_url.assert_called_once_with(
+            f"incoming/{ticket.id}", "image/png", 1024
+        )
 
-        result = await upload_service.get_upload(sample_upload.id)
+    @pytest.mark.asyncio
+    async def test_start_direct_upload_uses_storage_upload_url(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+    ) -> None:
+        """Test object storage receives the file directly."""
+        mock_storage.get_upload_url = MagicMock(
+            return_value="https://files.example.com/uploads/incoming/x?sig"
+        )
 
-        assert result == sample_upload
-        mock_upload_repo.get_by_id.assert_called_once_with(sample_upload.id)
+        with patch("app.services.upload.set_direct_upload", new_callable=AsyncMock):
+            ticket = await upload_service.start_direct_upload(
+                uuid.uuid4(), uuid.uuid4(), "test.png", "image/png", 1024
+            )
+
+        assert ticket.upload_url == "https://files.example.com/uploads/incoming/x?sig"
 
     @pytest.mark.asyncio
-    async def test_get_upload_not_found(
+    @pytest.mark.parametrize(
+        ("mime_type", "size_bytes", "error"),
+        [
+            ("image/png", 20 * 1024 * 1024, FileTooLargeError),
+            ("image/svg+xml", 1024, InvalidFileTypeError),
+        ],
+    )
+    async def test_start_direct_upload_rejects_declared_file(
+        self,
+        upload_service: UploadService,
+        mime_type: str,
+        size_bytes: int,
+        error: type[Exception],
+    ) -> None:
+        """Test files that would be refused are refused before sending."""
+        with (
+            patch(
+                "app.services.upload.set_direct_upload", new_callable=AsyncMock
+            ) as set_session,
+            pytest.raises(error),
+        ):
+            await upload_service.start_direct_upload(
+                uuid.uuid4(), uuid.uuid4(), "test.svg", mime_type, size_bytes
+            )
+
+        set_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_start_direct_upload_over_project_quota(
         self,
         upload_service: UploadService,
         mock_upload_repo: AsyncMock,
     ) -> None:
-        """Test get upload raises error when not found."""
-        mock_upload_repo.get_by_id.return_value = None
-        upload_id = uuid.uuid4()
+        """Test the declared size is checked against the project's quota."""
+        mock_upload_repo.get_project_storage.return_value = (900, 1000)
 
-        with pytest.raises(UploadNotFoundError, match=str(upload_id)):
-            await upload_service.get_upload(upload_id)
+        with (
+            patch(
+                "app.services.upload.set_direct_upload", new_callable=AsyncMock
+            ) as set_session,
+            pytest.raises(StorageQuotaExceededError),
+        ):
+            await upload_service.start_direct_upload(
+                uuid.uuid4(), uuid.uuid4(), "test.png", "image/png", 200
+            )
 
+        set_session.assert_not_called()
 
-class TestDeleteUpload:
-    """Tests for delete_upload method."""
+    @pytest.mark.asyncio
+    async def test_receive_direct_upload_streams_to_storage(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+    ) -> None:
+        """Test the body is handed to storage chunk by chunk."""
+        received = []
+
+        async def put_stream(path: str, chunks: AsyncIterator[bytes]) -> int:
+            received.extend([chunk async for chunk in chunks])
+            return sum(map(len, received))
+
+        mock_storage.put_stream.side_effect = put_stream
+
+        with patch(
+            "app.services.upload.get_direct_upload",
+            new_callable=AsyncMock,
+            return_value=direct_session(),
+        ):
+            await upload_service.receive_direct_upload(
+                "token", aiter_chunks(b"fake image", b" data")
+            )
+
+        assert mock_storage.put_stream.call_args[0][0] == "incoming/token"
+        assert received == [b"fake image", b" data"]
 
     @pytest.mark.asyncio
-    async def test_delete_upload_success(
+    async def test_receive_direct_upload_rejects_body_over_declared_size(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+    ) -> None:
+        """Test reading stops once the body exceeds the declared size."""
+
+        async def put_stream(path: str, chunks: AsyncIterator[bytes]) -> int:
+            return len(b"".join([chunk async for chunk in chunks]))
+
+        mock_storage.put_stream.side_effect = put_stream
+
+        with (
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=direct_session(size_bytes="10"),
+            ),
+            pytest.raises(FileTooLargeError),
+        ):
+            await upload_service.receive_direct_upload(
+                "token", aiter_chunks(b"fake image", b" data")
+            )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("session", "error"),
+        [
+            ({}, DirectUploadNotFoundError),
+            (direct_session(expires_at="0"), DirectUploadNotFoundError),
+            (direct_session(status="processing"), DirectUploadStateError),
+        ],
+    )
+    async def test_receive_direct_upload_rejected(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        session: dict[str, str],
+        error: type[Exception],
+    ) -> None:
+        """Test unknown, expired and completed uploads take no file."""
+        with (
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=session,
+            ),
+            pytest.raises(error),
+        ):
+            await upload_service.receive_direct_upload("token", aiter_chunks(b"x"))
+
+        mock_storage.put_stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_complete_direct_upload(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+    ) -> None:
+        """Test a fully received file is handed to processing."""
+        mock_storage.get_size.return_value = 15
+
+        with (
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=direct_session(),
+            ),
+            patch(
+                "app.services.upload.set_direct_upload", new_callable=AsyncMock
+            ) as set_session,
+        ):
+            result = await upload_service.complete_direct_upload(
+                "token", uuid.UUID(int=1)
+            )
+
+        assert result.status == DirectUploadStatus.PROCESSING
+        set_session.assert_awaited_once_with("token", {"status": "processing"})
+        mock_storage.move.assert_awaited_once_with(
+            "incoming/token", "incoming/token.sealed"
+        )
+        mock_storage.get_size.assert_awaited_once_with("incoming/token.sealed")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("size", [None, 10])
+    async def test_complete_direct_upload_file_not_received(
         self,
         upload_service: UploadService,
-        mock_upload_repo: AsyncMock,
         mock_storage: AsyncMock,
+        size: int | None,
+    ) -> None:
+        """Test completing before the whole file arrived is refused."""
+        mock_storage.get_size.return_value = size
+
+        with (
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=direct_session(),
+            ),
+            pytest.raises(DirectUploadStateError),
+        ):
+            await upload_service.complete_direct_upload("token", uuid.UUID(int=1))
+
+    @pytest.mark.asyncio
+    async def test_complete_direct_upload_other_user(
+        self,
+        upload_service: UploadService,
+    ) -> None:
+        """Test only the user who started an upload can complete it."""
+        with (
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=direct_session(),
+            ),
+            pytest.raises(PermissionDeniedError),
+        ):
+            await upload_service.complete_direct_upload("token", uuid.uuid4())
+
+    @pytest.mark.asyncio
+    async def test_get_direct_upload_status_completed(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
         sample_upload: Upload,
     ) -> None:
-        """Test successful upload deletion."""
+        """Test a completed upload reports the created upload."""
         mock_upload_repo.get_by_id.return_value = sample_upload
+        session = direct_session(status="completed", upload_id=str(sample_upload.id))
 
-        await upload_service.delete_upload(sample_upload.id, sample_upload.user_id)
+        with patch(
+            "app.services.upload.get_direct_upload",
+            new_callable=AsyncMock,
+            return_value=session,
+        ):
+            result = await upload_service.get_direct_upload_status(
+                "token", uuid.UUID(int=1)
+            )
 
-        mock_storage.delete.assert_called_once_with(sample_upload.storage_path)
-        mock_upload_repo.delete.assert_called_once_with(sample_upload)
+        assert result.status == DirectUploadStatus.COMPLETED
+        assert result.upload is not None
+        assert result.upload.id == sample_upload.id
 
     @pytest.mark.asyncio
-    async def test_delete_upload_not_owner(
+    async def test_finalize_direct_upload(
         self,
         upload_service: UploadService,
         mock_upload_repo: AsyncMock,
+        mock_storage: AsyncMock,
+        mock_image_pool: MagicMock,
+        mock_image_processor: MagicMock,
         sample_upload: Upload,
     ) -> None:
-        """Test delete upload fails when user is not owner."""
-        mock_upload_repo.get_by_id.return_value = sample_upload
-        other_user_id = uuid.uuid4()
+        """Test the received file is validated, processed and removed."""
+        mock_upload_repo.create.return_value = sample_upload
+        mock_storage.save_blob.return_value = "blobs/ab/abc123.png"
+        mock_storage.stream = MagicMock(
+            side_effect=lambda _: aiter_chunks(b"fake image", b" data")
+        )
 
-        with pytest.raises(PermissionDeniedError):
-            await upload_service.delete_upload(sample_upload.id, other_user_id)
+        with (
+            patch(
+                "app.services.upload.claim_direct_upload",
+                new_callable=AsyncMock,
+                return_value=True,
+            ),
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=direct_session(status="processing"),
+            ),
+            patch(
+                "app.services.upload.set_direct_upload", new_callable=AsyncMock
+            ) as set_session,
+            patch.object(upload_service, "_validate_mime_type", return_value=True),
+        ):
+            await upload_service.finalize_direct_upload("token")
+
+        mock_image_pool.run.assert_awaited_once_with(
+            mock_image_processor.process_bytes, b"fake image data", "image/png"
+        )
+        kwargs = mock_upload_repo.create.call_args.kwargs
+        assert kwargs["user_id"] == uuid.UUID(int=1)
+        assert kwargs["source_hash"] == hashlib.sha256(b"fake image data").hexdigest()
+        set_session.assert_awaited_once_with(
+            "token", {"status": "completed", "upload_id": str(sample_upload.id)}
+        )
+        mock_storage.stream.assert_called_with("incoming/token.sealed")
+        deleted = [c.args[0] for c in mock_storage.delete.await_args_list]
+        assert deleted == ["incoming/token.sealed", "incoming/token"]
 
     @pytest.mark.asyncio
-    async def test_delete_upload_not_found(
+    async def test_finalize_direct_upload_invalid_content(
         self,
         upload_service: UploadService,
         mock_upload_repo: AsyncMock,
+        mock_storage: AsyncMock,
     ) -> None:
-        """Test delete upload raises error when not found."""
-        mock_upload_repo.get_by_id.return_value = None
+        """Test content that does not match its type fails the upload."""
+        mock_storage.stream = MagicMock(return_value=aiter_chunks(b"not an image"))
 
-        with pytest.raises(UploadNotFoundError):
-            await upload_service.delete_upload(uuid.uuid4(), uuid.uuid4())
+        with (
+            patch(
+                "app.services.upload.claim_direct_upload",
+                new_callable=AsyncMock,
+                return_value=True,
+            ),
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=direct_session(status="processing"),
+            ),
+            patch(
+                "app.services.upload.set_direct_upload", new_callable=AsyncMock
+            ) as set_session,
+            patch.object(upload_service, "_validate_mime_type", return_value=False),
+        ):
+            await upload_service.finalize_direct_upload("token")
 
+        mock_upload_repo.create_from_source.assert_not_called()
+        fields = set_session.call_args[0][1]
+        assert fields["status"] == "failed"
+        assert "does not match" in fields["error"]
+        mock_storage.delete.assert_any_await("incoming/token.sealed")
 
-class TestGetFileContent:
-    """Tests for get_file_content method."""
+    @pytest.mark.asyncio
+    async def test_finalize_direct_upload_runs_once(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+    ) -> None:
+        """Test a job that loses the claim does nothing."""
+        with patch(
+            "app.services.upload.claim_direct_upload",
+            new_callable=AsyncMock,
+            return_value=False,
+        ):
+            await upload_service.finalize_direct_upload("token")
+
+        mock_storage.stream.assert_not_called()
+        mock_storage.delete.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_get_file_content_success(
+    async def test_finalize_direct_upload_session_gone(
         self,
         upload_service: UploadService,
-        mock_upload_repo: AsyncMock,
         mock_storage: AsyncMock,
-        sample_upload: Upload,
     ) -> None:
-        """Test successful file content retrieval."""
-        mock_upload_repo.get_by_id.return_value = sample_upload
-        mock_storage.get.return_value = b"file content"
+        """Test a session that expired after the claim is left to the sweep."""
+        with (
+            patch(
+                "app.services.upload.claim_direct_upload",
+                new_callable=AsyncMock,
+                return_value=True,
+            ),
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value={},
+            ),
+        ):
+            await upload_service.finalize_direct_upload("token")
 
-        content, mime_type = await upload_service.get_file_content(sample_upload.id)
+        mock_storage.stream.assert_not_called()
+        mock_storage.delete.assert_not_called()
 
-        assert content == b"file content"
-        assert mime_type == sample_upload.mime_type
-        mock_storage.get.assert_called_once_with(sample_upload.storage_path)
+
+@pytest.fixture
+def mock_expiry_index() -> Iterator[dict[str, AsyncMock]]:
+    """Patch the Redis helpers of the direct upload sweep."""
+    with (
+        patch(
+            "app.services.upload.get_expired_direct_uploads",
+            new_callable=AsyncMock,
+            return_value=["token"],
+        ) as get_expired,
+        patch(
+            "app.services.upload.expire_direct_upload", new_callable=AsyncMock
+        ) as expire,
+        patch(
+            "app.services.upload.get_direct_upload",
+            new_callable=AsyncMock,
+            return_value={},
+        ) as get_session,
+        patch(
+            "app.services.upload.remove_direct_upload_expiry", new_callable=AsyncMock
+        ) as remove,
+    ):
+        yield {
+            "get_expired": get_expired,
+            "expire": expire,
+            "get_session": get_session,
+            "remove": remove,
+        }
+
+
+class TestSweepExpiredDirectUploads:
+    """Tests for deleting the files of abandoned direct uploads."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("expired", [True, None])
+    async def test_abandoned_upload_files_deleted(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        mock_expiry_index: dict[str, AsyncMock],
+        expired: bool | None,
+    ) -> None:
+        """Test unfinished uploads lose their files, with or without session."""
+        mock_expiry_index["expire"].return_value = expired
+        mock_storage.get_size.return_value = None
+
+        assert await upload_service.sweep_expired_direct_uploads() == 1
+
+        cutoff = mock_expiry_index["get_expired"].call_args.args[0]
+        assert cutoff < time.time() - 3000
+        mock_expiry_index["expire"].assert_awaited_once_with(
+            "token", "failed", "Upload expired before it was completed"
+        )
+        mock_storage.delete.assert_any_await("incoming/token")
+        mock_storage.delete.assert_any_await("incoming/token.sealed")
+        mock_expiry_index["remove"].assert_awaited_once_with("token")
+
+    @pytest.mark.asyncio
+    async def test_abandoned_resumable_chunks_deleted(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        mock_expiry_index: dict[str, AsyncMock],
+    ) -> None:
+        """Test every stored chunk of an abandoned resumable upload goes."""
+        mock_expiry_index["expire"].return_value = None
+        chunks = {"incoming/token/000000": 8, "incoming/token/000001": 4}
+        mock_storage.get_size.side_effect = chunks.get
+
+        assert await upload_service.sweep_expired_direct_uploads() == 1
+
+        deleted = [c.args[0] for c in mock_storage.delete.await_args_list]
+        assert deleted == ["incoming/token", "incoming/token.sealed", *chunks]
+
+    @pytest.mark.asyncio
+    async def test_upload_being_finalised_is_kept(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        mock_expiry_index: dict[str, AsyncMock],
+    ) -> None:
+        """Test files are left to a finalisation still in progress."""
+        mock_expiry_index["expire"].return_value = False
+        mock_expiry_index["get_session"].return_value = direct_session(
+            status="processing", claimed="1"
+        )
+
+        assert await upload_service.sweep_expired_direct_uploads() == 0
+
+        mock_storage.delete.assert_not_called()
+        mock_expiry_index["remove"].assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_finalised_upload_leaves_index(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        mock_expiry_index: dict[str, AsyncMock],
+    ) -> None:
+        """Test finalised uploads are only dropped from the index."""
+        mock_expiry_index["expire"].return_value = False
+        mock_expiry_index["get_session"].return_value = direct_session(
+            status="completed", claimed="1"
+        )
+        mock_storage.get_size.return_value = None
+
+        assert await upload_service.sweep_expired_direct_uploads() == 0
+
+        mock_expiry_index["remove"].assert_awaited_once_with("token")
+
+
+def resumable_session(**fields: str) -> dict[str, str]:
+    """Build a resumable upload session as stored in Redis."""
+    return direct_session(**{"resumable": "1", "offset": "0", "parts": "0", **fields})
+
+
+async def collect_put_stream(path: str, chunks: AsyncIterator[bytes]) -> int:
+    """Consume a stream as storage would, returning its size."""
+    return len(b"".join([chunk async for chunk in chunks]))
+
+
+class TestResumableUpload:
+    """Tests for the resumable upload flow."""
+
+    @pytest.fixture
+    def chunk_lock(self) -> Iterator[tuple[AsyncMock, AsyncMock]]:
+        """Patch the chunk lock, which is free by default."""
+        with (
+            patch(
+                "app.services.upload.acquire_direct_upload_lock",
+                new_callable=AsyncMock,
+                return_value=True,
+            ) as acquire,
+            patch(
+                "app.services.upload.release_direct_upload_lock",
+                new_callable=AsyncMock,
+            ) as release,
+        ):
+            yield acquire, release
+
+    @pytest.mark.asyncio
+    async def test_start_resumable_upload(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+    ) -> None:
+        """Test resumable uploads are sent in chunks to the API."""
+        mock_storage.get_upload_url = MagicMock()
+
+        with patch(
+            "app.services.upload.set_direct_upload", new_callable=AsyncMock
+        ) as set_session:
+            ticket = await upload_service.start_direct_upload(
+                uuid.uuid4(), uuid.uuid4(), "test.png", "image/png", 1024, True
+            )
+
+        assert ticket.upload_url == f"/api/v1/uploads/resumable/{ticket.id}"
+        assert ticket.method == "PATCH"
+        assert ticket.headers == {"Content-Type": "application/offset+octet-stream"}
+        fields = set_session.call_args[0][1]
+        assert fields["resumable"] == 1
+        assert fields["offset"] == 0
+        assert fields["parts"] == 0
+        mock_storage.get_upload_url.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_append_chunk_stores_part(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        chunk_lock: tuple[AsyncMock, AsyncMock],
+    ) -> None:
+        """Test each chunk is stored as the next part and advances the offset."""
+        mock_storage.put_stream.side_effect = collect_put_stream
+
+        with (
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=resumable_session(offset="10", parts="2"),
+            ),
+            patch(
+                "app.services.upload.set_direct_upload", new_callable=AsyncMock
+            ) as set_session,
+        ):
+            offset = await upload_service.append_resumable_chunk(
+                "token", uuid.UUID(int=1), 10, aiter_chunks(b"da", b"ta")
+            )
+
+        assert offset == 14
+        assert mock_storage.put_stream.call_args[0][0] == "incoming/token/000002"
+        set_session.assert_awaited_once_with("token", {"offset": 14, "parts": 3})
+        chunk_lock[1].assert_awaited_once_with("token")
+
+    @pytest.mark.asyncio
+    async def test_append_chunk_offset_mismatch(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        chunk_lock: tuple[AsyncMock, AsyncMock],
+    ) -> None:
+        """Test a chunk at the wrong offset is refused without being read."""
+        with (
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=resumable_session(offset="10", parts="2"),
+            ),
+            pytest.raises(DirectUploadStateError, match="offset is 10"),
+        ):
+            await upload_service.append_resumable_chunk(
+                "token", uuid.UUID(int=1), 0, aiter_chunks(b"x")
+            )
+
+        mock_storage.put_stream.assert_not_called()
+        chunk_lock[1].assert_awaited_once_with("token")
+
+    @pytest.mark.asyncio
+    async def test_append_chunk_while_locked(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        chunk_lock: tuple[AsyncMock, AsyncMock],
+    ) -> None:
+        """Test two chunks of one upload cannot be stored at once."""
+        chunk_lock[0].return_value = False
+
+        with (
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=resumable_session(),
+            ),
+            pytest.raises(DirectUploadStateError, match="being sent"),
+        ):
+            await upload_service.append_resumable_chunk(
+                "token", uuid.UUID(int=1), 0, aiter_chunks(b"x")
+            )
+
+        mock_storage.put_stream.assert_not_called()
+        chunk_lock[1].assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("max_chunk_size", "offset"),
+        [(4, "0"), (1024, "12")],
+    )
+    async def test_append_chunk_too_large(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        chunk_lock: tuple[AsyncMock, AsyncMock],
+        max_chunk_size: int,
+        offset: str,
+    ) -> None:
+        """Test chunks over the chunk limit or past the file's end are refused."""
+        mock_storage.put_stream.side_effect = collect_put_stream
+
+        with (
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=resumable_session(offset=offset),
+            ),
+            patch(
+                "app.services.upload.set_direct_upload", new_callable=AsyncMock
+            ) as set_session,
+            patch(
+                "app.services.upload.settings.upload_resumable_max_chunk_size",
+                max_chunk_size,
+            ),
+            pytest.raises(FileTooLargeError),
+        ):
+            await upload_service.append_resumable_chunk(
+                "token", uuid.UUID(int=1), int(offset), aiter_chunks(b"fake", b"!")
+            )
+
+        set_session.assert_not_called()
+        chunk_lock[1].assert_awaited_once_with("token")
+
+    @pytest.mark.asyncio
+    async def test_append_empty_chunk(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        chunk_lock: tuple[AsyncMock, AsyncMock],
+    ) -> None:
+        """Test an empty chunk leaves no part behind."""
+        mock_storage.put_stream.side_effect = collect_put_stream
+
+        with (
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=resumable_session(offset="5", parts="1"),
+            ),
+            patch(
+                "app.services.upload.set_direct_upload", new_callable=AsyncMock
+            ) as set_session,
+        ):
+            offset = await upload_service.append_resumable_chunk(
+                "token", uuid.UUID(int=1), 5, aiter_chunks()
+            )
+
+        assert offset == 5
+        mock_storage.delete.assert_awaited_once_with("incoming/token/000001")
+        set_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("session", "user_id", "error"),
+        [
+            (direct_session(), uuid.UUID(int=1), DirectUploadNotFoundError),
+            (
+                resumable_session(expires_at="0"),
+                uuid.UUID(int=1),
+                DirectUploadNotFoundError,
+            ),
+            (resumable_session(), uuid.uuid4(), PermissionDeniedError),
+        ],
+    )
+    async def test_get_resumable_offset_rejected(
+        self,
+        upload_service: UploadService,
+        session: dict[str, str],
+        user_id: uuid.UUID,
+        error: type[Exception],
+    ) -> None:
+        """Test only the owner of a live resumable upload can query it."""
+        with (
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=session,
+            ),
+            pytest.raises(error),
+        ):
+            await upload_service.get_resumable_offset("token", user_id)
+
+    @pytest.mark.asyncio
+    async def test_receive_direct_upload_rejects_resumable(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+    ) -> None:
+        """Test a resumable upload cannot be sent in one PUT."""
+        with (
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=resumable_session(),
+            ),
+            pytest.raises(DirectUploadStateError),
+        ):
+            await upload_service.receive_direct_upload("token", aiter_chunks(b"x"))
+
+        mock_storage.put_stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("offset", "completes"), [("15", True), ("10", False)])
+    async def test_complete_checks_offset(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        offset: str,
+        completes: bool,
+    ) -> None:
+        """Test a resumable upload completes once every byte was received."""
+        with (
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=resumable_session(offset=offset, parts="2"),
+            ),
+            patch("app.services.upload.set_direct_upload", new_callable=AsyncMock),
+        ):
+            if completes:
+                result = await upload_service.complete_direct_upload(
+                    "token", uuid.UUID(int=1)
+                )
+                assert result.status == DirectUploadStatus.PROCESSING
+            else:
+                with pytest.raises(DirectUploadStateError):
+                    await upload_service.complete_direct_upload(
+                        "token", uuid.UUID(int=1)
+                    )
+
+        mock_storage.get_size.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_finalize_joins_parts(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
+        mock_storage: AsyncMock,
+        mock_image_pool: MagicMock,
+        mock_image_processor: MagicMock,
+        sample_upload: Upload,
+    ) -> None:
+        """Test the parts are read in order as one file, then removed."""
+        parts = {
+            "incoming/token/000000": b"fake image",
+            "incoming/token/000001": b" data",
+        }
+        mock_upload_repo.create.return_value = sample_upload
+        mock_storage.save_blob.return_value = "blobs/ab/abc123.png"
+        mock_storage.stream = MagicMock(side_effect=lambda p: aiter_chunks(parts[p]))
+
+        with (
+            patch(
+                "app.services.upload.claim_direct_upload",
+                new_callable=AsyncMock,
+                return_value=True,
+            ),
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=resumable_session(
+                    status="processing", offset="15", parts="2"
+                ),
+            ),
+            patch("app.services.upload.set_direct_upload", new_callable=AsyncMock),
+            patch.object(upload_service, "_validate_mime_type", return_value=True),
+        ):
+            await upload_service.finalize_direct_upload("token")
+
+        mock_image_pool.run.assert_awaited_once_with(
+            mock_image_processor.process_bytes, b"fake image data", "image/png"
+        )
+        # Parts are copied into one buffer, not joined
+        assert isinstance(mock_image_pool.run.call_args.args[1], bytearray)
+        mock_storage.get.assert_not_called()
+        kwargs = mock_upload_repo.create.call_args.kwargs
+        assert kwargs["source_hash"] == hashlib.sha256(b"fake image data").hexdigest()
+        assert [c.args[0] for c in mock_storage.delete.await_args_list] == list(parts)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("second_read", [b"fake image", b"fake image data!"])
+    async def test_finalize_rejects_file_resized_between_reads(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        mock_image_pool: MagicMock,
+        second_read: bytes,
+    ) -> None:
+        """Test a file that changes size after it was measured is not used."""
+        reads = iter([b"fake image data", second_read])
+        mock_storage.stream = MagicMock(side_effect=lambda _: aiter_chunks(next(reads)))
+
+        with (
+            patch(
+                "app.services.upload.claim_direct_upload",
+                new_callable=AsyncMock,
+                return_value=True,
+            ),
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=direct_session(status="processing"),
+            ),
+            patch(
+                "app.services.upload.set_direct_upload", new_callable=AsyncMock
+            ) as set_session,
+            patch.object(upload_service, "_validate_mime_type", return_value=True),
+        ):
+            await upload_service.finalize_direct_upload("token")
+
+        mock_image_pool.run.assert_not_called()
+        fields = set_session.call_args[0][1]
+        assert fields == {
+            "status": "failed",
+            "error": "File changed while it was being read",
+        }
+
+    @pytest.mark.asyncio
+    async def test_finalize_rejects_file_swapped_between_reads(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
+        mock_storage: AsyncMock,
+        mock_image_pool: MagicMock,
+    ) -> None:
+        """Test content other than what was hashed is never processed."""
+        reads = iter([b"fake image data", b"evil image data"])
+        mock_storage.stream = MagicMock(side_effect=lambda _: aiter_chunks(next(reads)))
+
+        with (
+            patch(
+                "app.services.upload.claim_direct_upload",
+                new_callable=AsyncMock,
+                return_value=True,
+            ),
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=direct_session(status="processing"),
+            ),
+            patch(
+                "app.services.upload.set_direct_upload", new_callable=AsyncMock
+            ) as set_session,
+            patch.object(upload_service, "_validate_mime_type", return_value=True),
+        ):
+            await upload_service.finalize_direct_upload("token")
+
+        mock_image_pool.run.assert_not_called()
+        mock_upload_repo.create.assert_not_called()
+        assert set_session.call_args[0][1]["status"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_file_replaced_after_complete_is_not_processed(
+        self,
+        mock_upload_repo: AsyncMock,
+        mock_image_processor: MagicMock,
+        mock_image_pool: MagicMock,
+        mock_file_cache: AsyncMock,
+        sample_upload: Upload,
+        tmp_path: Path,
+    ) -> None:
+        """Test a PUT landing between complete and finalize changes nothing."""
+        storage = LocalStorageProvider(str(tmp_path))
+        upload_service = UploadService(
+            upload_repo=mock_upload_repo,
+            storage=storage,
+            image_processor=mock_image_processor,
+            image_pool=mock_image_pool,
+            file_cache=mock_file_cache,
+        )
+        mock_upload_repo.create.return_value = sample_upload
+        session = direct_session()
+
+        async def set_session(token: str, fields: dict[str, object]) -> None:
+            session.update({key: str(value) for key, value in fields.items()})
+
+        await storage.put("incoming/token", b"fake image data")
+        with (
+            patch(
+                "app.services.upload.claim_direct_upload",
+                new_callable=AsyncMock,
+                return_value=True,
+            ),
+            patch(
+                "app.services.upload.get_direct_upload",
+                new_callable=AsyncMock,
+                return_value=session,
+            ),
+            patch("app.services.upload.set_direct_upload", side_effect=set_session),
+            patch.object(upload_service, "_validate_mime_type", return_value=True),
+        ):
+            await upload_service.complete_direct_upload("token", uuid.UUID(int=1))
+            await storage.put("incoming/token", b"evil image data")
+            await upload_service.finalize_direct_upload("token")
+
+        assert session["status"] == "completed"
+        mock_image_pool.run.assert_awaited_once_with(
+            mock_image_processor.process_bytes, b"fake image data", "image/png"
+        )
+        kwargs = mock_upload_repo.create.call_args.kwargs
+        assert kwargs["source_hash"] == hashlib.sha256(b"fake image data").hexdigest()
+        assert list((tmp_path / "incoming").iterdir()) == []
+
+
+class TestGetUpload:
+    """Tests for get_upload method."""
+
+    @pytest.mark.asyncio
+    async def test_get_upload_success(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
+        sample_upload: Upload,
+    ) -> None:
+        """Test successful upload retrieval."""
+        mock_upload_repo.get_by_id.return_value = sample_upload
+
+        result = await upload_service.get_upload(sample_upload.id)
+
+        assert result == sample_upload
+        mock_upload_repo.get_by_id.assert_called_once_with(sample_upload.id)
+
+    @pytest.mark.asyncio
+    async def test_get_upload_not_found(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
+    ) -> None:
+        """Test get upload raises error when not found."""
+        mock_upload_repo.get_by_id.return_value = None
+        upload_id = uuid.uuid4()
+
+        with pytest.raises(UploadNotFoundError, match=str(upload_id)):
+            await upload_service.get_upload(upload_id)
+
+
+class TestDeleteUpload:
+    """Tests for delete_upload method."""
+
+    @pytest.mark.asyncio
+    async def test_delete_upload_success(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
+        mock_storage: AsyncMock,
+        mock_file_cache: AsyncMock,
+        sample_upload: Upload,
+    ) -> None:
+        """Test successful upload deletion."""
+        mock_upload_repo.get_by_id.return_value = sample_upload
+        mock_upload_repo.delete.return_value = sample_upload.storage_path
+
+        await upload_service.delete_upload(sample_upload.id, sample_upload.user_id)
+
+        mock_upload_repo.delete.assert_called_once_with(sample_upload)
+        mock_storage.delete_many.assert_awaited_once_with(
+            [
+                sample_upload.storage_path,
+                *variant_storage_paths(sample_upload.storage_path),
+            ]
+        )
+        mock_file_cache.invalidate.assert_called_once_with(sample_upload.storage_path)
+
+    @pytest.mark.asyncio
+    async def test_delete_upload_keeps_shared_file(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
+        mock_storage: AsyncMock,
+        mock_file_cache: AsyncMock,
+        sample_upload: Upload,
+    ) -> None:
+        """Test a file still referenced by other uploads is kept."""
+        mock_upload_repo.get_by_id.return_value = sample_upload
+        mock_upload_repo.delete.return_value = None
+
+        await upload_service.delete_upload(sample_upload.id, sample_upload.user_id)
+
+        mock_upload_repo.delete.assert_called_once_with(sample_upload)
+        mock_storage.delete_many.assert_not_called()
+        mock_file_cache.invalidate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_upload_keeps_file_stored_again(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
+        mock_storage: AsyncMock,
+        sample_upload: Upload,
+    ) -> None:
+        """Test a file uploaded again after its blob was released is kept."""
+        mock_upload_repo.get_by_id.return_value = sample_upload
+        mock_upload_repo.delete.return_value = sample_upload.storage_path
+        mock_upload_repo.unused_files = _unused_files(sample_upload.storage_path)
+
+        await upload_service.delete_upload(sample_upload.id, sample_upload.user_id)
+
+        mock_upload_repo.unused_files.assert_called_once_with(
+            [sample_upload.storage_path]
+        )
+        mock_storage.delete_many.assert_awaited_once_with([])
+
+    @pytest.mark.asyncio
+    async def test_delete_upload_logs_files_left(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
+        mock_storage: AsyncMock,
+        mock_file_cache: AsyncMock,
+        sample_upload: Upload,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test files storage could not delete are logged."""
+        mock_upload_repo.get_by_id.return_value = sample_upload
+        mock_upload_repo.delete.return_value = sample_upload.storage_path
+        mock_storage.delete_many.return_value = [sample_upload.storage_path]
+
+        with caplog.at_level(logging.WARNING, logger="app.services.upload"):
+            await upload_service.delete_upload(sample_upload.id, sample_upload.user_id)
+
+        assert f"Deletion of upload {sample_upload.id} left 1 files" in caplog.text
+        mock_file_cache.invalidate.assert_called_once_with(sample_upload.storage_path)
+
+    @pytest.mark.asyncio
+    async def test_delete_upload_not_owner(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
+        sample_upload: Upload,
+    ) -> None:
+        """Test delete upload fails when user is not owner."""
+        mock_upload_repo.get_by_id.return_value = sample_upload
+        other_user_id = uuid.uuid4()
+
+        with pytest.raises(PermissionDeniedError):
+            await upload_service.delete_upload(sample_upload.id, other_user_id)
+
+    @pytest.mark.asyncio
+    async def test_delete_upload_not_found(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
+    ) -> None:
+        """Test delete upload raises error when not found."""
+        mock_upload_repo.get_by_id.return_value = None
+
+        with pytest.raises(UploadNotFoundError):
+            await upload_service.delete_upload(uuid.uuid4(), uuid.uuid4())
+
+
+class TestGetFileContent:
+    """Tests for get_file_content method."""
+
+    @pytest.mark.asyncio
+    async def test_get_file_content_success(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
+        mock_storage: AsyncMock,
+        sample_upload: Upload,
+    ) -> None:
+        """Test successful file content retrieval."""
+        mock_upload_repo.get_by_id.return_value = sample_upload
+        mock_storage.get.return_value = b"file content"
+
+        content, mime_type = await upload_service.get_file_content(sample_upload.id)
+
+        assert content == b"file content"
+        assert mime_type == sample_upload.mime_type
+        mock_storage.get.assert_called_once_with(sample_upload.storage_path)
+
+
+class TestGetFileInfo:
+    """Tests for get_file_info method."""
+
+    @pytest.mark.asyncio
+    async def test_get_file_info_cache_miss(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
+        mock_file_cache: AsyncMock,
+        sample_upload: Upload,
+    ) -> None:
+        """Test a miss loads the upload and fills the cache."""
+        mock_upload_repo.get_by_storage_path.return_value = sample_upload
+
+        info = await upload_service.get_file_info(sample_upload.storage_path)
+
+        assert info == UploadFileInfo(
+            storage_path=sample_upload.storage_path,
+            mime_type=sample_upload.mime_type,
+            size_bytes=sample_upload.size_bytes,
+            etag=f'"{sample_upload.id.hex}"',
+            last_modified=sample_upload.created_at,
+        )
+        mock_file_cache.set.assert_called_once_with(info)
+
+    @pytest.mark.asyncio
+    async def test_get_file_info_cache_hit(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
+        mock_file_cache: AsyncMock,
+    ) -> None:
+        """Test a hit does not touch the database."""
+        cached = UploadFileInfo(
+            storage_path="2026/02/abc123_test.png",
+            mime_type="image/png",
+            size_bytes=1024,
+            etag='"abc"',
+            last_modified=datetime.now(UTC),
+        )
+        mock_file_cache.get.return_value = cached
+
+        info = await upload_service.get_file_info(cached.storage_path)
+
+        assert info is cached
+        mock_upload_repo.get_by_storage_path.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_file_info_not_found(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
+        mock_file_cache: AsyncMock,
+    ) -> None:
+        """Test unknown path raises and is not cached."""
+        mock_upload_repo.get_by_storage_path.return_value = None
+
+        with pytest.raises(UploadNotFoundError):
+            await upload_service.get_file_info("missing.png")
+
+        mock_file_cache.set.assert_not_called()
+
+
+class TestGetVariant:
+    """Tests for get_variant method."""
+
+    @pytest.fixture
+    def cached_info(self, mock_file_cache: AsyncMock) -> UploadFileInfo:
+        """Cache the metadata of a stored PNG."""
+        info = UploadFileInfo(
+            storage_path="blobs/ab/abc.png",
+            mime_type="image/png",
+            size_bytes=1024,
+            etag='"abc"',
+            last_modified=datetime.now(UTC),
+        )
+        mock_file_cache.get.return_value = info
+        return info
+
+    @pytest.mark.asyncio
+    async def test_get_variant_generates_on_first_request(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        mock_image_processor: MagicMock,
+        mock_image_pool: MagicMock,
+        cached_info: UploadFileInfo,
+    ) -> None:
+        """Test a missing variant is generated in the pool and stored."""
+        mock_storage.get_size.return_value = None
+        mock_storage.get.return_value = b"original"
+        mock_image_processor.create_variant.return_value = (
+            b"variant",
+            "image/webp",
+            7,
+        )
+
+        info = await upload_service.get_variant(
+            cached_info.storage_path, 640, "image/avif;q=0,image/webp,*/*"
+        )
+
+        path = variant_storage_path(cached_info.storage_path, 640, "image/webp")
+        assert path == "variants/blobs/ab/abc/640.webp"
+        assert info.storage_path == path
+        assert info.mime_type == "image/webp"
+        assert info.size_bytes == 7
+        assert info.etag == '"abc-640-webp"'
+        mock_image_pool.run.assert_awaited_once_with(
+            mock_image_processor.create_variant, b"original", 640, "image/webp"
+        )
+        mock_storage.put.assert_called_once_with(path, b"variant")
+
+    @pytest.mark.asyncio
+    async def test_get_variant_reuses_stored_variant(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        mock_image_pool: MagicMock,
+        cached_info: UploadFileInfo,
+    ) -> None:
+        """Test an existing variant is served without reprocessing."""
+        mock_storage.get_size.return_value = 512
+
+        info = await upload_service.get_variant(
+            cached_info.storage_path, 320, "image/avif,image/webp"
+        )
+
+        assert info.mime_type == "image/avif"
+        assert info.size_bytes == 512
+        mock_image_pool.run.assert_not_called()
+        mock_storage.put.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_variant_falls_back_without_avif_support(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        cached_info: UploadFileInfo,
+    ) -> None:
+        """Test WebP is served to AVIF clients when Pillow cannot encode AVIF."""
+        mock_storage.get_size.return_value = 512
+
+        with patch("app.services.upload.VARIANT_PREFERRED_TYPES", ("image/webp",)):
+            info = await upload_service.get_variant(
+                cached_info.storage_path, 320, "image/avif,image/webp"
+            )
+
+        assert info.mime_type == "image/webp"
+
+    @pytest.mark.asyncio
+    async def test_get_variant_concurrent_requests_share_job(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        mock_image_processor: MagicMock,
+        mock_image_pool: MagicMock,
+        cached_info: UploadFileInfo,
+    ) -> None:
+        """Test concurrent first requests generate the variant once."""
+        mock_storage.get_size.return_value = None
+        mock_image_processor.create_variant.return_value = (b"v", "image/png", 1)
+
+        results = await asyncio.gather(
+            *(
+                upload_service.get_variant(cached_info.storage_path, 1280, "")
+                for _ in range(5)
+            )
+        )
+
+        assert {r.storage_path for r in results} == {
+            variant_storage_path(cached_info.storage_path, 1280, "image/png")
+        }
+        mock_image_pool.run.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("source_mime", "expected"),
+        [("image/png", "image/png"), ("image/webp", "image/jpeg")],
+    )
+    async def test_get_variant_fallback_type(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        cached_info: UploadFileInfo,
+        mock_file_cache: AsyncMock,
+        source_mime: str,
+        expected: str,
+    ) -> None:
+        """Test clients without AVIF/WebP get PNG for PNGs, else JPEG."""
+        mock_file_cache.get.return_value = UploadFileInfo(
+            **{**cached_info.__dict__, "mime_type": source_mime}
+        )
+        mock_storage.get_size.return_value = 100
+
+        info = await upload_service.get_variant(
+            cached_info.storage_path, 320, "image/*,*/*;q=0.8"
+        )
+
+        assert info.mime_type == expected
+
+    @pytest.mark.asyncio
+    async def test_get_variant_gif_serves_original(
+        self,
+        upload_service: UploadService,
+        mock_file_cache: AsyncMock,
+        cached_info: UploadFileInfo,
+    ) -> None:
+        """Test GIFs have no variants."""
+        gif = UploadFileInfo(**{**cached_info.__dict__, "mime_type": "image/gif"})
+        mock_file_cache.get.return_value = gif
+
+        assert await upload_service.get_variant(gif.storage_path, 320, "") is gif
+
+    @pytest.mark.asyncio
+    async def test_get_variant_gif_serves_animation(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        mock_file_cache: AsyncMock,
+        cached_info: UploadFileInfo,
+    ) -> None:
+        """Test GIF variants fall back to the full-size animated WebP."""
+        gif = UploadFileInfo(**{**cached_info.__dict__, "mime_type": "image/gif"})
+        mock_file_cache.get.return_value = gif
+        mock_storage.get_size.return_value = 300
+
+        info = await upload_service.get_variant(gif.storage_path, 320, "image/webp")
+
+        assert info.storage_path == animation_storage_path(
+            gif.storage_path, "image/webp"
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_variant_rejects_unknown_width(
+        self,
+        upload_service: UploadService,
+    ) -> None:
+        """Test widths outside the configured set are rejected."""
+        with pytest.raises(InvalidVariantError):
+            await upload_service.get_variant("blobs/ab/abc.png", 333, "")
+
+
+class TestGetAnimation:
+    """Tests for get_animation method."""
+
+    @pytest.fixture
+    def cached_gif(self, mock_file_cache: AsyncMock) -> UploadFileInfo:
+        """Cache the metadata of a stored GIF."""
+        info = UploadFileInfo(
+            storage_path="blobs/ab/abc.gif",
+            mime_type="image/gif",
+            size_bytes=4096,
+            etag='"abc"',
+            last_modified=datetime.now(UTC),
+        )
+        mock_file_cache.get.return_value = info
+        return info
+
+    @pytest.mark.asyncio
+    async def test_get_animation_transcodes_to_webp(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        mock_image_processor: MagicMock,
+        mock_image_pool: MagicMock,
+        cached_gif: UploadFileInfo,
+    ) -> None:
+        """Test GIFs are served as animated WebP when accepted."""
+        mock_storage.get_size.return_value = None
+        mock_storage.get.return_value = b"gif"
+        mock_image_processor.transcode_animation.return_value = (
+            b"webp",
+            "image/webp",
+            1024,
+        )
+
+        info = await upload_service.get_animation(
+            cached_gif.storage_path, "image/webp,*/*"
+        )
+
+        path = animation_storage_path(cached_gif.storage_path, "image/webp")
+        assert path == "variants/blobs/ab/abc/animated.webp"
+        assert info.storage_path == path
+        assert info.mime_type == "image/webp"
+        assert info.size_bytes == 1024
+        assert info.etag == '"abc-animated-webp"'
+        mock_image_pool.run.assert_awaited_once_with(
+            mock_image_processor.transcode_animation, b"gif", "image/webp"
+        )
+        mock_storage.put.assert_called_once_with(path, b"webp")
+
+    @pytest.mark.asyncio
+    async def test_get_animation_without_webp_serves_original(
+        self,
+        upload_service: UploadService,
+        mock_image_pool: MagicMock,
+        cached_gif: UploadFileInfo,
+    ) -> None:
+        """Test clients without WebP support get the GIF."""
+        info = await upload_service.get_animation(
+            cached_gif.storage_path, "image/png,image/*;q=0.8"
+        )
+
+        assert info is cached_gif
+        mock_image_pool.run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_animation_larger_transcode_serves_original(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        cached_gif: UploadFileInfo,
+    ) -> None:
+        """Test a transcode that saves nothing is not served."""
+        mock_storage.get_size.return_value = cached_gif.size_bytes
+
+        info = await upload_service.get_animation(cached_gif.storage_path, "image/webp")
+
+        assert info is cached_gif
+
+    @pytest.mark.asyncio
+    async def test_get_animation_failed_transcode_serves_original(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        mock_image_processor: MagicMock,
+        cached_gif: UploadFileInfo,
+    ) -> None:
+        """Test the GIF is served when it cannot be transcoded."""
+        mock_storage.get_size.return_value = None
+        mock_image_processor.transcode_animation.side_effect = InvalidFileTypeError(
+            "ffmpeg failed"
+        )
+
+        info = await upload_service.get_animation(
+            cached_gif.storage_path, "", video="mp4"
+        )
+
+        assert info is cached_gif
+        mock_storage.put.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_animation_video(
+        self,
+        upload_service: UploadService,
+        mock_storage: AsyncMock,
+        mock_image_processor: MagicMock,
+        cached_gif: UploadFileInfo,
+    ) -> None:
+        """Test video is served when requested and ffmpeg is available."""
+        mock_image_processor.video_available.return_value = True
+        mock_storage.get_size.return_value = 512
+
+        info = await upload_service.get_animation(
+            cached_gif.storage_path, "", video="webm"
+        )
+
+        assert info.storage_path == "variants/blobs/ab/abc/animated.webm"
+        assert info.mime_type == "video/webm"
+        assert info.etag == '"abc-animated-webm"'
+
+    @pytest.mark.asyncio
+    async def test_get_animation_video_unavailable(
+        self,
+        upload_service: UploadService,
+        mock_image_processor: MagicMock,
+        mock_image_pool: MagicMock,
+        cached_gif: UploadFileInfo,
+    ) -> None:
+        """Test the GIF is served when no video encoder is available."""
+        mock_image_processor.video_available.return_value = False
+
+        info = await upload_service.get_animation(
+            cached_gif.storage_path, "", video="mp4"
+        )
+
+        assert info is cached_gif
+        mock_image_pool.run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_animation_disabled(
+        self,
+        upload_service: UploadService,
+        mock_image_pool: MagicMock,
+        cached_gif: UploadFileInfo,
+    ) -> None:
+        """Test transcoding can be turned off."""
+        with patch("app.services.upload.settings.upload_gif_transcode", False):
+            info = await upload_service.get_animation(
+                cached_gif.storage_path, "image/webp"
+            )
+
+        assert info is cached_gif
+        mock_image_pool.run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_animation_other_images_as_is(
+        self,
+        upload_service: UploadService,
+        mock_file_cache: AsyncMock,
+        mock_image_pool: MagicMock,
+        cached_gif: UploadFileInfo,
+    ) -> None:
+        """Test non-GIF images are returned unchanged."""
+        png = UploadFileInfo(**{**cached_gif.__dict__, "mime_type": "image/png"})
+        mock_file_cache.get.return_value = png
+
+        info = await upload_service.get_animation(png.storage_path, "image/webp")
+
+        assert info is png
+        mock_image_pool.run.assert_not_called()
+
+
+class TestGetStorageStats:
+    """Tests for get_storage_stats method."""
+
+    @pytest.mark.asyncio
+    async def test_get_storage_stats(
+        self,
+        upload_service: UploadService,
+        mock_upload_repo: AsyncMock,
+    ) -> None:
+        """Test saved bytes are uploaded minus stored bytes."""
+        mock_upload_repo.get_storage_stats.return_value = (10, 4, 5000, 2000)
+
+        stats = await upload_service.get_storage_stats()
+
+        assert stats.upload_count == 10
+        assert stats.blob_count == 4
+        assert stats.saved_bytes == 3000
 
 
 class TestValidateMimeType:
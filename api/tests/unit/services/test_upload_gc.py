@@ -0,0 +1,378 @@
+"""Tests for the orphaned upload collector."""
+
+import contextlib
+import json
+import logging
+from collections.abc import AsyncIterator, Iterator
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+import httpx
+import pytest
+
+from app.core.storage import S3StorageProvider, StorageProvider
+from app.core.upload_cache import UploadFileCache
+from app.repositories.upload_gc import UploadGCRepository
+from app.schemas.upload import UploadGCStatus
+from app.services.upload import variant_storage_paths
+from app.services.upload_gc import UploadGCService, extract_upload_references
+
+MODULE = "app.services.upload_gc"
+
+
+def _upload(n: int, storage_path: str, size_bytes: int = 10) -> SimpleNamespace:
+    """Build an upload row as returned by get_uploads_chunk()."""
+    return SimpleNamespace(
+        id=UUID(int=n), storage_path=storage_path, size_bytes=size_bytes
+    )
+
+
+def _contents(*contents: str) -> MagicMock:
+    """Mock a content stream that can be read once per call."""
+
+    async def stream(*args: object) -> AsyncIterator[str]:
+        for content in contents:
+            yield content
+
+    return MagicMock(side_effect=stream)
+
+
+def _unused_files(*in_use: str) -> MagicMock:
+    """Mock unused_files() with the given paths stored again meanwhile."""
+
+    @contextlib.asynccontextmanager
+    async def unused_files(paths: list[str]) -> AsyncIterator[list[str]]:
+        yield [path for path in paths if path not in in_use]
+
+    return MagicMock(side_effect=unused_files)
+
+
+@pytest.fixture
+def mock_redis_state() -> Iterator[dict[str, AsyncMock]]:
+    """Patch the Redis-backed lock and progress helpers."""
+    with (
+        patch(
+            f"{MODULE}.acquire_upload_gc_lock",
+            new_callable=AsyncMock,
+            return_value=True,
+        ) as acquire,
+        patch(f"{MODULE}.refresh_upload_gc_lock", new_callable=AsyncMock),
+        patch(f"{MODULE}.release_upload_gc_lock", new_callable=AsyncMock) as release,
+        patch(f"{MODULE}.set_upload_gc_progress", new_callable=AsyncMock) as set_p,
+        patch(
+            f"{MODULE}.get_upload_gc_progress",
+            new_callable=AsyncMock,
+            return_value={},
+        ) as get_p,
+    ):
+        yield {
+            "acquire": acquire,
+            "release": release,
+            "set_progress": set_p,
+            "get_progress": get_p,
+        }
+
+
+class TestExtractUploadReferences:
+    """Tests for extract_upload_references."""
+
+    def test_markdown_and_html_links(self) -> None:
+        """Test paths are cut at link syntax, queries and fragments."""
+        content = (
+            "![a](/api/v1/uploads/file/blobs/ab/ab.png)\n"
+            '<img src="https://docs.example.com/api/v1/uploads/file/blobs/cd/cd.webp?w=640">\n'
+            "See /api/v1/uploads/file/2026/01/x%20y.png#top."
+        )
+
+        references = extract_upload_references(content)
+
+        assert "blobs/ab/ab.png" in references
+        assert "blobs/cd/cd.webp" in references
+        assert "2026/01/x y.png" in references
+
+    def test_trailing_punctuation(self) -> None:
+        """Test a path ending a sentence is still matched."""
+        references = extract_upload_references("at /api/v1/uploads/file/a.png.")
+
+        assert "a.png" in references
+
+    def test_no_references(self) -> None:
+        """Test text without file links references nothing."""
+        assert extract_upload_references("/api/v1/uploads/123") == set()
+
+
+class TestUploadGCServiceRun:
+    """Tests for UploadGCService.run method."""
+
+    @pytest.fixture
+    def mock_gc_repo(self) -> MagicMock:
+        """Create a repository with two chunks of uploads, one referenced."""
+        repo = MagicMock(spec=UploadGCRepository)
+        repo.stream_document_contents = _contents(
+            "![kept](/api/v1/uploads/file/blobs/aa/kept.png)"
+        )
+        repo.stream_revision_contents = _contents(
+            "![old](/api/v1/uploads/file/blobs/bb/in-revision.png)"
+        )
+        repo.get_uploads_chunk = AsyncMock(
+            side_effect=[
+                [
+                    _upload(1, "blobs/aa/kept.png"),
+                    _upload(2, "blobs/cc/orphan.png", 100),
+                ],
+                [
+                    _upload(3, "blobs/bb/in-revision.png"),
+                    _upload(4, "2026/01/legacy.png", 50),
+                ],
+                [],
+            ]
+        )
+        repo.delete_uploads = AsyncMock(
+            side_effect=[(1, ["blobs/cc/orphan.png"]), (1, ["2026/01/legacy.png"])]
+        )
+        repo.unused_files = _unused_files()
+        return repo
+
+    @pytest.fixture
+    def mock_storage(self) -> MagicMock:
+        """Create a mock storage provider."""
+        storage = MagicMock(spec=StorageProvider)
+        storage.delete_many = AsyncMock(return_value=[])
+        return storage
+
+    @pytest.fixture
+    def mock_file_cache(self) -> MagicMock:
+        """Create a mock file metadata cache."""
+        cache = MagicMock(spec=UploadFileCache)
+        cache.invalidate = AsyncMock()
+        return cache
+
+    @pytest.mark.asyncio
+    async def test_run_deletes_unreferenced_uploads(
+        self,
+        mock_gc_repo: MagicMock,
+        mock_storage: MagicMock,
+        mock_file_cache: MagicMock,
+        mock_redis_state: dict[str, AsyncMock],
+    ) -> None:
+        """Test uploads linked from documents or revisions are kept."""
+        service = UploadGCService(
+            mock_gc_repo, mock_storage, mock_file_cache, 2, timedelta(days=1)
+        )
+
+        await service.run(dry_run=False)
+
+        assert [c.args[0] for c in mock_gc_repo.delete_uploads.call_args_list] == [
+            [UUID(int=2)],
+            [UUID(int=4)],
+        ]
+        assert mock_gc_repo.get_uploads_chunk.call_args_list[1].args[1] == UUID(int=2)
+        assert [c.args[0] for c in mock_storage.delete_many.call_args_list] == [
+            ["blobs/cc/orphan.png", *variant_storage_paths("blobs/cc/orphan.png")],
+            ["2026/01/legacy.png", *variant_storage_paths("2026/01/legacy.png")],
+        ]
+        mock_file_cache.invalidate.assert_any_call("blobs/cc/orphan.png")
+
+        final = mock_redis_state["set_progress"].call_args.args[0]
+        assert final["status"] == UploadGCStatus.COMPLETED.value
+        assert final["dry_run"] == 0
+        assert final["documents_scanned"] == 1
+        assert final["revisions_scanned"] == 1
+        assert final["uploads_checked"] == 4
+        assert final["orphans_found"] == 2
+        assert final["orphan_bytes"] == 150
+        assert final["uploads_deleted"] == 2
+        assert final["files_deleted"] == 2
+        assert json.loads(final["orphan_sample"]) == [
+            "blobs/cc/orphan.png",
+            "2026/01/legacy.png",
+        ]
+        mock_redis_state["release"].assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_run_counts_only_removed_files(
+        self,
+        mock_gc_repo: MagicMock,
+        mock_storage: MagicMock,
+        mock_file_cache: MagicMock,
+        mock_redis_state: dict[str, AsyncMock],
+    ) -> None:
+        """Test a file storage could not delete is not counted as deleted."""
+        mock_storage.delete_many = AsyncMock(side_effect=[["blobs/cc/orphan.png"], []])
+        service = UploadGCService(
+            mock_gc_repo, mock_storage, mock_file_cache, 2, timedelta(days=1)
+        )
+
+        await service.run(dry_run=False)
+
+        final = mock_redis_state["set_progress"].call_args.args[0]
+        assert final["status"] == UploadGCStatus.COMPLETED.value
+        assert final["uploads_deleted"] == 2
+        assert final["files_deleted"] == 1
+        mock_file_cache.invalidate.assert_any_call("blobs/cc/orphan.png")
+
+    @pytest.mark.asyncio
+    async def test_run_counts_no_files_when_s3_refuses_deletes(
+        self,
+        mock_gc_repo: MagicMock,
+        mock_file_cache: MagicMock,
+        mock_redis_state: dict[str, AsyncMock],
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test deletes refused by the storage service are not counted."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.method == "DELETE"
+            return httpx.Response(
+                403, content=b"<Error><Code>AccessDenied</Code></Error>"
+            )
+
+        storage = S3StorageProvider(
+            bucket="uploads",
+            endpoint_url="http://minio:9000",
+            region="us-east-1",
+            access_key_id="test-key",
+            secret_access_key="test-secret",
+            path_style=True,
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        service = UploadGCService(
+            mock_gc_repo, storage, mock_file_cache, 2, timedelta(days=1)
+        )
+
+        with caplog.at_level(logging.WARNING, logger=MODULE):
+            await service.run(dry_run=False)
+
+        final = mock_redis_state["set_progress"].call_args.args[0]
+        assert final["status"] == UploadGCStatus.COMPLETED.value
+        assert final["uploads_deleted"] == 2
+        assert final["files_deleted"] == 0
+        assert "Orphaned upload collection left" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_run_rescans_before_deleting(
+        self,
+        mock_gc_repo: MagicMock,
+        mock_storage: MagicMock,
+        mock_file_cache: MagicMock,
+        mock_redis_state: dict[str, AsyncMock],
+    ) -> None:
+        """Test a link saved during the job keeps its upload."""
+
+        async def documents(
+            batch_size: int, since: object = None
+        ) -> AsyncIterator[str]:
+            if since is None:
+                yield "no links yet /api/v1/uploads/file/blobs/aa/kept.png"
+            else:
+                yield "![new](/api/v1/uploads/file/blobs/cc/orphan.png)"
+
+        mock_gc_repo.stream_document_contents = MagicMock(side_effect=documents)
+        service = UploadGCService(
+            mock_gc_repo, mock_storage, mock_file_cache, 2, timedelta(days=1)
+        )
+
+        await service.run(dry_run=False)
+
+        assert [c.args[0] for c in mock_gc_repo.delete_uploads.call_args_list] == [
+            [UUID(int=4)]
+        ]
+        rescans = mock_gc_repo.stream_document_contents.call_args_list[1:]
+        assert rescans
+        assert all(c.args[1] is not None for c in rescans)
+
+    @pytest.mark.asyncio
+    async def test_dry_run_only_reports(
+        self,
+        mock_gc_repo: MagicMock,
+        mock_storage: MagicMock,
+        mock_file_cache: MagicMock,
+        mock_redis_state: dict[str, AsyncMock],
+    ) -> None:
+        """Test a dry run counts orphans without deleting anything."""
+        service = UploadGCService(mock_gc_repo, mock_storage, mock_file_cache, 2)
+
+        await service.run(dry_run=True)
+
+        mock_gc_repo.delete_uploads.assert_not_called()
+        mock_storage.delete_many.assert_not_called()
+        assert mock_gc_repo.stream_document_contents.call_count == 1
+        final = mock_redis_state["set_progress"].call_args.args[0]
+        assert final["status"] == UploadGCStatus.COMPLETED.value
+        assert final["dry_run"] == 1
+        assert final["orphans_found"] == 2
+        assert final["orphan_bytes"] == 150
+        assert final["uploads_deleted"] == 0
+
+    @pytest.mark.asyncio
+    async def test_run_skips_when_already_locked(
+        self,
+        mock_gc_repo: MagicMock,
+        mock_storage: MagicMock,
+        mock_file_cache: MagicMock,
+        mock_redis_state: dict[str, AsyncMock],
+    ) -> None:
+        """Test only one collection runs at a time."""
+        mock_redis_state["acquire"].return_value = False
+        service = UploadGCService(mock_gc_repo, mock_storage, mock_file_cache)
+
+        await service.run(dry_run=False)
+
+        mock_gc_repo.stream_document_contents.assert_not_called()
+        mock_redis_state["release"].assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_records_failure(
+        self,
+        mock_gc_repo: MagicMock,
+        mock_storage: MagicMock,
+        mock_file_cache: MagicMock,
+        mock_redis_state: dict[str, AsyncMock],
+    ) -> None:
+        """Test a failing batch marks the job failed."""
+        mock_gc_repo.delete_uploads = AsyncMock(side_effect=RuntimeError("boom"))
+        service = UploadGCService(mock_gc_repo, mock_storage, mock_file_cache, 2)
+
+        await service.run(dry_run=False)
+
+        final = mock_redis_state["set_progress"].call_args.args[0]
+        assert final["status"] == UploadGCStatus.FAILED.value
+        assert final["phase"] == "sweep"
+        mock_redis_state["release"].assert_called_once()
+
+
+class TestUploadGCServiceGetStatus:
+    """Tests for UploadGCService.get_status method."""
+
+    @pytest.mark.asyncio
+    async def test_get_status_reports_progress(
+        self, mock_redis_state: dict[str, AsyncMock]
+    ) -> None:
+        """Test stored progress and report are returned."""
+        mock_redis_state["get_progress"].return_value = {
+            "status": "completed",
+            "dry_run": "1",
+            "phase": "sweep",
+            "orphans_found": "3",
+            "orphan_sample": '["blobs/cc/orphan.png"]',
+        }
+        service = UploadGCService(MagicMock(), MagicMock(), MagicMock())
+
+        result = await service.get_status()
+
+        assert result is not None
+        assert result.status == UploadGCStatus.COMPLETED
+        assert result.dry_run is True
+        assert result.orphans_found == 3
+        assert result.orphan_sample == ["blobs/cc/orphan.png"]
+
+    @pytest.mark.asyncio
+    async def test_get_status_none_before_first_run(
+        self, mock_redis_state: dict[str, AsyncMock]
+    ) -> None:
+        """Test no status is reported when no job has run."""
+        service = UploadGCService(MagicMock(), MagicMock(), MagicMock())
+
+        assert await service.get_status() is None
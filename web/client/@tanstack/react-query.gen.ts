@@ -1,10 +1,10 @@
 // This file is auto-generated by @hey-api/openapi-ts
 
-import { type DefaultError, queryOptions, type UseMutationOptions } from '@tanstack/react-query';
+import { type DefaultError, type InfiniteData, infiniteQueryOptions, queryOptions, type UseMutationOptions } from '@tanstack/react-query';
 
 import { client } from '../client.gen';
 import { Auth, Bookmarks, Documents, Health, type Options, ProjectMembers, Projects, Setup, Uploads, Users } from '../sdk.gen';
-import type { AddBookmarkData, AddBookmarkError, AddBookmarkResponse, AddMemberData, AddMemberError, AddMemberResponse, CreateAdminData, CreateAdminError, CreateAdminResponse, CreateProjectData, CreateProjectError, CreateProjectResponse, DeleteDocumentData, DeleteDocumentError, DeleteDocumentResponse, DeleteProjectData, DeleteProjectError, DeleteProjectResponse, DeleteUploadData, DeleteUploadError, DeleteUploadResponse, GetBookmarkStatusData, GetBookmarkStatusError, GetBookmarkStatusResponse, GetCurrentUserInfoData, GetCurrentUserInfoResponse, GetDocumentData, GetDocumentError, GetDocumentHistoryData, GetDocumentHistoryError, GetDocumentHistoryResponse, GetDocumentResponse, GetDocumentTreeData, GetDocumentTreeError, GetDocumentTreeResponse, GetProjectActivityData, GetProjectActivityError, GetProjectActivityResponse, GetProjectData, GetProjectError, GetProjectPermissionsData, GetProjectPermissionsError, GetProjectPermissionsResponse, GetProjectResponse, GetSetupStatusData, GetSetupStatusResponse, GetUploadData, GetUploadError, GetUploadResponse, HealthCheckData, HealthCheckResponse, ListBookmarksData, ListBookmarksError, ListBookmarksResponse, ListMembersData, ListMembersError, ListMembersResponse, ListProjectsData, ListProjectsError, ListProjectsResponse, LoginData, LoginError, LoginResponse, LogoutData, LogoutResponse, PutDocumentData, PutDocumentError, PutDocumentResponse, RefreshData, RefreshError, RefreshResponse, RegisterData, RegisterError, RegisterResponse, RemoveBookmarkData, RemoveBookmarkError, RemoveBookmarkResponse, RemoveMemberData, RemoveMemberError, RemoveMemberResponse, ServeFileData, ServeFileError, UpdateMemberRoleData, UpdateMemberRoleError, UpdateMemberRoleResponse, UpdateMyProfileData, UpdateMyProfileError, UpdateMyProfileResponse, UpdateProjectData, UpdateProjectError, UpdateProjectResponse, UploadImageData, UploadImageError, UploadImageResponse } from '../types.gen';
+import type { AddBookmarkData, AddBookmarkError, AddBookmarkResponse, AddMemberData, AddMemberError, AddMemberResponse, AddMembersBulkData, AddMembersBulkError, AddMembersBulkResponse, AppendResumableUploadChunkData, AppendResumableUploadChunkError, AppendResumableUploadChunkResponse, CollectOrphanedUploadsData, CollectOrphanedUploadsError, CollectOrphanedUploadsResponse, CompleteDirectUploadData, CompleteDirectUploadError, CompleteDirectUploadResponse, CreateAdminData, CreateAdminError, CreateAdminResponse, CreateProjectData, CreateProjectError, CreateProjectResponse, DeleteDocumentData, DeleteDocumentError, DeleteDocumentResponse, DeleteProjectData, DeleteProjectError, DeleteProjectResponse, DeleteUploadData, DeleteUploadError, DeleteUploadResponse, GetBookmarkStatusData, GetBookmarkStatusError, GetBookmarkStatusesData, GetBookmarkStatusesError, GetBookmarkStatusesResponse, GetBookmarkStatusResponse, GetCurrentUserInfoData, GetCurrentUserInfoResponse, GetDirectUploadData, GetDirectUploadError, GetDirectUploadResponse, GetDocumentData, GetDocumentError, GetDocumentHistoryData, GetDocumentHistoryError, GetDocumentHistoryResponse, GetDocumentResponse, GetDocumentTreeData, GetDocumentTreeError, GetDocumentTreeResponse, GetOrphanedUploadCollectionData, GetOrphanedUploadCollectionResponse, GetProjectActivityData, GetProjectActivityError, GetProjectActivityResponse, GetProjectData, GetProjectDeletionData, GetProjectDeletionError, GetProjectDeletionResponse, GetProjectError, GetProjectPermissionsData, GetProjectPermissionsError, GetProjectPermissionsResponse, GetProjectResponse, GetProjectStorageUsageData, GetProjectStorageUsageError, GetProjectStorageUsageResponse, GetResumableUploadOffsetData, GetResumableUploadOffsetError, GetSetupStatusData, GetSetupStatusResponse, GetUploadData, GetUploadError, GetUploadResponse, GetUploadStorageStatsData, GetUploadStorageStatsResponse, HealthCheckData, HealthCheckResponse, ImageProcessingMetricsData, ImageProcessingMetricsResponse, ListBookmarksData, ListBookmarksError, ListBookmarksResponse, ListMembersData, ListMembersError, ListMembersResponse, ListProjectsData, ListProjectsError, ListProjectsResponse, ListUsersData, ListUsersError, ListUsersResponse, LoginData, LoginError, LoginResponse, LogoutData, LogoutResponse, PutDocumentData, PutDocumentError, PutDocumentResponse, ReceiveDirectUploadData, ReceiveDirectUploadError, ReceiveDirectUploadResponse, RefreshData, RefreshError, RefreshResponse, RegisterData, RegisterError, RegisterResponse, RemoveBookmarkData, RemoveBookmarkError, RemoveBookmarkResponse, RemoveMemberData, RemoveMemberError, RemoveMemberResponse, SearchUsersData, SearchUsersError, SearchUsersResponse, ServeFileData, ServeFileError, StartDirectUploadData, StartDirectUploadError, StartDirectUploadResponse, StartResumableUploadData, StartResumableUploadError, StartResumableUploadResponse, UpdateMemberRoleData, UpdateMemberRoleError, UpdateMemberRoleResponse, UpdateMyProfileData, UpdateMyProfileError, UpdateMyProfileResponse, UpdateProjectData, UpdateProjectError, UpdateProjectResponse, UploadImageData, UploadImageError, UploadImageResponse } from '../types.gen';
 
 export type QueryKey<TOptions extends Options> = [
     Pick<TOptions, 'baseUrl' | 'body' | 'headers' | 'path' | 'query'> & {
@@ -61,6 +61,30 @@ export const healthCheckOptions = (options?: Options<HealthCheckData>) => queryO
     queryKey: healthCheckQueryKey(options)
 });
 
+export const imageProcessingMetricsQueryKey = (options?: Options<ImageProcessingMetricsData>) => createQueryKey('imageProcessingMetrics', options);
+
+/**
+ * Image Processing Metrics
+ *
+ * Image processing metrics.
+ *
+ * Returns the queue depth, job counters and job durations of this API
+ * worker's image processing pool. Counters are per worker process and
+ * reset on restart.
+ */
+export const imageProcessingMetricsOptions = (options?: Options<ImageProcessingMetricsData>) => queryOptions<ImageProcessingMetricsResponse, DefaultError, ImageProcessingMetricsResponse, ReturnType<typeof imageProcessingMetricsQueryKey>>({
+    queryFn: async ({ queryKey, signal }) => {
+        const { data } = await Health.imageProcessingMetrics({
+            ...options,
+            ...queryKey[0],
+            signal,
+            throwOnError: true
+        });
+        return data;
+    },
+    queryKey: imageProcessingMetricsQueryKey(options)
+});
+
 /**
  * Register
  *
@@ -197,6 +221,151 @@ export const getCurrentUserInfoOptions = (options?: Options<GetCurrentUserInfoDa
     queryKey: getCurrentUserInfoQueryKey(options)
 });
 
+export const listUsersQueryKey = (options?: Options<ListUsersData>) => createQueryKey('listUsers', options);
+
+/**
+ * List Users
+ *
+ * List all users for the admin user directory.
+ *
+ * Only system administrators can list users. ``q`` filters by name or
+ * email (prefix or substring, case-insensitive). When a full page is
+ * returned, the ``X-Next-Cursor`` header holds the cursor for the next
+ * page.
+ *
+ * Args:
+ * response: Response used to set the next-page cursor header.
+ * _admin: The authenticated admin user.
+ * service: User service.
+ * q: Optional name or email search text.
+ * limit: Maximum number of records to return.
+ * cursor: Opaque cursor from a previous ``X-Next-Cursor`` header.
+ *
+ * Returns:
+ * List of users, oldest first.
+ *
+ * Raises:
+ * HTTPException: If the cursor is malformed.
+ */
+export const listUsersOptions = (options?: Options<ListUsersData>) => queryOptions<ListUsersResponse, ListUsersError, ListUsersResponse, ReturnType<typeof listUsersQueryKey>>({
+    queryFn: async ({ queryKey, signal }) => {
+        const { data } = await Users.listUsers({
+            ...options,
+            ...queryKey[0],
+            signal,
+            throwOnError: true
+        });
+        return data;
+    },
+    queryKey: listUsersQueryKey(options)
+});
+
+const createInfiniteParams = <K extends Pick<QueryKey<Options>[0], 'body' | 'headers' | 'path' | 'query'>>(queryKey: QueryKey<Options>, page: K) => {
+    const params = { ...queryKey[0] };
+    if (page.body) {
+        params.body = {
+            ...queryKey[0].body as any,
+            ...page.body as any
+        };
+    }
+    if (page.headers) {
+        params.headers = {
+            ...queryKey[0].headers,
+            ...page.headers
+        };
+    }
+    if (page.path) {
+        params.path = {
+            ...queryKey[0].path as any,
+            ...page.path as any
+        };
+    }
+    if (page.query) {
+        params.query = {
+            ...queryKey[0].query as any,
+            ...page.query as any
+        };
+    }
+    return params as unknown as typeof page;
+};
+
+export const listUsersInfiniteQueryKey = (options?: Options<ListUsersData>): QueryKey<Options<ListUsersData>> => createQueryKey('listUsers', options, true);
+
+/**
+ * List Users
+ *
+ * List all users for the admin user directory.
+ *
+ * Only system administrators can list users. ``q`` filters by name or
+ * email (prefix or substring, case-insensitive). When a full page is
+ * returned, the ``X-Next-Cursor`` header holds the cursor for the next
+ * page.
+ *
+ * Args:
+ * response: Response used to set the next-page cursor header.
+ * _admin: The authenticated admin user.
+ * service: User service.
+ * q: Optional name or email search text.
+ * limit: Maximum number of records to return.
+ * cursor: Opaque cursor from a previous ``X-Next-Cursor`` header.
+ *
+ * Returns:
+ * List of users, oldest first.
+ *
+ * Raises:
+ * HTTPException: If the cursor is malformed.
+ */
+export const listUsersInfiniteOptions = (options?: Options<ListUsersData>) => infiniteQueryOptions<ListUsersResponse, ListUsersError, InfiniteData<ListUsersResponse>, QueryKey<Options<ListUsersData>>, string | null | Pick<QueryKey<Options<ListUsersData>>[0], 'body' | 'headers' | 'path' | 'query'>>(
+// @ts-ignore
+{
+    queryFn: async ({ pageParam, queryKey, signal }) => {
+        // @ts-ignore
+        const page: Pick<QueryKey<Options<ListUsersData>>[0], 'body' | 'headers' | 'path' | 'query'> = typeof pageParam === 'object' ? pageParam : {
+            query: {
+                cursor: pageParam
+            }
+        };
+        const params = createInfiniteParams(queryKey, page);
+        const { data } = await Users.listUsers({
+            ...options,
+            ...params,
+            signal,
+            throwOnError: true
+        });
+        return data;
+    },
+    queryKey: listUsersInfiniteQueryKey(options)
+});
+
+export const searchUsersQueryKey = (options: Options<SearchUsersData>) => createQueryKey('searchUsers', options);
+
+/**
+ * Search Users
+ *
+ * Search users by name or email, e.g. for the member invite dialog.
+ *
+ * Args:
+ * _current_user: The authenticated user.
+ * service: User service.
+ * q: Name or email search text (prefix or substring).
+ * limit: Maximum number of records to return.
+ *
+ * Returns:
+ * Matching users with public profile fields only.
+ */
+export const searchUsersOptions = (options: Options<SearchUsersData>) => queryOptions<SearchUsersResponse, SearchUsersError, SearchUsersResponse, ReturnType<typeof searchUsersQueryKey>>({
+    queryFn: async ({ queryKey, signal }) => {
+        const { data } = await Users.searchUsers({
+            ...options,
+            ...queryKey[0],
+            signal,
+            throwOnError: true
+        });
+        return data;
+    },
+    queryKey: searchUsersQueryKey(options)
+});
+
 /**
  * Update My Profile
  *
@@ -233,14 +402,29 @@ export const listProjectsQueryKey = (options?: Options<ListProjectsData>) => cre
  * - Projects where user is a member
  * - Public projects
  *
+ * Pass ``include=permissions`` and/or ``include=bookmark`` to also return
+ * the current user's permissions and bookmark state on every project,
+ * resolved in the same query as the list. Document count and last
+ * activity are always returned from denormalized project columns.
+ *
+ * When a full page is returned, the ``X-Next-Cursor`` response header
+ * holds a cursor for the next page. Passing it back as ``cursor`` pages
+ * by keyset, which stays fast on deep pages unlike ``skip``.
+ *
  * Args:
+ * response: Response used to set the next-page cursor header.
  * current_user: The authenticated user.
  * project_service: Project service.
  * skip: Number of records to skip (pagination).
  * limit: Maximum number of records to return.
+ * cursor: Opaque cursor from a previous ``X-Next-Cursor`` header.
+ * include: Optional extra data to include per project.
  *
  * Returns:
  * List of accessible projects.
+ *
+ * Raises:
+ * HTTPException: If the cursor is malformed.
  */
 export const listProjectsOptions = (options?: Options<ListProjectsData>) => queryOptions<ListProjectsResponse, ListProjectsError, ListProjectsResponse, ReturnType<typeof listProjectsQueryKey>>({
     queryFn: async ({ queryKey, signal }) => {
@@ -255,6 +439,64 @@ export const listProjectsOptions = (options?: Options<ListProjectsData>) => quer
     queryKey: listProjectsQueryKey(options)
 });
 
+export const listProjectsInfiniteQueryKey = (options?: Options<ListProjectsData>): QueryKey<Options<ListProjectsData>> => createQueryKey('listProjects', options, true);
+
+/**
+ * List Projects
+ *
+ * List all projects accessible by the current user.
+ *
+ * Includes:
+ * - Projects owned by the user
+ * - Projects where user is a member
+ * - Public projects
+ *
+ * Pass ``include=permissions`` and/or ``include=bookmark`` to also return
+ * the current user's permissions and bookmark state on every project,
+ * resolved in the same query as the list. Document count and last
+ * activity are always returned from denormalized project columns.
+ *
+ * When a full page is returned, the ``X-Next-Cursor`` response header
+ * holds a cursor for the next page. Passing it back as ``cursor`` pages
+ * by keyset, which stays fast on deep pages unlike ``skip``.
+ *
+ * Args:
+ * response: Response used to set the next-page cursor header.
+ * current_user: The authenticated user.
+ * project_service: Project service.
+ * skip: Number of records to skip (pagination).
+ * limit: Maximum number of records to return.
+ * cursor: Opaque cursor from a previous ``X-Next-Cursor`` header.
+ * include: Optional extra data to include per project.
+ *
+ * Returns:
+ * List of accessible projects.
+ *
+ * Raises:
+ * HTTPException: If the cursor is malformed.
+ */
+export const listProjectsInfiniteOptions = (options?: Options<ListProjectsData>) => infiniteQueryOptions<ListProjectsResponse, ListProjectsError, InfiniteData<ListProjectsResponse>, QueryKey<Options<ListProjectsData>>, string | null | Pick<QueryKey<Options<ListProjectsData>>[0], 'body' | 'headers' | 'path' | 'query'>>(
+// @ts-ignore
+{
+    queryFn: async ({ pageParam, queryKey, signal }) => {
+        // @ts-ignore
+        const page: Pick<QueryKey<Options<ListProjectsData>>[0], 'body' | 'headers' | 'path' | 'query'> = typeof pageParam === 'object' ? pageParam : {
+            query: {
+                cursor: pageParam
+            }
+        };
+        const params = createInfiniteParams(queryKey, page);
+        const { data } = await Projects.listProjects({
+            ...options,
+            ...params,
+            signal,
+            throwOnError: true
+        });
+        return data;
+    },
+    queryKey: listProjectsInfiniteQueryKey(options)
+});
+
 /**
  * Create Project
  *
@@ -290,11 +532,18 @@ export const createProjectMutation = (options?: Partial<Options<CreateProjectDat
  *
  * Delete a project.
  *
+ * The project is hidden immediately and its data is removed by a
+ * background job. Progress is available from ``GET /{slug}/deletion``.
+ *
  * Args:
  * slug: The project slug.
+ * background_tasks: Background task queue for the deletion job.
  * current_user: The authenticated user.
  * project_service: Project service.
  *
+ * Returns:
+ * Initial deletion status.
+ *
  * Raises:
  * HTTPException: If project is not found or user is not the owner.
  */
@@ -323,7 +572,6 @@ export const getProjectQueryKey = (options: Options<GetProjectData>) => createQu
  * slug: The project slug.
  * current_user: The authenticated user.
  * project_service: Project service.
- * member_repo: Project member repository.
  *
  * Returns:
  * The project.
@@ -375,6 +623,39 @@ export const updateProjectMutation = (options?: Partial<Options<UpdateProjectDat
     return mutationOptions;
 };
 
+export const getProjectDeletionQueryKey = (options: Options<GetProjectDeletionData>) => createQueryKey('getProjectDeletion', options);
+
+/**
+ * Get Project Deletion
+ *
+ * Get progress of a pending project deletion.
+ *
+ * Returns 404 once the deletion has completed.
+ *
+ * Args:
+ * slug: The project slug.
+ * current_user: The authenticated user.
+ * deletion_service: Project deletion service.
+ *
+ * Returns:
+ * Deletion progress.
+ *
+ * Raises:
+ * HTTPException: If no deletion is pending or user is not the owner.
+ */
+export const getProjectDeletionOptions = (options: Options<GetProjectDeletionData>) => queryOptions<GetProjectDeletionResponse, GetProjectDeletionError, GetProjectDeletionResponse, ReturnType<typeof getProjectDeletionQueryKey>>({
+    queryFn: async ({ queryKey, signal }) => {
+        const { data } = await Projects.getProjectDeletion({
+            ...options,
+            ...queryKey[0],
+            signal,
+            throwOnError: true
+        });
+        return data;
+    },
+    queryKey: getProjectDeletionQueryKey(options)
+});
+
 export const getProjectPermissionsQueryKey = (options: Options<GetProjectPermissionsData>) => createQueryKey('getProjectPermissions', options);
 
 /**
@@ -391,7 +672,6 @@ export const getProjectPermissionsQueryKey = (options: Options<GetProjectPermiss
  * slug: The project slug.
  * current_user: The authenticated user.
  * project_service: Project service.
- * member_repo: Project member repository.
  *
  * Returns:
  * User's permissions and role on the project.
@@ -592,14 +872,20 @@ export const listMembersQueryKey = (options: Options<ListMembersData>) => create
  *
  * List all members of a project.
  *
- * All project members (viewer+) can view the member list.
+ * All project members (viewer+) can view the member list. ``q`` filters
+ * by member name or email (prefix or substring, case-insensitive). When
+ * a full page is returned, the ``X-Next-Cursor`` header holds a cursor
+ * for the next page.
  *
  * Args:
  * slug: The project slug.
+ * response: Response used to set the next-page cursor header.
  * current_user: The authenticated user.
  * member_service: Project member service.
  * skip: Number of records to skip (pagination).
  * limit: Maximum number of records to return.
+ * q: Optional name or email search text.
+ * cursor: Opaque cursor from a previous ``X-Next-Cursor`` header.
  *
  * Returns:
  * List of project members with user details.
@@ -617,6 +903,53 @@ export const listMembersOptions = (options: Options<ListMembersData>) => queryOp
     queryKey: listMembersQueryKey(options)
 });
 
+export const listMembersInfiniteQueryKey = (options: Options<ListMembersData>): QueryKey<Options<ListMembersData>> => createQueryKey('listMembers', options, true);
+
+/**
+ * List Members
+ *
+ * List all members of a project.
+ *
+ * All project members (viewer+) can view the member list. ``q`` filters
+ * by member name or email (prefix or substring, case-insensitive). When
+ * a full page is returned, the ``X-Next-Cursor`` header holds a cursor
+ * for the next page.
+ *
+ * Args:
+ * slug: The project slug.
+ * response: Response used to set the next-page cursor header.
+ * current_user: The authenticated user.
+ * member_service: Project member service.
+ * skip: Number of records to skip (pagination).
+ * limit: Maximum number of records to return.
+ * q: Optional name or email search text.
+ * cursor: Opaque cursor from a previous ``X-Next-Cursor`` header.
+ *
+ * Returns:
+ * List of project members with user details.
+ */
+export const listMembersInfiniteOptions = (options: Options<ListMembersData>) => infiniteQueryOptions<ListMembersResponse, ListMembersError, InfiniteData<ListMembersResponse>, QueryKey<Options<ListMembersData>>, string | null | Pick<QueryKey<Options<ListMembersData>>[0], 'body' | 'headers' | 'path' | 'query'>>(
+// @ts-ignore
+{
+    queryFn: async ({ pageParam, queryKey, signal }) => {
+        // @ts-ignore
+        const page: Pick<QueryKey<Options<ListMembersData>>[0], 'body' | 'headers' | 'path' | 'query'> = typeof pageParam === 'object' ? pageParam : {
+            query: {
+                cursor: pageParam
+            }
+        };
+        const params = createInfiniteParams(queryKey, page);
+        const { data } = await ProjectMembers.listMembers({
+            ...options,
+            ...params,
+            signal,
+            throwOnError: true
+        });
+        return data;
+    },
+    queryKey: listMembersInfiniteQueryKey(options)
+});
+
 /**
  * Add Member
  *
@@ -647,6 +980,41 @@ export const addMemberMutation = (options?: Partial<Options<AddMemberData>>): Us
     return mutationOptions;
 };
 
+/**
+ * Add Members Bulk
+ *
+ * Add many members to a project at once.
+ *
+ * Users may be given by ID or email. Unknown users, the owner and
+ * duplicates are reported per entry instead of failing the request.
+ * Existing members are skipped, or have their role updated with
+ * ``on_conflict=update_role``.
+ *
+ * Only project admins and owners can add members.
+ *
+ * Args:
+ * slug: The project slug.
+ * request: Invites and conflict handling.
+ * current_user: The authenticated user.
+ * member_service: Project member service.
+ *
+ * Returns:
+ * Outcome per invite, in request order.
+ */
+export const addMembersBulkMutation = (options?: Partial<Options<AddMembersBulkData>>): UseMutationOptions<AddMembersBulkResponse, AddMembersBulkError, Options<AddMembersBulkData>> => {
+    const mutationOptions: UseMutationOptions<AddMembersBulkResponse, AddMembersBulkError, Options<AddMembersBulkData>> = {
+        mutationFn: async (fnOptions) => {
+            const { data } = await ProjectMembers.addMembersBulk({
+                ...options,
+                ...fnOptions,
+                throwOnError: true
+            });
+            return data;
+        }
+    };
+    return mutationOptions;
+};
+
 /**
  * Remove Member
  *
@@ -736,6 +1104,38 @@ export const listBookmarksOptions = (options?: Options<ListBookmarksData>) => qu
     queryKey: listBookmarksQueryKey(options)
 });
 
+export const getBookmarkStatusesQueryKey = (options: Options<GetBookmarkStatusesData>) => createQueryKey('getBookmarkStatuses', options);
+
+/**
+ * Get Bookmark Statuses
+ *
+ * Check whether each of many projects is bookmarked by the current user.
+ *
+ * Answers for every slug in one query, so list views do not need one
+ * ``GET /projects/{slug}/bookmark`` call per project. Pass ``slug``
+ * repeatedly (up to 100 times). Unknown slugs are left out.
+ *
+ * Args:
+ * current_user: The authenticated user.
+ * bookmark_service: Bookmark service.
+ * slug: Project slugs to check.
+ *
+ * Returns:
+ * Bookmark status per project, in request order.
+ */
+export const getBookmarkStatusesOptions = (options: Options<GetBookmarkStatusesData>) => queryOptions<GetBookmarkStatusesResponse, GetBookmarkStatusesError, GetBookmarkStatusesResponse, ReturnType<typeof getBookmarkStatusesQueryKey>>({
+    queryFn: async ({ queryKey, signal }) => {
+        const { data } = await Bookmarks.getBookmarkStatuses({
+            ...options,
+            ...queryKey[0],
+            signal,
+            throwOnError: true
+        });
+        return data;
+    },
+    queryKey: getBookmarkStatusesQueryKey(options)
+});
+
 /**
  * Remove Bookmark
  *
@@ -896,7 +1296,6 @@ export const createAdminMutation = (options?: Partial<Options<CreateAdminData>>)
  * current_user: The authenticated user.
  * upload_service: Upload service.
  * project_repo: Project repository.
- * member_repo: Project member repository.
  *
  * Returns:
  * Upload metadata including URL.
@@ -918,6 +1317,353 @@ export const uploadImageMutation = (options?: Partial<Options<UploadImageData>>)
     return mutationOptions;
 };
 
+/**
+ * Start Direct Upload
+ *
+ * Start an upload whose file is sent straight to storage.
+ *
+ * 1. Call this endpoint with the file's name, type and exact size.
+ * 2. Send the file as the body of a PUT to ``upload_url`` with the
+ * returned headers, before ``expires_at``.
+ * 3. Call ``POST /uploads/direct/{id}/complete``. The file is validated
+ * and processed in the background; poll ``GET /uploads/direct/{id}``
+ * for the created upload.
+ *
+ * With object storage the file goes to the bucket directly and never
+ * passes through the API.
+ *
+ * Args:
+ * project_id: UUID of the project.
+ * body: Declared file name, type and size.
+ * current_user: The authenticated user.
+ * upload_service: Upload service.
+ * project_repo: Project repository.
+ *
+ * Returns:
+ * Where and how to send the file.
+ *
+ * Raises:
+ * HTTPException: If access is denied or the file is not accepted.
+ */
+export const startDirectUploadMutation = (options?: Partial<Options<StartDirectUploadData>>): UseMutationOptions<StartDirectUploadResponse, StartDirectUploadError, Options<StartDirectUploadData>> => {
+    const mutationOptions: UseMutationOptions<StartDirectUploadResponse, StartDirectUploadError, Options<StartDirectUploadData>> = {
+        mutationFn: async (fnOptions) => {
+            const { data } = await Uploads.startDirectUpload({
+                ...options,
+                ...fnOptions,
+                throwOnError: true
+            });
+            return data;
+        }
+    };
+    return mutationOptions;
+};
+
+export const getDirectUploadQueryKey = (options: Options<GetDirectUploadData>) => createQueryKey('getDirectUpload', options);
+
+/**
+ * Get Direct Upload
+ *
+ * Get the state of a direct upload.
+ *
+ * Args:
+ * token: Direct upload token.
+ * current_user: The authenticated user.
+ * upload_service: Upload service.
+ *
+ * Returns:
+ * State of the upload, with the created upload once completed.
+ *
+ * Raises:
+ * HTTPException: If the upload is not found or belongs to another user.
+ */
+export const getDirectUploadOptions = (options: Options<GetDirectUploadData>) => queryOptions<GetDirectUploadResponse, GetDirectUploadError, GetDirectUploadResponse, ReturnType<typeof getDirectUploadQueryKey>>({
+    queryFn: async ({ queryKey, signal }) => {
+        const { data } = await Uploads.getDirectUpload({
+            ...options,
+            ...queryKey[0],
+            signal,
+            throwOnError: true
+        });
+        return data;
+    },
+    queryKey: getDirectUploadQueryKey(options)
+});
+
+/**
+ * Receive Direct Upload
+ *
+ * Receive the file of a direct upload when storage takes no uploads.
+ *
+ * The ``upload_url`` of a direct upload points here with local storage.
+ * The body is the raw file, written to storage as it arrives. The token
+ * authorizes the request, so no Authorization header is needed.
+ *
+ * Args:
+ * token: Direct upload token.
+ * request: The request, whose body is streamed.
+ * upload_service: Upload service.
+ *
+ * Raises:
+ * HTTPException: If the token is invalid or the body is not accepted.
+ */
+export const receiveDirectUploadMutation = (options?: Partial<Options<ReceiveDirectUploadData>>): UseMutationOptions<ReceiveDirectUploadResponse, ReceiveDirectUploadError, Options<ReceiveDirectUploadData>> => {
+    const mutationOptions: UseMutationOptions<ReceiveDirectUploadResponse, ReceiveDirectUploadError, Options<ReceiveDirectUploadData>> = {
+        mutationFn: async (fnOptions) => {
+            const { data } = await Uploads.receiveDirectUpload({
+                ...options,
+                ...fnOptions,
+                throwOnError: true
+            });
+            return data;
+        }
+    };
+    return mutationOptions;
+};
+
+/**
+ * Complete Direct Upload
+ *
+ * Finish a direct upload once its file has been sent.
+ *
+ * The file is validated and processed by a background job. Progress is
+ * available from ``GET /uploads/direct/{token}``.
+ *
+ * Args:
+ * token: Direct upload token.
+ * background_tasks: Background task queue for the processing job.
+ * current_user: The authenticated user.
+ * upload_service: Upload service.
+ *
+ * Returns:
+ * State of the upload.
+ *
+ * Raises:
+ * HTTPException: If the upload is not found, belongs to another user
+ * or its file has not arrived.
+ */
+export const completeDirectUploadMutation = (options?: Partial<Options<CompleteDirectUploadData>>): UseMutationOptions<CompleteDirectUploadResponse, CompleteDirectUploadError, Options<CompleteDirectUploadData>> => {
+    const mutationOptions: UseMutationOptions<CompleteDirectUploadResponse, CompleteDirectUploadError, Options<CompleteDirectUploadData>> = {
+        mutationFn: async (fnOptions) => {
+            const { data } = await Uploads.completeDirectUpload({
+                ...options,
+                ...fnOptions,
+                throwOnError: true
+            });
+            return data;
+        }
+    };
+    return mutationOptions;
+};
+
+/**
+ * Start Resumable Upload
+ *
+ * Start an upload that is sent in chunks and survives dropped connections.
+ *
+ * Modelled on the tus protocol:
+ *
+ * 1. Call this endpoint with the file's name, type and exact size.
+ * 2. Send the file in chunks as PATCH requests to ``upload_url``, each
+ * with an ``Upload-Offset`` header giving where the chunk starts and
+ * ``Content-Type: application/offset+octet-stream``. After an error,
+ * ``HEAD upload_url`` returns the ``Upload-Offset`` to continue from.
+ * 3. Call ``POST /uploads/direct/{id}/complete`` and poll
+ * ``GET /uploads/direct/{id}`` as for a direct upload.
+ *
+ * Args:
+ * project_id: UUID of the project.
+ * body: Declared file name, type and size.
+ * response: Response used to set the Location header.
+ * current_user: The authenticated user.
+ * upload_service: Upload service.
+ * project_repo: Project repository.
+ *
+ * Returns:
+ * Where and how to send the chunks.
+ *
+ * Raises:
+ * HTTPException: If access is denied or the file is not accepted.
+ */
+export const startResumableUploadMutation = (options?: Partial<Options<StartResumableUploadData>>): UseMutationOptions<StartResumableUploadResponse, StartResumableUploadError, Options<StartResumableUploadData>> => {
+    const mutationOptions: UseMutationOptions<StartResumableUploadResponse, StartResumableUploadError, Options<StartResumableUploadData>> = {
+        mutationFn: async (fnOptions) => {
+            const { data } = await Uploads.startResumableUpload({
+                ...options,
+                ...fnOptions,
+                throwOnError: true
+            });
+            return data;
+        }
+    };
+    return mutationOptions;
+};
+
+/**
+ * Append Resumable Upload Chunk
+ *
+ * Receive the next chunk of a resumable upload.
+ *
+ * The body is written to storage as it arrives. ``Upload-Offset`` must
+ * equal the bytes received so far; a chunk cut off part way is
+ * discarded and must be sent again from the offset returned by HEAD.
+ *
+ * Args:
+ * token: Direct upload token.
+ * upload_offset: Offset the chunk starts at.
+ * request: The request, whose body is streamed.
+ * current_user: The authenticated user.
+ * upload_service: Upload service.
+ *
+ * Returns:
+ * Empty response with the new ``Upload-Offset`` header.
+ *
+ * Raises:
+ * HTTPException: If the upload is not found or belongs to another
+ * user, the offset is wrong, or the chunk is not accepted.
+ */
+export const appendResumableUploadChunkMutation = (options?: Partial<Options<AppendResumableUploadChunkData>>): UseMutationOptions<AppendResumableUploadChunkResponse, AppendResumableUploadChunkError, Options<AppendResumableUploadChunkData>> => {
+    const mutationOptions: UseMutationOptions<AppendResumableUploadChunkResponse, AppendResumableUploadChunkError, Options<AppendResumableUploadChunkData>> = {
+        mutationFn: async (fnOptions) => {
+            const { data } = await Uploads.appendResumableUploadChunk({
+                ...options,
+                ...fnOptions,
+                throwOnError: true
+            });
+            return data;
+        }
+    };
+    return mutationOptions;
+};
+
+export const getUploadStorageStatsQueryKey = (options?: Options<GetUploadStorageStatsData>) => createQueryKey('getUploadStorageStats', options);
+
+/**
+ * Get Upload Storage Stats
+ *
+ * Report storage saved by deduplicating identical uploads.
+ *
+ * Only system administrators can view storage statistics.
+ *
+ * Args:
+ * _admin: The authenticated admin user.
+ * upload_service: Upload service.
+ *
+ * Returns:
+ * Uploaded and stored byte totals.
+ */
+export const getUploadStorageStatsOptions = (options?: Options<GetUploadStorageStatsData>) => queryOptions<GetUploadStorageStatsResponse, DefaultError, GetUploadStorageStatsResponse, ReturnType<typeof getUploadStorageStatsQueryKey>>({
+    queryFn: async ({ queryKey, signal }) => {
+        const { data } = await Uploads.getUploadStorageStats({
+            ...options,
+            ...queryKey[0],
+            signal,
+            throwOnError: true
+        });
+        return data;
+    },
+    queryKey: getUploadStorageStatsQueryKey(options)
+});
+
+export const getProjectStorageUsageQueryKey = (options?: Options<GetProjectStorageUsageData>) => createQueryKey('getProjectStorageUsage', options);
+
+/**
+ * Get Project Storage Usage
+ *
+ * List the projects using the most storage.
+ *
+ * Totals are maintained as content is written and recounted
+ * periodically. Only system administrators can view storage usage.
+ *
+ * Args:
+ * _admin: The authenticated admin user.
+ * usage_service: Storage usage service.
+ * limit: Maximum number of projects.
+ *
+ * Returns:
+ * Storage usage per project, largest first.
+ */
+export const getProjectStorageUsageOptions = (options?: Options<GetProjectStorageUsageData>) => queryOptions<GetProjectStorageUsageResponse, GetProjectStorageUsageError, GetProjectStorageUsageResponse, ReturnType<typeof getProjectStorageUsageQueryKey>>({
+    queryFn: async ({ queryKey, signal }) => {
+        const { data } = await Uploads.getProjectStorageUsage({
+            ...options,
+            ...queryKey[0],
+            signal,
+            throwOnError: true
+        });
+        return data;
+    },
+    queryKey: getProjectStorageUsageQueryKey(options)
+});
+
+export const getOrphanedUploadCollectionQueryKey = (options?: Options<GetOrphanedUploadCollectionData>) => createQueryKey('getOrphanedUploadCollection', options);
+
+/**
+ * Get Orphaned Upload Collection
+ *
+ * Get progress or the report of the latest upload collection.
+ *
+ * Only system administrators can view upload collections.
+ *
+ * Args:
+ * _admin: The authenticated admin user.
+ * gc_service: Orphaned upload collector.
+ *
+ * Returns:
+ * Job progress and counts.
+ *
+ * Raises:
+ * HTTPException: If no collection has run recently.
+ */
+export const getOrphanedUploadCollectionOptions = (options?: Options<GetOrphanedUploadCollectionData>) => queryOptions<GetOrphanedUploadCollectionResponse, DefaultError, GetOrphanedUploadCollectionResponse, ReturnType<typeof getOrphanedUploadCollectionQueryKey>>({
+    queryFn: async ({ queryKey, signal }) => {
+        const { data } = await Uploads.getOrphanedUploadCollection({
+            ...options,
+            ...queryKey[0],
+            signal,
+            throwOnError: true
+        });
+        return data;
+    },
+    queryKey: getOrphanedUploadCollectionQueryKey(options)
+});
+
+/**
+ * Collect Orphaned Uploads
+ *
+ * Start collecting uploads no document or revision links to.
+ *
+ * Uploads older than the grace period whose file no document or
+ * revision references are deleted by a background job. Progress and the
+ * report are available from ``GET /uploads/gc``. Only system
+ * administrators can collect uploads.
+ *
+ * Args:
+ * background_tasks: Background task queue for the collection job.
+ * _admin: The authenticated admin user.
+ * gc_service: Orphaned upload collector.
+ * dry_run: Only report what would be deleted.
+ *
+ * Returns:
+ * Initial job status.
+ *
+ * Raises:
+ * HTTPException: If a collection is already running.
+ */
+export const collectOrphanedUploadsMutation = (options?: Partial<Options<CollectOrphanedUploadsData>>): UseMutationOptions<CollectOrphanedUploadsResponse, CollectOrphanedUploadsError, Options<CollectOrphanedUploadsData>> => {
+    const mutationOptions: UseMutationOptions<CollectOrphanedUploadsResponse, CollectOrphanedUploadsError, Options<CollectOrphanedUploadsData>> = {
+        mutationFn: async (fnOptions) => {
+            const { data } = await Uploads.collectOrphanedUploads({
+                ...options,
+                ...fnOptions,
+                throwOnError: true
+            });
+            return data;
+        }
+    };
+    return mutationOptions;
+};
+
 /**
  * Delete Upload
  *
@@ -959,7 +1705,6 @@ export const getUploadQueryKey = (options: Options<GetUploadData>) => createQuer
  * current_user: The authenticated user.
  * upload_service: Upload service.
  * project_repo: Project repository.
- * member_repo: Project member repository.
  *
  * Returns:
  * Upload metadata.
@@ -987,18 +1732,33 @@ export const serveFileQueryKey = (options: Options<ServeFileData>) => createQuer
  *
  * Serve uploaded file content.
  *
- * Note: In production, this should be handled by a CDN or reverse proxy
- * for better performance.
+ * Local files are streamed from disk (sendfile where the server supports
+ * it) with byte-range support. Conditional requests are answered with
+ * 304 Not Modified. With ``UPLOAD_SERVE_MODE=x-accel`` the transfer is
+ * handed to nginx via ``X-Accel-Redirect``. Files in object storage are
+ * served by a redirect to a presigned URL, or streamed through when
+ * presigned downloads are disabled.
+ *
+ * With ``w``, a variant resized to that width is served instead, as AVIF
+ * or WebP when the Accept header allows it and JPEG/PNG otherwise.
+ *
+ * GIFs are served as animated WebP when the Accept header allows it, or
+ * as MP4/WebM with ``video`` where ffmpeg is available. The original GIF
+ * is served when no smaller transcode can be made.
  *
  * Args:
  * storage_path: Storage path of the file.
+ * request: Incoming request.
  * upload_service: Upload service.
+ * w: Optional variant width, one of ``UPLOAD_VARIANT_WIDTHS``.
+ * video: Optional video type for GIFs.
  *
  * Returns:
  * File content as HTTP response.
  *
  * Raises:
- * HTTPException: If file not found.
+ * HTTPException: If file not found, the width is not offered, or the
+ * variant cannot be generated right now.
  */
 export const serveFileOptions = (options: Options<ServeFileData>) => queryOptions<unknown, ServeFileError, unknown, ReturnType<typeof serveFileQueryKey>>({
     queryFn: async ({ queryKey, signal }) => {
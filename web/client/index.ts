@@ -1,4 +1,4 @@
 // This file is auto-generated by @hey-api/openapi-ts
 
 export { Auth, Bookmarks, Documents, Health, type Options, ProjectMembers, Projects, Setup, Uploads, Users } from './sdk.gen';
-export type { AddBookmarkData, AddBookmarkError, AddBookmarkErrors, AddBookmarkResponse, AddBookmarkResponses, AddMemberData, AddMemberError, AddMemberErrors, AddMemberResponse, AddMemberResponses, AdminCreateRequest, BodyUploadImage, BookmarkedProjectRead, BookmarkStatusRead, ClientOptions, CreateAdminData, CreateAdminError, CreateAdminErrors, CreateAdminResponse, CreateAdminResponses, CreateProjectData, CreateProjectError, CreateProjectErrors, CreateProjectResponse, CreateProjectResponses, DeleteDocumentData, DeleteDocumentError, DeleteDocumentErrors, DeleteDocumentResponse, DeleteDocumentResponses, DeleteProjectData, DeleteProjectError, DeleteProjectErrors, DeleteProjectResponse, DeleteProjectResponses, DeleteUploadData, DeleteUploadError, DeleteUploadErrors, DeleteUploadResponse, DeleteUploadResponses, DocumentPutRequest, DocumentRead, DocumentRevisionRead, DocumentTreeNode, GetBookmarkStatusData, GetBookmarkStatusError, GetBookmarkStatusErrors, GetBookmarkStatusResponse, GetBookmarkStatusResponses, GetCurrentUserInfoData, GetCurrentUserInfoResponse, GetCurrentUserInfoResponses, GetDocumentData, GetDocumentError, GetDocumentErrors, GetDocumentHistoryData, GetDocumentHistoryError, GetDocumentHistoryErrors, GetDocumentHistoryResponse, GetDocumentHistoryResponses, GetDocumentResponse, GetDocumentResponses, GetDocumentTreeData, GetDocumentTreeError, GetDocumentTreeErrors, GetDocumentTreeResponse, GetDocumentTreeResponses, GetProjectActivityData, GetProjectActivityError, GetProjectActivityErrors, GetProjectActivityResponse, GetProjectActivityResponses, GetProjectData, GetProjectError, GetProjectErrors, GetProjectPermissionsData, GetProjectPermissionsError, GetProjectPermissionsErrors, GetProjectPermissionsResponse, GetProjectPermissionsResponses, GetProjectResponse, GetProjectResponses, GetSetupStatusData, GetSetupStatusResponse, GetSetupStatusResponses, GetUploadData, GetUploadError, GetUploadErrors, GetUploadResponse, GetUploadResponses, HealthCheckData, HealthCheckResponse, HealthCheckResponses, HealthResponse, HttpValidationError, ListBookmarksData, ListBookmarksError, ListBookmarksErrors, ListBookmarksResponse, ListBookmarksResponses, ListMembersData, ListMembersError, ListMembersErrors, ListMembersResponse, ListMembersResponses, ListProjectsData, ListProjectsError, ListProjectsErrors, ListProjectsResponse, ListProjectsResponses, LoginData, LoginError, LoginErrors, LoginRequest, LoginResponse, LoginResponses, LogoutData, LogoutResponse, LogoutResponses, MemberRole, ProjectBookmarkRead, ProjectCreate, ProjectMemberCreate, ProjectMemberRead, ProjectMemberUpdate, ProjectMemberWithUserRead, ProjectPermissionsRead, ProjectRead, ProjectUpdate, ProjectVisibility, PutDocumentData, PutDocumentError, PutDocumentErrors, PutDocumentResponse, PutDocumentResponses, RefreshData, RefreshError, RefreshErrors, RefreshResponse, RefreshResponses, RefreshTokenRequest, RegisterData, RegisterError, RegisterErrors, RegisterRequest, RegisterResponse, RegisterResponses, RemoveBookmarkData, RemoveBookmarkError, RemoveBookmarkErrors, RemoveBookmarkResponse, RemoveBookmarkResponses, RemoveMemberData, RemoveMemberError, RemoveMemberErrors, RemoveMemberResponse, RemoveMemberResponses, RevisionBatchRead, RevisionDocumentSummary, ServeFileData, ServeFileError, ServeFileErrors, ServeFileResponses, SetupStatusResponse, TokenResponse, UpdateMemberRoleData, UpdateMemberRoleError, UpdateMemberRoleErrors, UpdateMemberRoleResponse, UpdateMemberRoleResponses, UpdateMyProfileData, UpdateMyProfileError, UpdateMyProfileErrors, UpdateMyProfileResponse, UpdateMyProfileResponses, UpdateProjectData, UpdateProjectError, UpdateProjectErrors, UpdateProjectResponse, UpdateProjectResponses, UploadCreateResponse, UploadImageData, UploadImageError, UploadImageErrors, UploadImageResponse, UploadImageResponses, UploadRead, UserProfileUpdate, UserRead, ValidationError } from './types.gen';
+export type { AddBookmarkData, AddBookmarkError, AddBookmarkErrors, AddBookmarkResponse, AddBookmarkResponses, AddMemberData, AddMemberError, AddMemberErrors, AddMemberResponse, AddMemberResponses, AddMembersBulkData, AddMembersBulkError, AddMembersBulkErrors, AddMembersBulkResponse, AddMembersBulkResponses, AdminCreateRequest, AppendResumableUploadChunkData, AppendResumableUploadChunkError, AppendResumableUploadChunkErrors, AppendResumableUploadChunkResponse, AppendResumableUploadChunkResponses, BodyUploadImage, BookmarkedProjectRead, BookmarkStatusRead, BulkInviteConflict, BulkInviteOutcome, ClientOptions, CollectOrphanedUploadsData, CollectOrphanedUploadsError, CollectOrphanedUploadsErrors, CollectOrphanedUploadsResponse, CollectOrphanedUploadsResponses, CompleteDirectUploadData, CompleteDirectUploadError, CompleteDirectUploadErrors, CompleteDirectUploadResponse, CompleteDirectUploadResponses, CreateAdminData, CreateAdminError, CreateAdminErrors, CreateAdminResponse, CreateAdminResponses, CreateProjectData, CreateProjectError, CreateProjectErrors, CreateProjectResponse, CreateProjectResponses, DeleteDocumentData, DeleteDocumentError, DeleteDocumentErrors, DeleteDocumentResponse, DeleteDocumentResponses, DeleteProjectData, DeleteProjectError, DeleteProjectErrors, DeleteProjectResponse, DeleteProjectResponses, DeleteUploadData, DeleteUploadError, DeleteUploadErrors, DeleteUploadResponse, DeleteUploadResponses, DirectUploadCreate, DirectUploadRead, DirectUploadStatus, DirectUploadTicket, DocumentPutRequest, DocumentRead, DocumentRevisionRead, DocumentTreeNode, GetBookmarkStatusData, GetBookmarkStatusError, GetBookmarkStatusErrors, GetBookmarkStatusesData, GetBookmarkStatusesError, GetBookmarkStatusesErrors, GetBookmarkStatusesResponse, GetBookmarkStatusesResponses, GetBookmarkStatusResponse, GetBookmarkStatusResponses, GetCurrentUserInfoData, GetCurrentUserInfoResponse, GetCurrentUserInfoResponses, GetDirectUploadData, GetDirectUploadError, GetDirectUploadErrors, GetDirectUploadResponse, GetDirectUploadResponses, GetDocumentData, GetDocumentError, GetDocumentErrors, GetDocumentHistoryData, GetDocumentHistoryError, GetDocumentHistoryErrors, GetDocumentHistoryResponse, GetDocumentHistoryResponses, GetDocumentResponse, GetDocumentResponses, GetDocumentTreeData, GetDocumentTreeError, GetDocumentTreeErrors, GetDocumentTreeResponse, GetDocumentTreeResponses, GetOrphanedUploadCollectionData, GetOrphanedUploadCollectionResponse, GetOrphanedUploadCollectionResponses, GetProjectActivityData, GetProjectActivityError, GetProjectActivityErrors, GetProjectActivityResponse, GetProjectActivityResponses, GetProjectData, GetProjectDeletionData, GetProjectDeletionError, GetProjectDeletionErrors, GetProjectDeletionResponse, GetProjectDeletionResponses, GetProjectError, GetProjectErrors, GetProjectPermissionsData, GetProjectPermissionsError, GetProjectPermissionsErrors, GetProjectPermissionsResponse, GetProjectPermissionsResponses, GetProjectResponse, GetProjectResponses, GetProjectStorageUsageData, GetProjectStorageUsageError, GetProjectStorageUsageErrors, GetProjectStorageUsageResponse, GetProjectStorageUsageResponses, GetResumableUploadOffsetData, GetResumableUploadOffsetError, GetResumableUploadOffsetErrors, GetResumableUploadOffsetResponses, GetSetupStatusData, GetSetupStatusResponse, GetSetupStatusResponses, GetUploadData, GetUploadError, GetUploadErrors, GetUploadResponse, GetUploadResponses, GetUploadStorageStatsData, GetUploadStorageStatsResponse, GetUploadStorageStatsResponses, HealthCheckData, HealthCheckResponse, HealthCheckResponses, HealthResponse, HttpValidationError, ImageProcessingMetricsData, ImageProcessingMetricsResponse, ImageProcessingMetricsResponse, ImageProcessingMetricsResponses, ListBookmarksData, ListBookmarksError, ListBookmarksErrors, ListBookmarksResponse, ListBookmarksResponses, ListMembersData, ListMembersError, ListMembersErrors, ListMembersResponse, ListMembersResponses, ListProjectsData, ListProjectsError, ListProjectsErrors, ListProjectsResponse, ListProjectsResponses, ListUsersData, ListUsersError, ListUsersErrors, ListUsersResponse, ListUsersResponses, LoginData, LoginError, LoginErrors, LoginRequest, LoginResponse, LoginResponses, LogoutData, LogoutResponse, LogoutResponses, MemberRole, ProjectBookmarkRead, ProjectBookmarkStatusRead, ProjectCreate, ProjectDeletionRead, ProjectDeletionStatus, ProjectListInclude, ProjectListItemRead, ProjectMemberBulkCreate, ProjectMemberCreate, ProjectMemberInvite, ProjectMemberInviteResult, ProjectMemberRead, ProjectMemberUpdate, ProjectMemberWithUserRead, ProjectPermissionsRead, ProjectRead, ProjectStorageUsageRead, ProjectUpdate, ProjectVisibility, PutDocumentData, PutDocumentError, PutDocumentErrors, PutDocumentResponse, PutDocumentResponses, ReceiveDirectUploadData, ReceiveDirectUploadError, ReceiveDirectUploadErrors, ReceiveDirectUploadResponse, ReceiveDirectUploadResponses, RefreshData, RefreshError, RefreshErrors, RefreshResponse, RefreshResponses, RefreshTokenRequest, RegisterData, RegisterError, RegisterErrors, RegisterRequest, RegisterResponse, RegisterResponses, RemoveBookmarkData, RemoveBookmarkError, RemoveBookmarkErrors, RemoveBookmarkResponse, RemoveBookmarkResponses, RemoveMemberData, RemoveMemberError, RemoveMemberErrors, RemoveMemberResponse, RemoveMemberResponses, RevisionBatchRead, RevisionDocumentSummary, SearchUsersData, SearchUsersError, SearchUsersErrors, SearchUsersResponse, SearchUsersResponses, ServeFileData, ServeFileError, ServeFileErrors, ServeFileResponses, SetupStatusResponse, StartDirectUploadData, StartDirectUploadError, StartDirectUploadErrors, StartDirectUploadResponse, StartDirectUploadResponses, StartResumableUploadData, StartResumableUploadError, StartResumableUploadErrors, StartResumableUploadResponse, StartResumableUploadResponses, TokenResponse, UpdateMemberRoleData, UpdateMemberRoleError, UpdateMemberRoleErrors, UpdateMemberRoleResponse, UpdateMemberRoleResponses, UpdateMyProfileData, UpdateMyProfileError, UpdateMyProfileErrors, UpdateMyProfileResponse, UpdateMyProfileResponses, UpdateProjectData, UpdateProjectError, UpdateProjectErrors, UpdateProjectResponse, UpdateProjectResponses, UploadCreateResponse, UploadGcRead, UploadGcStatus, UploadImageData, UploadImageError, UploadImageErrors, UploadImageResponse, UploadImageResponses, UploadRead, UploadStorageStatsRead, UserProfileUpdate, UserRead, UserSummaryRead, ValidationError } from './types.gen';
@@ -2,7 +2,7 @@
 
 import { type Client, formDataBodySerializer, type Options as Options2, type TDataShape } from './client';
 import { client } from './client.gen';
-import type { AddBookmarkData, AddBookmarkErrors, AddBookmarkResponses, AddMemberData, AddMemberErrors, AddMemberResponses, CreateAdminData, CreateAdminErrors, CreateAdminResponses, CreateProjectData, CreateProjectErrors, CreateProjectResponses, DeleteDocumentData, DeleteDocumentErrors, DeleteDocumentResponses, DeleteProjectData, DeleteProjectErrors, DeleteProjectResponses, DeleteUploadData, DeleteUploadErrors, DeleteUploadResponses, GetBookmarkStatusData, GetBookmarkStatusErrors, GetBookmarkStatusResponses, GetCurrentUserInfoData, GetCurrentUserInfoResponses, GetDocumentData, GetDocumentErrors, GetDocumentHistoryData, GetDocumentHistoryErrors, GetDocumentHistoryResponses, GetDocumentResponses, GetDocumentTreeData, GetDocumentTreeErrors, GetDocumentTreeResponses, GetProjectActivityData, GetProjectActivityErrors, GetProjectActivityResponses, GetProjectData, GetProjectErrors, GetProjectPermissionsData, GetProjectPermissionsErrors, GetProjectPermissionsResponses, GetProjectResponses, GetSetupStatusData, GetSetupStatusResponses, GetUploadData, GetUploadErrors, GetUploadResponses, HealthCheckData, HealthCheckResponses, ListBookmarksData, ListBookmarksErrors, ListBookmarksResponses, ListMembersData, ListMembersErrors, ListMembersResponses, ListProjectsData, ListProjectsErrors, ListProjectsResponses, LoginData, LoginErrors, LoginResponses, LogoutData, LogoutResponses, PutDocumentData, PutDocumentErrors, PutDocumentResponses, RefreshData, RefreshErrors, RefreshResponses, RegisterData, RegisterErrors, RegisterResponses, RemoveBookmarkData, RemoveBookmarkErrors, RemoveBookmarkResponses, RemoveMemberData, RemoveMemberErrors, RemoveMemberResponses, ServeFileData, ServeFileErrors, ServeFileResponses, UpdateMemberRoleData, UpdateMemberRoleErrors, UpdateMemberRoleResponses, UpdateMyProfileData, UpdateMyProfileErrors, UpdateMyProfileResponses, UpdateProjectData, UpdateProjectErrors, UpdateProjectResponses, UploadImageData, UploadImageErrors, UploadImageResponses } from './types.gen';
+import type { AddBookmarkData, AddBookmarkErrors, AddBookmarkResponses, AddMemberData, AddMemberErrors, AddMemberResponses, AddMembersBulkData, AddMembersBulkErrors, AddMembersBulkResponses, AppendResumableUploadChunkData, AppendResumableUploadChunkErrors, AppendResumableUploadChunkResponses, CollectOrphanedUploadsData, CollectOrphanedUploadsErrors, CollectOrphanedUploadsResponses, CompleteDirectUploadData, CompleteDirectUploadErrors, CompleteDirectUploadResponses, CreateAdminData, CreateAdminErrors, CreateAdminResponses, CreateProjectData, CreateProjectErrors, CreateProjectResponses, DeleteDocumentData, DeleteDocumentErrors, DeleteDocumentResponses, DeleteProjectData, DeleteProjectErrors, DeleteProjectResponses, DeleteUploadData, DeleteUploadErrors, DeleteUploadResponses, GetBookmarkStatusData, GetBookmarkStatusErrors, GetBookmarkStatusesData, GetBookmarkStatusesErrors, GetBookmarkStatusesResponses, GetBookmarkStatusResponses, GetCurrentUserInfoData, GetCurrentUserInfoResponses, GetDirectUploadData, GetDirectUploadErrors, GetDirectUploadResponses, GetDocumentData, GetDocumentErrors, GetDocumentHistoryData, GetDocumentHistoryErrors, GetDocumentHistoryResponses, GetDocumentResponses, GetDocumentTreeData, GetDocumentTreeErrors, GetDocumentTreeResponses, GetOrphanedUploadCollectionData, GetOrphanedUploadCollectionResponses, GetProjectActivityData, GetProjectActivityErrors, GetProjectActivityResponses, GetProjectData, GetProjectDeletionData, GetProjectDeletionErrors, GetProjectDeletionResponses, GetProjectErrors, GetProjectPermissionsData, GetProjectPermissionsErrors, GetProjectPermissionsResponses, GetProjectResponses, GetProjectStorageUsageData, GetProjectStorageUsageErrors, GetProjectStorageUsageResponses, GetResumableUploadOffsetData, GetResumableUploadOffsetErrors, GetResumableUploadOffsetResponses, GetSetupStatusData, GetSetupStatusResponses, GetUploadData, GetUploadErrors, GetUploadResponses, GetUploadStorageStatsData, GetUploadStorageStatsResponses, HealthCheckData, HealthCheckResponses, ImageProcessingMetricsData, ImageProcessingMetricsResponses, ListBookmarksData, ListBookmarksErrors, ListBookmarksResponses, ListMembersData, ListMembersErrors, ListMembersResponses, ListProjectsData, ListProjectsErrors, ListProjectsResponses, ListUsersData, ListUsersErrors, ListUsersResponses, LoginData, LoginErrors, LoginResponses, LogoutData, LogoutResponses, PutDocumentData, PutDocumentErrors, PutDocumentResponses, ReceiveDirectUploadData, ReceiveDirectUploadErrors, ReceiveDirectUploadResponses, RefreshData, RefreshErrors, RefreshResponses, RegisterData, RegisterErrors, RegisterResponses, RemoveBookmarkData, RemoveBookmarkErrors, RemoveBookmarkResponses, RemoveMemberData, RemoveMemberErrors, RemoveMemberResponses, SearchUsersData, SearchUsersErrors, SearchUsersResponses, ServeFileData, ServeFileErrors, ServeFileResponses, StartDirectUploadData, StartDirectUploadErrors, StartDirectUploadResponses, StartResumableUploadData, StartResumableUploadErrors, StartResumableUploadResponses, UpdateMemberRoleData, UpdateMemberRoleErrors, UpdateMemberRoleResponses, UpdateMyProfileData, UpdateMyProfileErrors, UpdateMyProfileResponses, UpdateProjectData, UpdateProjectErrors, UpdateProjectResponses, UploadImageData, UploadImageErrors, UploadImageResponses } from './types.gen';
 
 export type Options<TData extends TDataShape = TDataShape, ThrowOnError extends boolean = boolean> = Options2<TData, ThrowOnError> & {
     /**
@@ -29,6 +29,19 @@ export class Health {
     public static healthCheck<ThrowOnError extends boolean = false>(options?: Options<HealthCheckData, ThrowOnError>) {
         return (options?.client ?? client).get<HealthCheckResponses, unknown, ThrowOnError>({ url: '/api/v1/health', ...options });
     }
+    
+    /**
+     * Image Processing Metrics
+     *
+     * Image processing metrics.
+     *
+     * Returns the queue depth, job counters and job durations of this API
+     * worker's image processing pool. Counters are per worker process and
+     * reset on restart.
+     */
+    public static imageProcessingMetrics<ThrowOnError extends boolean = false>(options?: Options<ImageProcessingMetricsData, ThrowOnError>) {
+        return (options?.client ?? client).get<ImageProcessingMetricsResponses, unknown, ThrowOnError>({ url: '/api/v1/health/image-processing', ...options });
+    }
 }
 
 export class Auth {
@@ -148,6 +161,60 @@ export class Auth {
 }
 
 export class Users {
+    /**
+     * List Users
+     *
+     * List all users for the admin user directory.
+     *
+     * Only system administrators can list users. ``q`` filters by name or
+     * email (prefix or substring, case-insensitive). When a full page is
+     * returned, the ``X-Next-Cursor`` header holds the cursor for the next
+     * page.
+     *
+     * Args:
+     * response: Response used to set the next-page cursor header.
+     * _admin: The authenticated admin user.
+     * service: User service.
+     * q: Optional name or email search text.
+     * limit: Maximum number of records to return.
+     * cursor: Opaque cursor from a previous ``X-Next-Cursor`` header.
+     *
+     * Returns:
+     * List of users, oldest first.
+     *
+     * Raises:
+     * HTTPException: If the cursor is malformed.
+     */
+    public static listUsers<ThrowOnError extends boolean = false>(options?: Options<ListUsersData, ThrowOnError>) {
+        return (options?.client ?? client).get<ListUsersResponses, ListUsersErrors, ThrowOnError>({
+            security: [{ scheme: 'bearer', type: 'http' }],
+            url: '/api/v1/users',
+            ...options
+        });
+    }
+    
+    /**
+     * Search Users
+     *
+     * Search users by name or email, e.g. for the member invite dialog.
+     *
+     * Args:
+     * _current_user: The authenticated user.
+     * service: User service.
+     * q: Name or email search text (prefix or substring).
+     * limit: Maximum number of records to return.
+     *
+     * Returns:
+     * Matching users with public profile fields only.
+     */
+    public static searchUsers<ThrowOnError extends boolean = false>(options: Options<SearchUsersData, ThrowOnError>) {
+        return (options.client ?? client).get<SearchUsersResponses, SearchUsersErrors, ThrowOnError>({
+            security: [{ scheme: 'bearer', type: 'http' }],
+            url: '/api/v1/users/search',
+            ...options
+        });
+    }
+    
     /**
      * Update My Profile
      *
@@ -182,14 +249,29 @@ export class Projects {
      * - Projects where user is a member
      * - Public projects
      *
+     * Pass ``include=permissions`` and/or ``include=bookmark`` to also return
+     * the current user's permissions and bookmark state on every project,
+     * resolved in the same query as the list. Document count and last
+     * activity are always returned from denormalized project columns.
+     *
+     * When a full page is returned, the ``X-Next-Cursor`` response header
+     * holds a cursor for the next page. Passing it back as ``cursor`` pages
+     * by keyset, which stays fast on deep pages unlike ``skip``.
+     *
      * Args:
+     * response: Response used to set the next-page cursor header.
      * current_user: The authenticated user.
      * project_service: Project service.
      * skip: Number of records to skip (pagination).
      * limit: Maximum number of records to return.
+     * cursor: Opaque cursor from a previous ``X-Next-Cursor`` header.
+     * include: Optional extra data to include per project.
      *
      * Returns:
      * List of accessible projects.
+     *
+     * Raises:
+     * HTTPException: If the cursor is malformed.
      */
     public static listProjects<ThrowOnError extends boolean = false>(options?: Options<ListProjectsData, ThrowOnError>) {
         return (options?.client ?? client).get<ListProjectsResponses, ListProjectsErrors, ThrowOnError>({
@@ -232,11 +314,18 @@ export class Projects {
      *
      * Delete a project.
      *
+     * The project is hidden immediately and its data is removed by a
+     * background job. Progress is available from ``GET /{slug}/deletion``.
+     *
      * Args:
      * slug: The project slug.
+     * background_tasks: Background task queue for the deletion job.
      * current_user: The authenticated user.
      * project_service: Project service.
      *
+     * Returns:
+     * Initial deletion status.
+     *
      * Raises:
      * HTTPException: If project is not found or user is not the owner.
      */
@@ -257,7 +346,6 @@ export class Projects {
      * slug: The project slug.
      * current_user: The authenticated user.
      * project_service: Project service.
-     * member_repo: Project member repository.
      *
      * Returns:
      * The project.
@@ -302,6 +390,32 @@ export class Projects {
         });
     }
     
+    /**
+     * Get Project Deletion
+     *
+     * Get progress of a pending project deletion.
+     *
+     * Returns 404 once the deletion has completed.
+     *
+     * Args:
+     * slug: The project slug.
+     * current_user: The authenticated user.
+     * deletion_service: Project deletion service.
+     *
+     * Returns:
+     * Deletion progress.
+     *
+     * Raises:
+     * HTTPException: If no deletion is pending or user is not the owner.
+     */
+    public static getProjectDeletion<ThrowOnError extends boolean = false>(options: Options<GetProjectDeletionData, ThrowOnError>) {
+        return (options.client ?? client).get<GetProjectDeletionResponses, GetProjectDeletionErrors, ThrowOnError>({
+            security: [{ scheme: 'bearer', type: 'http' }],
+            url: '/api/v1/projects/{slug}/deletion',
+            ...options
+        });
+    }
+    
     /**
      * Get Project Permissions
      *
@@ -316,7 +430,6 @@ export class Projects {
      * slug: The project slug.
      * current_user: The authenticated user.
      * project_service: Project service.
-     * member_repo: Project member repository.
      *
      * Returns:
      * User's permissions and role on the project.
@@ -478,14 +591,20 @@ export class ProjectMembers {
      *
      * List all members of a project.
      *
-     * All project members (viewer+) can view the member list.
+     * All project members (viewer+) can view the member list. ``q`` filters
+     * by member name or email (prefix or substring, case-insensitive). When
+     * a full page is returned, the ``X-Next-Cursor`` header holds a cursor
+     * for the next page.
      *
      * Args:
      * slug: The project slug.
+     * response: Response used to set the next-page cursor header.
      * current_user: The authenticated user.
      * member_service: Project member service.
      * skip: Number of records to skip (pagination).
      * limit: Maximum number of records to return.
+     * q: Optional name or email search text.
+     * cursor: Opaque cursor from a previous ``X-Next-Cursor`` header.
      *
      * Returns:
      * List of project members with user details.
@@ -526,6 +645,39 @@ export class ProjectMembers {
         });
     }
     
+    /**
+     * Add Members Bulk
+     *
+     * Add many members to a project at once.
+     *
+     * Users may be given by ID or email. Unknown users, the owner and
+     * duplicates are reported per entry instead of failing the request.
+     * Existing members are skipped, or have their role updated with
+     * ``on_conflict=update_role``.
+     *
+     * Only project admins and owners can add members.
+     *
+     * Args:
+     * slug: The project slug.
+     * request: Invites and conflict handling.
+     * current_user: The authenticated user.
+     * member_service: Project member service.
+     *
+     * Returns:
+     * Outcome per invite, in request order.
+     */
+    public static addMembersBulk<ThrowOnError extends boolean = false>(options: Options<AddMembersBulkData, ThrowOnError>) {
+        return (options.client ?? client).post<AddMembersBulkResponses, AddMembersBulkErrors, ThrowOnError>({
+            security: [{ scheme: 'bearer', type: 'http' }],
+            url: '/api/v1/projects/{slug}/members/bulk',
+            ...options,
+            headers: {
+                'Content-Type': 'application/json',
+                ...options.headers
+            }
+        });
+    }
+    
     /**
      * Remove Member
      *
@@ -602,6 +754,31 @@ export class Bookmarks {
         });
     }
     
+    /**
+     * Get Bookmark Statuses
+     *
+     * Check whether each of many projects is bookmarked by the current user.
+     *
+     * Answers for every slug in one query, so list views do not need one
+     * ``GET /projects/{slug}/bookmark`` call per project. Pass ``slug``
+     * repeatedly (up to 100 times). Unknown slugs are left out.
+     *
+     * Args:
+     * current_user: The authenticated user.
+     * bookmark_service: Bookmark service.
+     * slug: Project slugs to check.
+     *
+     * Returns:
+     * Bookmark status per project, in request order.
+     */
+    public static getBookmarkStatuses<ThrowOnError extends boolean = false>(options: Options<GetBookmarkStatusesData, ThrowOnError>) {
+        return (options.client ?? client).get<GetBookmarkStatusesResponses, GetBookmarkStatusesErrors, ThrowOnError>({
+            security: [{ scheme: 'bearer', type: 'http' }],
+            url: '/api/v1/bookmarks/status',
+            ...options
+        });
+    }
+    
     /**
      * Remove Bookmark
      *
@@ -733,7 +910,6 @@ export class Uploads {
      * current_user: The authenticated user.
      * upload_service: Upload service.
      * project_repo: Project repository.
-     * member_repo: Project member repository.
      *
      * Returns:
      * Upload metadata including URL.
@@ -754,6 +930,317 @@ export class Uploads {
         });
     }
     
+    /**
+     * Start Direct Upload
+     *
+     * Start an upload whose file is sent straight to storage.
+     *
+     * 1. Call this endpoint with the file's name, type and exact size.
+     * 2. Send the file as the body of a PUT to ``upload_url`` with the
+     * returned headers, before ``expires_at``.
+     * 3. Call ``POST /uploads/direct/{id}/complete``. The file is validated
+     * and processed in the background; poll ``GET /uploads/direct/{id}``
+     * for the created upload.
+     *
+     * With object storage the file goes to the bucket directly and never
+     * passes through the API.
+     *
+     * Args:
+     * project_id: UUID of the project.
+     * body: Declared file name, type and size.
+     * current_user: The authenticated user.
+     * upload_service: Upload service.
+     * project_repo: Project repository.
+     *
+     * Returns:
+     * Where and how to send the file.
+     *
+     * Raises:
+     * HTTPException: If access is denied or the file is not accepted.
+     */
+    public static startDirectUpload<ThrowOnError extends boolean = false>(options: Options<StartDirectUploadData, ThrowOnError>) {
+        return (options.client ?? client).post<StartDirectUploadResponses, StartDirectUploadErrors, ThrowOnError>({
+            security: [{ scheme: 'bearer', type: 'http' }],
+            url: '/api/v1/projects/{project_id}/uploads/direct',
+            ...options,
+            headers: {
+                'Content-Type': 'application/json',
+                ...options.headers
+            }
+        });
+    }
+    
+    /**
+     * Get Direct Upload
+     *
+     * Get the state of a direct upload.
+     *
+     * Args:
+     * token: Direct upload token.
+     * current_user: The authenticated user.
+     * upload_service: Upload service.
+     *
+     * Returns:
+     * State of the upload, with the created upload once completed.
+     *
+     * Raises:
+     * HTTPException: If the upload is not found or belongs to another user.
+     */
+    public static getDirectUpload<ThrowOnError extends boolean = false>(options: Options<GetDirectUploadData, ThrowOnError>) {
+        return (options.client ?? client).get<GetDirectUploadResponses, GetDirectUploadErrors, ThrowOnError>({
+            security: [{ scheme: 'bearer', type: 'http' }],
+            url: '/api/v1/uploads/direct/{token}',
+            ...options
+        });
+    }
+    
+    /**
+     * Receive Direct Upload
+     *
+     * Receive the file of a direct upload when storage takes no uploads.
+     *
+     * The ``upload_url`` of a direct upload points here with local storage.
+     * The body is the raw file, written to storage as it arrives. The token
+     * authorizes the request, so no Authorization header is needed.
+     *
+     * Args:
+     * token: Direct upload token.
+     * request: The request, whose body is streamed.
+     * upload_service: Upload service.
+     *
+     * Raises:
+     * HTTPException: If the token is invalid or the body is not accepted.
+     */
+    public static receiveDirectUpload<ThrowOnError extends boolean = false>(options: Options<ReceiveDirectUploadData, ThrowOnError>) {
+        return (options.client ?? client).put<ReceiveDirectUploadResponses, ReceiveDirectUploadErrors, ThrowOnError>({ url: '/api/v1/uploads/direct/{token}', ...options });
+    }
+    
+    /**
+     * Complete Direct Upload
+     *
+     * Finish a direct upload once its file has been sent.
+     *
+     * The file is validated and processed by a background job. Progress is
+     * available from ``GET /uploads/direct/{token}``.
+     *
+     * Args:
+     * token: Direct upload token.
+     * background_tasks: Background task queue for the processing job.
+     * current_user: The authenticated user.
+     * upload_service: Upload service.
+     *
+     * Returns:
+     * State of the upload.
+     *
+     * Raises:
+     * HTTPException: If the upload is not found, belongs to another user
+     * or its file has not arrived.
+     */
+    public static completeDirectUpload<ThrowOnError extends boolean = false>(options: Options<CompleteDirectUploadData, ThrowOnError>) {
+        return (options.client ?? client).post<CompleteDirectUploadResponses, CompleteDirectUploadErrors, ThrowOnError>({
+            security: [{ scheme: 'bearer', type: 'http' }],
+            url: '/api/v1/uploads/direct/{token}/complete',
+            ...options
+        });
+    }
+    
+    /**
+     * Start Resumable Upload
+     *
+     * Start an upload that is sent in chunks and survives dropped connections.
+     *
+     * Modelled on the tus protocol:
+     *
+     * 1. Call this endpoint with the file's name, type and exact size.
+     * 2. Send the file in chunks as PATCH requests to ``upload_url``, each
+     * with an ``Upload-Offset`` header giving where the chunk starts and
+     * ``Content-Type: application/offset+octet-stream``. After an error,
+     * ``HEAD upload_url`` returns the ``Upload-Offset`` to continue from.
+     * 3. Call ``POST /uploads/direct/{id}/complete`` and poll
+     * ``GET /uploads/direct/{id}`` as for a direct upload.
+     *
+     * Args:
+     * project_id: UUID of the project.
+     * body: Declared file name, type and size.
+     * response: Response used to set the Location header.
+     * current_user: The authenticated user.
+     * upload_service: Upload service.
+     * project_repo: Project repository.
+     *
+     * Returns:
+     * Where and how to send the chunks.
+     *
+     * Raises:
+     * HTTPException: If access is denied or the file is not accepted.
+     */
+    public static startResumableUpload<ThrowOnError extends boolean = false>(options: Options<StartResumableUploadData, ThrowOnError>) {
+        return (options.client ?? client).post<StartResumableUploadResponses, StartResumableUploadErrors, ThrowOnError>({
+            security: [{ scheme: 'bearer', type: 'http' }],
+            url: '/api/v1/projects/{project_id}/uploads/resumable',
+            ...options,
+            headers: {
+                'Content-Type': 'application/json',
+                ...options.headers
+            }
+        });
+    }
+    
+    /**
+     * Get Resumable Upload Offset
+     *
+     * Get how much of a resumable upload has been received.
+     *
+     * Args:
+     * token: Direct upload token.
+     * current_user: The authenticated user.
+     * upload_service: Upload service.
+     *
+     * Returns:
+     * Empty response with ``Upload-Offset`` and ``Upload-Length`` headers.
+     *
+     * Raises:
+     * HTTPException: If the upload is not found or belongs to another user.
+     */
+    public static getResumableUploadOffset<ThrowOnError extends boolean = false>(options: Options<GetResumableUploadOffsetData, ThrowOnError>) {
+        return (options.client ?? client).head<GetResumableUploadOffsetResponses, GetResumableUploadOffsetErrors, ThrowOnError>({
+            security: [{ scheme: 'bearer', type: 'http' }],
+            url: '/api/v1/uploads/resumable/{token}',
+            ...options
+        });
+    }
+    
+    /**
+     * Append Resumable Upload Chunk
+     *
+     * Receive the next chunk of a resumable upload.
+     *
+     * The body is written to storage as it arrives. ``Upload-Offset`` must
+     * equal the bytes received so far; a chunk cut off part way is
+     * discarded and must be sent again from the offset returned by HEAD.
+     *
+     * Args:
+     * token: Direct upload token.
+     * upload_offset: Offset the chunk starts at.
+     * request: The request, whose body is streamed.
+     * current_user: The authenticated user.
+     * upload_service: Upload service.
+     *
+     * Returns:
+     * Empty response with the new ``Upload-Offset`` header.
+     *
+     * Raises:
+     * HTTPException: If the upload is not found or belongs to another
+     * user, the offset is wrong, or the chunk is not accepted.
+     */
+    public static appendResumableUploadChunk<ThrowOnError extends boolean = false>(options: Options<AppendResumableUploadChunkData, ThrowOnError>) {
+        return (options.client ?? client).patch<AppendResumableUploadChunkResponses, AppendResumableUploadChunkErrors, ThrowOnError>({
+            security: [{ scheme: 'bearer', type: 'http' }],
+            url: '/api/v1/uploads/resumable/{token}',
+            ...options
+        });
+    }
+    
+    /**
+     * Get Upload Storage Stats
+     *
+     * Report storage saved by deduplicating identical uploads.
+     *
+     * Only system administrators can view storage statistics.
+     *
+     * Args:
+     * _admin: The authenticated admin user.
+     * upload_service: Upload service.
+     *
+     * Returns:
+     * Uploaded and stored byte totals.
+     */
+    public static getUploadStorageStats<ThrowOnError extends boolean = false>(options?: Options<GetUploadStorageStatsData, ThrowOnError>) {
+        return (options?.client ?? client).get<GetUploadStorageStatsResponses, unknown, ThrowOnError>({
+            security: [{ scheme: 'bearer', type: 'http' }],
+            url: '/api/v1/uploads/stats',
+            ...options
+        });
+    }
+    
+    /**
+     * Get Project Storage Usage
+     *
+     * List the projects using the most storage.
+     *
+     * Totals are maintained as content is written and recounted
+     * periodically. Only system administrators can view storage usage.
+     *
+     * Args:
+     * _admin: The authenticated admin user.
+     * usage_service: Storage usage service.
+     * limit: Maximum number of projects.
+     *
+     * Returns:
+     * Storage usage per project, largest first.
+     */
+    public static getProjectStorageUsage<ThrowOnError extends boolean = false>(options?: Options<GetProjectStorageUsageData, ThrowOnError>) {
+        return (options?.client ?? client).get<GetProjectStorageUsageResponses, GetProjectStorageUsageErrors, ThrowOnError>({
+            security: [{ scheme: 'bearer', type: 'http' }],
+            url: '/api/v1/uploads/stats/projects',
+            ...options
+        });
+    }
+    
+    /**
+     * Get Orphaned Upload Collection
+     *
+     * Get progress or the report of the latest upload collection.
+     *
+     * Only system administrators can view upload collections.
+     *
+     * Args:
+     * _admin: The authenticated admin user.
+     * gc_service: Orphaned upload collector.
+     *
+     * Returns:
+     * Job progress and counts.
+     *
+     * Raises:
+     * HTTPException: If no collection has run recently.
+     */
+    public static getOrphanedUploadCollection<ThrowOnError extends boolean = false>(options?: Options<GetOrphanedUploadCollectionData, ThrowOnError>) {
+        return (options?.client ?? client).get<GetOrphanedUploadCollectionResponses, unknown, ThrowOnError>({
+            security: [{ scheme: 'bearer', type: 'http' }],
+            url: '/api/v1/uploads/gc',
+            ...options
+        });
+    }
+    
+    /**
+     * Collect Orphaned Uploads
+     *
+     * Start collecting uploads no document or revision links to.
+     *
+     * Uploads older than the grace period whose file no document or
+     * revision references are deleted by a background job. Progress and the
+     * report are available from ``GET /uploads/gc``. Only system
+     * administrators can collect uploads.
+     *
+     * Args:
+     * background_tasks: Background task queue for the collection job.
+     * _admin: The authenticated admin user.
+     * gc_service: Orphaned upload collector.
+     * dry_run: Only report what would be deleted.
+     *
+     * Returns:
+     * Initial job status.
+     *
+     * Raises:
+     * HTTPException: If a collection is already running.
+     */
+    public static collectOrphanedUploads<ThrowOnError extends boolean = false>(options?: Options<CollectOrphanedUploadsData, ThrowOnError>) {
+        return (options?.client ?? client).post<CollectOrphanedUploadsResponses, CollectOrphanedUploadsErrors, ThrowOnError>({
+            security: [{ scheme: 'bearer', type: 'http' }],
+            url: '/api/v1/uploads/gc',
+            ...options
+        });
+    }
+    
     /**
      * Delete Upload
      *
@@ -787,7 +1274,6 @@ export class Uploads {
      * current_user: The authenticated user.
      * upload_service: Upload service.
      * project_repo: Project repository.
-     * member_repo: Project member repository.
      *
      * Returns:
      * Upload metadata.
@@ -808,18 +1294,33 @@ export class Uploads {
      *
      * Serve uploaded file content.
      *
-     * Note: In production, this should be handled by a CDN or reverse proxy
-     * for better performance.
+     * Local files are streamed from disk (sendfile where the server supports
+     * it) with byte-range support. Conditional requests are answered with
+     * 304 Not Modified. With ``UPLOAD_SERVE_MODE=x-accel`` the transfer is
+     * handed to nginx via ``X-Accel-Redirect``. Files in object storage are
+     * served by a redirect to a presigned URL, or streamed through when
+     * presigned downloads are disabled.
+     *
+     * With ``w``, a variant resized to that width is served instead, as AVIF
+     * or WebP when the Accept header allows it and JPEG/PNG otherwise.
+     *
+     * GIFs are served as animated WebP when the Accept header allows it, or
+     * as MP4/WebM with ``video`` where ffmpeg is available. The original GIF
+     * is served when no smaller transcode can be made.
      *
      * Args:
      * storage_path: Storage path of the file.
+     * request: Incoming request.
      * upload_service: Upload service.
+     * w: Optional variant width, one of ``UPLOAD_VARIANT_WIDTHS``.
+     * video: Optional video type for GIFs.
      *
      * Returns:
      * File content as HTTP response.
      *
      * Raises:
-     * HTTPException: If file not found.
+     * HTTPException: If file not found, the width is not offered, or the
+     * variant cannot be generated right now.
      */
     public static serveFile<ThrowOnError extends boolean = false>(options: Options<ServeFileData, ThrowOnError>) {
         return (options.client ?? client).get<ServeFileResponses, ServeFileErrors, ThrowOnError>({ url: '/api/v1/uploads/file/{storage_path}', ...options });
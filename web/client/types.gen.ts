@@ -69,6 +69,116 @@ export type BookmarkedProjectRead = {
     project: ProjectRead;
 };
 
+/**
+ * BulkInviteConflict
+ *
+ * What to do when an invited user is already a member.
+ */
+export type BulkInviteConflict = 'skip' | 'update_role';
+
+/**
+ * BulkInviteOutcome
+ *
+ * Result of one entry of a bulk member invitation.
+ */
+export type BulkInviteOutcome = 'added' | 'role_updated' | 'already_member' | 'user_not_found' | 'is_owner' | 'duplicate';
+
+/**
+ * DirectUploadCreate
+ *
+ * Schema for starting an upload sent straight to storage.
+ */
+export type DirectUploadCreate = {
+    /**
+     * Filename
+     */
+    filename: string;
+    /**
+     * Mime Type
+     *
+     * Content-Type the file will be sent with
+     */
+    mime_type: string;
+    /**
+     * Size Bytes
+     *
+     * Exact size of the file in bytes
+     */
+    size_bytes: number;
+};
+
+/**
+ * DirectUploadRead
+ *
+ * Schema for reading the state of a direct upload.
+ */
+export type DirectUploadRead = {
+    /**
+     * Id
+     *
+     * Direct upload token
+     */
+    id: string;
+    status: DirectUploadStatus;
+    /**
+     * Error
+     *
+     * Why the upload failed
+     */
+    error?: string | null;
+    /**
+     * The created upload, once completed
+     */
+    upload?: UploadCreateResponse | null;
+};
+
+/**
+ * DirectUploadStatus
+ *
+ * State of a direct upload.
+ */
+export type DirectUploadStatus = 'pending' | 'processing' | 'completed' | 'failed';
+
+/**
+ * DirectUploadTicket
+ *
+ * Schema telling the client where and how to send the file.
+ */
+export type DirectUploadTicket = {
+    /**
+     * Id
+     *
+     * Direct upload token
+     */
+    id: string;
+    /**
+     * Upload Url
+     *
+     * URL to send the file to
+     */
+    upload_url: string;
+    /**
+     * Method
+     *
+     * HTTP method to send it with
+     */
+    method?: string;
+    /**
+     * Headers
+     *
+     * Headers the request must carry
+     */
+    headers: {
+        [key: string]: string;
+    };
+    /**
+     * Expires At
+     *
+     * When upload_url stops accepting
+     */
+    expires_at: string;
+};
+
 /**
  * DocumentPutRequest
  *
@@ -255,6 +365,50 @@ export type HealthResponse = {
     database: string;
 };
 
+/**
+ * ImageProcessingMetricsResponse
+ *
+ * Image processing pool metrics for the API worker serving the request.
+ */
+export type ImageProcessingMetricsResponse = {
+    /**
+     * Workers
+     */
+    workers: number;
+    /**
+     * Running
+     */
+    running: number;
+    /**
+     * Queued
+     */
+    queued: number;
+    /**
+     * Completed
+     */
+    completed: number;
+    /**
+     * Failed
+     */
+    failed: number;
+    /**
+     * Rejected
+     */
+    rejected: number;
+    /**
+     * Timed Out
+     */
+    timed_out: number;
+    /**
+     * Job Seconds Total
+     */
+    job_seconds_total: number;
+    /**
+     * Job Seconds Max
+     */
+    job_seconds_max: number;
+};
+
 /**
  * LoginRequest
  *
@@ -298,6 +452,22 @@ export type ProjectBookmarkRead = {
     created_at: string;
 };
 
+/**
+ * ProjectBookmarkStatusRead
+ *
+ * Schema for one project's entry in a batch bookmark status response.
+ */
+export type ProjectBookmarkStatusRead = {
+    /**
+     * Is Bookmarked
+     */
+    is_bookmarked: boolean;
+    /**
+     * Slug
+     */
+    slug: string;
+};
+
 /**
  * ProjectCreate
  *
@@ -335,6 +505,141 @@ export type ProjectCreate = {
     chat_enabled?: boolean;
 };
 
+/**
+ * ProjectDeletionRead
+ *
+ * Schema for reading the progress of a background project deletion.
+ */
+export type ProjectDeletionRead = {
+    /**
+     * Project Id
+     */
+    project_id: string;
+    status: ProjectDeletionStatus;
+    /**
+     * Phase
+     *
+     * Table currently being cleared: revisions, documents, uploads or batches
+     */
+    phase?: string | null;
+    /**
+     * Revisions Deleted
+     */
+    revisions_deleted?: number;
+    /**
+     * Documents Deleted
+     */
+    documents_deleted?: number;
+    /**
+     * Uploads Deleted
+     */
+    uploads_deleted?: number;
+    /**
+     * Batches Deleted
+     */
+    batches_deleted?: number;
+};
+
+/**
+ * ProjectDeletionStatus
+ *
+ * State of a background project deletion.
+ */
+export type ProjectDeletionStatus = 'pending' | 'running' | 'completed' | 'failed';
+
+/**
+ * ProjectListInclude
+ *
+ * Optional extra data for the project list endpoint.
+ */
+export type ProjectListInclude = 'permissions' | 'bookmark';
+
+/**
+ * ProjectListItemRead
+ *
+ * Schema for a project in the project list.
+ *
+ * Optional fields are only populated when requested via ``include``.
+ */
+export type ProjectListItemRead = {
+    /**
+     * Slug
+     */
+    slug: string;
+    /**
+     * Name
+     */
+    name: string;
+    /**
+     * Description
+     */
+    description?: string | null;
+    visibility?: ProjectVisibility;
+    /**
+     * Id
+     */
+    id: string;
+    /**
+     * Owner Id
+     */
+    owner_id: string;
+    /**
+     * Git Url
+     */
+    git_url: string | null;
+    /**
+     * Git Branch
+     */
+    git_branch: string | null;
+    /**
+     * Git Doc Root
+     */
+    git_doc_root: string | null;
+    /**
+     * Chat Enabled
+     */
+    chat_enabled: boolean;
+    /**
+     * Document Count
+     */
+    document_count?: number;
+    /**
+     * Last Activity At
+     */
+    last_activity_at?: string | null;
+    /**
+     * Created At
+     */
+    created_at: string;
+    /**
+     * Updated At
+     */
+    updated_at: string;
+    /**
+     * Current user's permissions (only with include=permissions)
+     */
+    permissions?: ProjectPermissionsRead | null;
+    /**
+     * Is Bookmarked
+     *
+     * Whether the current user bookmarked it (only with include=bookmark)
+     */
+    is_bookmarked?: boolean | null;
+};
+
+/**
+ * ProjectMemberBulkCreate
+ *
+ * Schema for adding many project members at once.
+ */
+export type ProjectMemberBulkCreate = {
+    /**
+     * Members
+     */
+    members: Array<ProjectMemberInvite>;
+    on_conflict?: BulkInviteConflict;
+};
+
 /**
  * ProjectMemberCreate
  *
@@ -348,6 +653,47 @@ export type ProjectMemberCreate = {
     role?: MemberRole;
 };
 
+/**
+ * ProjectMemberInvite
+ *
+ * Schema for one entry of a bulk member invitation.
+ *
+ * Exactly one of ``user_id`` or ``email`` identifies the user.
+ */
+export type ProjectMemberInvite = {
+    /**
+     * User Id
+     */
+    user_id?: string | null;
+    /**
+     * Email
+     */
+    email?: string | null;
+    role?: MemberRole;
+};
+
+/**
+ * ProjectMemberInviteResult
+ *
+ * Outcome of one entry of a bulk member invitation, in request order.
+ */
+export type ProjectMemberInviteResult = {
+    /**
+     * User Id
+     */
+    user_id: string | null;
+    /**
+     * Email
+     */
+    email: string | null;
+    role: MemberRole;
+    outcome: BulkInviteOutcome;
+    /**
+     * Member Id
+     */
+    member_id?: string | null;
+};
+
 /**
  * ProjectMemberRead
  *
@@ -491,6 +837,14 @@ export type ProjectRead = {
      * Chat Enabled
      */
     chat_enabled: boolean;
+    /**
+     * Document Count
+     */
+    document_count?: number;
+    /**
+     * Last Activity At
+     */
+    last_activity_at?: string | null;
     /**
      * Created At
      */
@@ -502,37 +856,79 @@ export type ProjectRead = {
 };
 
 /**
- * ProjectUpdate
+ * ProjectStorageUsageRead
  *
- * Schema for updating a project.
+ * Schema for reading a project's storage use.
  */
-export type ProjectUpdate = {
+export type ProjectStorageUsageRead = {
     /**
-     * Name
+     * Project Id
      */
-    name?: string | null;
+    project_id: string;
     /**
-     * Description
+     * Slug
      */
-    description?: string | null;
-    visibility?: ProjectVisibility | null;
+    slug: string;
     /**
-     * Git Url
+     * Name
      */
-    git_url?: string | null;
+    name: string;
     /**
-     * Git Branch
+     * Upload Bytes
      */
-    git_branch?: string | null;
+    upload_bytes: number;
     /**
-     * Git Doc Root
+     * Document Bytes
      */
-    git_doc_root?: string | null;
+    document_bytes: number;
     /**
-     * Chat Enabled
+     * Revision Bytes
      */
-    chat_enabled?: boolean | null;
-};
+    revision_bytes: number;
+    /**
+     * Total Bytes
+     */
+    total_bytes: number;
+    /**
+     * Quota Bytes
+     *
+     * Storage quota in bytes; null when unlimited
+     */
+    quota_bytes?: number | null;
+};
+
+/**
+ * ProjectUpdate
+ *
+ * Schema for updating a project.
+ */
+export type ProjectUpdate = {
+    /**
+     * Name
+     */
+    name?: string | null;
+    /**
+     * Description
+     */
+    description?: string | null;
+    visibility?: ProjectVisibility | null;
+    /**
+     * Git Url
+     */
+    git_url?: string | null;
+    /**
+     * Git Branch
+     */
+    git_branch?: string | null;
+    /**
+     * Git Doc Root
+     */
+    git_doc_root?: string | null;
+    /**
+     * Chat Enabled
+     */
+    chat_enabled?: boolean | null;
+};
 
 /**
  * ProjectVisibility
@@ -699,6 +1095,24 @@ export type UploadCreateResponse = {
      * Size Bytes
      */
     size_bytes: number;
+    /**
+     * Width
+     *
+     * Image width in pixels
+     */
+    width?: number | null;
+    /**
+     * Height
+     *
+     * Image height in pixels
+     */
+    height?: number | null;
+    /**
+     * Placeholder
+     *
+     * Tiny preview as a data: URI, to paint while loading
+     */
+    placeholder?: string | null;
     /**
      * Url
      */
@@ -709,6 +1123,78 @@ export type UploadCreateResponse = {
     created_at: string;
 };
 
+/**
+ * UploadGCRead
+ *
+ * Schema for reading the progress of an orphaned upload collection.
+ */
+export type UploadGcRead = {
+    status: UploadGcStatus;
+    /**
+     * Dry Run
+     *
+     * Whether orphans are only reported
+     */
+    dry_run: boolean;
+    /**
+     * Phase
+     *
+     * Current step: scan (collect references) or sweep (uploads)
+     */
+    phase?: string | null;
+    /**
+     * Documents Scanned
+     */
+    documents_scanned?: number;
+    /**
+     * Revisions Scanned
+     */
+    revisions_scanned?: number;
+    /**
+     * References Found
+     *
+     * Distinct referenced file paths
+     */
+    references_found?: number;
+    /**
+     * Uploads Checked
+     */
+    uploads_checked?: number;
+    /**
+     * Orphans Found
+     *
+     * Unreferenced uploads older than the grace period
+     */
+    orphans_found?: number;
+    /**
+     * Orphan Bytes
+     */
+    orphan_bytes?: number;
+    /**
+     * Uploads Deleted
+     */
+    uploads_deleted?: number;
+    /**
+     * Files Deleted
+     *
+     * Uploaded files removed from storage, variants excluded
+     */
+    files_deleted?: number;
+    /**
+     * Orphan Sample
+     *
+     * Storage paths of the first orphans found
+     */
+    orphan_sample?: Array<string>;
+};
+
+/**
+ * UploadGCStatus
+ *
+ * State of an orphaned upload collection job.
+ */
+export type UploadGcStatus = 'pending' | 'running' | 'completed' | 'failed';
+
 /**
  * UploadRead
  *
@@ -739,6 +1225,24 @@ export type UploadRead = {
      * Size Bytes
      */
     size_bytes: number;
+    /**
+     * Width
+     *
+     * Image width in pixels
+     */
+    width?: number | null;
+    /**
+     * Height
+     *
+     * Image height in pixels
+     */
+    height?: number | null;
+    /**
+     * Placeholder
+     *
+     * Tiny preview as a data: URI, to paint while loading
+     */
+    placeholder?: string | null;
     /**
      * Created At
      */
@@ -751,6 +1255,42 @@ export type UploadRead = {
     url: string;
 };
 
+/**
+ * UploadStorageStatsRead
+ *
+ * Schema for storage saved by content-addressed deduplication.
+ */
+export type UploadStorageStatsRead = {
+    /**
+     * Upload Count
+     */
+    upload_count: number;
+    /**
+     * Blob Count
+     *
+     * Number of distinct stored files
+     */
+    blob_count: number;
+    /**
+     * Uploaded Bytes
+     *
+     * Total size of all uploads
+     */
+    uploaded_bytes: number;
+    /**
+     * Stored Bytes
+     *
+     * Bytes actually kept in storage
+     */
+    stored_bytes: number;
+    /**
+     * Saved Bytes
+     *
+     * uploaded_bytes - stored_bytes
+     */
+    saved_bytes: number;
+};
+
 /**
  * UserProfileUpdate
  *
@@ -823,6 +1363,30 @@ export type UserRead = {
     updated_at: string;
 };
 
+/**
+ * UserSummaryRead
+ *
+ * Schema for a user in search results, e.g. the member invite dialog.
+ */
+export type UserSummaryRead = {
+    /**
+     * Email
+     */
+    email: string;
+    /**
+     * Name
+     */
+    name: string;
+    /**
+     * Avatar Url
+     */
+    avatar_url?: string | null;
+    /**
+     * Id
+     */
+    id: string;
+};
+
 /**
  * ValidationError
  */
@@ -857,6 +1421,22 @@ export type HealthCheckResponses = {
 
 export type HealthCheckResponse = HealthCheckResponses[keyof HealthCheckResponses];
 
+export type ImageProcessingMetricsData = {
+    body?: never;
+    path?: never;
+    query?: never;
+    url: '/api/v1/health/image-processing';
+};
+
+export type ImageProcessingMetricsResponses = {
+    /**
+     * Successful Response
+     */
+    200: ImageProcessingMetricsResponse;
+};
+
+export type ImageProcessingMetricsResponse = ImageProcessingMetricsResponses[keyof ImageProcessingMetricsResponses];
+
 export type RegisterData = {
     body: RegisterRequest;
     path?: never;
@@ -964,6 +1544,82 @@ export type GetCurrentUserInfoResponses = {
 
 export type GetCurrentUserInfoResponse = GetCurrentUserInfoResponses[keyof GetCurrentUserInfoResponses];
 
+export type ListUsersData = {
+    body?: never;
+    path?: never;
+    query?: {
+        /**
+         * Q
+         */
+        q?: string | null;
+        /**
+         * Limit
+         */
+        limit?: number;
+        /**
+         * Cursor
+         */
+        cursor?: string | null;
+    };
+    url: '/api/v1/users';
+};
+
+export type ListUsersErrors = {
+    /**
+     * Validation Error
+     */
+    422: HttpValidationError;
+};
+
+export type ListUsersError = ListUsersErrors[keyof ListUsersErrors];
+
+export type ListUsersResponses = {
+    /**
+     * Response List Users
+     *
+     * Successful Response
+     */
+    200: Array<UserRead>;
+};
+
+export type ListUsersResponse = ListUsersResponses[keyof ListUsersResponses];
+
+export type SearchUsersData = {
+    body?: never;
+    path?: never;
+    query: {
+        /**
+         * Q
+         */
+        q: string;
+        /**
+         * Limit
+         */
+        limit?: number;
+    };
+    url: '/api/v1/users/search';
+};
+
+export type SearchUsersErrors = {
+    /**
+     * Validation Error
+     */
+    422: HttpValidationError;
+};
+
+export type SearchUsersError = SearchUsersErrors[keyof SearchUsersErrors];
+
+export type SearchUsersResponses = {
+    /**
+     * Response Search Users
+     *
+     * Successful Response
+     */
+    200: Array<UserSummaryRead>;
+};
+
+export type SearchUsersResponse = SearchUsersResponses[keyof SearchUsersResponses];
+
 export type UpdateMyProfileData = {
     body: UserProfileUpdate;
     path?: never;
@@ -1001,6 +1657,14 @@ export type ListProjectsData = {
          * Limit
          */
         limit?: number;
+        /**
+         * Cursor
+         */
+        cursor?: string | null;
+        /**
+         * Include
+         */
+        include?: Array<ProjectListInclude> | null;
     };
     url: '/api/v1/projects';
 };
@@ -1020,7 +1684,7 @@ export type ListProjectsResponses = {
      *
      * Successful Response
      */
-    200: Array<ProjectRead>;
+    200: Array<ProjectListItemRead>;
 };
 
 export type ListProjectsResponse = ListProjectsResponses[keyof ListProjectsResponses];
@@ -1075,7 +1739,7 @@ export type DeleteProjectResponses = {
     /**
      * Successful Response
      */
-    204: void;
+    202: ProjectDeletionRead;
 };
 
 export type DeleteProjectResponse = DeleteProjectResponses[keyof DeleteProjectResponses];
@@ -1140,6 +1804,36 @@ export type UpdateProjectResponses = {
 
 export type UpdateProjectResponse = UpdateProjectResponses[keyof UpdateProjectResponses];
 
+export type GetProjectDeletionData = {
+    body?: never;
+    path: {
+        /**
+         * Slug
+         */
+        slug: string;
+    };
+    query?: never;
+    url: '/api/v1/projects/{slug}/deletion';
+};
+
+export type GetProjectDeletionErrors = {
+    /**
+     * Validation Error
+     */
+    422: HttpValidationError;
+};
+
+export type GetProjectDeletionError = GetProjectDeletionErrors[keyof GetProjectDeletionErrors];
+
+export type GetProjectDeletionResponses = {
+    /**
+     * Successful Response
+     */
+    200: ProjectDeletionRead;
+};
+
+export type GetProjectDeletionResponse = GetProjectDeletionResponses[keyof GetProjectDeletionResponses];
+
 export type GetProjectPermissionsData = {
     body?: never;
     path: {
@@ -1432,6 +2126,14 @@ export type ListMembersData = {
          * Limit
          */
         limit?: number;
+        /**
+         * Q
+         */
+        q?: string | null;
+        /**
+         * Cursor
+         */
+        cursor?: string | null;
     };
     url: '/api/v1/projects/{slug}/members';
 };
@@ -1486,6 +2188,38 @@ export type AddMemberResponses = {
 
 export type AddMemberResponse = AddMemberResponses[keyof AddMemberResponses];
 
+export type AddMembersBulkData = {
+    body: ProjectMemberBulkCreate;
+    path: {
+        /**
+         * Slug
+         */
+        slug: string;
+    };
+    query?: never;
+    url: '/api/v1/projects/{slug}/members/bulk';
+};
+
+export type AddMembersBulkErrors = {
+    /**
+     * Validation Error
+     */
+    422: HttpValidationError;
+};
+
+export type AddMembersBulkError = AddMembersBulkErrors[keyof AddMembersBulkErrors];
+
+export type AddMembersBulkResponses = {
+    /**
+     * Response Add Members Bulk
+     *
+     * Successful Response
+     */
+    200: Array<ProjectMemberInviteResult>;
+};
+
+export type AddMembersBulkResponse = AddMembersBulkResponses[keyof AddMembersBulkResponses];
+
 export type RemoveMemberData = {
     body?: never;
     path: {
@@ -1590,9 +2324,41 @@ export type ListBookmarksResponses = {
 
 export type ListBookmarksResponse = ListBookmarksResponses[keyof ListBookmarksResponses];
 
-export type RemoveBookmarkData = {
+export type GetBookmarkStatusesData = {
     body?: never;
-    path: {
+    path?: never;
+    query: {
+        /**
+         * Slug
+         */
+        slug: Array<string>;
+    };
+    url: '/api/v1/bookmarks/status';
+};
+
+export type GetBookmarkStatusesErrors = {
+    /**
+     * Validation Error
+     */
+    422: HttpValidationError;
+};
+
+export type GetBookmarkStatusesError = GetBookmarkStatusesErrors[keyof GetBookmarkStatusesErrors];
+
+export type GetBookmarkStatusesResponses = {
+    /**
+     * Response Get Bookmark Statuses
+     *
+     * Successful Response
+     */
+    200: Array<ProjectBookmarkStatusRead>;
+};
+
+export type GetBookmarkStatusesResponse = GetBookmarkStatusesResponses[keyof GetBookmarkStatusesResponses];
+
+export type RemoveBookmarkData = {
+    body?: never;
+    path: {
         /**
          * Slug
          */
@@ -1753,6 +2519,332 @@ export type UploadImageResponses = {
 
 export type UploadImageResponse = UploadImageResponses[keyof UploadImageResponses];
 
+export type StartDirectUploadData = {
+    body: DirectUploadCreate;
+    path: {
+        /**
+         * Project Id
+         *
+         * Project UUID
+         */
+        project_id: string;
+    };
+    query?: never;
+    url: '/api/v1/projects/{project_id}/uploads/direct';
+};
+
+export type StartDirectUploadErrors = {
+    /**
+     * Validation Error
+     */
+    422: HttpValidationError;
+};
+
+export type StartDirectUploadError = StartDirectUploadErrors[keyof StartDirectUploadErrors];
+
+export type StartDirectUploadResponses = {
+    /**
+     * Successful Response
+     */
+    201: DirectUploadTicket;
+};
+
+export type StartDirectUploadResponse = StartDirectUploadResponses[keyof StartDirectUploadResponses];
+
+export type GetDirectUploadData = {
+    body?: never;
+    path: {
+        /**
+         * Token
+         *
+         * Direct upload token
+         */
+        token: string;
+    };
+    query?: never;
+    url: '/api/v1/uploads/direct/{token}';
+};
+
+export type GetDirectUploadErrors = {
+    /**
+     * Validation Error
+     */
+    422: HttpValidationError;
+};
+
+export type GetDirectUploadError = GetDirectUploadErrors[keyof GetDirectUploadErrors];
+
+export type GetDirectUploadResponses = {
+    /**
+     * Successful Response
+     */
+    200: DirectUploadRead;
+};
+
+export type GetDirectUploadResponse = GetDirectUploadResponses[keyof GetDirectUploadResponses];
+
+export type ReceiveDirectUploadData = {
+    body?: never;
+    path: {
+        /**
+         * Token
+         *
+         * Direct upload token
+         */
+        token: string;
+    };
+    query?: never;
+    url: '/api/v1/uploads/direct/{token}';
+};
+
+export type ReceiveDirectUploadErrors = {
+    /**
+     * Validation Error
+     */
+    422: HttpValidationError;
+};
+
+export type ReceiveDirectUploadError = ReceiveDirectUploadErrors[keyof ReceiveDirectUploadErrors];
+
+export type ReceiveDirectUploadResponses = {
+    /**
+     * Successful Response
+     */
+    204: void;
+};
+
+export type ReceiveDirectUploadResponse = ReceiveDirectUploadResponses[keyof ReceiveDirectUploadResponses];
+
+export type CompleteDirectUploadData = {
+    body?: never;
+    path: {
+        /**
+         * Token
+         *
+         * Direct upload token
+         */
+        token: string;
+    };
+    query?: never;
+    url: '/api/v1/uploads/direct/{token}/complete';
+};
+
+export type CompleteDirectUploadErrors = {
+    /**
+     * Validation Error
+     */
+    422: HttpValidationError;
+};
+
+export type CompleteDirectUploadError = CompleteDirectUploadErrors[keyof CompleteDirectUploadErrors];
+
+export type CompleteDirectUploadResponses = {
+    /**
+     * Successful Response
+     */
+    202: DirectUploadRead;
+};
+
+export type CompleteDirectUploadResponse = CompleteDirectUploadResponses[keyof CompleteDirectUploadResponses];
+
+export type StartResumableUploadData = {
+    body: DirectUploadCreate;
+    path: {
+        /**
+         * Project Id
+         *
+         * Project UUID
+         */
+        project_id: string;
+    };
+    query?: never;
+    url: '/api/v1/projects/{project_id}/uploads/resumable';
+};
+
+export type StartResumableUploadErrors = {
+    /**
+     * Validation Error
+     */
+    422: HttpValidationError;
+};
+
+export type StartResumableUploadError = StartResumableUploadErrors[keyof StartResumableUploadErrors];
+
+export type StartResumableUploadResponses = {
+    /**
+     * Successful Response
+     */
+    201: DirectUploadTicket;
+};
+
+export type StartResumableUploadResponse = StartResumableUploadResponses[keyof StartResumableUploadResponses];
+
+export type GetResumableUploadOffsetData = {
+    body?: never;
+    path: {
+        /**
+         * Token
+         *
+         * Direct upload token
+         */
+        token: string;
+    };
+    query?: never;
+    url: '/api/v1/uploads/resumable/{token}';
+};
+
+export type GetResumableUploadOffsetErrors = {
+    /**
+     * Validation Error
+     */
+    422: HttpValidationError;
+};
+
+export type GetResumableUploadOffsetError = GetResumableUploadOffsetErrors[keyof GetResumableUploadOffsetErrors];
+
+export type GetResumableUploadOffsetResponses = {
+    /**
+     * Successful Response
+     */
+    200: unknown;
+};
+
+export type AppendResumableUploadChunkData = {
+    body?: never;
+    headers: {
+        /**
+         * Upload-Offset
+         */
+        'Upload-Offset': number;
+    };
+    path: {
+        /**
+         * Token
+         *
+         * Direct upload token
+         */
+        token: string;
+    };
+    query?: never;
+    url: '/api/v1/uploads/resumable/{token}';
+};
+
+export type AppendResumableUploadChunkErrors = {
+    /**
+     * Validation Error
+     */
+    422: HttpValidationError;
+};
+
+export type AppendResumableUploadChunkError = AppendResumableUploadChunkErrors[keyof AppendResumableUploadChunkErrors];
+
+export type AppendResumableUploadChunkResponses = {
+    /**
+     * Successful Response
+     */
+    204: void;
+};
+
+export type AppendResumableUploadChunkResponse = AppendResumableUploadChunkResponses[keyof AppendResumableUploadChunkResponses];
+
+export type GetUploadStorageStatsData = {
+    body?: never;
+    path?: never;
+    query?: never;
+    url: '/api/v1/uploads/stats';
+};
+
+export type GetUploadStorageStatsResponses = {
+    /**
+     * Successful Response
+     */
+    200: UploadStorageStatsRead;
+};
+
+export type GetUploadStorageStatsResponse = GetUploadStorageStatsResponses[keyof GetUploadStorageStatsResponses];
+
+export type GetProjectStorageUsageData = {
+    body?: never;
+    path?: never;
+    query?: {
+        /**
+         * Limit
+         *
+         * Maximum number of projects
+         */
+        limit?: number;
+    };
+    url: '/api/v1/uploads/stats/projects';
+};
+
+export type GetProjectStorageUsageErrors = {
+    /**
+     * Validation Error
+     */
+    422: HttpValidationError;
+};
+
+export type GetProjectStorageUsageError = GetProjectStorageUsageErrors[keyof GetProjectStorageUsageErrors];
+
+export type GetProjectStorageUsageResponses = {
+    /**
+     * Response Get Project Storage Usage
+     *
+     * Successful Response
+     */
+    200: Array<ProjectStorageUsageRead>;
+};
+
+export type GetProjectStorageUsageResponse = GetProjectStorageUsageResponses[keyof GetProjectStorageUsageResponses];
+
+export type GetOrphanedUploadCollectionData = {
+    body?: never;
+    path?: never;
+    query?: never;
+    url: '/api/v1/uploads/gc';
+};
+
+export type GetOrphanedUploadCollectionResponses = {
+    /**
+     * Successful Response
+     */
+    200: UploadGcRead;
+};
+
+export type GetOrphanedUploadCollectionResponse = GetOrphanedUploadCollectionResponses[keyof GetOrphanedUploadCollectionResponses];
+
+export type CollectOrphanedUploadsData = {
+    body?: never;
+    path?: never;
+    query?: {
+        /**
+         * Dry Run
+         *
+         * Only report the uploads that would be deleted
+         */
+        dry_run?: boolean;
+    };
+    url: '/api/v1/uploads/gc';
+};
+
+export type CollectOrphanedUploadsErrors = {
+    /**
+     * Validation Error
+     */
+    422: HttpValidationError;
+};
+
+export type CollectOrphanedUploadsError = CollectOrphanedUploadsErrors[keyof CollectOrphanedUploadsErrors];
+
+export type CollectOrphanedUploadsResponses = {
+    /**
+     * Successful Response
+     */
+    202: UploadGcRead;
+};
+
+export type CollectOrphanedUploadsResponse = CollectOrphanedUploadsResponses[keyof CollectOrphanedUploadsResponses];
+
 export type DeleteUploadData = {
     body?: never;
     path: {
@@ -1827,7 +2919,20 @@ export type ServeFileData = {
          */
         storage_path: string;
     };
-    query?: never;
+    query?: {
+        /**
+         * W
+         *
+         * Width of a resized variant
+         */
+        w?: number | null;
+        /**
+         * Video
+         *
+         * Serve a GIF as video of this type
+         */
+        video?: 'mp4' | 'webm' | null;
+    };
     url: '/api/v1/uploads/file/{storage_path}';
 };
 